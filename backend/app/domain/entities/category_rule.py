@@ -0,0 +1,22 @@
+"""Module contenant l'entité CategoryRule."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+
+from app.domain.entities.monthly_rollup import RollupKind
+
+
+@dataclass
+class CategoryRule:
+    """Catégorie apprise d'une correction de l'utilisateur, pour un libellé normalisé.
+
+    Une règle existe par (user_id, kind, key) ; `hits` compte les corrections
+    confirmant la même catégorie.
+    """
+
+    user_id: str
+    kind: RollupKind
+    key: str
+    category: str
+    hits: int = 1
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
@@ -45,3 +45,4 @@ class Expense:
     description: Optional[str] = None
     is_recurring: bool = False
     frequency: Optional[ExpenseFrequency] = None
+    fingerprint: Optional[str] = None
@@ -1,7 +1,7 @@
 """Module contenant les entités liées aux prévisions."""
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, UTC
 from enum import Enum
 from typing import List, Optional
 
@@ -24,6 +24,38 @@ class DataPoint:
     category: Optional[str] = None
 
 
+@dataclass
+class AggregatedAmount:
+    """Représente une somme journalière calculée par la base de données."""
+
+    date: datetime
+    amount: float
+    count: int
+    category: Optional[str] = None
+    is_recurring: bool = False
+
+
+@dataclass
+class CategoryForecast:
+    """Représente l'historique et les prévisions d'une catégorie de transactions."""
+
+    category: str
+    data: List[DataPoint]
+    forecast: List[DataPoint]
+    total: float
+    forecast_total: float
+
+
+@dataclass(frozen=True)
+class RecurringSeries:
+    """Représente une série de transactions récurrentes (même libellé et fréquence)."""
+
+    key: str
+    frequency: str
+    anchor: date
+    amount: float
+
+
 @dataclass
 class ForecastData:
     """Représente les données agrégées pour les prévisions."""
@@ -54,3 +86,35 @@ class ForecastData:
     # Métadonnées
     created_at: datetime
     updated_at: datetime
+    stale: bool = False
+
+    # Détail par catégorie (None si non calculé)
+    expense_categories: Optional[List[CategoryForecast]] = None
+    income_categories: Optional[List[CategoryForecast]] = None
+
+
+@dataclass
+class ForecastSnapshot:
+    """Représente une prévision précalculée et la version des données utilisée."""
+
+    forecast: ForecastData
+    data_version: int
+
+    def is_stale(self, current_version: int, today: date) -> bool:
+        """Périmée si les données ont changé depuis le calcul, ou s'il date d'un autre jour."""
+        computed_on = self.forecast.created_at
+        if computed_on.tzinfo is not None:
+            computed_on = computed_on.astimezone(UTC)
+        return self.data_version < current_version or computed_on.date() < today
+
+
+@dataclass
+class ForecastCacheStats:
+    """Compteurs d'utilisation du cache des prévisions."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: Optional[int] = None
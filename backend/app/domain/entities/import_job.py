@@ -0,0 +1,65 @@
+"""Module contenant l'entité ImportJob."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from enum import Enum
+from typing import Optional
+
+from app.domain.entities.import_result import ImportResult
+
+
+class ImportJobStatus(Enum):
+    """Énumération des états d'un import en arrière-plan."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class ImportJob:
+    """Représente un import CSV exécuté en arrière-plan.
+
+    Le fichier envoyé est conservé dans `file_path` jusqu'à la fin de l'import ;
+    les compteurs sont mis à jour après chaque lot écrit. `content_hash` (SHA-256
+    du fichier) identifie les envois d'un même fichier. Le worker qui exécute
+    l'import (`owner`) en renouvelle le bail à chaque lot (`heartbeat_at`).
+    """
+
+    id: str
+    user_id: str
+    filename: str
+    file_path: str
+    content_hash: Optional[str] = None
+    status: ImportJobStatus = ImportJobStatus.PENDING
+    rows_parsed: int = 0
+    expenses_created: int = 0
+    incomes_created: int = 0
+    skipped: int = 0
+    result: Optional[ImportResult] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    finished_at: Optional[datetime] = None
+    owner: Optional[str] = None
+    heartbeat_at: Optional[datetime] = None
+
+    @property
+    def rows_inserted(self) -> int:
+        """Nombre de transactions écrites (dépenses et revenus)."""
+        return self.expenses_created + self.incomes_created
+
+    @property
+    def is_finished(self) -> bool:
+        """Indique si l'import est terminé (succès ou échec)."""
+        return self.status in (ImportJobStatus.COMPLETED, ImportJobStatus.FAILED)
+
+    def report(self, result: ImportResult) -> None:
+        """Reporte l'avancement d'un import en cours."""
+        self.rows_parsed = result.total_transactions
+        self.expenses_created = result.expenses_created
+        self.incomes_created = result.incomes_created
+        self.skipped = result.skipped
+        self.updated_at = datetime.now(UTC)
+        self.heartbeat_at = self.updated_at
@@ -0,0 +1,23 @@
+"""Module contenant l'entité ImportLedgerChunk."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from typing import List
+
+
+@dataclass
+class ImportLedgerChunk:
+    """Lot d'un import entièrement écrit, consigné dans le registre des imports.
+
+    `chunk_hash` identifie les transactions du lot : un import repris ne réécrit
+    pas un lot dont l'empreinte est déjà consignée.
+    """
+
+    index: int
+    chunk_hash: str
+    rows: int
+    expenses_created: int = 0
+    incomes_created: int = 0
+    skipped: int = 0
+    errors: List[str] = field(default_factory=list)
+    committed_at: datetime = field(default_factory=lambda: datetime.now(UTC))
@@ -0,0 +1,66 @@
+"""Entités pour l'aperçu d'un import (simulation sans écriture)."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from enum import Enum
+from typing import List, Optional
+
+from app.domain.entities.expense import Expense
+from app.domain.entities.income import Income
+
+
+class PreviewRowStatus(Enum):
+    """Issue prévue d'une transaction du fichier."""
+
+    NEW = "new"
+    DUPLICATE = "duplicate"
+    ERROR = "error"
+
+
+@dataclass
+class ImportPreviewRow:
+    """Transaction du fichier telle qu'elle serait importée."""
+
+    index: int  # Position dans le fichier (à partir de 1)
+    date: datetime
+    description: str
+    amount: float
+    is_expense: bool
+    status: PreviewRowStatus
+    category: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportPreview:
+    """Aperçu d'un import : lignes classées et transactions prêtes à écrire.
+
+    Les dépenses et revenus préparés sont conservés sous `token` : la confirmation
+    les écrit sans relire le fichier.
+    """
+
+    token: str
+    user_id: str
+    filename: str
+    rows: List[ImportPreviewRow] = field(default_factory=list)
+    expenses: List[Expense] = field(default_factory=list)
+    incomes: List[Income] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def total_transactions(self) -> int:
+        """Nombre de transactions lues dans le fichier."""
+        return len(self.rows)
+
+    def count(self, status: PreviewRowStatus) -> int:
+        """Nombre de lignes ayant ce statut."""
+        return sum(1 for row in self.rows if row.status == status)
+
+    def page(
+        self, page: int, page_size: int, status: Optional[PreviewRowStatus] = None
+    ) -> tuple[List[ImportPreviewRow], int]:
+        """Retourne une page de lignes (filtrées par statut) et le nombre total filtré."""
+        rows = self.rows if status is None else [r for r in self.rows if r.status == status]
+        start = (page - 1) * page_size
+        return rows[start:start + page_size], len(rows)
@@ -1,6 +1,6 @@
 """Entités pour l'import de transactions."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
@@ -20,6 +20,18 @@ class ImportedTransaction:
     account_label: Optional[str] = None
 
 
+@dataclass
+class ImportChunkResult:
+    """Résultat de l'écriture d'un lot de transactions (une transaction SQL par lot)."""
+
+    kind: str  # "expense" ou "income"
+    index: int
+    size: int
+    created: int = 0
+    skipped: int = 0
+    error: Optional[str] = None
+
+
 @dataclass
 class ImportResult:
     """Résultat d'un import de transactions."""
@@ -30,6 +42,8 @@ class ImportResult:
     errors: List[str]
     skipped: int  # Transactions ignorées (doublons)
     success: bool
+    chunks: List[ImportChunkResult] = field(default_factory=list)
+    resumed: int = 0  # Transactions des lots déjà écrits par une tentative précédente
 
     def add_error(self, error: str) -> None:
         """Ajoute une erreur au résultat."""
@@ -45,3 +45,4 @@ class Income:
     description: Optional[str] = None
     is_recurring: bool = False
     frequency: Optional[IncomeFrequency] = None
+    fingerprint: Optional[str] = None
@@ -0,0 +1,65 @@
+"""Module contenant l'entité MonthlyRollup."""
+
+from dataclasses import dataclass, replace
+from datetime import date, datetime, UTC
+from enum import Enum
+from typing import Iterable
+
+
+class RollupKind(Enum):
+    """Énumération des types de transactions agrégées."""
+
+    EXPENSE = "expense"
+    INCOME = "income"
+
+
+def year_month_of(value: date) -> str:
+    """Retourne la clé de mois 'YYYY-MM' d'une date (convertie en UTC si besoin)."""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+@dataclass
+class MonthlyRollup:
+    """Représente la somme mensuelle des transactions d'un utilisateur.
+
+    Une ligne existe par (user_id, year_month, kind, category, is_recurring).
+    """
+
+    user_id: str
+    year_month: str
+    kind: RollupKind
+    category: str
+    is_recurring: bool
+    amount: float
+    count: int
+
+    @classmethod
+    def from_transaction(cls, kind: RollupKind, transaction) -> "MonthlyRollup":
+        """Crée le delta correspondant à une dépense ou un revenu."""
+        return cls(
+            user_id=transaction.user_id,
+            year_month=year_month_of(transaction.date),
+            kind=kind,
+            category=transaction.category.value if transaction.category else "other",
+            is_recurring=bool(transaction.is_recurring),
+            amount=float(transaction.amount),
+            count=1,
+        )
+
+    def negated(self) -> "MonthlyRollup":
+        """Retourne le delta inverse (pour une suppression)."""
+        return replace(self, amount=-self.amount, count=-self.count)
+
+
+def merge_rollups(deltas: Iterable[MonthlyRollup]) -> list[MonthlyRollup]:
+    """Fusionne des deltas de même clé (un seul upsert par ligne d'agrégat)."""
+    merged: dict[tuple, MonthlyRollup] = {}
+    for delta in deltas:
+        key = (delta.user_id, delta.year_month, delta.kind, delta.category, delta.is_recurring)
+        current = merged.get(key)
+        merged[key] = delta if current is None else replace(
+            current, amount=current.amount + delta.amount, count=current.count + delta.count
+        )
+    return list(merged.values())
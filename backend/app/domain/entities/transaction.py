@@ -0,0 +1,25 @@
+"""Module contenant l'entité Transaction."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from app.domain.entities.monthly_rollup import RollupKind
+
+
+@dataclass
+class Transaction:
+    """Dépense ou revenu du fil unifié des transactions (catégorie et fréquence en valeurs)."""
+
+    id: str
+    user_id: str
+    kind: RollupKind
+    name: str
+    amount: float
+    date: datetime
+    category: Optional[str] = None
+    description: Optional[str] = None
+    is_recurring: bool = False
+    frequency: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
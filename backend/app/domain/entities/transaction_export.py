@@ -0,0 +1,12 @@
+"""Module contenant les formats d'export des transactions."""
+
+from enum import Enum
+
+
+class ExportFormat(Enum):
+    """Énumération des formats d'export des transactions."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+    ARROW = "arrow"
+    PARQUET = "parquet"
@@ -0,0 +1,55 @@
+"""Entités pour la liste paginée des transactions."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TransactionSort(Enum):
+    """Énumération des tris de la liste des transactions (`-` : décroissant)."""
+
+    DATE_DESC = "-date"
+    DATE_ASC = "date"
+    AMOUNT_DESC = "-amount"
+    AMOUNT_ASC = "amount"
+
+    @property
+    def field(self) -> str:
+        """Champ trié ('date' ou 'amount'), départagé par l'id."""
+        return self.value.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        """Indique un tri décroissant."""
+        return self.value.startswith("-")
+
+
+@dataclass
+class TransactionQuery:
+    """Filtres, tri et position d'une page de transactions.
+
+    `after` est la clé (valeur triée, id) de la dernière transaction de la page
+    précédente : la page suivante est lue par keyset, sans OFFSET.
+    """
+
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    categories: list[Enum] = field(default_factory=list)
+    is_recurring: Optional[bool] = None
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+    search: Optional[str] = None
+    sort: TransactionSort = TransactionSort.DATE_DESC
+    limit: Optional[int] = None
+    after: Optional[tuple[Any, str]] = None
+
+
+@dataclass
+class TransactionPage(Generic[T]):
+    """Page de transactions et curseur de la page suivante (None en fin de liste)."""
+
+    items: list[T]
+    next_cursor: Optional[str] = None
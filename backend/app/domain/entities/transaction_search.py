@@ -0,0 +1,33 @@
+"""Entités pour la recherche plein texte des transactions."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction import Transaction
+
+
+@dataclass
+class TransactionSearch:
+    """Texte recherché, types de transaction et position d'une page de résultats.
+
+    `after` est la clé (score, id) du dernier résultat de la page précédente.
+    """
+
+    text: str
+    kinds: tuple[RollupKind, ...] = (RollupKind.EXPENSE, RollupKind.INCOME)
+    limit: int = 20
+    after: Optional[tuple[float, str]] = None
+
+
+@dataclass
+class TransactionSearchHit:
+    """Transaction trouvée et son score de pertinence."""
+
+    transaction: Transaction
+    score: float
+
+    @property
+    def id(self) -> str:
+        """Identifiant de la transaction, départage des scores égaux."""
+        return self.transaction.id
@@ -0,0 +1,96 @@
+"""Entités pour les statistiques des transactions."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+from app.domain.entities.monthly_rollup import RollupKind
+
+
+class StatsGranularity(Enum):
+    """Énumération des pas de regroupement des statistiques par période."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
+class StatsGroup(Enum):
+    """Énumération des regroupements d'agrégats (par type, puis par clé)."""
+
+    TOTAL = "total"
+    CATEGORY = "category"
+    PERIOD = "period"
+
+
+@dataclass
+class StatsQuery:
+    """Intervalle (bornes incluses) et pas des statistiques demandées."""
+
+    start_date: datetime
+    end_date: datetime
+    granularity: StatsGranularity = StatsGranularity.MONTH
+
+
+@dataclass
+class AmountStats:
+    """Agrégats des montants d'un groupe de transactions."""
+
+    total: float = 0.0
+    count: int = 0
+    average: float = 0.0
+    median: float = 0.0
+    p90: float = 0.0
+
+
+@dataclass
+class StatsBucket:
+    """Agrégats d'un groupe (type, clé).
+
+    La clé est None pour les totaux, la catégorie (valeur) ou le début de période.
+    """
+
+    kind: RollupKind
+    key: Any
+    stats: AmountStats
+
+
+@dataclass
+class CategoryStats:
+    """Agrégats d'une catégorie et sa part du total de son type."""
+
+    kind: RollupKind
+    category: str
+    stats: AmountStats
+    share: float
+
+
+@dataclass
+class PeriodStats:
+    """Agrégats d'une période et variations par rapport à la précédente.
+
+    Les variations sont relatives (0.1 = +10 %) et None si la période précédente est vide.
+    """
+
+    start: datetime
+    expenses: AmountStats
+    incomes: AmountStats
+    net: float
+    expense_change: Optional[float] = None
+    income_change: Optional[float] = None
+
+
+@dataclass
+class TransactionStats:
+    """Statistiques des dépenses et revenus d'un utilisateur sur un intervalle."""
+
+    start_date: datetime
+    end_date: datetime
+    granularity: StatsGranularity
+    expenses: AmountStats
+    incomes: AmountStats
+    net_balance: float
+    categories: list[CategoryStats] = field(default_factory=list)
+    periods: list[PeriodStats] = field(default_factory=list)
@@ -0,0 +1,9 @@
+"""Exceptions du domaine."""
+
+
+class DuplicateTransactionError(Exception):
+    """Une transaction de même empreinte existe déjà pour l'utilisateur."""
+
+
+class DuplicateImportJobError(Exception):
+    """Un import du même fichier est déjà en attente ou en cours pour l'utilisateur."""
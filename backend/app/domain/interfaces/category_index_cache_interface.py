@@ -0,0 +1,25 @@
+"""Interface pour le cache des index de catégories apprises."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.services.category_index import CategoryIndex
+
+
+class CategoryIndexCacheInterface(ABC):
+    """Interface pour le cache des index de catégories, indexé par utilisateur."""
+
+    @abstractmethod
+    def get(self, user_id: str) -> Optional[CategoryIndex]:
+        """Retourne l'index en cache, ou None si absent ou expiré."""
+        pass
+
+    @abstractmethod
+    def set(self, user_id: str, index: CategoryIndex) -> None:
+        """Met en cache l'index d'un utilisateur."""
+        pass
+
+    @abstractmethod
+    def invalidate_user(self, user_id: str) -> None:
+        """Retire l'index d'un utilisateur du cache."""
+        pass
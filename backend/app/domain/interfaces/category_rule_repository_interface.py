@@ -0,0 +1,19 @@
+"""Interface pour le repository des catégories apprises."""
+
+from abc import ABC, abstractmethod
+
+from app.domain.entities.category_rule import CategoryRule
+
+
+class CategoryRuleRepositoryInterface(ABC):
+    """Interface pour le repository des catégories apprises."""
+
+    @abstractmethod
+    def get_by_user_id(self, user_id: str) -> list[CategoryRule]:
+        """Récupère toutes les règles d'un utilisateur."""
+        pass
+
+    @abstractmethod
+    def upsert(self, rule: CategoryRule) -> CategoryRule:
+        """Crée ou remplace la règle (user_id, kind, key) et la retourne."""
+        pass
@@ -1,7 +1,11 @@
 """Module contenant les interfaces pour les opérations liées aux dépenses."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterator, Optional
 from app.domain.entities.expense import Expense
+from app.domain.entities.forecast import AggregatedAmount
+from app.domain.entities.transaction_query import TransactionQuery
 
 
 class ExpenseRepositoryInterface(ABC):
@@ -12,6 +16,16 @@ class ExpenseRepositoryInterface(ABC):
         """Crée une dépense."""
         pass
 
+    @abstractmethod
+    def bulk_create(self, expenses: list[Expense]) -> list[Expense]:
+        """
+        Crée plusieurs dépenses en une seule transaction.
+
+        Si une empreinte existe déjà, rien n'est enregistré (agrégats compris)
+        et DuplicateTransactionError est levée.
+        """
+        pass
+
     @abstractmethod
     def get_all(self, user_id: str) -> list[Expense]:
         """Récupère toutes les dépenses."""
@@ -27,6 +41,37 @@ class ExpenseRepositoryInterface(ABC):
         """Récupère toutes les dépenses d'un utilisateur."""
         pass
 
+    @abstractmethod
+    def iter_by_user_id(
+        self, user_id: str, since: Optional[datetime] = None, batch_size: int = 500
+    ) -> Iterator[Expense]:
+        """Parcourt les dépenses d'un utilisateur par lots, triées par date."""
+        pass
+
+    @abstractmethod
+    def get_page(self, user_id: str, query: TransactionQuery) -> list[Expense]:
+        """Récupère les dépenses filtrées et triées d'un utilisateur, après `query.after`."""
+        pass
+
+    @abstractmethod
+    def get_by_user_id_and_date_range(
+        self, user_id: str, start_date: datetime, end_date: datetime
+    ) -> list[Expense]:
+        """Récupère les dépenses d'un utilisateur comprises entre deux dates (incluses)."""
+        pass
+
+    @abstractmethod
+    def get_recurring_by_user_id(self, user_id: str, since: datetime) -> list[Expense]:
+        """Récupère les dépenses récurrentes d'un utilisateur depuis une date, triées par date."""
+        pass
+
+    @abstractmethod
+    def get_daily_totals(
+        self, user_id: str, start_date: datetime, end_date: datetime, by_category: bool = False
+    ) -> list[AggregatedAmount]:
+        """Récupère les sommes journalières des dépenses par récurrence (et catégorie)."""
+        pass
+
     @abstractmethod
     def update(self, expense: Expense, user_id: str) -> Expense:
         """Met à jour une dépense."""
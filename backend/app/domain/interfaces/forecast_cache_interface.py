@@ -0,0 +1,35 @@
+"""Interface pour le cache des prévisions."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.entities.forecast import ForecastCacheStats, ForecastData, ForecastPeriod
+
+
+class ForecastCacheInterface(ABC):
+    """Interface pour le cache des prévisions, indexé par (user_id, période)."""
+
+    @abstractmethod
+    def get(self, user_id: str, period: ForecastPeriod) -> Optional[ForecastData]:
+        """Retourne la prévision en cache, ou None si absente ou expirée."""
+        pass
+
+    @abstractmethod
+    def set(self, forecast: ForecastData) -> None:
+        """Met en cache une prévision calculée."""
+        pass
+
+    @abstractmethod
+    def invalidate_user(self, user_id: str) -> None:
+        """Invalide toutes les prévisions en cache d'un utilisateur."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Vide entièrement le cache."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> ForecastCacheStats:
+        """Retourne les compteurs hits / misses / évictions du cache."""
+        pass
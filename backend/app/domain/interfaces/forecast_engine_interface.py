@@ -0,0 +1,34 @@
+"""Interface pour les moteurs de calcul des prévisions."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+from app.domain.entities.forecast import DataPoint
+
+# Historique attendu par project()
+AGGREGATE_HISTORY = "aggregates"
+SERIES_HISTORY = "series"
+# Profondeur des transactions récurrentes transmises aux moteurs SERIES_HISTORY
+SERIES_LOOKBACK_DAYS = 2 * 366
+
+
+class ForecastEngineInterface(ABC):
+    """Interface pour les moteurs de calcul des prévisions.
+
+    Avec AGGREGATE_HISTORY, les lignes d'historique exposent `amount`, `count` et
+    soit `date` (sommes journalières), soit `year_month` (agrégats mensuels).
+    Avec SERIES_HISTORY, ce sont les transactions récurrentes (avec `frequency`).
+    """
+
+    history = AGGREGATE_HISTORY
+
+    @abstractmethod
+    def aggregate(self, items: List) -> List[DataPoint]:
+        """Agrège des montants datés en une série journalière triée."""
+        pass
+
+    @abstractmethod
+    def project(self, history: List, end_date: datetime, months_ahead: int) -> List[DataPoint]:
+        """Projette `months_ahead` points mensuels à partir de l'historique récurrent."""
+        pass
@@ -0,0 +1,20 @@
+"""Interface pour le repository des prévisions précalculées."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.entities.forecast import ForecastData, ForecastPeriod, ForecastSnapshot
+
+
+class ForecastSnapshotRepositoryInterface(ABC):
+    """Interface pour le repository des prévisions précalculées."""
+
+    @abstractmethod
+    def get(self, user_id: str, period: ForecastPeriod) -> Optional[ForecastSnapshot]:
+        """Récupère la dernière prévision précalculée d'un utilisateur pour une période."""
+        pass
+
+    @abstractmethod
+    def save_all(self, forecasts: list[ForecastData], data_version: int) -> None:
+        """Enregistre (ou remplace) des prévisions calculées à une version des données."""
+        pass
@@ -0,0 +1,75 @@
+"""Interface pour le repository des imports en arrière-plan."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from app.domain.entities.import_job import ImportJob
+
+
+class ImportJobRepositoryInterface(ABC):
+    """Interface pour la persistance de l'état des imports en arrière-plan."""
+
+    @abstractmethod
+    def create(self, job: ImportJob) -> ImportJob:
+        """
+        Enregistre un nouvel import.
+
+        Raises:
+            DuplicateImportJobError: si un import du même fichier est déjà actif
+        """
+        pass
+
+    @abstractmethod
+    def get_by_id(self, job_id: str, user_id: Optional[str] = None) -> Optional[ImportJob]:
+        """Récupère un import par son id (restreint à un utilisateur si précisé)."""
+        pass
+
+    @abstractmethod
+    def update(self, job: ImportJob) -> ImportJob:
+        """
+        Enregistre l'état et l'avancement d'un import.
+
+        Raises:
+            ValueError: si l'import n'existe pas ou a été repris par un autre worker
+            DuplicateImportJobError: si un import du même fichier est déjà actif
+        """
+        pass
+
+    @abstractmethod
+    def claim(self, job_id: str, owner: str, stale_before: datetime) -> Optional[ImportJob]:
+        """
+        Prend un import pour l'exécuter, en une seule écriture atomique.
+
+        L'import est pris s'il est en attente, ou en cours avec un bail non renouvelé
+        depuis `stale_before` (worker arrêté) ; il passe alors en cours pour `owner`.
+
+        Returns:
+            L'import pris, ou None s'il est terminé ou exécuté par un autre worker
+        """
+        pass
+
+    @abstractmethod
+    def renew(self, job_id: str, owner: str) -> bool:
+        """
+        Renouvelle le bail d'un import en cours pour `owner`.
+
+        Returns:
+            False si l'import est terminé ou a été repris par un autre worker
+        """
+        pass
+
+    @abstractmethod
+    def get_unfinished(self, stale_before: Optional[datetime] = None) -> list[ImportJob]:
+        """
+        Récupère les imports en attente ou interrompus, du plus ancien au plus récent.
+
+        Avec `stale_before`, les imports en cours dont le bail a été renouvelé
+        depuis cette date (exécutés par un worker actif) sont exclus.
+        """
+        pass
+
+    @abstractmethod
+    def get_latest_by_content_hash(self, user_id: str, content_hash: str) -> Optional[ImportJob]:
+        """Récupère le dernier import d'un fichier identique de l'utilisateur."""
+        pass
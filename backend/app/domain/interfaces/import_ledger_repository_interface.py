@@ -0,0 +1,19 @@
+"""Interface pour le registre des lots importés."""
+
+from abc import ABC, abstractmethod
+
+from app.domain.entities.import_ledger import ImportLedgerChunk
+
+
+class ImportLedgerRepositoryInterface(ABC):
+    """Interface pour la persistance des lots écrits par chaque import."""
+
+    @abstractmethod
+    def get_chunks(self, job_id: str) -> list[ImportLedgerChunk]:
+        """Récupère les lots déjà écrits d'un import, par index croissant."""
+        pass
+
+    @abstractmethod
+    def add_chunk(self, job_id: str, chunk: ImportLedgerChunk) -> ImportLedgerChunk:
+        """Consigne un lot entièrement écrit."""
+        pass
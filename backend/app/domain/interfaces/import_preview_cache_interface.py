@@ -0,0 +1,25 @@
+"""Interface pour le cache des aperçus d'import."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.entities.import_preview import ImportPreview
+
+
+class ImportPreviewCacheInterface(ABC):
+    """Interface pour le cache des aperçus d'import, indexé par jeton."""
+
+    @abstractmethod
+    def get(self, token: str) -> Optional[ImportPreview]:
+        """Retourne l'aperçu en cache, ou None si absent ou expiré."""
+        pass
+
+    @abstractmethod
+    def set(self, preview: ImportPreview) -> None:
+        """Met en cache un aperçu sous son jeton."""
+        pass
+
+    @abstractmethod
+    def pop(self, token: str) -> Optional[ImportPreview]:
+        """Retire et retourne l'aperçu (une confirmation ne peut être rejouée)."""
+        pass
@@ -1,8 +1,11 @@
 """Interface pour le repository des revenus."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterator, List, Optional
 
+from app.domain.entities.forecast import AggregatedAmount
+from app.domain.entities.transaction_query import TransactionQuery
 from app.domain.entities.income import Income
 
 
@@ -14,14 +17,57 @@ class IncomeRepositoryInterface(ABC):
         """Crée un nouveau revenu."""
         pass
 
+    @abstractmethod
+    def bulk_create(self, incomes: list[Income]) -> list[Income]:
+        """
+        Crée plusieurs revenus en une seule transaction.
+
+        Si une empreinte existe déjà, rien n'est enregistré (agrégats compris)
+        et DuplicateTransactionError est levée.
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, income_id: str, user_id: str) -> Optional[Income]:
         """Récupère un revenu par son ID et l'ID de l'utilisateur."""
         pass
 
     @abstractmethod
-    def get_all_by_user_id(self, user_id: str, skip: int = 0, limit: int = 100) -> List[Income]:
-        """Récupère tous les revenus d'un utilisateur avec pagination."""
+    def get_all_by_user_id(
+        self, user_id: str, skip: int = 0, limit: Optional[int] = None
+    ) -> List[Income]:
+        """Récupère tous les revenus d'un utilisateur avec pagination (sans limite par défaut)."""
+        pass
+
+    @abstractmethod
+    def iter_by_user_id(
+        self, user_id: str, since: Optional[datetime] = None, batch_size: int = 500
+    ) -> Iterator[Income]:
+        """Parcourt les revenus d'un utilisateur par lots, triés par date."""
+        pass
+
+    @abstractmethod
+    def get_page(self, user_id: str, query: TransactionQuery) -> list[Income]:
+        """Récupère les revenus filtrées et triées d'un utilisateur, après `query.after`."""
+        pass
+
+    @abstractmethod
+    def get_by_user_id_and_date_range(
+        self, user_id: str, start_date: datetime, end_date: datetime
+    ) -> List[Income]:
+        """Récupère les revenus d'un utilisateur compris entre deux dates (incluses)."""
+        pass
+
+    @abstractmethod
+    def get_recurring_by_user_id(self, user_id: str, since: datetime) -> list[Income]:
+        """Récupère les revenus récurrents d'un utilisateur depuis une date, triés par date."""
+        pass
+
+    @abstractmethod
+    def get_daily_totals(
+        self, user_id: str, start_date: datetime, end_date: datetime, by_category: bool = False
+    ) -> List[AggregatedAmount]:
+        """Récupère les sommes journalières des revenus par récurrence (et catégorie)."""
         pass
 
     @abstractmethod
@@ -0,0 +1,49 @@
+"""Interface pour le repository des agrégats mensuels."""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
+
+
+class MonthlyRollupRepositoryInterface(ABC):
+    """Interface pour les agrégats mensuels des transactions."""
+
+    @abstractmethod
+    def apply(self, delta: MonthlyRollup) -> None:
+        """
+        Ajoute un delta (montant et nombre) à la ligne d'agrégat correspondante.
+
+        Le changement n'est pas validé : il l'est par le commit du repository
+        de transactions qui partage la même session, dans la même transaction.
+        """
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Annule les deltas appliqués et non encore validés (après un échec d'écriture)."""
+        pass
+
+    @abstractmethod
+    def get_by_user_id(
+        self,
+        user_id: str,
+        start_month: str,
+        end_month: str,
+        kind: Optional[RollupKind] = None,
+    ) -> List[MonthlyRollup]:
+        """Récupère les agrégats d'un utilisateur entre deux mois 'YYYY-MM' (inclus)."""
+        pass
+
+    @abstractmethod
+    def rebuild(self, user_id: Optional[str] = None) -> int:
+        """
+        Recalcule les agrégats depuis les transactions brutes.
+
+        Args:
+            user_id: Utilisateur à recalculer (tous si None)
+
+        Returns:
+            int: Nombre de lignes d'agrégat écrites
+        """
+        pass
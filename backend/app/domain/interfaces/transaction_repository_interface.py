@@ -0,0 +1,48 @@
+"""Interface pour le fil unifié des dépenses et revenus."""
+
+from abc import ABC, abstractmethod
+from typing import Iterator, Sequence
+
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction_query import TransactionQuery
+from app.domain.entities.transaction_search import TransactionSearch, TransactionSearchHit
+
+
+class TransactionRepositoryInterface(ABC):
+    """Interface pour la lecture des dépenses et revenus en un seul fil trié."""
+
+    @abstractmethod
+    def get_page(
+        self,
+        user_id: str,
+        query: TransactionQuery,
+        kinds: Sequence[RollupKind] = (RollupKind.EXPENSE, RollupKind.INCOME),
+    ) -> list[Transaction]:
+        """Récupère les transactions filtrées et triées d'un utilisateur, après `query.after`.
+
+        Les catégories de `query.categories` sont des valeurs ('food', 'salary'...).
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        user_id: str,
+        query: TransactionQuery,
+        kinds: Sequence[RollupKind] = (RollupKind.EXPENSE, RollupKind.INCOME),
+        batch_size: int = 1000,
+    ) -> Iterator[list[Transaction]]:
+        """Parcourt toutes les transactions filtrées et triées par lots, sans les charger.
+
+        Conçu pour les exports : la lecture suit un curseur côté serveur.
+        """
+        pass
+
+    @abstractmethod
+    def search(self, user_id: str, search: TransactionSearch) -> list[TransactionSearchHit]:
+        """Recherche dans les libellés et descriptions, par pertinence décroissante.
+
+        Les résultats suivent la clé (score, id) `search.after`, dans la limite `search.limit`.
+        """
+        pass
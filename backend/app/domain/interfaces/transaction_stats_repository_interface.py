@@ -0,0 +1,19 @@
+"""Interface pour les agrégats statistiques des transactions."""
+
+from abc import ABC, abstractmethod
+
+from app.domain.entities.transaction_stats import StatsBucket, StatsGroup, StatsQuery
+
+
+class TransactionStatsRepositoryInterface(ABC):
+    """Interface pour le calcul des agrégats des dépenses et revenus."""
+
+    @abstractmethod
+    def aggregate(self, user_id: str, query: StatsQuery, group: StatsGroup) -> list[StatsBucket]:
+        """Agrège (somme, nombre, moyenne, médiane, p90) les montants de l'intervalle.
+
+        Un groupe par type de transaction et par clé : aucune (TOTAL), catégorie
+        (CATEGORY) ou début de période selon `query.granularity` (PERIOD). Les groupes
+        sans transaction sont absents.
+        """
+        pass
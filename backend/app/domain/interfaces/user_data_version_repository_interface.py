@@ -0,0 +1,23 @@
+"""Interface pour le repository des versions de données utilisateur."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class UserDataVersionRepositoryInterface(ABC):
+    """Compteur incrémenté à chaque écriture de dépenses ou de revenus d'un utilisateur."""
+
+    @abstractmethod
+    def get(self, user_id: str) -> int:
+        """Retourne la version courante des données (0 si jamais modifiées)."""
+        pass
+
+    @abstractmethod
+    def bump(self, user_id: str) -> int:
+        """Incrémente la version des données et la retourne."""
+        pass
+
+    @abstractmethod
+    def get_active_user_ids(self, since: datetime) -> list[str]:
+        """Utilisateurs ayant modifié leurs données ou ouvert une session depuis une date."""
+        pass
@@ -0,0 +1,43 @@
+"""Moteur de prévision historique, en Python pur."""
+
+from datetime import datetime, timedelta, UTC
+from typing import List
+
+from app.domain.entities.forecast import DataPoint
+from app.domain.interfaces.forecast_engine_interface import ForecastEngineInterface
+
+
+class AverageForecastEngine(ForecastEngineInterface):
+    """Projette le montant moyen par transaction récurrente sur chaque mois à venir."""
+
+    def aggregate(self, items: List) -> List[DataPoint]:
+        """Agrège les données par date (fusionne les lignes récurrentes et ponctuelles)."""
+        aggregated = {}
+
+        for item in items:
+            date_key = item.date.date()
+            if date_key not in aggregated:
+                aggregated[date_key] = 0
+            aggregated[date_key] += item.amount
+
+        return [
+            DataPoint(date=datetime.combine(date, datetime.min.time(), tzinfo=UTC), amount=amount)
+            for date, amount in sorted(aggregated.items())
+        ]
+
+    def project(self, history: List, end_date: datetime, months_ahead: int) -> List[DataPoint]:
+        """Répète la moyenne par transaction sur `months_ahead` mois."""
+        monthly_average = self.monthly_average(history)
+        return [
+            DataPoint(date=end_date + timedelta(days=30 * i), amount=monthly_average)
+            for i in range(months_ahead)
+        ]
+
+    def monthly_average(self, items: List) -> float:
+        """Calcule la moyenne mensuelle des montants."""
+        count = sum(item.count for item in items)
+        if not count:
+            return 0.0
+
+        total_amount = sum(item.amount for item in items)
+        return total_amount / count
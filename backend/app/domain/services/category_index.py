@@ -0,0 +1,95 @@
+"""Index des catégories apprises des corrections de l'utilisateur."""
+
+import re
+from typing import Iterable, Optional
+
+from app.domain.entities.category_rule import CategoryRule
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.services.transaction_fingerprint import normalize_name
+
+# Préfixes bancaires sans valeur pour identifier le marchand
+PAYMENT_PREFIXES = {
+    "achat",
+    "carte",
+    "cb",
+    "dab",
+    "inst",
+    "paiement",
+    "prelevement",
+    "prlv",
+    "retrait",
+    "sepa",
+    "vir",
+    "virement",
+}
+# Nombre maximal de mots retenus dans une clé (le marchand est en tête du libellé)
+MAX_KEY_TOKENS = 4
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def categorization_key(label: str) -> str:
+    """Clé d'un libellé : mots normalisés, sans préfixe bancaire ni références chiffrées.
+
+    'CB CARREFOUR MARKET 15/01 X1234' -> 'carrefour market'
+    """
+    tokens = [t for t in _NON_WORD.sub(" ", normalize_name(label)).split() if t.isalpha()]
+    start = 0
+    while start < len(tokens) and tokens[start] in PAYMENT_PREFIXES:
+        start += 1
+    return " ".join(tokens[start:start + MAX_KEY_TOKENS])
+
+
+class CategoryIndex:
+    """Trie des catégories apprises d'un utilisateur, un par type de transaction.
+
+    La recherche retourne la règle la plus spécifique dont la clé préfixe le libellé :
+    une règle 'carrefour' couvre 'carrefour market' et 'carrefour city'.
+    """
+
+    # Clé réservée d'un nœud portant une catégorie (aucun mot n'est vide)
+    _CATEGORY = ""
+
+    def __init__(self):
+        self._roots: dict[RollupKind, dict] = {}
+        self._size = 0
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[CategoryRule]) -> "CategoryIndex":
+        """Construit l'index depuis les règles persistées."""
+        index = cls()
+        for rule in rules:
+            index.add(rule.kind, rule.key, rule.category)
+        return index
+
+    def add(self, kind: RollupKind, key: str, category: str) -> None:
+        """Associe une catégorie à une clé déjà normalisée."""
+        node = self._roots.setdefault(kind, {})
+        for token in key.split():
+            node = node.setdefault(token, {})
+        if self._CATEGORY not in node:
+            self._size += 1
+        node[self._CATEGORY] = category
+
+    def learn(self, kind: RollupKind, label: str, category: str) -> Optional[str]:
+        """Apprend la catégorie d'un libellé ; retourne la clé, ou None si vide."""
+        key = categorization_key(label)
+        if not key:
+            return None
+        self.add(kind, key, category)
+        return key
+
+    def lookup(self, kind: RollupKind, label: str) -> Optional[str]:
+        """Catégorie apprise pour un libellé, ou None."""
+        node = self._roots.get(kind)
+        if not node or not label:
+            return None
+        found = None
+        for token in categorization_key(label).split():
+            node = node.get(token)
+            if node is None:
+                break
+            found = node.get(self._CATEGORY, found)
+        return found
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,49 @@
+"""Index des empreintes existantes, chargé une fois par import."""
+
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Optional
+
+from app.domain.services.transaction_fingerprint import fingerprint_of
+
+# Charge les dépenses et revenus existants entre deux instants (inclus)
+DedupeLoader = Callable[[datetime, datetime], tuple[Iterable, Iterable]]
+
+
+class DedupeIndex:
+    """Empreintes des dépenses et revenus d'un utilisateur, chargées par plage de jours.
+
+    La plage chargée ne fait que s'étendre : chaque jour de l'historique est lu au
+    plus une fois par import, quel que soit l'ordre des lignes du fichier. Les
+    empreintes des transactions préparées pendant l'import y sont ajoutées.
+    """
+
+    def __init__(self, load: DedupeLoader):
+        self.load = load
+        self.expenses: set[str] = set()
+        self.incomes: set[str] = set()
+        self.start: Optional[datetime] = None
+        self.end: Optional[datetime] = None
+
+    def cover(self, start: datetime, end: datetime) -> None:
+        """Charge les empreintes des jours de [start, end] qui ne l'ont pas encore été."""
+        start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = end.replace(hour=23, minute=59, second=59, microsecond=999999)
+        if self.start is None:
+            self._load(start, end)
+            self.start, self.end = start, end
+            return
+        if start < self.start:
+            self._load(start, self.start - timedelta(microseconds=1))
+            self.start = start
+        if end > self.end:
+            self._load(self.end + timedelta(microseconds=1), end)
+            self.end = end
+
+    def discard(self, expense: bool, fingerprints: Iterable[str]) -> None:
+        """Retire des empreintes (transactions préparées mais non écrites)."""
+        (self.expenses if expense else self.incomes).difference_update(fingerprints)
+
+    def _load(self, start: datetime, end: datetime) -> None:
+        expenses, incomes = self.load(start, end)
+        self.expenses.update(fingerprint_of(expense) for expense in expenses)
+        self.incomes.update(fingerprint_of(income) for income in incomes)
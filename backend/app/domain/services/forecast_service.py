@@ -1,12 +1,40 @@
 """Service pour le calcul des prévisions."""
 
+from bisect import bisect_left
+from dataclasses import replace
 from datetime import datetime, timedelta, UTC
-from typing import List
-from app.domain.entities.forecast import ForecastData, ForecastPeriod, DataPoint
-from app.domain.entities.expense import Expense
-from app.domain.entities.income import Income
+from typing import Dict, List, Optional
+from app.domain.entities.forecast import (
+    AggregatedAmount,
+    CategoryForecast,
+    DataPoint,
+    ForecastData,
+    ForecastPeriod,
+)
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind, year_month_of
 from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
+from app.domain.interfaces.forecast_engine_interface import (
+    SERIES_HISTORY,
+    SERIES_LOOKBACK_DAYS,
+    ForecastEngineInterface,
+)
 from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
+from app.domain.services.average_forecast_engine import AverageForecastEngine
+
+
+# Catégorie des lignes sans catégorie (sommes journalières non ventilées)
+DEFAULT_CATEGORY = "other"
+
+
+def category_of(row) -> str:
+    """Retourne la catégorie d'une ligne d'historique (énumération ou chaîne)."""
+    category = getattr(row, "category", None)
+    if category is None:
+        return DEFAULT_CATEGORY
+    return getattr(category, "value", category)
 
 
 def ensure_utc(dt):
@@ -20,29 +48,112 @@ class ForecastService:
     """Service pour calculer les prévisions financières."""
 
     def __init__(
-        self, expense_repo: ExpenseRepositoryInterface, income_repo: IncomeRepositoryInterface
+        self,
+        expense_repo: ExpenseRepositoryInterface,
+        income_repo: IncomeRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+        engine: Optional[ForecastEngineInterface] = None,
     ):
         self.expense_repo = expense_repo
         self.income_repo = income_repo
+        self.rollup_repo = rollup_repo
+        self.engine = engine or AverageForecastEngine()
 
-    def calculate_forecast(self, user_id: str, period: ForecastPeriod) -> ForecastData:
+    def calculate_forecast(
+        self, user_id: str, period: ForecastPeriod, by_category: bool = False
+    ) -> ForecastData:
         """Calcule les prévisions pour une période donnée."""
+        return self.calculate_forecasts(user_id, [period], by_category)[period]
+
+    def calculate_forecasts(
+        self,
+        user_id: str,
+        periods: Optional[List[ForecastPeriod]] = None,
+        by_category: bool = False,
+    ) -> Dict[ForecastPeriod, ForecastData]:
+        """Calcule les prévisions de plusieurs périodes en une seule passe.
+
+        L'historique de la fenêtre la plus large est lu une seule fois et agrégé
+        une seule fois, puis découpé pour chaque période. Avec `by_category`, la
+        même requête groupe aussi par catégorie : les totaux en sont déduits et
+        le détail par catégorie est ajouté à chaque prévision.
+        """
+        periods = list(periods or ForecastPeriod)
 
         # Déterminer les dates de début et fin
         end_date = datetime.now(UTC)
-        start_date = self._get_start_date(end_date, period)
+        start_dates = {period: self._get_start_date(end_date, period) for period in periods}
+        window_start = min(start_dates.values())
 
-        # Récupérer les données historiques
-        expenses = self._get_historical_expenses(user_id, start_date, end_date)
-        incomes = self._get_historical_incomes(user_id, start_date, end_date)
+        # Récupérer les sommes journalières calculées par la base de données
+        expenses = self._get_historical_expenses(user_id, window_start, end_date, by_category)
+        incomes = self._get_historical_incomes(user_id, window_start, end_date, by_category)
 
         # Agréger les données historiques
         expenses_data = self._aggregate_data(expenses)
         income_data = self._aggregate_data(incomes)
+        expense_history = self._aggregate_by_category(expenses) if by_category else None
+        income_history = self._aggregate_by_category(incomes) if by_category else None
+
+        # Base des prévisions (à partir des agrégats mensuels si disponibles)
+        expense_base = self._get_projection_base(
+            user_id, RollupKind.EXPENSE, window_start, end_date, expenses
+        )
+        income_base = self._get_projection_base(
+            user_id, RollupKind.INCOME, window_start, end_date, incomes
+        )
+
+        forecasts = {}
+        for period in periods:
+            start_date = start_dates[period]
+            if start_date > window_start:
+                # Période plus courte que la fenêtre lue : découper les données déjà agrégées
+                forecasts[period] = self._build_forecast(
+                    user_id,
+                    period,
+                    start_date,
+                    end_date,
+                    self._slice_data(expenses_data, start_date),
+                    self._slice_data(income_data, start_date),
+                    self._slice_projection_base(expense_base, expenses, start_date, end_date),
+                    self._slice_projection_base(income_base, incomes, start_date, end_date),
+                    self._slice_history(expense_history, start_date),
+                    self._slice_history(income_history, start_date),
+                )
+            else:
+                forecasts[period] = self._build_forecast(
+                    user_id,
+                    period,
+                    start_date,
+                    end_date,
+                    expenses_data,
+                    income_data,
+                    expense_base,
+                    income_base,
+                    expense_history,
+                    income_history,
+                )
+
+        return forecasts
+
+    def _build_forecast(
+        self,
+        user_id: str,
+        period: ForecastPeriod,
+        start_date: datetime,
+        end_date: datetime,
+        expenses_data: List[DataPoint],
+        income_data: List[DataPoint],
+        expense_base: List,
+        income_base: List,
+        expense_history: Optional[Dict[str, List[DataPoint]]] = None,
+        income_history: Optional[Dict[str, List[DataPoint]]] = None,
+    ) -> ForecastData:
+        """Construit les prévisions d'une période à partir de données déjà découpées."""
 
         # Calculer les prévisions
-        forecast_expenses = self._calculate_expense_forecast(expenses, period)
-        forecast_income = self._calculate_income_forecast(incomes, period)
+        forecast_expenses = self._calculate_expense_forecast(expense_base, period)
+        forecast_income = self._calculate_income_forecast(income_base, period)
 
         # Calculer les totaux
         total_expenses = sum(point.amount for point in expenses_data)
@@ -70,103 +181,192 @@ class ForecastService:
             forecast_net_balance=forecast_net_balance,
             created_at=datetime.now(UTC),
             updated_at=datetime.now(UTC),
+            expense_categories=self._category_breakdown(expense_history, expense_base, period),
+            income_categories=self._category_breakdown(income_history, income_base, period),
         )
 
     def _get_start_date(self, end_date: datetime, period: ForecastPeriod) -> datetime:
-        """Calcule la date de début basée sur la période."""
-        if period == ForecastPeriod.ONE_MONTH:
-            return end_date - timedelta(days=30)
-        elif period == ForecastPeriod.THREE_MONTHS:
-            return end_date - timedelta(days=90)
+        """Calcule la date de début basée sur la période.
+
+        La date est ramenée à minuit : la lecture dédiée d'une période et le découpage
+        des sommes journalières d'une fenêtre plus large couvrent alors les mêmes jours.
+        """
+        if period == ForecastPeriod.THREE_MONTHS:
+            days = 90
         elif period == ForecastPeriod.SIX_MONTHS:
-            return end_date - timedelta(days=180)
+            days = 180
         elif period == ForecastPeriod.ONE_YEAR:
-            return end_date - timedelta(days=365)
+            days = 365
         else:
-            return end_date - timedelta(days=30)
+            days = 30
+        start_date = end_date - timedelta(days=days)
+        return start_date.replace(hour=0, minute=0, second=0, microsecond=0)
 
     def _get_historical_expenses(
-        self, user_id: str, start_date: datetime, end_date: datetime
-    ) -> List[Expense]:
-        """Récupère les dépenses historiques."""
-        all_expenses = self.expense_repo.get_by_user_id(user_id)
-        return [
-            expense
-            for expense in all_expenses
-            if start_date <= ensure_utc(expense.date) <= end_date
-        ]
+        self, user_id: str, start_date: datetime, end_date: datetime, by_category: bool = False
+    ) -> List[AggregatedAmount]:
+        """Récupère les sommes journalières des dépenses historiques."""
+        return self.expense_repo.get_daily_totals(
+            user_id, start_date, end_date, by_category=by_category
+        )
 
     def _get_historical_incomes(
-        self, user_id: str, start_date: datetime, end_date: datetime
-    ) -> List[Income]:
-        """Récupère les revenus historiques."""
-        all_incomes = self.income_repo.get_all_by_user_id(user_id)
+        self, user_id: str, start_date: datetime, end_date: datetime, by_category: bool = False
+    ) -> List[AggregatedAmount]:
+        """Récupère les sommes journalières des revenus historiques."""
+        return self.income_repo.get_daily_totals(
+            user_id, start_date, end_date, by_category=by_category
+        )
+
+    def _get_projection_base(
+        self,
+        user_id: str,
+        kind: RollupKind,
+        start_date: datetime,
+        end_date: datetime,
+        daily_totals: List[AggregatedAmount],
+    ) -> List:
+        """Retourne les lignes servant de base aux prévisions.
+
+        Avec un repository d'agrégats, les mois entièrement couverts par la période
+        sont lus dans les agrégats mensuels (au plus 12 × catégories lignes) et les
+        mois incomplets des bords dans les sommes journalières (voir _trim_rollups) ;
+        sinon on réutilise les sommes journalières.
+        Un moteur SERIES_HISTORY reçoit les transactions récurrentes elles-mêmes.
+        """
+        if self.engine.history == SERIES_HISTORY:
+            repo = self.expense_repo if kind == RollupKind.EXPENSE else self.income_repo
+            return repo.get_recurring_by_user_id(
+                user_id, end_date - timedelta(days=SERIES_LOOKBACK_DAYS)
+            )
+        if self.rollup_repo is None:
+            return daily_totals
+        rollups = self.rollup_repo.get_by_user_id(
+            user_id, year_month_of(start_date), year_month_of(end_date), kind
+        )
+        return self._trim_rollups(rollups, daily_totals, start_date, end_date)
+
+    def _slice_projection_base(
+        self,
+        rows: List,
+        daily_totals: List[AggregatedAmount],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List:
+        """Restreint la base des prévisions aux lignes datées de start_date ou après."""
+        if self.engine.history == SERIES_HISTORY:
+            # Les séries sont ancrées sur leur dernière occurrence, quelle que soit la période
+            return rows
+        daily_totals = [row for row in daily_totals if row.date >= start_date]
+        if self.rollup_repo is None:
+            return daily_totals
+        rollups = [row for row in rows if isinstance(row, MonthlyRollup)]
+        return self._trim_rollups(rollups, daily_totals, start_date, end_date)
+
+    def _trim_rollups(
+        self,
+        rollups: List[MonthlyRollup],
+        daily_totals: List[AggregatedAmount],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List:
+        """Remplace les agrégats des mois de début et de fin par les sommes journalières.
+
+        Ces mois ne sont couverts qu'en partie (le mois courant peut contenir des
+        transactions futures) : la base reste ainsi celle des lignes brutes de la période.
+        """
+        start_month, end_month = year_month_of(start_date), year_month_of(end_date)
         return [
-            income for income in all_incomes if start_date <= ensure_utc(income.date) <= end_date
-        ]
+            rollup for rollup in rollups if start_month < rollup.year_month < end_month
+        ] + [row for row in daily_totals if year_month_of(row.date) in (start_month, end_month)]
+
+    def _slice_data(self, points: List[DataPoint], start_date: datetime) -> List[DataPoint]:
+        """Retourne les points journaliers (triés) datés de start_date ou après.
+
+        Les points sont datés de minuit et start_date aussi (voir _get_start_date) :
+        le jour de début est inclus, comme par le filtre `date >= start` d'une
+        lecture dédiée.
+        """
+        return points[bisect_left(points, start_date, key=lambda point: point.date):]
+
+    def _slice_history(
+        self, history: Optional[Dict[str, List[DataPoint]]], start_date: datetime
+    ) -> Optional[Dict[str, List[DataPoint]]]:
+        """Découpe chaque série historique par catégorie (voir _slice_data)."""
+        if history is None:
+            return None
+        return {
+            category: self._slice_data(points, start_date)
+            for category, points in history.items()
+        }
 
     def _aggregate_data(self, items: List) -> List[DataPoint]:
-        """Agrège les données par date."""
-        aggregated = {}
-
-        for item in items:
-            date_key = item.date.date()
-            if date_key not in aggregated:
-                aggregated[date_key] = 0
-            aggregated[date_key] += item.amount
-
-        return [
-            DataPoint(date=datetime.combine(date, datetime.min.time(), tzinfo=UTC), amount=amount)
-            for date, amount in sorted(aggregated.items())
-        ]
+        """Agrège les données par date via le moteur de prévision."""
+        return self.engine.aggregate(items)
+
+    def _aggregate_by_category(self, items: List) -> Dict[str, List[DataPoint]]:
+        """Agrège les données par catégorie puis par date."""
+        return {
+            category: [
+                replace(point, category=category) for point in self._aggregate_data(rows)
+            ]
+            for category, rows in self._group_by_category(items).items()
+        }
+
+    def _group_by_category(self, rows: List) -> Dict[str, List]:
+        """Répartit des lignes d'historique par catégorie."""
+        groups: Dict[str, List] = {}
+        for row in rows:
+            groups.setdefault(category_of(row), []).append(row)
+        return groups
+
+    def _category_breakdown(
+        self,
+        history: Optional[Dict[str, List[DataPoint]]],
+        projection_base: List,
+        period: ForecastPeriod,
+    ) -> Optional[List[CategoryForecast]]:
+        """Construit l'historique et les prévisions de chaque catégorie."""
+        if history is None:
+            return None
+
+        base_by_category = self._group_by_category(projection_base)
+        breakdown = []
+        for category in sorted(set(history) | set(base_by_category)):
+            data = history.get(category, [])
+            forecast = [
+                replace(point, category=category)
+                for point in self._project_recurring(base_by_category.get(category, []), period)
+            ]
+            if not data and not any(point.amount for point in forecast):
+                continue
+            breakdown.append(
+                CategoryForecast(
+                    category=category,
+                    data=data,
+                    forecast=forecast,
+                    total=sum(point.amount for point in data),
+                    forecast_total=sum(point.amount for point in forecast),
+                )
+            )
+        return breakdown
 
     def _calculate_expense_forecast(
-        self, historical_expenses: List[Expense], period: ForecastPeriod
+        self, historical_expenses: List, period: ForecastPeriod
     ) -> List[DataPoint]:
-        """Calcule les prévisions de dépenses."""
-        forecast_data = []
-        end_date = datetime.now(UTC)
-
-        # Calculer la moyenne mensuelle des dépenses récurrentes
-        recurring_expenses = [e for e in historical_expenses if e.is_recurring]
-        monthly_average = self._calculate_monthly_average(recurring_expenses)
-
-        # Générer les prévisions pour la période demandée
-        months_ahead = self._get_months_ahead(period)
-
-        for i in range(months_ahead):
-            forecast_date = end_date + timedelta(days=30 * i)
-            forecast_data.append(DataPoint(date=forecast_date, amount=monthly_average))
-
-        return forecast_data
+        """Calcule les prévisions de dépenses à partir des dépenses récurrentes."""
+        return self._project_recurring(historical_expenses, period)
 
     def _calculate_income_forecast(
-        self, historical_incomes: List[Income], period: ForecastPeriod
+        self, historical_incomes: List, period: ForecastPeriod
     ) -> List[DataPoint]:
-        """Calcule les prévisions de revenus."""
-        forecast_data = []
-        end_date = datetime.now(UTC)
-
-        # Calculer la moyenne mensuelle des revenus récurrents
-        recurring_incomes = [i for i in historical_incomes if i.is_recurring]
-        monthly_average = self._calculate_monthly_average(recurring_incomes)
-
-        # Générer les prévisions pour la période demandée
-        months_ahead = self._get_months_ahead(period)
-
-        for i in range(months_ahead):
-            forecast_date = end_date + timedelta(days=30 * i)
-            forecast_data.append(DataPoint(date=forecast_date, amount=monthly_average))
-
-        return forecast_data
-
-    def _calculate_monthly_average(self, items: List) -> float:
-        """Calcule la moyenne mensuelle des montants."""
-        if not items:
-            return 0.0
+        """Calcule les prévisions de revenus à partir des revenus récurrents."""
+        return self._project_recurring(historical_incomes, period)
 
-        total_amount = sum(item.amount for item in items)
-        return total_amount / len(items) if items else 0.0
+    def _project_recurring(self, rows: List, period: ForecastPeriod) -> List[DataPoint]:
+        """Projette les lignes récurrentes sur la période via le moteur de prévision."""
+        recurring = [row for row in rows if row.is_recurring]
+        return self.engine.project(recurring, datetime.now(UTC), self._get_months_ahead(period))
 
     def _get_months_ahead(self, period: ForecastPeriod) -> int:
         """Retourne le nombre de mois à prévoir."""
@@ -0,0 +1,88 @@
+"""Curseurs opaques de pagination par keyset."""
+
+import base64
+import binascii
+import json
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from app.domain.entities.transaction_query import (
+    TransactionPage,
+    TransactionQuery,
+    TransactionSort,
+)
+from app.domain.entities.transaction_search import TransactionSearch
+
+# Tri des curseurs de recherche : score de pertinence décroissant
+SEARCH_RANK = "-score"
+
+
+def _encode(sort_value: str, value: Any, item_id: str) -> str:
+    """Encode un curseur [tri, valeur, id] en base64 URL."""
+    payload = json.dumps([sort_value, value, item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str, sort_value: str, parse: Callable[[Any], Any]) -> tuple[Any, str]:
+    """Décode un curseur émis pour le même tri (ValueError sinon)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, value, item_id = json.loads(raw)
+        if cursor_sort != sort_value or not isinstance(item_id, str):
+            raise ValueError
+        return parse(value), item_id
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError("Curseur de pagination invalide") from e
+
+
+def encode_cursor(sort: TransactionSort, value: Any, item_id: str) -> str:
+    """Encode la clé (valeur triée, id) de la dernière ligne d'une page."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return _encode(sort.value, value, item_id)
+
+
+def decode_cursor(cursor: str, sort: TransactionSort) -> tuple[Any, str]:
+    """Décode un curseur émis pour le même tri (ValueError sinon)."""
+    parse = datetime.fromisoformat if sort.field == "date" else float
+    return _decode(cursor, sort.value, parse)
+
+
+def paginate(
+    fetch: Callable[[TransactionQuery], list],
+    query: TransactionQuery,
+    cursor: Optional[str] = None,
+) -> TransactionPage:
+    """
+    Lit une page après le curseur et calcule le curseur de la page suivante.
+
+    Une ligne de plus que `query.limit` est demandée pour savoir s'il reste des pages ;
+    sans limite, toute la liste est retournée.
+    """
+    after = decode_cursor(cursor, query.sort) if cursor else None
+    limit = query.limit
+    items = fetch(replace(query, after=after, limit=limit + 1 if limit else None))
+    if limit is None or len(items) <= limit:
+        return TransactionPage(items=items)
+
+    items = items[:limit]
+    last = items[-1]
+    next_cursor = encode_cursor(query.sort, getattr(last, query.sort.field), last.id)
+    return TransactionPage(items=items, next_cursor=next_cursor)
+
+
+def paginate_search(
+    fetch: Callable[[TransactionSearch], list],
+    search: TransactionSearch,
+    cursor: Optional[str] = None,
+) -> TransactionPage:
+    """Lit une page de résultats de recherche après le curseur (clé (score, id))."""
+    after = _decode(cursor, SEARCH_RANK, float) if cursor else None
+    items = fetch(replace(search, after=after, limit=search.limit + 1))
+    if len(items) <= search.limit:
+        return TransactionPage(items=items)
+
+    items = items[:search.limit]
+    last = items[-1]
+    return TransactionPage(items=items, next_cursor=_encode(SEARCH_RANK, last.score, last.id))
@@ -0,0 +1,126 @@
+"""Moteur de prévision qui déroule chaque série récurrente selon sa fréquence."""
+
+import re
+from bisect import bisect_left
+from calendar import monthrange
+from datetime import date, datetime, UTC
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from app.domain.entities.forecast import DataPoint, RecurringSeries
+from app.domain.interfaces.forecast_engine_interface import SERIES_HISTORY
+from app.domain.services.average_forecast_engine import AverageForecastEngine
+
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+YEARLY = "yearly"
+ONE_TIME = "one-time"
+
+# Une série sans occurrence depuis 2 intervalles est considérée comme terminée
+STALE_INTERVALS = 2
+
+_DIGITS = re.compile(r"\d+")
+_SPACES = re.compile(r"\s+")
+
+
+def add_months(value: date, months: int) -> date:
+    """Ajoute des mois à une date en ramenant le jour à la fin du mois si besoin."""
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(value.day, monthrange(year, month)[1]))
+
+
+def nth_occurrence(anchor: date, frequency: str, n: int) -> date:
+    """Retourne la n-ième occurrence d'une série (calculée depuis l'ancre, sans dérive)."""
+    if frequency == WEEKLY:
+        return date.fromordinal(anchor.toordinal() + 7 * n)
+    if frequency == YEARLY:
+        return add_months(anchor, 12 * n)
+    return add_months(anchor, n)
+
+
+def _intervals_between(anchor: date, today: date, frequency: str) -> int:
+    """Nombre (approché par défaut) d'intervalles entre l'ancre et aujourd'hui."""
+    if frequency == WEEKLY:
+        return (today - anchor).days // 7
+    months = (today.year - anchor.year) * 12 + today.month - anchor.month
+    return months // 12 if frequency == YEARLY else months
+
+
+def series_key(name: str) -> str:
+    """Normalise un libellé (casse, chiffres, espaces) pour regrouper une série."""
+    return _SPACES.sub(" ", _DIGITS.sub("", name.lower())).strip()
+
+
+def build_series(transactions: List) -> List[RecurringSeries]:
+    """Regroupe les transactions récurrentes en séries ancrées sur leur dernière occurrence."""
+    latest: Dict[Tuple[str, str], RecurringSeries] = {}
+    for transaction in transactions:
+        frequency = transaction.frequency.value if transaction.frequency else MONTHLY
+        if frequency == ONE_TIME:
+            continue
+
+        key = series_key(transaction.name)
+        anchor = transaction.date
+        if isinstance(anchor, datetime):
+            anchor = (anchor.astimezone(UTC) if anchor.tzinfo else anchor).date()
+
+        current = latest.get((key, frequency))
+        if current is None or anchor >= current.anchor:
+            latest[(key, frequency)] = RecurringSeries(
+                key=key, frequency=frequency, anchor=anchor, amount=float(transaction.amount)
+            )
+    return list(latest.values())
+
+
+def is_active(series: RecurringSeries, today: date) -> bool:
+    """Indique si la série a eu une occurrence dans les derniers intervalles."""
+    return nth_occurrence(series.anchor, series.frequency, STALE_INTERVALS) >= today
+
+
+@lru_cache(maxsize=4096)
+def occurrence_counts(anchor: date, frequency: str, today: date, months: int) -> Tuple[int, ...]:
+    """Compte les occurrences futures d'une série dans chaque mois à partir d'aujourd'hui.
+
+    Le mois i couvre ]today + i mois, today + (i + 1) mois]. Le résultat est mis en
+    cache par série : une modification ne ré-déroule que la série concernée.
+    """
+    bounds = [add_months(today, i) for i in range(months + 1)]
+    counts = [0] * months
+
+    n = max(0, _intervals_between(anchor, today, frequency) - 1)
+    occurrence = nth_occurrence(anchor, frequency, n)
+    while occurrence <= bounds[-1]:
+        if occurrence > today:
+            counts[bisect_left(bounds, occurrence) - 1] += 1
+        n += 1
+        occurrence = nth_occurrence(anchor, frequency, n)
+
+    return tuple(counts)
+
+
+class RecurrenceForecastEngine(AverageForecastEngine):
+    """Projette chaque série récurrente à ses dates d'échéance et somme par mois."""
+
+    history = SERIES_HISTORY
+    horizon_months = 12
+
+    def project(self, history: List, end_date: datetime, months_ahead: int) -> List[DataPoint]:
+        """Déroule les séries sur `months_ahead` mois calendaires à partir de end_date."""
+        end_date = end_date.astimezone(UTC)
+        today = end_date.date()
+        horizon = max(months_ahead, self.horizon_months)
+
+        totals = [0.0] * months_ahead
+        for series in build_series(history):
+            if not is_active(series, today):
+                continue
+            counts = occurrence_counts(series.anchor, series.frequency, today, horizon)
+            for i in range(months_ahead):
+                totals[i] += counts[i] * series.amount
+
+        return [
+            DataPoint(date=datetime.combine(add_months(today, i), end_date.timetz()), amount=total)
+            for i, total in enumerate(totals)
+        ]
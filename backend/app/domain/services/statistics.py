@@ -0,0 +1,53 @@
+"""Calculs statistiques : découpage en périodes et percentiles."""
+
+import math
+from datetime import datetime, timedelta
+from typing import Iterator, Sequence
+
+from app.domain.entities.transaction_stats import StatsGranularity
+
+
+def truncate(value: datetime, granularity: StatsGranularity) -> datetime:
+    """Début de la période contenant une date (semaines commençant le lundi)."""
+    day = datetime(value.year, value.month, value.day)
+    if granularity == StatsGranularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == StatsGranularity.MONTH:
+        return day.replace(day=1)
+    if granularity == StatsGranularity.YEAR:
+        return day.replace(month=1, day=1)
+    return day
+
+
+def next_period(start: datetime, granularity: StatsGranularity) -> datetime:
+    """Début de la période suivante."""
+    if granularity == StatsGranularity.DAY:
+        return start + timedelta(days=1)
+    if granularity == StatsGranularity.WEEK:
+        return start + timedelta(weeks=1)
+    if granularity == StatsGranularity.MONTH:
+        return start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    return start.replace(year=start.year + 1)
+
+
+def period_starts(
+    start: datetime, end: datetime, granularity: StatsGranularity
+) -> Iterator[datetime]:
+    """Débuts des périodes couvrant l'intervalle, dans l'ordre."""
+    current = truncate(start, granularity)
+    while current <= end:
+        yield current
+        current = next_period(current, granularity)
+
+
+def percentile_cont(values: Sequence[float], fraction: float) -> float:
+    """Percentile par interpolation linéaire, comme `percentile_cont` de PostgreSQL.
+
+    `values` doit être trié ; 0.0 pour une série vide.
+    """
+    if not values:
+        return 0.0
+    position = fraction * (len(values) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
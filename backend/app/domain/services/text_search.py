@@ -0,0 +1,88 @@
+"""Recherche plein texte en mémoire sur les libellés des transactions."""
+
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Optional
+
+from app.domain.services.transaction_fingerprint import normalize_name
+
+# Nombre maximal de mots pris en compte dans une recherche
+MAX_SEARCH_TERMS = 8
+# Poids d'un mot qui ne fait que commencer par le terme cherché ('carre' -> 'carrefour')
+PREFIX_WEIGHT = 0.5
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def words(text: Optional[str]) -> list[str]:
+    """Mots normalisés d'un texte (casse, ponctuation retirée)."""
+    return _NON_WORD.sub(" ", normalize_name(text or "")).split()
+
+
+def search_terms(text: Optional[str]) -> list[str]:
+    """Mots distincts d'une recherche, dans l'ordre.
+
+    'Carrefour  MARKET, carrefour' -> ['carrefour', 'market']
+    """
+    return list(dict.fromkeys(words(text)))[:MAX_SEARCH_TERMS]
+
+
+class InvertedIndex:
+    """Index inversé mot -> documents, interrogé par préfixe.
+
+    Chaque terme de la recherche doit préfixer un mot du document (ET logique).
+    Le score somme, par terme, l'idf du mot trouvé pondéré par sa fréquence dans le
+    document ; un mot égal au terme compte plus qu'un mot qu'il ne fait que préfixer.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, dict[str, int]] = {}
+        self._documents: set[str] = set()
+        self._vocabulary: Optional[list[str]] = None
+
+    def add(self, doc_id: str, *texts: Optional[str]) -> None:
+        """Indexe les textes d'un document."""
+        counts = Counter(word for text in texts for word in words(text))
+        for word, count in counts.items():
+            self._postings.setdefault(word, {})[doc_id] = count
+        self._documents.add(doc_id)
+        self._vocabulary = None
+
+    def search(self, text: str) -> list[tuple[str, float]]:
+        """Documents contenant tous les termes, par score puis id décroissants."""
+        terms = search_terms(text)
+        if not terms:
+            return []
+        scores: Optional[dict[str, float]] = None
+        for term in terms:
+            matches = self._match(term)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {
+                    doc: score + matches[doc] for doc, score in scores.items() if doc in matches
+                }
+            if not scores:
+                return []
+        return sorted(scores.items(), key=lambda item: (item[1], item[0]), reverse=True)
+
+    def _match(self, term: str) -> dict[str, float]:
+        """Meilleur score du terme dans chaque document dont un mot commence par lui."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        matches: dict[str, float] = {}
+        start = bisect_left(self._vocabulary, term)
+        for word in self._vocabulary[start:]:
+            if not word.startswith(term):
+                break
+            postings = self._postings[word]
+            idf = math.log(1 + len(self._documents) / len(postings))
+            weight = 1.0 if word == term else PREFIX_WEIGHT
+            for doc, count in postings.items():
+                score = weight * idf * count / (count + 1)
+                matches[doc] = max(matches.get(doc, 0.0), score)
+        return matches
+
+    def __len__(self) -> int:
+        return len(self._documents)
@@ -0,0 +1,48 @@
+"""Empreinte des transactions pour la détection des doublons à l'import."""
+
+import hashlib
+import unicodedata
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
+
+
+def normalize_name(name: str) -> str:
+    """Normalise un libellé (Unicode NFKC, casse, espaces multiples)."""
+    return " ".join(unicodedata.normalize("NFKC", name or "").split()).casefold()
+
+
+def amount_cents(amount: float) -> int:
+    """Arrondit un montant au centime, en entier."""
+    return int((Decimal(str(amount)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def dedupe_key(on: date, amount: float, name: str) -> tuple[date, int, str]:
+    """Clé de déduplication : (jour, montant en centimes, libellé normalisé)."""
+    if isinstance(on, datetime):
+        on = on.date()
+    return on, amount_cents(amount), normalize_name(name)
+
+
+def transaction_fingerprint(on: date, amount: float, name: str) -> str:
+    """Empreinte SHA-256 de la clé de déduplication, stockée avec la transaction."""
+    day, cents, normalized = dedupe_key(on, amount, name)
+    return hashlib.sha256(f"{day.isoformat()}|{cents}|{normalized}".encode()).hexdigest()
+
+
+def fingerprint_of(transaction) -> str:
+    """Empreinte d'une dépense ou d'un revenu (celle stockée si elle existe)."""
+    stored = getattr(transaction, "fingerprint", None)
+    if stored:
+        return stored
+    return transaction_fingerprint(transaction.date, transaction.amount, transaction.name)
+
+
+def chunk_hash(transactions) -> str:
+    """Empreinte SHA-256 d'un lot de transactions parsées (contenu et ordre)."""
+    digest = hashlib.sha256()
+    for t in transactions:
+        digest.update(
+            f"{t.date.isoformat()}|{amount_cents(t.amount)}|{t.description}|{t.category}|"
+            f"{t.category_parent}|{t.supplier}|{t.is_expense}|{t.is_recurring}\n".encode()
+        )
+    return digest.hexdigest()
@@ -3,15 +3,25 @@
 import uuid
 from datetime import date, datetime, UTC
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.domain.entities.expense import Expense, ExpenseCategory, ExpenseFrequency
+from app.domain.entities.transaction_query import TransactionQuery
 from app.domain.entities.user import User
+from app.domain.interfaces.category_index_cache_interface import CategoryIndexCacheInterface
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.external_interfaces.api.transaction_params import send_page, transaction_query
+from app.infrastructure.cache.category_index_cache import get_category_index_cache
+from app.infrastructure.cache.forecast_cache_factory import get_forecast_cache
 from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.jobs.forecast_jobs import refresh_user_forecasts
+from app.infrastructure.repositories.category_rule_repository import SQLCategoryRuleRepository
 from app.infrastructure.repositories.expense_repository import SQLExpenseRepository
+from app.infrastructure.repositories.monthly_rollup_repository import SQLMonthlyRollupRepository
 from app.infrastructure.security.dependencies import get_current_user
+from app.use_cases.categories.learn_category import LearnCategory
 from app.use_cases.expenses.create_expense import CreateExpense
 from app.use_cases.expenses.get_expense import GetExpense
 from app.use_cases.expenses.list_expenses import ListExpenses
@@ -92,10 +102,11 @@ def create_expense(
     expense: ExpenseCreateRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache),
 ):
     """Crée une dépense."""
 
-    use_case = CreateExpense(SQLExpenseRepository(db))
+    use_case = CreateExpense(SQLExpenseRepository(db), SQLMonthlyRollupRepository(db))
 
     try:
         expense_data = expense.model_dump()
@@ -105,18 +116,30 @@ def create_expense(
         expense_data["updated_at"] = datetime.now(UTC)
         expense_obj = Expense(**expense_data)
         new_expense = use_case.execute(expense_obj)
+        refresh_user_forecasts(db, forecast_cache, current_user.id)
         return new_expense
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
 
 @expense_router.get("", response_model=list[Expense])
-def list_expenses(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Liste toutes les dépenses."""
+def list_expenses(
+    response: Response,
+    query: TransactionQuery = Depends(transaction_query),
+    category: Optional[list[ExpenseCategory]] = Query(None),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Liste les dépenses filtrées et triées, par pages (100 si `limit` est absent).
+
+    Le curseur de la page suivante est renvoyé dans l'en-tête X-Next-Cursor.
+    """
 
     try:
+        query.categories = category or []
         use_case = ListExpenses(SQLExpenseRepository(db))
-        return use_case.execute(current_user.id)
+        return send_page(response, use_case.execute_page(current_user.id, query, cursor))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
@@ -139,25 +162,37 @@ def update_expense(
     expense: Expense,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache),
+    category_index_cache: CategoryIndexCacheInterface = Depends(get_category_index_cache),
 ):
-    """Met à jour une dépense."""
+    """Met à jour une dépense (un changement de catégorie est appris pour les imports)."""
 
     try:
-        use_case = UpdateExpense(SQLExpenseRepository(db))
-        return use_case.execute(expense, current_user.id)
+        use_case = UpdateExpense(
+            SQLExpenseRepository(db),
+            SQLMonthlyRollupRepository(db),
+            LearnCategory(SQLCategoryRuleRepository(db), category_index_cache),
+        )
+        updated_expense = use_case.execute(expense, current_user.id)
+        refresh_user_forecasts(db, forecast_cache, current_user.id)
+        return updated_expense
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
 
 @expense_router.delete("/{expense_id}")
 def delete_expense(
-    expense_id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    expense_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache),
 ):
     """Supprime une dépense."""
 
     try:
-        use_case = DeleteExpense(SQLExpenseRepository(db))
+        use_case = DeleteExpense(SQLExpenseRepository(db), SQLMonthlyRollupRepository(db))
         use_case.execute(expense_id, current_user.id)
+        refresh_user_forecasts(db, forecast_cache, current_user.id)
         return {"message": "Dépense supprimée avec succès"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -2,17 +2,34 @@
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.domain.entities.forecast import ForecastPeriod
+from app.domain.entities.forecast import (
+    CategoryForecast,
+    DataPoint,
+    ForecastData,
+    ForecastPeriod,
+)
 from app.domain.entities.user import User
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.infrastructure.cache.forecast_cache_factory import get_forecast_cache
 from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.forecasting.forecast_engine_factory import create_forecast_engine
+from app.infrastructure.jobs.forecast_jobs import enqueue_precompute
 from app.infrastructure.repositories.expense_repository import SQLExpenseRepository
+from app.infrastructure.repositories.forecast_snapshot_repository import (
+    SQLForecastSnapshotRepository,
+)
 from app.infrastructure.repositories.income_repository import SQLIncomeRepository
+from app.infrastructure.repositories.monthly_rollup_repository import SQLMonthlyRollupRepository
+from app.infrastructure.repositories.user_data_version_repository import (
+    SQLUserDataVersionRepository,
+)
 from app.infrastructure.security.dependencies import get_current_user
+from app.use_cases.forecast.get_all_forecasts import GetAllForecasts
 from app.use_cases.forecast.get_forecast import GetForecast
 
 # Configuration du logging
@@ -29,6 +46,16 @@ class DataPointResponse(BaseModel):
     category: Optional[str] = None
 
 
+class CategoryForecastResponse(BaseModel):
+    """Réponse pour l'historique et les prévisions d'une catégorie."""
+
+    category: str
+    data: List[DataPointResponse]
+    forecast: List[DataPointResponse]
+    total: float
+    forecast_total: float
+
+
 class ForecastDataResponse(BaseModel):
     """Réponse pour les données de prévision."""
 
@@ -59,6 +86,86 @@ class ForecastDataResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    # Fraîcheur : `stale` indique une prévision précalculée antérieure aux dernières écritures
+    computed_at: datetime
+    stale: bool = False
+
+    # Détail par catégorie (uniquement avec group_by=category)
+    expense_categories: Optional[List[CategoryForecastResponse]] = None
+    income_categories: Optional[List[CategoryForecastResponse]] = None
+
+
+class ForecastBatchResponse(BaseModel):
+    """Réponse regroupant les prévisions de plusieurs périodes."""
+
+    user_id: str
+    forecasts: Dict[str, ForecastDataResponse]
+
+
+def to_forecast_response(
+    forecast_data: ForecastData, by_category: bool = False
+) -> ForecastDataResponse:
+    """Convertit une entité ForecastData en réponse API."""
+    return ForecastDataResponse(
+        user_id=forecast_data.user_id,
+        period=forecast_data.period.value,
+        start_date=forecast_data.start_date,
+        end_date=forecast_data.end_date,
+        expenses_data=to_data_points(forecast_data.expenses_data),
+        income_data=to_data_points(forecast_data.income_data),
+        forecast_expenses=to_data_points(forecast_data.forecast_expenses),
+        forecast_income=to_data_points(forecast_data.forecast_income),
+        total_expenses=forecast_data.total_expenses,
+        total_income=forecast_data.total_income,
+        net_balance=forecast_data.net_balance,
+        forecast_total_expenses=forecast_data.forecast_total_expenses,
+        forecast_total_income=forecast_data.forecast_total_income,
+        forecast_net_balance=forecast_data.forecast_net_balance,
+        created_at=forecast_data.created_at,
+        updated_at=forecast_data.updated_at,
+        computed_at=forecast_data.created_at,
+        stale=forecast_data.stale,
+        expense_categories=(
+            to_category_forecasts(forecast_data.expense_categories) if by_category else None
+        ),
+        income_categories=(
+            to_category_forecasts(forecast_data.income_categories) if by_category else None
+        ),
+    )
+
+
+def to_data_points(points: List[DataPoint]) -> List[DataPointResponse]:
+    """Convertit des points de données en réponses API."""
+    return [
+        DataPointResponse(date=point.date, amount=point.amount, category=point.category)
+        for point in points
+    ]
+
+
+def to_category_forecasts(
+    categories: Optional[List[CategoryForecast]],
+) -> List[CategoryForecastResponse]:
+    """Convertit le détail par catégorie en réponses API."""
+    return [
+        CategoryForecastResponse(
+            category=category.category,
+            data=to_data_points(category.data),
+            forecast=to_data_points(category.forecast),
+            total=category.total,
+            forecast_total=category.forecast_total,
+        )
+        for category in categories or []
+    ]
+
+
+def parse_group_by(group_by: Optional[str]) -> bool:
+    """Valide le paramètre group_by et indique si le détail par catégorie est demandé."""
+    if group_by is None:
+        return False
+    if group_by != "category":
+        raise ValueError(f"Regroupement non supporté: {group_by}")
+    return True
+
 
 def get_db():
     """Dépendance pour obtenir la session de base de données."""
@@ -72,8 +179,15 @@ def get_db():
 @router.get("", response_model=ForecastDataResponse)
 def get_forecast(
     period: str = Query(..., description="Période de prévision (1m, 3m, 6m, 1y)"),
+    allow_stale: bool = Query(
+        False, description="Accepter une prévision précalculée périmée plutôt que recalculer"
+    ),
+    group_by: Optional[str] = Query(
+        None, description="Détail des prévisions par catégorie (category)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache),
 ):
     """Récupère les données de prévision pour une période donnée."""
 
@@ -86,6 +200,7 @@ def get_forecast(
 
         # Convertir la période string en enum
         period_enum = ForecastPeriod(period)
+        by_category = parse_group_by(group_by)
 
         # Initialiser les repositories
         expense_repository = SQLExpenseRepository(db)
@@ -93,41 +208,22 @@ def get_forecast(
         logger.info("✅ Repositories initialisés")
 
         # Exécuter le cas d'usage
-        use_case = GetForecast(expense_repository, income_repository)
+        use_case = GetForecast(
+            expense_repository,
+            income_repository,
+            SQLMonthlyRollupRepository(db),
+            forecast_cache,
+            create_forecast_engine(),
+            SQLForecastSnapshotRepository(db),
+            SQLUserDataVersionRepository(db),
+        )
 
-        forecast_data = use_case.execute(current_user.id, period_enum)
+        forecast_data = use_case.execute(current_user.id, period_enum, allow_stale, by_category)
+        if forecast_data.stale:
+            enqueue_precompute(current_user.id)
 
         # Convertir en réponse
-        response = ForecastDataResponse(
-            user_id=forecast_data.user_id,
-            period=forecast_data.period.value,
-            start_date=forecast_data.start_date,
-            end_date=forecast_data.end_date,
-            expenses_data=[
-                DataPointResponse(date=point.date, amount=point.amount, category=point.category)
-                for point in forecast_data.expenses_data
-            ],
-            income_data=[
-                DataPointResponse(date=point.date, amount=point.amount, category=point.category)
-                for point in forecast_data.income_data
-            ],
-            forecast_expenses=[
-                DataPointResponse(date=point.date, amount=point.amount, category=point.category)
-                for point in forecast_data.forecast_expenses
-            ],
-            forecast_income=[
-                DataPointResponse(date=point.date, amount=point.amount, category=point.category)
-                for point in forecast_data.forecast_income
-            ],
-            total_expenses=forecast_data.total_expenses,
-            total_income=forecast_data.total_income,
-            net_balance=forecast_data.net_balance,
-            forecast_total_expenses=forecast_data.forecast_total_expenses,
-            forecast_total_income=forecast_data.forecast_total_income,
-            forecast_net_balance=forecast_data.forecast_net_balance,
-            created_at=forecast_data.created_at,
-            updated_at=forecast_data.updated_at,
-        )
+        response = to_forecast_response(forecast_data, by_category)
 
         logger.info("✅ Réponse formatée avec succès")
         return response
@@ -143,3 +239,56 @@ def get_forecast(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erreur lors du calcul des prévisions: {str(e)}",
         ) from e
+
+
+@router.get("/all", response_model=ForecastBatchResponse)
+def get_all_forecasts(
+    periods: Optional[List[str]] = Query(
+        None, description="Périodes à calculer (toutes par défaut)"
+    ),
+    allow_stale: bool = Query(
+        False, description="Accepter des prévisions précalculées périmées plutôt que recalculer"
+    ),
+    group_by: Optional[str] = Query(
+        None, description="Détail des prévisions par catégorie (category)"
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache),
+):
+    """Récupère les prévisions de plusieurs périodes, calculées en une seule passe."""
+
+    try:
+        period_enums = [ForecastPeriod(period) for period in periods] if periods else None
+        by_category = parse_group_by(group_by)
+
+        use_case = GetAllForecasts(
+            SQLExpenseRepository(db),
+            SQLIncomeRepository(db),
+            SQLMonthlyRollupRepository(db),
+            forecast_cache,
+            create_forecast_engine(),
+            SQLForecastSnapshotRepository(db),
+            SQLUserDataVersionRepository(db),
+        )
+        forecasts = use_case.execute(current_user.id, period_enums, allow_stale, by_category)
+        if any(forecast_data.stale for forecast_data in forecasts.values()):
+            enqueue_precompute(current_user.id)
+
+        return ForecastBatchResponse(
+            user_id=current_user.id,
+            forecasts={
+                period.value: to_forecast_response(forecast_data, by_category)
+                for period, forecast_data in forecasts.items()
+            },
+        )
+
+    except ValueError as e:
+        logger.error("❌ Erreur de validation: %s", str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except Exception as e:
+        logger.error("❌ Erreur lors du calcul des prévisions: %s", str(e), exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erreur lors du calcul des prévisions: {str(e)}",
+        ) from e
@@ -1,10 +1,15 @@
 """Module contenant les routes de health check."""
 
 import logging
-from fastapi import APIRouter
+from dataclasses import asdict
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.infrastructure.cache.forecast_cache_factory import get_forecast_cache
 from app.infrastructure.db.database import engine
+from app.infrastructure.jobs.import_jobs import get_import_scheduler
+from app.infrastructure.jobs.scheduler import get_job_scheduler
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -32,3 +37,21 @@ def health_check():
             status_code=503,
             content={"status": "unhealthy", "message": "Service indisponible", "error": str(e)},
         )
+
+
+@health_router.get("/forecast-cache")
+def forecast_cache_stats(forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache)):
+    """Retourne les compteurs du cache des prévisions (hits, misses, évictions)."""
+    return asdict(forecast_cache.stats())
+
+
+@health_router.get("/jobs")
+def job_scheduler_stats():
+    """Retourne l'état de l'ordonnanceur des tâches de fond."""
+    return asdict(get_job_scheduler().stats())
+
+
+@health_router.get("/imports")
+def import_scheduler_stats():
+    """Retourne l'état du pool de workers des imports."""
+    return asdict(get_import_scheduler().stats())
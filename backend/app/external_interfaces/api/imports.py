@@ -1,20 +1,46 @@
 """Module contenant les routes pour l'import de transactions."""
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
+from typing import Optional
 
+from app.domain.entities.import_job import ImportJob
+from app.domain.entities.import_preview import ImportPreview, PreviewRowStatus
+from app.domain.entities.import_result import ImportResult
 from app.domain.entities.user import User
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.domain.interfaces.import_preview_cache_interface import ImportPreviewCacheInterface
+from app.infrastructure.cache.forecast_cache_factory import get_forecast_cache
+from app.infrastructure.cache.import_preview_cache import get_import_preview_cache
 from app.infrastructure.db.database import SessionLocal
-from app.infrastructure.repositories.expense_repository import SQLExpenseRepository
-from app.infrastructure.repositories.income_repository import SQLIncomeRepository
+from app.infrastructure.jobs.forecast_jobs import refresh_user_forecasts
+from app.infrastructure.jobs.import_jobs import build_import_csv, submit_import
+from app.infrastructure.repositories.import_job_repository import SQLImportJobRepository
 from app.infrastructure.security.dependencies import get_current_user
-from app.use_cases.imports.import_csv import ImportCSV
+from app.use_cases.imports.confirm_import import ConfirmImport
+from app.use_cases.imports.create_import_job import SUPPORTED_EXTENSIONS
+from app.use_cases.imports.get_import_job import GetImportJob
+from app.use_cases.imports.get_import_preview import GetImportPreview
+from app.use_cases.imports.preview_import import PreviewImport
 
 
 import_router = APIRouter(prefix="/imports", tags=["imports"])
 
 
+class ImportChunkResponse(BaseModel):
+    """Modèle de réponse pour le résultat d'un lot écrit."""
+
+    kind: str
+    index: int
+    size: int
+    created: int
+    skipped: int
+    error: Optional[str] = None
+
+
 class ImportResultResponse(BaseModel):
     """Modèle de réponse pour le résultat d'un import."""
 
@@ -24,6 +50,118 @@ class ImportResultResponse(BaseModel):
     errors: list[str]
     skipped: int
     success: bool
+    chunks: list[ImportChunkResponse] = []
+    resumed: int = 0
+
+
+class ImportJobResponse(BaseModel):
+    """Modèle de réponse pour l'état d'un import en arrière-plan."""
+
+    id: str
+    status: str
+    filename: str
+    rows_parsed: int
+    rows_inserted: int
+    expenses_created: int
+    incomes_created: int
+    skipped: int
+    error: Optional[str] = None
+    result: Optional[ImportResultResponse] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+class ImportPreviewRowResponse(BaseModel):
+    """Modèle de réponse pour une transaction de l'aperçu."""
+
+    index: int
+    date: datetime
+    description: str
+    amount: float
+    is_expense: bool
+    status: str
+    category: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ImportPreviewResponse(BaseModel):
+    """Modèle de réponse pour l'aperçu d'un import (une page de transactions)."""
+
+    token: str
+    filename: str
+    total_transactions: int
+    new_expenses: int
+    new_incomes: int
+    duplicates: int
+    errors: int
+    parse_errors: list[str]
+    page: int
+    page_size: int
+    total_rows: int
+    rows: list[ImportPreviewRowResponse]
+    created_at: datetime
+
+
+def to_import_preview_response(
+    preview: ImportPreview,
+    page: int,
+    page_size: int,
+    status_filter: Optional[PreviewRowStatus] = None,
+) -> ImportPreviewResponse:
+    """Convertit un aperçu en réponse paginée."""
+    rows, total_rows = preview.page(page, page_size, status_filter)
+    return ImportPreviewResponse(
+        token=preview.token,
+        filename=preview.filename,
+        total_transactions=preview.total_transactions,
+        new_expenses=len(preview.expenses),
+        new_incomes=len(preview.incomes),
+        duplicates=preview.count(PreviewRowStatus.DUPLICATE),
+        errors=preview.count(PreviewRowStatus.ERROR),
+        parse_errors=preview.errors,
+        page=page,
+        page_size=page_size,
+        total_rows=total_rows,
+        rows=[
+            ImportPreviewRowResponse(**{**vars(row), "status": row.status.value})
+            for row in rows
+        ],
+        created_at=preview.created_at,
+    )
+
+
+def to_import_result_response(result: ImportResult) -> ImportResultResponse:
+    """Convertit le résultat d'un import en réponse."""
+    return ImportResultResponse(
+        total_transactions=result.total_transactions,
+        expenses_created=result.expenses_created,
+        incomes_created=result.incomes_created,
+        errors=result.errors,
+        skipped=result.skipped,
+        success=result.success,
+        chunks=[ImportChunkResponse(**vars(chunk)) for chunk in result.chunks],
+        resumed=result.resumed,
+    )
+
+
+def to_import_job_response(job: ImportJob) -> ImportJobResponse:
+    """Convertit un import en arrière-plan en réponse."""
+    return ImportJobResponse(
+        id=job.id,
+        status=job.status.value,
+        filename=job.filename,
+        rows_parsed=job.rows_parsed,
+        rows_inserted=job.rows_inserted,
+        expenses_created=job.expenses_created,
+        incomes_created=job.incomes_created,
+        skipped=job.skipped,
+        error=job.error,
+        result=to_import_result_response(job.result) if job.result else None,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        finished_at=job.finished_at,
+    )
 
 
 # Dépendance d'injection de session DB
@@ -36,60 +174,129 @@ def get_db():
         db.close()
 
 
-@import_router.post("/csv", response_model=ImportResultResponse)
+@import_router.post(
+    "/csv", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED
+)
 async def import_csv(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Importe des transactions depuis un fichier CSV.
-
-    Le fichier CSV doit être au format d'export bancaire avec les colonnes:
-    - dateOp: date d'opération
-    - dateVal: date de valeur
-    - label: description
-    - category: catégorie
-    - amount: montant (négatif = dépense, positif = revenu)
+    Programme l'import de transactions depuis un relevé bancaire.
+
+    Le fichier est enregistré puis importé en arrière-plan : la réponse contient
+    l'id de l'import, dont l'avancement est consultable via `GET /imports/jobs/{id}`.
+
+    Le format est détecté à partir du contenu :
+    - CSV d'export bancaire avec les colonnes dateOp, dateVal, label, category, amount
+      (montant négatif = dépense, positif = revenu)
+    - CSV des banques françaises (Date/Libellé/Débit/Crédit ou Montant, préambule accepté)
+    - OFX/QFX, QIF et CAMT.053 (XML ISO 20022)
     """
     # Vérifier le type de fichier
-    if not file.filename.endswith('.csv'):
+    if not file.filename.lower().endswith(SUPPORTED_EXTENSIONS):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Le fichier doit être au format CSV",
+            detail="Format de fichier non supporté. Formats acceptés: CSV, OFX/QFX, QIF, CAMT.053",
         )
 
     try:
-        # Lire le contenu du fichier
-        content = await file.read()
-        file_content = content.decode('utf-8')
-
-        # Créer le use case avec les repositories
-        use_case = ImportCSV(
-            expense_repo=SQLExpenseRepository(db),
-            income_repo=SQLIncomeRepository(db),
-        )
-
-        # Exécuter l'import
-        result = use_case.execute(current_user.id, file_content)
-
-        # Convertir le résultat en réponse
-        return ImportResultResponse(
-            total_transactions=result.total_transactions,
-            expenses_created=result.expenses_created,
-            incomes_created=result.incomes_created,
-            errors=result.errors,
-            skipped=result.skipped,
-            success=result.success,
+        # Copie du fichier et écritures en base hors de la boucle d'événements
+        await file.seek(0)
+        job = await run_in_threadpool(
+            submit_import, db, current_user.id, file.filename, file.file
         )
+        return to_import_job_response(job)
 
-    except UnicodeDecodeError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Erreur de décodage du fichier. Assurez-vous qu'il est en UTF-8.",
-        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erreur lors de l'import: {str(e)}",
         )
+
+
+@import_router.get("/jobs/{job_id}", response_model=ImportJobResponse)
+def get_import_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Retourne l'état, l'avancement et le résultat d'un import."""
+    try:
+        job = GetImportJob(SQLImportJobRepository(db)).execute(job_id, current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    return to_import_job_response(job)
+
+
+@import_router.post("/preview", response_model=ImportPreviewResponse)
+async def preview_import(
+    file: UploadFile = File(...),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    status_filter: Optional[PreviewRowStatus] = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    preview_cache: ImportPreviewCacheInterface = Depends(get_import_preview_cache),
+):
+    """
+    Simule l'import d'un relevé sans rien écrire.
+
+    Retourne les transactions nouvelles, les doublons et les erreurs (paginés) et un
+    jeton : `POST /imports/preview/{token}/confirm` écrit les transactions nouvelles
+    sans relire le fichier.
+    """
+    try:
+        await file.seek(0)
+        use_case = PreviewImport(build_import_csv(db), preview_cache)
+        preview = await run_in_threadpool(
+            use_case.execute, current_user.id, file.filename, file.file
+        )
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Erreur de décodage du fichier. Encodages supportés: "
+            "UTF-8, UTF-16 et Windows-1252.",
+        ) from e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    return to_import_preview_response(preview, page, page_size, status_filter)
+
+
+@import_router.get("/preview/{token}", response_model=ImportPreviewResponse)
+def get_import_preview(
+    token: str,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    status_filter: Optional[PreviewRowStatus] = Query(None, alias="status"),
+    current_user: User = Depends(get_current_user),
+    preview_cache: ImportPreviewCacheInterface = Depends(get_import_preview_cache),
+):
+    """Retourne une page de l'aperçu d'un import."""
+    try:
+        preview = GetImportPreview(preview_cache).execute(token, current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    return to_import_preview_response(preview, page, page_size, status_filter)
+
+
+@import_router.post("/preview/{token}/confirm", response_model=ImportResultResponse)
+def confirm_import(
+    token: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    preview_cache: ImportPreviewCacheInterface = Depends(get_import_preview_cache),
+    forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache),
+):
+    """Écrit les transactions nouvelles d'un aperçu (le jeton n'est utilisable qu'une fois)."""
+    try:
+        result = ConfirmImport(build_import_csv(db), preview_cache).execute(
+            token, current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    refresh_user_forecasts(db, forecast_cache, current_user.id)
+    return to_import_result_response(result)
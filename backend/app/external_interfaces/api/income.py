@@ -3,15 +3,25 @@
 import uuid
 from datetime import date, datetime, UTC
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.domain.entities.income import Income, IncomeCategory, IncomeFrequency
+from app.domain.entities.transaction_query import TransactionQuery
 from app.domain.entities.user import User
+from app.domain.interfaces.category_index_cache_interface import CategoryIndexCacheInterface
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.external_interfaces.api.transaction_params import send_page, transaction_query
+from app.infrastructure.cache.category_index_cache import get_category_index_cache
+from app.infrastructure.cache.forecast_cache_factory import get_forecast_cache
 from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.jobs.forecast_jobs import refresh_user_forecasts
+from app.infrastructure.repositories.category_rule_repository import SQLCategoryRuleRepository
 from app.infrastructure.repositories.income_repository import SQLIncomeRepository
+from app.infrastructure.repositories.monthly_rollup_repository import SQLMonthlyRollupRepository
 from app.infrastructure.security.dependencies import get_current_user
+from app.use_cases.categories.learn_category import LearnCategory
 from app.use_cases.income.create_income import CreateIncome
 from app.use_cases.income.delete_income import DeleteIncome
 from app.use_cases.income.get_income import GetIncome
@@ -99,10 +109,11 @@ def create_income(
     request: IncomeCreateRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache),
 ):
     """Crée un nouveau revenu."""
     income_repository = SQLIncomeRepository(db)
-    create_income_use_case = CreateIncome(income_repository)
+    create_income_use_case = CreateIncome(income_repository, SQLMonthlyRollupRepository(db))
 
     try:
         income_data = request.model_dump()
@@ -112,6 +123,7 @@ def create_income(
         income_data["updated_at"] = datetime.now(UTC)
         income_obj = Income(**income_data)
         new_income = create_income_use_case.execute(income_obj)
+        refresh_user_forecasts(db, forecast_cache, current_user.id)
         return new_income
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -119,15 +131,23 @@ def create_income(
 
 @router.get("", response_model=List[Income])
 def list_incomes(
+    response: Response,
+    query: TransactionQuery = Depends(transaction_query),
+    category: Optional[List[IncomeCategory]] = Query(None),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Liste tous les revenus de l'utilisateur."""
+    """Liste les revenus filtrés et triés, par pages (100 si `limit` est absent).
+
+    Le curseur de la page suivante est renvoyé dans l'en-tête X-Next-Cursor.
+    """
 
     try:
+        query.categories = category or []
         income_repository = SQLIncomeRepository(db)
         use_case = ListIncomes(income_repository)
-        return use_case.execute(current_user.id)
+        return send_page(response, use_case.execute_page(current_user.id, query, cursor))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
@@ -154,10 +174,16 @@ def update_income(
     request: IncomeUpdateRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache),
+    category_index_cache: CategoryIndexCacheInterface = Depends(get_category_index_cache),
 ):
-    """Met à jour un revenu."""
+    """Met à jour un revenu (un changement de catégorie est appris pour les imports)."""
     income_repository = SQLIncomeRepository(db)
-    use_case = UpdateIncome(income_repository)
+    use_case = UpdateIncome(
+        income_repository,
+        SQLMonthlyRollupRepository(db),
+        LearnCategory(SQLCategoryRuleRepository(db), category_index_cache),
+    )
 
     try:
         # Récupérer le revenu existant
@@ -172,7 +198,9 @@ def update_income(
         income_data["updated_at"] = datetime.now(UTC)
 
         income_obj = Income(**income_data)
-        return use_case.execute(income_obj, current_user.id)
+        updated_income = use_case.execute(income_obj, current_user.id)
+        refresh_user_forecasts(db, forecast_cache, current_user.id)
+        return updated_income
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
@@ -182,13 +210,15 @@ def delete_income(
     income_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    forecast_cache: ForecastCacheInterface = Depends(get_forecast_cache),
 ):
     """Supprime un revenu."""
 
     try:
         income_repository = SQLIncomeRepository(db)
-        use_case = DeleteIncome(income_repository)
+        use_case = DeleteIncome(income_repository, SQLMonthlyRollupRepository(db))
         use_case.execute(income_id, current_user.id)
+        refresh_user_forecasts(db, forecast_cache, current_user.id)
         return {"message": "Revenu supprimé avec succès"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -0,0 +1,90 @@
+"""Module contenant les routes des statistiques."""
+
+from datetime import date, datetime, time
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from app.domain.entities.transaction_stats import StatsGranularity, StatsQuery, TransactionStats
+from app.domain.entities.user import User
+from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.repositories.transaction_stats_repository import (
+    SQLTransactionStatsRepository,
+)
+from app.infrastructure.repositories.user_data_version_repository import (
+    SQLUserDataVersionRepository,
+)
+from app.infrastructure.security.dependencies import get_current_user
+from app.use_cases.stats.get_stats import GetStats
+
+# Nombre de mois couverts par défaut, mois courant compris
+DEFAULT_STATS_MONTHS = 12
+
+stats_router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+# Dépendance d'injection de session DB
+def get_db():
+    """Dépendance d'injection de session DB."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def stats_query(
+    start_date: Optional[date] = Query(
+        None, description="Date de début (incluse, défaut : début du mois il y a 11 mois)"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="Date de fin (incluse, défaut : aujourd'hui)"
+    ),
+    granularity: StatsGranularity = StatsGranularity.MONTH,
+) -> StatsQuery:
+    """Dépendance : intervalle et pas des statistiques."""
+    end_date = end_date or date.today()
+    if start_date is None:
+        months = end_date.year * 12 + end_date.month - DEFAULT_STATS_MONTHS
+        start_date = date(months // 12, months % 12 + 1, 1)
+    return StatsQuery(
+        start_date=datetime.combine(start_date, time.min),
+        end_date=datetime.combine(end_date, time.max),
+        granularity=granularity,
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Indique si l'en-tête If-None-Match désigne l'ETag (comparaison faible)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+@stats_router.get("", response_model=TransactionStats)
+def get_stats(
+    response: Response,
+    query: StatsQuery = Depends(stats_query),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Totaux, catégories et évolution par période des dépenses et revenus.
+
+    La réponse porte un ETag dérivé de la version des données de l'utilisateur : tant
+    qu'aucune dépense ni aucun revenu n'est écrit, If-None-Match renvoie 304 sans calcul.
+    """
+
+    try:
+        use_case = GetStats(SQLTransactionStatsRepository(db), SQLUserDataVersionRepository(db))
+        etag = use_case.etag(current_user.id, query)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        stats = use_case.execute(current_user.id, query)
+        response.headers.update(headers)
+        return stats
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -0,0 +1,74 @@
+"""Paramètres communs des listes paginées de transactions."""
+
+from datetime import date, datetime, time
+from typing import Callable, Optional
+from fastapi import HTTPException, Query, Response, status
+
+from app.domain.entities.transaction_query import (
+    TransactionPage,
+    TransactionQuery,
+    TransactionSort,
+)
+
+# En-tête portant le curseur de la page suivante (absent sur la dernière page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
+# Taille de page des listes lorsque `limit` n'est pas précisé
+DEFAULT_PAGE_SIZE = 100
+
+
+def make_transaction_query(
+    default_limit: Optional[int] = None,
+) -> Callable[..., TransactionQuery]:
+    """Construit la dépendance des filtres, avec une taille de page par défaut."""
+    limit_description = (
+        f"Taille de page ({default_limit} par défaut)"
+        if default_limit
+        else "Taille de page (sans limite par défaut)"
+    )
+
+    def transaction_query(
+        start_date: Optional[date] = Query(None, description="Date de début (incluse)"),
+        end_date: Optional[date] = Query(None, description="Date de fin (incluse)"),
+        is_recurring: Optional[bool] = None,
+        min_amount: Optional[float] = Query(None, ge=0),
+        max_amount: Optional[float] = Query(None, ge=0),
+        q: Optional[str] = Query(
+            None, min_length=1, max_length=100, description="Texte recherché"
+        ),
+        sort: TransactionSort = TransactionSort.DATE_DESC,
+        limit: Optional[int] = Query(
+            default_limit, ge=1, le=MAX_PAGE_SIZE, description=limit_description
+        ),
+    ) -> TransactionQuery:
+        """Dépendance : filtres, tri et taille de page d'une liste de transactions."""
+        if start_date and end_date and start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="La date de début doit précéder la date de fin",
+            )
+        return TransactionQuery(
+            start_date=datetime.combine(start_date, time.min) if start_date else None,
+            end_date=datetime.combine(end_date, time.max) if end_date else None,
+            is_recurring=is_recurring,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            search=q,
+            sort=sort,
+            limit=limit,
+        )
+
+    return transaction_query
+
+
+# Listes des dépenses, des revenus et fil unifié : toujours paginés
+transaction_query = make_transaction_query(DEFAULT_PAGE_SIZE)
+# Export : tout le fil filtré, sans limite si `limit` est absent
+export_query = make_transaction_query()
+
+
+def send_page(response: Response, page: TransactionPage) -> list:
+    """Retourne les éléments de la page et expose le curseur suivant dans l'en-tête."""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
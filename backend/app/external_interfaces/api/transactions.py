@@ -0,0 +1,195 @@
+"""Module contenant les routes du fil unifié des transactions."""
+
+from datetime import datetime
+from typing import Iterator, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.domain.entities.expense import ExpenseCategory
+from app.domain.entities.income import IncomeCategory
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction_export import ExportFormat
+from app.domain.entities.transaction_query import TransactionQuery
+from app.domain.entities.transaction_search import TransactionSearchHit
+from app.domain.entities.user import User
+from app.external_interfaces.api.transaction_params import (
+    export_query,
+    send_page,
+    transaction_query,
+)
+from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.exporters.base import TransactionExporter, gzip_chunks
+from app.infrastructure.exporters.registry import get_exporter
+from app.infrastructure.repositories.transaction_repository import SQLTransactionRepository
+from app.infrastructure.security.dependencies import get_current_user
+from app.use_cases.transactions.export_transactions import ExportTransactions
+from app.use_cases.transactions.list_transactions import ListTransactions
+from app.use_cases.transactions.search_transactions import SearchTransactions
+
+
+transaction_router = APIRouter(prefix="/transactions", tags=["transactions"])
+
+# Catégorie d'une dépense ou d'un revenu (toute autre valeur est refusée en 422)
+TransactionCategory = ExpenseCategory | IncomeCategory
+
+
+class TransactionResponse(BaseModel):
+    """Modèle de réponse pour une dépense ou un revenu du fil unifié."""
+
+    id: str
+    user_id: str
+    type: str
+    name: str
+    amount: float
+    date: datetime
+    category: Optional[str] = None
+    description: Optional[str] = None
+    is_recurring: bool
+    frequency: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class TransactionSearchResponse(TransactionResponse):
+    """Modèle de réponse pour un résultat de recherche."""
+
+    score: float
+
+
+def to_transaction_response(transaction: Transaction) -> TransactionResponse:
+    """Convertit une transaction en réponse (`type` : 'expense' ou 'income')."""
+    values = {k: v for k, v in vars(transaction).items() if k != "kind"}
+    return TransactionResponse(**values, type=transaction.kind.value)
+
+
+def to_search_response(hit: TransactionSearchHit) -> TransactionSearchResponse:
+    """Convertit un résultat de recherche en réponse."""
+    values = to_transaction_response(hit.transaction).model_dump()
+    return TransactionSearchResponse(**values, score=hit.score)
+
+
+def category_values(categories: Optional[list[TransactionCategory]]) -> list[str]:
+    """Valeurs des catégories filtrées (chaque branche du fil garde celles de son type)."""
+    return [category.value for category in categories or []]
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Indique si le client accepte une réponse gzip (q=0 la refuse)."""
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+def export_chunks(
+    user_id: str,
+    query: TransactionQuery,
+    kind: Optional[RollupKind],
+    exporter: TransactionExporter,
+) -> Iterator[bytes]:
+    """Produit le fichier d'export au fil de la lecture, dans sa propre session.
+
+    Les dépendances à yield (get_db) sont fermées avant l'envoi d'une réponse en flux.
+    """
+    db = SessionLocal()
+    try:
+        batches = ExportTransactions(SQLTransactionRepository(db)).execute(user_id, query, kind)
+        yield from exporter.write(batches)
+    finally:
+        db.close()
+
+
+# Dépendance d'injection de session DB
+def get_db():
+    """Dépendance d'injection de session DB."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@transaction_router.get("", response_model=list[TransactionResponse])
+def list_transactions(
+    response: Response,
+    query: TransactionQuery = Depends(transaction_query),
+    type: Optional[RollupKind] = Query(None, description="expense ou income (défaut : les deux)"),
+    category: Optional[list[TransactionCategory]] = Query(None),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Liste les dépenses et revenus en un seul fil trié, par pages de `limit` (100 par défaut).
+
+    Le curseur de la page suivante est renvoyé dans l'en-tête X-Next-Cursor.
+    """
+
+    try:
+        query.categories = category_values(category)
+        use_case = ListTransactions(SQLTransactionRepository(db))
+        page = use_case.execute(current_user.id, query, cursor, type)
+        return [to_transaction_response(t) for t in send_page(response, page)]
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+@transaction_router.get("/search", response_model=list[TransactionSearchResponse])
+def search_transactions(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=100, description="Texte recherché"),
+    type: Optional[RollupKind] = Query(None, description="expense ou income (défaut : les deux)"),
+    limit: int = Query(20, ge=1, le=100, description="Taille de page"),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Recherche dans les libellés et descriptions, résultats par pertinence décroissante.
+
+    Chaque mot doit commencer un mot de la transaction ; sous PostgreSQL, les libellés
+    proches (fautes de frappe) sont aussi trouvés. Le curseur de la page suivante est
+    renvoyé dans l'en-tête X-Next-Cursor.
+    """
+
+    try:
+        use_case = SearchTransactions(SQLTransactionRepository(db))
+        page = use_case.execute(current_user.id, q, limit, cursor, type)
+        return [to_search_response(hit) for hit in send_page(response, page)]
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+@transaction_router.get("/export")
+def export_transactions(
+    query: TransactionQuery = Depends(export_query),
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv, ndjson, arrow ou parquet"),
+    type: Optional[RollupKind] = Query(None, description="expense ou income (défaut : les deux)"),
+    category: Optional[list[TransactionCategory]] = Query(None),
+    accept_encoding: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+):
+    """Exporte toutes les transactions filtrées et triées, en flux.
+
+    Les lignes sont lues par lots depuis un curseur côté serveur et écrites au fur et à
+    mesure (mémoire constante) ; `limit` et `cursor` sont ignorés. Sauf en Parquet, déjà
+    compressé, la réponse est compressée en gzip si le client l'accepte.
+    """
+
+    try:
+        exporter = get_exporter(format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    query.categories = category_values(category)
+    body = export_chunks(current_user.id, query, type, exporter)
+    headers = {
+        "Content-Disposition": f'attachment; filename="transactions.{exporter.extension}"',
+        "Vary": "Accept-Encoding",
+    }
+    if exporter.compressible and accepts_gzip(accept_encoding):
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=exporter.media_type, headers=headers)
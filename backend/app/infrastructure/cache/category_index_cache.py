@@ -0,0 +1,74 @@
+"""Cache des index de catégories apprises en mémoire du processus (TTL + LRU)."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from app.domain.interfaces.category_index_cache_interface import CategoryIndexCacheInterface
+from app.domain.services.category_index import CategoryIndex
+
+_category_index_cache: Optional[CategoryIndexCacheInterface] = None
+
+
+class InMemoryCategoryIndexCache(CategoryIndexCacheInterface):
+    """Cache LRU borné des index par utilisateur, expirés après `ttl_seconds`.
+
+    Le TTL borne le délai de prise en compte des corrections faites par un autre
+    processus ; celles du processus courant sont appliquées directement à l'index.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries doit être strictement positif")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds doit être strictement positif")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, CategoryIndex]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[CategoryIndex]:
+        """Retourne l'index en cache, ou None si absent ou expiré."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, index = entry
+            if expires_at <= self._clock():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return index
+
+    def set(self, user_id: str, index: CategoryIndex) -> None:
+        """Met en cache un index, en évinçant le moins récemment utilisé si plein."""
+        with self._lock:
+            self._entries[user_id] = (self._clock() + self.ttl_seconds, index)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Retire l'index d'un utilisateur du cache."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+def get_category_index_cache() -> CategoryIndexCacheInterface:
+    """Dépendance retournant le cache des index de catégories partagé par le processus."""
+    global _category_index_cache
+    if _category_index_cache is None:
+        _category_index_cache = InMemoryCategoryIndexCache(
+            max_entries=int(os.getenv("CATEGORY_INDEX_CACHE_MAX_USERS", "256")),
+            ttl_seconds=int(os.getenv("CATEGORY_INDEX_CACHE_TTL_SECONDS", "300")),
+        )
+    return _category_index_cache
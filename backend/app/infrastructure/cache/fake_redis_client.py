@@ -0,0 +1,85 @@
+"""Client Redis factice en mémoire, pour le développement local et les tests."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+class FakeRedisClient:
+    """
+    Sous-ensemble de l'API redis-py (get, mget, set, incr, delete, info, flushdb).
+
+    Reproduit l'expiration des clés et la politique `allkeys-lru` lorsque
+    `max_keys` est atteint. Les valeurs sont retournées en bytes, comme redis-py.
+    """
+
+    def __init__(
+        self, max_keys: Optional[int] = None, clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._data: OrderedDict[str, tuple[Optional[float], bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._evicted_keys = 0
+        self._expired_keys = 0
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode("utf-8")
+
+    def _read(self, name: str) -> Optional[bytes]:
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[name]
+            self._expired_keys += 1
+            return None
+        self._data.move_to_end(name)
+        return value
+
+    def _write(self, name: str, value: bytes, expires_at: Optional[float]) -> None:
+        self._data[name] = (expires_at, value)
+        self._data.move_to_end(name)
+        while self.max_keys is not None and len(self._data) > self.max_keys:
+            self._data.popitem(last=False)
+            self._evicted_keys += 1
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            return self._read(name)
+
+    def mget(self, keys: list[str]) -> list[Optional[bytes]]:
+        with self._lock:
+            return [self._read(key) for key in keys]
+
+    def set(self, name: str, value: Any, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            expires_at = self._clock() + ex if ex is not None else None
+            self._write(name, self._encode(value), expires_at)
+            return True
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            current = self._read(name)
+            expires_at = self._data[name][0] if current is not None else None
+            value = int(current or 0) + amount
+            self._write(name, self._encode(value), expires_at)
+            return value
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(1 for name in names if self._data.pop(name, None) is not None)
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            self._data.clear()
+            return True
+
+    def info(self, section: Optional[str] = None) -> dict:
+        with self._lock:
+            return {"evicted_keys": self._evicted_keys, "expired_keys": self._expired_keys}
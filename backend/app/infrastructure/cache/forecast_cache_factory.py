@@ -0,0 +1,56 @@
+"""Factory pour créer le cache des prévisions selon la configuration."""
+
+import os
+from typing import Optional
+
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.infrastructure.cache.fake_redis_client import FakeRedisClient
+from app.infrastructure.cache.in_memory_forecast_cache import InMemoryForecastCache
+from app.infrastructure.cache.redis_forecast_cache import RedisForecastCache
+
+_forecast_cache: Optional[ForecastCacheInterface] = None
+
+
+def create_forecast_cache() -> ForecastCacheInterface:
+    """
+    Crée le cache des prévisions selon FORECAST_CACHE_BACKEND.
+
+    memory (défaut): cache LRU en mémoire du processus
+    redis: cache partagé via REDIS_URL (nécessite le paquet redis)
+    fake-redis: RedisForecastCache adossé à un client Redis factice en mémoire
+
+    Returns:
+        ForecastCacheInterface: Le cache à utiliser
+
+    Raises:
+        ValueError: Si le backend est inconnu ou si Redis n'est pas configuré
+    """
+    backend = os.getenv("FORECAST_CACHE_BACKEND", "memory")
+    ttl_seconds = int(os.getenv("FORECAST_CACHE_TTL_SECONDS", "300"))
+    max_entries = int(os.getenv("FORECAST_CACHE_MAX_ENTRIES", "1024"))
+
+    if backend == "memory":
+        return InMemoryForecastCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    if backend == "fake-redis":
+        return RedisForecastCache(FakeRedisClient(max_keys=max_entries), ttl_seconds=ttl_seconds)
+
+    if backend == "redis":
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            raise ValueError("La variable d'environnement REDIS_URL est requise pour Redis")
+        try:
+            import redis
+        except ImportError as e:
+            raise ValueError("Le paquet redis est requis pour FORECAST_CACHE_BACKEND=redis") from e
+        return RedisForecastCache(redis.Redis.from_url(redis_url), ttl_seconds=ttl_seconds)
+
+    raise ValueError(f"Backend de cache des prévisions inconnu: {backend}")
+
+
+def get_forecast_cache() -> ForecastCacheInterface:
+    """Dépendance retournant le cache des prévisions partagé par le processus."""
+    global _forecast_cache
+    if _forecast_cache is None:
+        _forecast_cache = create_forecast_cache()
+    return _forecast_cache
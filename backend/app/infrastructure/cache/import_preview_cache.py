@@ -0,0 +1,77 @@
+"""Cache des aperçus d'import en mémoire du processus (TTL + LRU)."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from app.domain.entities.import_preview import ImportPreview
+from app.domain.interfaces.import_preview_cache_interface import ImportPreviewCacheInterface
+
+_import_preview_cache: Optional[ImportPreviewCacheInterface] = None
+
+
+class InMemoryImportPreviewCache(ImportPreviewCacheInterface):
+    """Cache LRU borné des aperçus, expirés après `ttl_seconds`.
+
+    Un aperçu contient toutes les transactions préparées du fichier : le nombre
+    d'entrées est volontairement faible.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        ttl_seconds: float = 900,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries doit être strictement positif")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds doit être strictement positif")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, ImportPreview]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[ImportPreview]:
+        """Retourne l'aperçu en cache, ou None si absent ou expiré."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            expires_at, preview = entry
+            if expires_at <= self._clock():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return preview
+
+    def set(self, preview: ImportPreview) -> None:
+        """Met en cache un aperçu, en évinçant le moins récemment utilisé si plein."""
+        with self._lock:
+            self._entries[preview.token] = (self._clock() + self.ttl_seconds, preview)
+            self._entries.move_to_end(preview.token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, token: str) -> Optional[ImportPreview]:
+        """Retire et retourne l'aperçu, ou None si absent ou expiré."""
+        with self._lock:
+            entry = self._entries.pop(token, None)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return entry[1]
+
+
+def get_import_preview_cache() -> ImportPreviewCacheInterface:
+    """Dépendance retournant le cache des aperçus d'import partagé par le processus."""
+    global _import_preview_cache
+    if _import_preview_cache is None:
+        _import_preview_cache = InMemoryImportPreviewCache(
+            max_entries=int(os.getenv("IMPORT_PREVIEW_MAX_ENTRIES", "32")),
+            ttl_seconds=int(os.getenv("IMPORT_PREVIEW_TTL_SECONDS", "900")),
+        )
+    return _import_preview_cache
@@ -0,0 +1,92 @@
+"""Cache des prévisions en mémoire du processus (TTL + LRU)."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from app.domain.entities.forecast import ForecastCacheStats, ForecastData, ForecastPeriod
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryForecastCache(ForecastCacheInterface):
+    """Cache LRU borné, dont les entrées expirent après `ttl_seconds`."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries doit être strictement positif")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds doit être strictement positif")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, ForecastData]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = ForecastCacheStats()
+
+    def get(self, user_id: str, period: ForecastPeriod) -> Optional[ForecastData]:
+        """Retourne la prévision en cache, ou None si absente ou expirée."""
+        key = (user_id, period.value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                logger.debug("Cache prévisions MISS %s", key)
+                return None
+
+            expires_at, forecast = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                logger.debug("Cache prévisions MISS (expirée) %s", key)
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            logger.debug("Cache prévisions HIT %s", key)
+            return forecast
+
+    def set(self, forecast: ForecastData) -> None:
+        """Met en cache une prévision, en évinçant la moins récemment utilisée si plein."""
+        key = (forecast.user_id, forecast.period.value)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, forecast)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._stats.evictions += 1
+                logger.debug("Cache prévisions EVICT %s", evicted_key)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Invalide les prévisions de toutes les périodes d'un utilisateur."""
+        with self._lock:
+            for period in ForecastPeriod:
+                self._entries.pop((user_id, period.value), None)
+            self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Vide entièrement le cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> ForecastCacheStats:
+        """Retourne une copie des compteurs du cache."""
+        with self._lock:
+            return ForecastCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                invalidations=self._stats.invalidations,
+                entries=len(self._entries),
+            )
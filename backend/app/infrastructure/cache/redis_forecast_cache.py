@@ -0,0 +1,90 @@
+"""Cache des prévisions partagé, adossé à un client compatible Redis."""
+
+import logging
+import threading
+from typing import Any, Optional
+
+from app.domain.entities.forecast import ForecastCacheStats, ForecastData, ForecastPeriod
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.infrastructure.forecasting.forecast_serializer import (
+    deserialize_forecast,
+    serialize_forecast,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RedisForecastCache(ForecastCacheInterface):
+    """
+    Cache des prévisions stocké dans Redis.
+
+    L'expiration est portée par le TTL des clés et l'éviction LRU par la politique
+    `maxmemory-policy allkeys-lru` du serveur. L'invalidation d'un utilisateur
+    incrémente sa version : les anciennes clés ne sont plus lues et expirent d'elles-mêmes.
+    """
+
+    def __init__(self, client: Any, ttl_seconds: int = 300, prefix: str = "forecast"):
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds doit être strictement positif")
+
+        self.client = client
+        self.ttl_seconds = int(ttl_seconds)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._stats = ForecastCacheStats()
+
+    def _generation_key(self) -> str:
+        return f"{self.prefix}:generation"
+
+    def _version_key(self, user_id: str) -> str:
+        return f"{self.prefix}:{user_id}:version"
+
+    def _entry_key(self, user_id: str, period: ForecastPeriod) -> str:
+        generation, version = self.client.mget(
+            [self._generation_key(), self._version_key(user_id)]
+        )
+        return (
+            f"{self.prefix}:{user_id}:{int(generation or 0)}:{int(version or 0)}:{period.value}"
+        )
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self._stats, field, getattr(self._stats, field) + 1)
+
+    def get(self, user_id: str, period: ForecastPeriod) -> Optional[ForecastData]:
+        """Retourne la prévision en cache, ou None si absente ou expirée."""
+        raw = self.client.get(self._entry_key(user_id, period))
+        if raw is None:
+            self._count("misses")
+            logger.debug("Cache prévisions MISS (%s, %s)", user_id, period.value)
+            return None
+
+        self._count("hits")
+        logger.debug("Cache prévisions HIT (%s, %s)", user_id, period.value)
+        return deserialize_forecast(raw)
+
+    def set(self, forecast: ForecastData) -> None:
+        """Met en cache une prévision avec le TTL configuré."""
+        key = self._entry_key(forecast.user_id, forecast.period)
+        self.client.set(key, serialize_forecast(forecast), ex=self.ttl_seconds)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Invalide les prévisions d'un utilisateur en incrémentant sa version."""
+        self.client.incr(self._version_key(user_id))
+        self._count("invalidations")
+
+    def clear(self) -> None:
+        """Invalide toutes les prévisions en incrémentant la génération globale."""
+        self.client.incr(self._generation_key())
+
+    def stats(self) -> ForecastCacheStats:
+        """Retourne les compteurs locaux et ceux d'éviction/expiration du serveur."""
+        server_stats = self.client.info("stats")
+        with self._lock:
+            return ForecastCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=int(server_stats.get("evicted_keys", 0)),
+                expirations=int(server_stats.get("expired_keys", 0)),
+                invalidations=self._stats.invalidations,
+            )
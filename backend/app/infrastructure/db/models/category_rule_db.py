@@ -0,0 +1,25 @@
+"""Modèle de données pour les catégories apprises."""
+
+from datetime import datetime, UTC
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from app.infrastructure.db.database import Base
+
+
+class CategoryRuleDB(Base):
+    """Modèle de données pour les catégories apprises des corrections utilisateur."""
+
+    __tablename__ = "category_rules"
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    kind = Column(String, primary_key=True)
+    key = Column(String, primary_key=True)
+    category = Column(String, nullable=False)
+    hits = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+
+    def __repr__(self) -> str:
+        """Représentation de la règle."""
+        return (
+            f"CategoryRule(user_id={self.user_id}, kind={self.kind}, key={self.key}, "
+            f"category={self.category})"
+        )
@@ -1,7 +1,7 @@
 """Module contenant les modèles liés aux dépenses."""
 
 from datetime import datetime, UTC
-from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Boolean, Index, Enum as SQLEnum
 from app.infrastructure.db.database import Base
 from app.domain.entities.expense import ExpenseCategory, ExpenseFrequency
 
@@ -10,6 +10,15 @@ class ExpenseDB(Base):
     """Représente une dépense dans la base de données."""
 
     __tablename__ = "expenses"
+    # Recherche : index GIN plein texte et trigrammes propres à PostgreSQL, créés par la
+    # migration b5f2c8e1d4a3 (hors métadonnées, absents des bases SQLite de test)
+    __table_args__ = (
+        # Listes paginées par keyset sur (date, id) et (montant, id)
+        Index("ix_expenses_user_id_date_id", "user_id", "date", "id"),
+        Index("ix_expenses_user_id_amount_id", "user_id", "amount", "id"),
+        # Empreinte des transactions importées (NULL pour les saisies manuelles)
+        Index("ux_expenses_user_id_fingerprint", "user_id", "fingerprint", unique=True),
+    )
 
     id = Column(String, primary_key=True, index=True)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -20,6 +29,7 @@ class ExpenseDB(Base):
     description = Column(String)
     is_recurring = Column(Boolean, default=False)
     frequency = Column(SQLEnum(ExpenseFrequency))
+    fingerprint = Column(String(64))
     created_at = Column(DateTime, default=lambda: datetime.now(UTC))
     updated_at = Column(DateTime, default=lambda: datetime.now(UTC))
 
@@ -0,0 +1,24 @@
+"""Modèle de données pour les prévisions précalculées."""
+
+from datetime import datetime, UTC
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from app.infrastructure.db.database import Base
+
+
+class ForecastSnapshotDB(Base):
+    """Modèle de données pour les prévisions précalculées par les tâches de fond."""
+
+    __tablename__ = "forecast_snapshots"
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    period = Column(String(3), primary_key=True)
+    payload = Column(Text, nullable=False)
+    data_version = Column(Integer, nullable=False, default=0)
+    computed_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+
+    def __repr__(self) -> str:
+        """Représentation de la prévision précalculée."""
+        return (
+            f"ForecastSnapshot(user_id={self.user_id}, period={self.period}, "
+            f"data_version={self.data_version})"
+        )
@@ -0,0 +1,47 @@
+"""Modèle de données pour les imports en arrière-plan."""
+
+from datetime import datetime, UTC
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Index, text
+from app.infrastructure.db.database import Base
+
+
+class ImportJobDB(Base):
+    """Modèle de données pour l'état et l'avancement d'un import CSV."""
+
+    __tablename__ = "import_jobs"
+    __table_args__ = (
+        # Envois d'un fichier identique (court-circuit et reprise)
+        Index("ix_import_jobs_user_id_content_hash", "user_id", "content_hash"),
+        # Un seul import actif par fichier : deux envois simultanés ne créent qu'un import
+        Index(
+            "ux_import_jobs_active_content_hash",
+            "user_id",
+            "content_hash",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+            sqlite_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
+    id = Column(String, primary_key=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    filename = Column(String, nullable=False)
+    file_path = Column(String, nullable=False)
+    content_hash = Column(String(64))
+    status = Column(String(16), nullable=False, default="pending", index=True)
+    rows_parsed = Column(Integer, nullable=False, default=0)
+    expenses_created = Column(Integer, nullable=False, default=0)
+    incomes_created = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+    result = Column(Text)
+    error = Column(Text)
+    created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    finished_at = Column(DateTime)
+    # Worker qui exécute l'import et dernier renouvellement de son bail
+    owner = Column(String)
+    heartbeat_at = Column(DateTime)
+
+    def __repr__(self) -> str:
+        """Représentation de l'import."""
+        return f"ImportJob(id={self.id}, user_id={self.user_id}, status={self.status})"
@@ -0,0 +1,25 @@
+"""Modèle de données pour le registre des lots importés."""
+
+from datetime import datetime, UTC
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from app.infrastructure.db.database import Base
+
+
+class ImportLedgerChunkDB(Base):
+    """Modèle de données pour un lot entièrement écrit par un import."""
+
+    __tablename__ = "import_ledger"
+
+    job_id = Column(String, ForeignKey("import_jobs.id"), primary_key=True)
+    chunk_index = Column(Integer, primary_key=True)
+    chunk_hash = Column(String(64), nullable=False)
+    rows = Column(Integer, nullable=False)
+    expenses_created = Column(Integer, nullable=False, default=0)
+    incomes_created = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+    errors = Column(Text)
+    committed_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+
+    def __repr__(self) -> str:
+        """Représentation du lot."""
+        return f"ImportLedgerChunk(job_id={self.job_id}, chunk_index={self.chunk_index})"
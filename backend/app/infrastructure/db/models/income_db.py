@@ -1,7 +1,7 @@
 """Modèle de base de données pour les revenus."""
 
 from datetime import datetime, UTC
-from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Boolean, Index, Enum as SQLEnum
 from app.infrastructure.db.database import Base
 from app.domain.entities.income import IncomeCategory, IncomeFrequency
 
@@ -15,6 +15,15 @@ class IncomeDB(Base):
     """Modèle de base de données pour les revenus."""
 
     __tablename__ = "incomes"
+    # Recherche : index GIN plein texte et trigrammes propres à PostgreSQL, créés par la
+    # migration b5f2c8e1d4a3 (hors métadonnées, absents des bases SQLite de test)
+    __table_args__ = (
+        # Listes paginées par keyset sur (date, id) et (montant, id)
+        Index("ix_incomes_user_id_date_id", "user_id", "date", "id"),
+        Index("ix_incomes_user_id_amount_id", "user_id", "amount", "id"),
+        # Empreinte des transactions importées (NULL pour les saisies manuelles)
+        Index("ux_incomes_user_id_fingerprint", "user_id", "fingerprint", unique=True),
+    )
 
     id = Column(String, primary_key=True, index=True)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -25,6 +34,7 @@ class IncomeDB(Base):
     description = Column(String)
     is_recurring = Column(Boolean, default=False)
     frequency = Column(SQLEnum(IncomeFrequency))
+    fingerprint = Column(String(64))
     created_at = Column(DateTime, default=lambda: datetime.now(UTC))
     updated_at = Column(DateTime, default=lambda: datetime.now(UTC))
 
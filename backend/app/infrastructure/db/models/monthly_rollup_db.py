@@ -0,0 +1,25 @@
+"""Modèle de données pour les agrégats mensuels."""
+
+from sqlalchemy import Column, String, Float, Integer, Boolean, ForeignKey
+from app.infrastructure.db.database import Base
+
+
+class MonthlyRollupDB(Base):
+    """Modèle de données pour les agrégats mensuels des transactions."""
+
+    __tablename__ = "monthly_rollups"
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    year_month = Column(String(7), primary_key=True)
+    kind = Column(String, primary_key=True)
+    category = Column(String, primary_key=True)
+    is_recurring = Column(Boolean, primary_key=True)
+    amount = Column(Float, nullable=False, default=0.0)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """Représentation de l'agrégat mensuel."""
+        return (
+            f"MonthlyRollup(user_id={self.user_id}, year_month={self.year_month}, "
+            f"kind={self.kind}, category={self.category}, amount={self.amount})"
+        )
@@ -0,0 +1,21 @@
+"""Modèle de données pour les versions de données utilisateur."""
+
+from datetime import datetime, UTC
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from app.infrastructure.db.database import Base
+
+
+class UserDataVersionDB(Base):
+    """Modèle de données pour le compteur d'écritures d'un utilisateur."""
+
+    __tablename__ = "user_data_versions"
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC), index=True
+    )
+
+    def __repr__(self) -> str:
+        """Représentation de la version de données."""
+        return f"UserDataVersion(user_id={self.user_id}, version={self.version})"
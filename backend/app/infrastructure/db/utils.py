@@ -0,0 +1,65 @@
+"""Utilitaires partagés par les repositories SQL."""
+
+from datetime import date, datetime, UTC
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def to_naive_utc(dt: datetime) -> datetime:
+    """Convertit une date en UTC naïf, format de stockage des colonnes DateTime."""
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(UTC).replace(tzinfo=None)
+
+
+def day_bucket(db: Session, column):
+    """Expression SQL tronquant une colonne DateTime au jour."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date_trunc("day", column)
+    # SQLite (tests) : date() renvoie une chaîne 'YYYY-MM-DD'
+    return func.date(column)
+
+
+def month_bucket(db: Session, column):
+    """Expression SQL renvoyant le mois 'YYYY-MM' d'une colonne DateTime."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.to_char(column, "YYYY-MM")
+    return func.strftime("%Y-%m", column)
+
+
+def to_utc_day(value) -> datetime:
+    """Convertit le résultat de day_bucket en datetime UTC à minuit."""
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        value = value.date()
+    return datetime.combine(value, datetime.min.time(), tzinfo=UTC)
+
+
+def insert_or_ignore(db: Session, model, values: dict, index_elements: list[str]) -> bool:
+    """Insère une ligne sauf conflit sur l'index unique (ON CONFLICT DO NOTHING).
+
+    Retourne False si la ligne existait déjà. Rien n'est validé.
+    """
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    statement = dialect.insert(model).values(**values)
+    statement = statement.on_conflict_do_nothing(index_elements=index_elements)
+    return db.execute(statement).rowcount > 0
+
+
+def insert_many_or_ignore(
+    db: Session, model, rows: list[dict], index_elements: list[str]
+) -> int:
+    """Insère plusieurs lignes en un seul executemany (ON CONFLICT DO NOTHING).
+
+    Les lignes sont envoyées par lots multi-VALUES (insertmanyvalues de SQLAlchemy)
+    et la clé primaire des lignes réellement insérées est renvoyée via RETURNING.
+    Retourne le nombre de lignes insérées. Rien n'est validé.
+    """
+    if not rows:
+        return 0
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    statement = dialect.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+    statement = statement.returning(*model.__table__.primary_key.columns)
+    return len(db.execute(statement, rows).all())
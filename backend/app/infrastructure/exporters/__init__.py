@@ -0,0 +1 @@
+"""Writers des exports de transactions, produits en flux."""
@@ -0,0 +1,112 @@
+"""Exports colonnes des transactions : flux Arrow IPC et Parquet (paquet pyarrow)."""
+
+import io
+from abc import abstractmethod
+from typing import Iterable, Iterator
+
+from app.domain.entities.transaction import Transaction
+from app.infrastructure.exporters.base import EXPORT_COLUMNS, TransactionExporter, export_row
+
+
+def _require_pyarrow():
+    """Importe pyarrow, optionnel (ValueError s'il manque)."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ValueError("Le paquet pyarrow est requis pour les exports Arrow et Parquet") from e
+    return pyarrow
+
+
+def transaction_schema(pa):
+    """Schéma Arrow des colonnes exportées."""
+    timestamp = pa.timestamp("us")
+    types = {
+        "date": timestamp,
+        "amount": pa.float64(),
+        "is_recurring": pa.bool_(),
+        "created_at": timestamp,
+        "updated_at": timestamp,
+    }
+    return pa.schema([(column, types.get(column, pa.string())) for column in EXPORT_COLUMNS])
+
+
+class _ChunkSink(io.RawIOBase):
+    """Fichier en écriture seule dont les octets sont récupérés au fur et à mesure."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        """Retourne et oublie les octets écrits depuis le dernier appel."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _ArrowExporter(TransactionExporter):
+    """Base des exports pyarrow : un lot de transactions devient un RecordBatch."""
+
+    def __init__(self):
+        self.pa = _require_pyarrow()
+        self.schema = transaction_schema(self.pa)
+
+    def record_batch(self, batch: list[Transaction]):
+        """Convertit un lot de transactions en RecordBatch, colonne par colonne."""
+        columns = zip(*(export_row(transaction) for transaction in batch))
+        arrays = [
+            self.pa.array(values, type=field.type) for values, field in zip(columns, self.schema)
+        ]
+        return self.pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    @abstractmethod
+    def open_writer(self, sink):
+        """Ouvre le writer du format sur le fichier de sortie."""
+        pass
+
+    def write(self, batches: Iterable[list[Transaction]]) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        writer = self.open_writer(sink)
+        try:
+            for batch in batches:
+                if batch:
+                    writer.write_batch(self.record_batch(batch))
+                    yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+
+class ArrowExporter(_ArrowExporter):
+    """Export au format flux Arrow IPC (lisible par pyarrow, pandas, polars, DuckDB)."""
+
+    media_type = "application/vnd.apache.arrow.stream"
+    extension = "arrows"
+
+    def open_writer(self, sink):
+        return self.pa.ipc.new_stream(sink, self.schema)
+
+
+class ParquetExporter(_ArrowExporter):
+    """Export Parquet compressé en zstd, un groupe de lignes par lot."""
+
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+    compressible = False
+
+    def open_writer(self, sink):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(sink, self.schema, compression="zstd")
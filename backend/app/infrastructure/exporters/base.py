@@ -0,0 +1,65 @@
+"""Base commune des exports de transactions (écriture par lots et compression en flux)."""
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+
+from app.domain.entities.transaction import Transaction
+
+# Colonnes exportées, dans l'ordre
+EXPORT_COLUMNS = (
+    "id",
+    "type",
+    "date",
+    "name",
+    "amount",
+    "category",
+    "description",
+    "is_recurring",
+    "frequency",
+    "created_at",
+    "updated_at",
+)
+# Format gzip (en-tête et somme de contrôle) pour zlib
+GZIP_WBITS = 31
+
+
+def export_row(transaction: Transaction) -> tuple:
+    """Valeurs d'une transaction dans l'ordre de EXPORT_COLUMNS (dates conservées)."""
+    return (
+        transaction.id,
+        transaction.kind.value,
+        transaction.date,
+        transaction.name,
+        transaction.amount,
+        transaction.category,
+        transaction.description,
+        transaction.is_recurring,
+        transaction.frequency,
+        transaction.created_at,
+        transaction.updated_at,
+    )
+
+
+class TransactionExporter(ABC):
+    """Writer d'un format d'export : un morceau d'octets par lot de transactions."""
+
+    media_type: str = "application/octet-stream"
+    extension: str = ""
+    # Faux pour les formats déjà compressés, que gzip n'allège pas
+    compressible: bool = True
+
+    @abstractmethod
+    def write(self, batches: Iterable[list[Transaction]]) -> Iterator[bytes]:
+        """Produit le fichier au fil des lots, sans garder les lots déjà écrits."""
+        pass
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compresse un flux d'octets en gzip, morceau par morceau."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
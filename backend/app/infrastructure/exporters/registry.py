@@ -0,0 +1,18 @@
+"""Registre des writers d'export par format."""
+
+from app.domain.entities.transaction_export import ExportFormat
+from app.infrastructure.exporters.arrow_exporters import ArrowExporter, ParquetExporter
+from app.infrastructure.exporters.base import TransactionExporter
+from app.infrastructure.exporters.text_exporters import CSVExporter, NDJSONExporter
+
+EXPORTERS = {
+    ExportFormat.CSV: CSVExporter,
+    ExportFormat.NDJSON: NDJSONExporter,
+    ExportFormat.ARROW: ArrowExporter,
+    ExportFormat.PARQUET: ParquetExporter,
+}
+
+
+def get_exporter(export_format: ExportFormat) -> TransactionExporter:
+    """Writer du format demandé (ValueError si une dépendance optionnelle manque)."""
+    return EXPORTERS[export_format]()
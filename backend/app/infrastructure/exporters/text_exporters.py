@@ -0,0 +1,56 @@
+"""Exports texte des transactions : CSV et JSON délimité par lignes (NDJSON)."""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from app.domain.entities.transaction import Transaction
+from app.infrastructure.exporters.base import EXPORT_COLUMNS, TransactionExporter, export_row
+
+
+def _text_value(value):
+    """Valeur sérialisable : dates au format ISO 8601."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class CSVExporter(TransactionExporter):
+    """Export CSV (séparateur virgule, en-tête, UTF-8)."""
+
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def write(self, batches: Iterable[list[Transaction]]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(EXPORT_COLUMNS)
+        for batch in batches:
+            writer.writerows(
+                [_text_value(value) for value in export_row(transaction)]
+                for transaction in batch
+            )
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            # Export vide : l'en-tête seul
+            yield buffer.getvalue().encode("utf-8")
+
+
+class NDJSONExporter(TransactionExporter):
+    """Export NDJSON : un objet JSON par transaction et par ligne."""
+
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def write(self, batches: Iterable[list[Transaction]]) -> Iterator[bytes]:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        for batch in batches:
+            lines = (
+                encoder.encode(
+                    dict(zip(EXPORT_COLUMNS, map(_text_value, export_row(transaction))))
+                )
+                for transaction in batch
+            )
+            yield ("\n".join(lines) + "\n").encode("utf-8")
@@ -0,0 +1,44 @@
+"""Factory pour créer le moteur de prévision selon la configuration."""
+
+import os
+
+from app.domain.interfaces.forecast_engine_interface import ForecastEngineInterface
+from app.domain.services.average_forecast_engine import AverageForecastEngine
+from app.domain.services.recurrence_forecast_engine import RecurrenceForecastEngine
+from app.infrastructure.forecasting.numpy_forecast_engine import (
+    EXPONENTIAL_SMOOTHING,
+    NumpyForecastEngine,
+)
+
+
+def create_forecast_engine() -> ForecastEngineInterface:
+    """
+    Crée le moteur de prévision selon FORECAST_ENGINE.
+
+    recurrence (défaut): déroule chaque série récurrente selon sa fréquence
+    average: moyenne par transaction récurrente, en Python pur
+    numpy: séries mensuelles vectorisées (FORECAST_ENGINE_METHOD: moving_average,
+    exponential_smoothing ou linear_trend)
+
+    Returns:
+        ForecastEngineInterface: Le moteur à utiliser
+
+    Raises:
+        ValueError: Si le moteur ou la méthode est inconnu
+    """
+    engine = os.getenv("FORECAST_ENGINE", "recurrence")
+
+    if engine == "recurrence":
+        return RecurrenceForecastEngine()
+
+    if engine == "average":
+        return AverageForecastEngine()
+
+    if engine == "numpy":
+        return NumpyForecastEngine(
+            method=os.getenv("FORECAST_ENGINE_METHOD", EXPONENTIAL_SMOOTHING),
+            window=int(os.getenv("FORECAST_ENGINE_WINDOW", "3")),
+            alpha=float(os.getenv("FORECAST_ENGINE_ALPHA", "0.5")),
+        )
+
+    raise ValueError(f"Moteur de prévision inconnu: {engine}")
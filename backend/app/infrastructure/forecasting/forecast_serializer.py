@@ -0,0 +1,70 @@
+"""Sérialisation JSON des prévisions (cache partagé, prévisions précalculées)."""
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any
+
+from app.domain.entities.forecast import CategoryForecast, DataPoint, ForecastData, ForecastPeriod
+
+_SERIES_FIELDS = ("expenses_data", "income_data", "forecast_expenses", "forecast_income")
+_DATETIME_FIELDS = ("start_date", "end_date", "created_at", "updated_at")
+_CATEGORY_FIELDS = ("expense_categories", "income_categories")
+
+
+def serialize_forecast(forecast: ForecastData) -> str:
+    """Sérialise une prévision en JSON."""
+    payload = asdict(forecast)
+    payload["period"] = forecast.period.value
+    for field in _DATETIME_FIELDS:
+        payload[field] = payload[field].isoformat()
+    for field in _SERIES_FIELDS:
+        _dump_points(payload[field])
+    for field in _CATEGORY_FIELDS:
+        for category in payload[field] or []:
+            _dump_points(category["data"])
+            _dump_points(category["forecast"])
+    return json.dumps(payload)
+
+
+def deserialize_forecast(raw: Any) -> ForecastData:
+    """Reconstruit une prévision à partir de son JSON."""
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    payload = json.loads(raw)
+    payload["period"] = ForecastPeriod(payload["period"])
+    for field in _DATETIME_FIELDS:
+        payload[field] = datetime.fromisoformat(payload[field])
+    for field in _SERIES_FIELDS:
+        payload[field] = _load_points(payload[field])
+    for field in _CATEGORY_FIELDS:
+        if payload.get(field) is not None:
+            payload[field] = [
+                CategoryForecast(
+                    category=category["category"],
+                    data=_load_points(category["data"]),
+                    forecast=_load_points(category["forecast"]),
+                    total=category["total"],
+                    forecast_total=category["forecast_total"],
+                )
+                for category in payload[field]
+            ]
+    return ForecastData(**payload)
+
+
+def _dump_points(points: list[dict]) -> None:
+    """Convertit en place les dates d'une série de points en ISO 8601."""
+    for point in points:
+        point["date"] = point["date"].isoformat()
+
+
+def _load_points(points: list[dict]) -> list[DataPoint]:
+    """Reconstruit une série de points de données."""
+    return [
+        DataPoint(
+            date=datetime.fromisoformat(point["date"]),
+            amount=point["amount"],
+            category=point["category"],
+        )
+        for point in points
+    ]
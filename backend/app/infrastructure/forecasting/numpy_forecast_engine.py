@@ -0,0 +1,145 @@
+"""Moteur de prévision vectorisé avec NumPy."""
+
+from datetime import datetime, timedelta, UTC
+from typing import List, Optional
+
+import numpy as np
+
+from app.domain.entities.forecast import DataPoint
+from app.domain.interfaces.forecast_engine_interface import ForecastEngineInterface
+
+MOVING_AVERAGE = "moving_average"
+EXPONENTIAL_SMOOTHING = "exponential_smoothing"
+LINEAR_TREND = "linear_trend"
+METHODS = (MOVING_AVERAGE, EXPONENTIAL_SMOOTHING, LINEAR_TREND)
+
+
+def bin_daily(items: List) -> tuple[np.ndarray, np.ndarray]:
+    """Regroupe les montants par jour.
+
+    Returns:
+        (ordinaux des jours présents, sommes correspondantes), triés par jour
+    """
+    if not items:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    ordinals = np.fromiter(
+        (item.date.toordinal() for item in items), dtype=np.int64, count=len(items)
+    )
+    amounts = np.fromiter((item.amount for item in items), dtype=np.float64, count=len(items))
+
+    first_day = ordinals.min()
+    offsets = ordinals - first_day
+    totals = np.bincount(offsets, weights=amounts)
+    present = np.flatnonzero(np.bincount(offsets))
+    return present + first_day, totals[present]
+
+
+def _month_index(item) -> int:
+    """Retourne l'indice de mois (année * 12 + mois - 1) d'une ligne d'historique."""
+    year_month = getattr(item, "year_month", None)
+    if year_month is not None:
+        return int(year_month[:4]) * 12 + int(year_month[5:7]) - 1
+    return item.date.year * 12 + item.date.month - 1
+
+
+def bin_monthly(items: List, end_month: Optional[int] = None) -> np.ndarray:
+    """Regroupe les montants en une série mensuelle contiguë.
+
+    La série couvre du premier mois ayant des données jusqu'au dernier, ou jusqu'à
+    `end_month` (indice de mois, voir _month_index) s'il est postérieur ; les mois
+    sans transaction valent 0.
+    """
+    if not items:
+        return np.empty(0, dtype=np.float64)
+
+    months = np.fromiter((_month_index(item) for item in items), dtype=np.int64, count=len(items))
+    amounts = np.fromiter((item.amount for item in items), dtype=np.float64, count=len(items))
+    first_month = months.min()
+    length = 0 if end_month is None else end_month - first_month + 1
+    return np.bincount(months - first_month, weights=amounts, minlength=length)
+
+
+def complete_months(items: List, end_date: datetime) -> np.ndarray:
+    """Série mensuelle des seuls mois entièrement couverts par l'historique.
+
+    Le premier mois (la fenêtre d'historique commence en cours de mois) et le mois
+    de end_date (en cours) sont partiels : les garder tirerait la moyenne, le
+    niveau lissé et la pente vers le bas. Les mois vides jusqu'à end_date valent 0.
+    Sans aucun mois complet, l'historique entier compte pour un seul mois.
+    """
+    end_month = end_date.year * 12 + end_date.month - 1
+    series = bin_monthly([item for item in items if _month_index(item) <= end_month], end_month)
+    if len(series) > 2:
+        return series[1:-1]
+    if len(series) == 0:
+        return series
+    return np.array([series.sum()])
+
+
+def moving_average(series: np.ndarray, window: int) -> float:
+    """Moyenne des `window` derniers mois."""
+    return float(series[-window:].mean())
+
+
+def exponential_smoothing(series: np.ndarray, alpha: float) -> float:
+    """Niveau final du lissage exponentiel simple, calculé sans boucle."""
+    n = len(series)
+    decay = (1 - alpha) ** np.arange(n - 1, -1, -1)
+    # Le premier mois initialise le niveau : il reçoit le poids résiduel (1 - alpha)^(n-1)
+    weights = alpha * decay
+    weights[0] = decay[0]
+    return float(np.dot(weights, series))
+
+
+def linear_trend(series: np.ndarray, months_ahead: int) -> np.ndarray:
+    """Prolonge la droite des moindres carrés ajustée sur la série."""
+    if len(series) < 2:
+        return np.full(months_ahead, float(series[-1]))
+    slope, intercept = np.polyfit(np.arange(len(series)), series, 1)
+    future = np.arange(len(series), len(series) + months_ahead)
+    return np.maximum(intercept + slope * future, 0.0)
+
+
+class NumpyForecastEngine(ForecastEngineInterface):
+    """Moteur de prévision basé sur des séries mensuelles (moyenne mobile, lissage, tendance)."""
+
+    def __init__(self, method: str = EXPONENTIAL_SMOOTHING, window: int = 3, alpha: float = 0.5):
+        if method not in METHODS:
+            raise ValueError(f"Méthode de prévision inconnue: {method}")
+        if window <= 0:
+            raise ValueError("window doit être strictement positif")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha doit être compris dans ]0, 1]")
+
+        self.method = method
+        self.window = window
+        self.alpha = alpha
+
+    def aggregate(self, items: List) -> List[DataPoint]:
+        """Agrège les données par date à partir d'un regroupement journalier vectorisé."""
+        days, totals = bin_daily(items)
+        return [
+            DataPoint(date=datetime.fromordinal(int(day)).replace(tzinfo=UTC), amount=float(total))
+            for day, total in zip(days, totals)
+        ]
+
+    def project(self, history: List, end_date: datetime, months_ahead: int) -> List[DataPoint]:
+        """Projette les montants mensuels selon la méthode configurée."""
+        values = self.forecast_values(complete_months(history, end_date), months_ahead)
+        return [
+            DataPoint(date=end_date + timedelta(days=30 * i), amount=float(value))
+            for i, value in enumerate(values)
+        ]
+
+    def forecast_values(self, series: np.ndarray, months_ahead: int) -> np.ndarray:
+        """Calcule les `months_ahead` valeurs futures d'une série mensuelle."""
+        if len(series) == 0:
+            return np.zeros(months_ahead)
+        if self.method == LINEAR_TREND:
+            return linear_trend(series, months_ahead)
+        if self.method == MOVING_AVERAGE:
+            level = moving_average(series, self.window)
+        else:
+            level = exponential_smoothing(series, self.alpha)
+        return np.full(months_ahead, level)
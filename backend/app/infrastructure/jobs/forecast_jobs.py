@@ -0,0 +1,82 @@
+"""Tâches de fond de précalcul des prévisions."""
+
+import logging
+import os
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.infrastructure.cache.forecast_cache_factory import get_forecast_cache
+from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.forecasting.forecast_engine_factory import create_forecast_engine
+from app.infrastructure.jobs.scheduler import JobScheduler, get_job_scheduler
+from app.infrastructure.repositories.expense_repository import SQLExpenseRepository
+from app.infrastructure.repositories.forecast_snapshot_repository import (
+    SQLForecastSnapshotRepository,
+)
+from app.infrastructure.repositories.income_repository import SQLIncomeRepository
+from app.infrastructure.repositories.monthly_rollup_repository import SQLMonthlyRollupRepository
+from app.infrastructure.repositories.user_data_version_repository import (
+    SQLUserDataVersionRepository,
+)
+from app.use_cases.forecast.precompute_forecasts import PrecomputeForecasts
+
+logger = logging.getLogger(__name__)
+
+
+def precompute_user_forecasts(user_id: str) -> int:
+    """Précalcule les prévisions d'un utilisateur dans sa propre session."""
+    db = SessionLocal()
+    try:
+        use_case = PrecomputeForecasts(
+            SQLExpenseRepository(db),
+            SQLIncomeRepository(db),
+            SQLForecastSnapshotRepository(db),
+            SQLUserDataVersionRepository(db),
+            SQLMonthlyRollupRepository(db),
+            get_forecast_cache(),
+            create_forecast_engine(),
+        )
+        return use_case.execute(user_id)
+    finally:
+        db.close()
+
+
+def enqueue_precompute(user_id: str, scheduler: Optional[JobScheduler] = None) -> bool:
+    """Programme le précalcul des prévisions d'un utilisateur."""
+    scheduler = scheduler or get_job_scheduler()
+    return scheduler.enqueue(f"forecast:{user_id}", precompute_user_forecasts, user_id)
+
+
+def sweep_forecasts(scheduler: Optional[JobScheduler] = None) -> int:
+    """Programme le précalcul pour les utilisateurs actifs (FORECAST_ACTIVE_DAYS jours)."""
+    active_days = int(os.getenv("FORECAST_ACTIVE_DAYS", "30"))
+    since = datetime.now(UTC) - timedelta(days=active_days)
+
+    db = SessionLocal()
+    try:
+        user_ids = SQLUserDataVersionRepository(db).get_active_user_ids(since)
+    finally:
+        db.close()
+
+    enqueued = sum(enqueue_precompute(user_id, scheduler) for user_id in user_ids)
+    logger.info("Précalcul nocturne des prévisions programmé pour %s utilisateurs", enqueued)
+    return enqueued
+
+
+def refresh_user_forecasts(
+    db: Session,
+    forecast_cache: ForecastCacheInterface,
+    user_id: str,
+    scheduler: Optional[JobScheduler] = None,
+) -> None:
+    """Après une écriture : périme les précalculs, invalide le cache et les reprogramme.
+
+    La version est incrémentée avant l'invalidation : une lecture concurrente qui
+    remplirait le cache entre les deux verrait déjà la nouvelle version, donc les
+    précalculs comme périmés.
+    """
+    SQLUserDataVersionRepository(db).bump(user_id)
+    forecast_cache.invalidate_user(user_id)
+    enqueue_precompute(user_id, scheduler)
@@ -0,0 +1,229 @@
+"""Tâches de fond d'import CSV."""
+
+import hashlib
+import logging
+import os
+import socket
+import tempfile
+import threading
+from datetime import datetime, timedelta, UTC
+from typing import BinaryIO, Callable, Optional
+from sqlalchemy.orm import Session
+
+from app.domain.entities.import_job import ImportJob
+from app.infrastructure.cache.category_index_cache import get_category_index_cache
+from app.infrastructure.cache.forecast_cache_factory import get_forecast_cache
+from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.jobs.forecast_jobs import refresh_user_forecasts
+from app.infrastructure.jobs.scheduler import JobScheduler
+from app.infrastructure.repositories.category_rule_repository import SQLCategoryRuleRepository
+from app.infrastructure.repositories.expense_repository import SQLExpenseRepository
+from app.infrastructure.repositories.import_job_repository import SQLImportJobRepository
+from app.infrastructure.repositories.import_ledger_repository import SQLImportLedgerRepository
+from app.infrastructure.repositories.income_repository import SQLIncomeRepository
+from app.infrastructure.repositories.monthly_rollup_repository import SQLMonthlyRollupRepository
+from app.use_cases.categories.get_category_index import GetCategoryIndex
+from app.use_cases.imports.create_import_job import CreateImportJob
+from app.use_cases.imports.import_csv import ImportCSV
+from app.use_cases.imports.run_import_job import RunImportJob
+
+logger = logging.getLogger(__name__)
+
+# Taille des blocs copiés lors de l'enregistrement du fichier envoyé
+COPY_BUFFER_SIZE = 1024 * 1024
+# Durée du bail d'un import : non renouvelé pendant cette durée, il peut être repris ailleurs
+DEFAULT_IMPORT_LEASE_SECONDS = 300
+# Renouvellements du bail par durée de bail (tolère un renouvellement manqué)
+LEASE_RENEWALS_PER_LEASE = 3
+
+
+def get_upload_dir() -> str:
+    """Répertoire des fichiers en attente d'import (IMPORT_UPLOAD_DIR)."""
+    return os.getenv(
+        "IMPORT_UPLOAD_DIR", os.path.join(tempfile.gettempdir(), "forecast_budget_imports")
+    )
+
+
+def get_import_lease() -> timedelta:
+    """Durée du bail d'un import en cours (IMPORT_JOB_LEASE_SECONDS)."""
+    return timedelta(
+        seconds=int(os.getenv("IMPORT_JOB_LEASE_SECONDS", str(DEFAULT_IMPORT_LEASE_SECONDS)))
+    )
+
+
+def worker_id() -> str:
+    """Identifiant du processus qui exécute les imports (hôte et pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaseRenewer:
+    """Renouvelle le bail d'un import à intervalle régulier, dans un thread dédié.
+
+    Le bail ne dépend pas de l'avancement : un parsing long, le dernier lot
+    partiel ou la relecture du registre ne le laissent pas expirer. Le
+    renouvellement s'arrête si l'import a été repris par un autre worker.
+    """
+
+    def __init__(self, renew: Callable[[], bool], interval: float):
+        self.renew = renew
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "LeaseRenewer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                if not self.renew():
+                    return
+            except Exception:
+                logger.exception("Échec du renouvellement du bail d'un import")
+
+
+def renew_import_lease(job_id: str, owner: str) -> bool:
+    """Renouvelle le bail d'un import dans une session dédiée (appelé hors du worker)."""
+    db = SessionLocal()
+    try:
+        return SQLImportJobRepository(db).renew(job_id, owner)
+    finally:
+        db.close()
+
+
+def store_upload(
+    source: BinaryIO, directory: Optional[str] = None, suffix: str = ".csv"
+) -> tuple[str, str]:
+    """Copie le fichier envoyé sur disque, par blocs, et retourne son chemin et son SHA-256."""
+    directory = directory or get_upload_dir()
+    os.makedirs(directory, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=directory)
+    digest = hashlib.sha256()
+    with os.fdopen(fd, "wb") as target:
+        while block := source.read(COPY_BUFFER_SIZE):
+            digest.update(block)
+            target.write(block)
+    return path, digest.hexdigest()
+
+
+def submit_import(
+    db: Session,
+    user_id: str,
+    filename: str,
+    source: BinaryIO,
+    scheduler: Optional[JobScheduler] = None,
+) -> ImportJob:
+    """Enregistre le fichier et programme son import.
+
+    Un fichier identique à un import en cours ou réussi retourne cet import sans
+    relire le fichier. Sans ordonnanceur démarré (scripts, tests), l'import est
+    exécuté immédiatement.
+    """
+    path, content_hash = store_upload(source, suffix=os.path.splitext(filename)[1].lower())
+    try:
+        job = CreateImportJob(SQLImportJobRepository(db)).execute(
+            user_id, filename, path, content_hash
+        )
+    except Exception:
+        os.remove(path)
+        raise
+
+    if job.file_path != path:
+        # Fichier déjà importé ou en cours d'import
+        os.remove(path)
+        return job
+
+    if enqueue_import(job.id, scheduler):
+        return job
+    return run_import_job(job.id)
+
+
+def enqueue_import(job_id: str, scheduler: Optional[JobScheduler] = None) -> bool:
+    """Programme l'exécution d'un import."""
+    scheduler = scheduler or get_import_scheduler()
+    return scheduler.enqueue(f"import:{job_id}", run_import_job, job_id)
+
+
+def build_import_csv(db: Session) -> ImportCSV:
+    """Construit le cas d'usage d'import sur une session (agrégats, catégories apprises)."""
+    return ImportCSV(
+        SQLExpenseRepository(db),
+        SQLIncomeRepository(db),
+        SQLMonthlyRollupRepository(db),
+        get_category_index=GetCategoryIndex(
+            SQLCategoryRuleRepository(db), get_category_index_cache()
+        ),
+    )
+
+
+def run_import_job(job_id: str) -> Optional[ImportJob]:
+    """Exécute un import dans ses propres sessions (une pour l'état, une pour les données).
+
+    L'import est d'abord pris de façon atomique : avec plusieurs workers ou
+    répliques, un import en attente n'est exécuté que par un seul d'entre eux.
+    """
+    jobs_db = SessionLocal()
+    db = SessionLocal()
+    try:
+        job_repo = SQLImportJobRepository(jobs_db)
+        job = job_repo.claim(job_id, worker_id(), datetime.now(UTC) - get_import_lease())
+        if job is None:
+            # Terminé, ou exécuté par un autre worker
+            return job_repo.get_by_id(job_id)
+
+        use_case = RunImportJob(job_repo, build_import_csv(db), SQLImportLedgerRepository(jobs_db))
+        if not os.path.exists(job.file_path):
+            return use_case.fail(job, "Le fichier importé n'est plus disponible")
+
+        job_id, owner = job.id, job.owner
+        interval = get_import_lease().total_seconds() / LEASE_RENEWALS_PER_LEASE
+        try:
+            with LeaseRenewer(lambda: renew_import_lease(job_id, owner), interval):
+                # Format et encodage détectés depuis les premiers octets
+                with open(job.file_path, "rb") as stream:
+                    job = use_case.execute(job, stream)
+        finally:
+            # Les lots déjà écrits invalident les prévisions, même en cas d'échec
+            db.rollback()
+            refresh_user_forecasts(db, get_forecast_cache(), job.user_id)
+
+        os.remove(job.file_path)
+        logger.info("Import %s terminé (%s)", job.id, job.status.value)
+        return job
+    finally:
+        db.close()
+        jobs_db.close()
+
+
+def resume_import_jobs(scheduler: Optional[JobScheduler] = None) -> int:
+    """Reprogramme les imports en attente ou dont le bail a expiré (worker arrêté).
+
+    Exécuté périodiquement par chaque processus : un import en cours dans un autre
+    worker n'est pas repris tant que son bail est renouvelé.
+    """
+    db = SessionLocal()
+    try:
+        jobs = SQLImportJobRepository(db).get_unfinished(datetime.now(UTC) - get_import_lease())
+    finally:
+        db.close()
+
+    resumed = sum(enqueue_import(job.id, scheduler) for job in jobs)
+    if resumed:
+        logger.info("%s imports en attente ou interrompus reprogrammés", resumed)
+    return resumed
+
+
+_import_scheduler: Optional[JobScheduler] = None
+
+
+def get_import_scheduler() -> JobScheduler:
+    """Retourne le pool de workers dédié aux imports (IMPORT_WORKERS workers)."""
+    global _import_scheduler
+    if _import_scheduler is None:
+        _import_scheduler = JobScheduler(workers=int(os.getenv("IMPORT_WORKERS", "2")))
+    return _import_scheduler
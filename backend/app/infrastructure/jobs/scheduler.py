@@ -0,0 +1,172 @@
+"""Ordonnanceur de tâches de fond en mémoire (file asyncio et pool de workers)."""
+
+import asyncio
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobSchedulerStats:
+    """Compteurs de l'ordonnanceur de tâches."""
+
+    running: bool
+    workers: int
+    pending: int
+    completed: int = 0
+    failed: int = 0
+    coalesced: int = 0
+
+
+class JobScheduler:
+    """Exécute des tâches synchrones en arrière-plan, sans broker externe.
+
+    Les tâches sont identifiées par une clé : une tâche déjà en attente avec la même
+    clé n'est pas dupliquée. `enqueue` peut être appelé depuis n'importe quel thread
+    (les routes synchrones de FastAPI tournent dans un pool de threads).
+    """
+
+    def __init__(self, workers: int = 2):
+        if workers < 1:
+            raise ValueError("Le nombre de workers doit être au moins 1")
+        self.workers = workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._failed = 0
+        self._coalesced = 0
+
+    @property
+    def running(self) -> bool:
+        """Indique si les workers sont démarrés."""
+        return self._loop is not None
+
+    async def start(self) -> None:
+        """Démarre les workers sur la boucle d'événements courante."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Arrête les workers et les tâches périodiques (les tâches en attente sont perdues)."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        with self._lock:
+            self._loop = None
+            self._queue = None
+            self._pending.clear()
+
+    async def join(self) -> None:
+        """Attend que toutes les tâches en file soient terminées."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def enqueue(self, key: str, func: Callable, *args) -> bool:
+        """Programme une tâche ; retourne False si l'ordonnanceur n'est pas démarré."""
+        with self._lock:
+            if self._loop is None:
+                return False
+            if key in self._pending:
+                self._coalesced += 1
+                return True
+            self._pending.add(key)
+            if _running_loop() is self._loop:
+                self._queue.put_nowait((key, func, args))
+            else:
+                self._loop.call_soon_threadsafe(self._queue.put_nowait, (key, func, args))
+        return True
+
+    def schedule_daily(self, hour: int, key: str, func: Callable, *args) -> None:
+        """Programme une tâche chaque jour à l'heure donnée (UTC)."""
+        if not self.running:
+            raise ValueError("L'ordonnanceur doit être démarré avant de planifier une tâche")
+        if not 0 <= hour < 24:
+            raise ValueError("L'heure doit être comprise entre 0 et 23")
+        self._tasks.append(asyncio.create_task(self._daily(hour, key, func, args)))
+
+    def schedule_every(self, seconds: float, key: str, func: Callable, *args) -> None:
+        """Programme une tâche tout de suite, puis toutes les `seconds` secondes."""
+        if not self.running:
+            raise ValueError("L'ordonnanceur doit être démarré avant de planifier une tâche")
+        if seconds <= 0:
+            raise ValueError("L'intervalle doit être positif")
+        self._tasks.append(asyncio.create_task(self._every(seconds, key, func, args)))
+
+    def stats(self) -> JobSchedulerStats:
+        """Retourne les compteurs de l'ordonnanceur."""
+        with self._lock:
+            return JobSchedulerStats(
+                running=self.running,
+                workers=self.workers,
+                pending=len(self._pending),
+                completed=self._completed,
+                failed=self._failed,
+                coalesced=self._coalesced,
+            )
+
+    async def _worker(self) -> None:
+        """Consomme la file et exécute les tâches dans un thread."""
+        while True:
+            key, func, args = await self._queue.get()
+            # Libérer la clé avant l'exécution : une écriture pendant le calcul reprogramme
+            with self._lock:
+                self._pending.discard(key)
+            try:
+                await asyncio.to_thread(func, *args)
+                self._completed += 1
+            except Exception:
+                self._failed += 1
+                logger.error("Échec de la tâche de fond %s", key, exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def _daily(self, hour: int, key: str, func: Callable, args: tuple) -> None:
+        """Boucle de planification quotidienne."""
+        while True:
+            await asyncio.sleep(seconds_until(hour, datetime.now(UTC)))
+            self.enqueue(key, func, *args)
+
+    async def _every(self, seconds: float, key: str, func: Callable, args: tuple) -> None:
+        """Boucle de planification périodique."""
+        while True:
+            self.enqueue(key, func, *args)
+            await asyncio.sleep(seconds)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Boucle d'événements du thread courant, s'il y en a une."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def seconds_until(hour: int, now: datetime) -> float:
+    """Nombre de secondes jusqu'à la prochaine occurrence de l'heure donnée."""
+    target = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+_job_scheduler: Optional[JobScheduler] = None
+
+
+def get_job_scheduler() -> JobScheduler:
+    """Retourne l'ordonnanceur partagé par le processus (JOB_WORKERS workers)."""
+    global _job_scheduler
+    if _job_scheduler is None:
+        _job_scheduler = JobScheduler(workers=int(os.getenv("JOB_WORKERS", "2")))
+    return _job_scheduler
@@ -0,0 +1,110 @@
+"""Base commune des parsers de relevés bancaires (détection et lecture en flux)."""
+
+import codecs
+import csv
+import io
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Iterator, List, Optional
+
+from app.domain.entities.import_result import ImportedTransaction
+
+# Taille du début de fichier lu pour détecter le format
+SNIFF_SIZE = 8192
+# Séparateurs candidats des exports CSV, par ordre de préférence
+CSV_DELIMITERS = (';', ',', '\t', '|')
+# Nombre de lignes examinées pour trouver l'en-tête (préambule des exports)
+HEADER_SEARCH_LINES = 20
+
+
+@dataclass
+class StatementSample:
+    """Début d'un relevé, décodé pour la détection du format."""
+
+    head: bytes
+    encoding: str
+    text: str
+    lines: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_head(cls, head: bytes) -> "StatementSample":
+        """Décode le début du fichier (la dernière ligne, tronquée, est écartée)."""
+        encoding = detect_encoding(head)
+        text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(head)
+        lines = [line.rstrip("\r\n") for line in io.StringIO(text, newline="")]
+        if len(head) >= SNIFF_SIZE and lines:
+            lines.pop()
+        return cls(head=head, encoding=encoding, text=text, lines=lines)
+
+
+@dataclass
+class CSVHeader:
+    """En-tête trouvé dans un CSV : position, séparateur et colonnes."""
+
+    line_index: int
+    delimiter: str
+    columns: List[str]
+
+
+class StatementParser(ABC):
+    """Parser d'un format de relevé, lu en flux et converti en ImportedTransaction."""
+
+    name: str = ""
+
+    @abstractmethod
+    def matches(self, sample: StatementSample) -> bool:
+        """Indique si le début du fichier correspond à ce format."""
+        pass
+
+    @abstractmethod
+    def parse_stream(
+        self, stream: BinaryIO, sample: StatementSample
+    ) -> Iterator[ImportedTransaction]:
+        """Parse le fichier (positionné au début) et produit les transactions une à une."""
+        pass
+
+
+def detect_encoding(head: bytes) -> str:
+    """Détecte l'encodage : BOM, sinon UTF-8 s'il est valide, sinon Windows-1252."""
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        # Décodage incrémental : un caractère coupé en fin d'extrait n'est pas une erreur
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
+
+
+def iter_lines(stream: BinaryIO, encoding: str) -> Iterator[str]:
+    """Décode le fichier au fil de l'eau et produit ses lignes (fins de ligne conservées)."""
+    text = io.TextIOWrapper(stream, encoding=encoding, newline="")
+    try:
+        yield from text
+    finally:
+        # Ne pas fermer le fichier sous-jacent avec l'enveloppe texte
+        text.detach()
+
+
+def find_csv_header(
+    lines: List[str], predicate: Callable[[List[str]], bool]
+) -> Optional[CSVHeader]:
+    """Cherche, parmi les premières lignes, un en-tête accepté par `predicate`."""
+    for index, line in enumerate(lines[:HEADER_SEARCH_LINES]):
+        for delimiter in CSV_DELIMITERS:
+            if delimiter not in line:
+                continue
+            columns = next(csv.reader([line], delimiter=delimiter), [])
+            if predicate(columns):
+                return CSVHeader(line_index=index, delimiter=delimiter, columns=columns)
+    return None
+
+
+def skip_lines(lines: Iterator[str], count: int) -> Iterator[str]:
+    """Saute les `count` premières lignes (préambule avant l'en-tête)."""
+    for _ in range(count):
+        if next(lines, None) is None:
+            break
+    return lines
@@ -0,0 +1,85 @@
+"""Parser des relevés ISO 20022 CAMT.053 (XML), lu en flux avec iterparse."""
+
+import logging
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Iterator, Optional
+
+from app.domain.entities.import_result import ImportedTransaction
+from app.infrastructure.parsers.base import StatementParser, StatementSample
+from app.infrastructure.parsers.conversion import make_transaction, parse_iso_date
+
+logger = logging.getLogger(__name__)
+
+
+def _local(tag: str) -> str:
+    """Nom d'un élément sans son espace de noms."""
+    return tag.rsplit("}", 1)[-1]
+
+
+class CAMT053Parser(StatementParser):
+    """Parser des relevés de compte camt.053 (BkToCstmrStmt)."""
+
+    name = "camt.053"
+
+    def matches(self, sample: StatementSample) -> bool:
+        """Reconnaît l'espace de noms ou la racine BkToCstmrStmt."""
+        return "camt.053" in sample.text or "<BkToCstmrStmt" in sample.text
+
+    def parse_stream(
+        self, stream: BinaryIO, sample: StatementSample
+    ) -> Iterator[ImportedTransaction]:
+        """Parse chaque <Ntry> dès sa fermeture puis le libère (mémoire constante)."""
+        account_label = ""
+        parents = []
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                parents.append(element)
+                continue
+            parents.pop()
+            name = _local(element.tag)
+            if name == "Acct" and not account_label:
+                account_label = element.findtext("{*}Id/{*}IBAN", "") or element.findtext(
+                    "{*}Id/{*}Othr/{*}Id", ""
+                )
+            elif name == "Ntry":
+                try:
+                    transaction = self._to_transaction(element, account_label)
+                except Exception as e:
+                    logger.warning("Écriture CAMT ignorée: %s", e)
+                    transaction = None
+                if parents:
+                    parents[-1].remove(element)
+                if transaction:
+                    yield transaction
+
+    @staticmethod
+    def _to_transaction(entry: ET.Element, account_label: str) -> Optional[ImportedTransaction]:
+        # Seules les écritures comptabilisées sont importées (pas les opérations en attente)
+        status = entry.findtext("{*}Sts/{*}Cd") or entry.findtext("{*}Sts") or "BOOK"
+        if status.strip() != "BOOK":
+            return None
+
+        amount = float(entry.findtext("{*}Amt", "").strip())
+        is_debit = entry.findtext("{*}CdtDbtInd", "").strip() == "DBIT"
+        # Date de valeur en priorité, comme pour les exports CSV
+        date_raw = (
+            entry.findtext("{*}ValDt/{*}Dt")
+            or entry.findtext("{*}ValDt/{*}DtTm")
+            or entry.findtext("{*}BookgDt/{*}Dt")
+            or entry.findtext("{*}BookgDt/{*}DtTm", "")
+        )
+        party = "Cdtr" if is_debit else "Dbtr"
+        counterparty = entry.findtext(f".//{{*}}RltdPties/{{*}}{party}//{{*}}Nm", "")
+        label = (
+            entry.findtext("{*}AddtlNtryInf")
+            or entry.findtext(".//{*}RmtInf/{*}Ustrd")
+            or entry.findtext(".//{*}AddtlTxInf")
+            or counterparty
+        )
+        return make_transaction(
+            date=parse_iso_date(date_raw.strip()[:10]),
+            amount=-amount if is_debit else amount,
+            description=" ".join(label.split()),
+            supplier=counterparty.strip(),
+            account_label=account_label,
+        )
@@ -0,0 +1,116 @@
+"""Conversion rapide des champs de relevés bancaires, partagée par tous les parsers."""
+
+import re
+import unicodedata
+from datetime import datetime
+
+from app.domain.entities.import_result import ImportedTransaction
+
+# Mots-clés pour détecter les transactions récurrentes
+RECURRING_KEYWORDS = [
+    "PRLV SEPA",
+    "PRLV",
+    "PRELEVEMENT",
+    "ABONNEMENT",
+    "VIR SEPA",
+    "VIR INST",
+]
+RECURRING_PATTERN = re.compile("|".join(map(re.escape, RECURRING_KEYWORDS)))
+
+# Mapping des catégories bancaires vers nos catégories
+CATEGORY_MAPPING = {
+    "Alimentation": "Alimentation",
+    "Restaurants, bars, discothèques…": "Restaurants",
+    "Transports quotidiens (métro, bus…)": "Transport",
+    "Carburant": "Carburant",
+    "Téléphonie (fixe et mobile)": "Téléphonie",
+    "Multimedia à domicile (TV, internet, téléphonie…)": "Abonnements",
+    "Crédit conso": "Crédit",
+    "Complémentaires santé": "Santé",
+    "Assurances (Auto/Moto)": "Assurance",
+    "Divertissement - culture (ciné, théâtre, concerts…)": "Loisirs",
+    "Electronique et informatique": "Electronique",
+    "Bricolage et jardinage": "Bricolage",
+    "Club / association (sport, hobby, art…)": "Sport",
+    "Etudes (formation, fournitures, cantines…)": "Education",
+    "Frais bancaires et de gestion (dont agios)": "Frais bancaires",
+    "Livres, CD/DVD, bijoux, jouets…": "Shopping",
+    "Mobilier, électroménager, décoration…": "Equipement maison",
+    "Dépenses Jeux et paris": "Jeux",
+    "Epargne financière (retraite, prévoyance, PEA, assurance-vie…)": "Epargne",
+    "Vie Quotidienne - Autres": "Autres",
+    "Non catégorisé": "Autres",
+}
+
+# Format français : espaces (milliers, y compris insécables), guillemets et symbole
+# monétaire supprimés, virgule décimale
+_AMOUNT_TRANSLATION = str.maketrans(
+    {' ': None, '\xa0': None, '\u202f': None, '"': None, '€': None, ',': '.'}
+)
+
+
+def parse_iso_date(value: str) -> datetime:
+    """Parse une date 'YYYY-MM-DD' par découpage fixe (strptime en repli)."""
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        digits = value[:4] + value[5:7] + value[8:]
+        if digits.isascii() and digits.isdigit():
+            try:
+                return datetime(int(value[:4]), int(value[5:7]), int(value[8:]))
+            except ValueError:
+                pass  # Date impossible : strptime lève l'erreur habituelle
+    return datetime.strptime(value, '%Y-%m-%d')
+
+
+def parse_french_date(value: str) -> datetime:
+    """Parse une date 'JJ/MM/AAAA' ou 'JJ/MM/AA' (séparateurs / - .), ISO en repli."""
+    value = value.strip()
+    if len(value) in (8, 10) and value[2] == value[5] and value[2] in '/-.':
+        digits = value[:2] + value[3:5] + value[6:]
+        if digits.isascii() and digits.isdigit():
+            year = int(value[6:])
+            return datetime(year + 2000 if year < 100 else year, int(value[3:5]), int(value[:2]))
+    return parse_iso_date(value)
+
+
+def parse_french_amount(value: str) -> float:
+    """Parse un montant au format français ('-1 234,56') en une seule passe."""
+    if ',' in value and '.' in value:
+        # Le dernier séparateur est décimal : '1.234,56' (FR) ou '1,234.56' (US)
+        value = value.replace('.' if value.rfind(',') > value.rfind('.') else ',', '')
+    return float(value.translate(_AMOUNT_TRANSLATION))
+
+
+def normalize_column(name: str) -> str:
+    """Normalise un nom de colonne (sans accents, minuscules, espaces simples)."""
+    decomposed = unicodedata.normalize("NFKD", name.strip().strip('"'))
+    ascii_name = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(ascii_name.replace("\u2019", "'").lower().split())
+
+
+def is_recurring_label(description: str) -> bool:
+    """Détermine si une transaction est récurrente d'après son libellé."""
+    return RECURRING_PATTERN.search(description.upper()) is not None
+
+
+def make_transaction(
+    date: datetime,
+    amount: float,
+    description: str,
+    category: str = "",
+    category_parent: str = "",
+    supplier: str = "",
+    account_label: str = "",
+    is_recurring: bool = False,
+) -> ImportedTransaction:
+    """Construit une transaction à partir d'un montant signé (négatif = dépense)."""
+    return ImportedTransaction(
+        date=date,
+        description=description,
+        amount=abs(amount),
+        category=CATEGORY_MAPPING.get(category, category or "Autres"),
+        category_parent=category_parent,
+        supplier=supplier,
+        is_expense=amount < 0,
+        is_recurring=is_recurring or RECURRING_PATTERN.search(description.upper()) is not None,
+        account_label=account_label,
+    )
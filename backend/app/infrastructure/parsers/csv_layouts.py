@@ -0,0 +1,192 @@
+"""Parsers des exports CSV des principales banques françaises."""
+
+import csv
+import logging
+import re
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.domain.entities.import_result import ImportedTransaction
+from app.infrastructure.parsers.base import (
+    StatementParser,
+    StatementSample,
+    find_csv_header,
+    iter_lines,
+    skip_lines,
+)
+from app.infrastructure.parsers.conversion import (
+    is_recurring_label,
+    make_transaction,
+    normalize_column,
+    parse_french_amount,
+    parse_french_date,
+)
+
+logger = logging.getLogger(__name__)
+
+# Suffixe de devise des en-têtes ('Débit euros', 'Montant(EUROS)', 'Crédit (€)')
+_CURRENCY_SUFFIX = re.compile(r"\s*\(?\s*(?:euros?|eur|€)\s*\)?$")
+
+DATE_COLUMNS = (
+    "date",
+    "date operation",
+    "date de l'operation",
+    "date op",
+    "date de comptabilisation",
+    "date comptable",
+)
+VALUE_DATE_COLUMNS = ("date de valeur", "date valeur")
+LABEL_COLUMNS = (
+    "libelle",
+    "libelle operation",
+    "libelle de l'operation",
+    "libelle simplifie",
+)
+DETAIL_COLUMNS = ("detail de l'ecriture", "detail", "informations complementaires")
+CATEGORY_COLUMNS = ("categorie", "categorie operation")
+SUBCATEGORY_COLUMNS = ("sous categorie", "sous categorie operation")
+
+
+def header_key(name: str) -> str:
+    """Clé de comparaison d'un en-tête (normalisé, sans suffixe de devise)."""
+    return _CURRENCY_SUFFIX.sub("", normalize_column(name))
+
+
+@dataclass(frozen=True)
+class CSVLayout:
+    """Disposition des colonnes d'un export CSV (noms normalisés acceptés)."""
+
+    name: str
+    amount: Tuple[str, ...] = ()
+    debit: Tuple[str, ...] = ()
+    credit: Tuple[str, ...] = ()
+
+    def resolve(self, columns: List[str]) -> Optional[Dict[str, int]]:
+        """Retourne l'index de chaque champ, ou None si l'en-tête ne correspond pas."""
+        keys = {}
+        for i, column in enumerate(columns):
+            keys.setdefault(header_key(column), i)
+
+        def find(candidates: Tuple[str, ...]) -> int:
+            return next((keys[c] for c in candidates if c in keys), -1)
+
+        index = {
+            "date": find(DATE_COLUMNS),
+            "value_date": find(VALUE_DATE_COLUMNS),
+            "label": find(LABEL_COLUMNS),
+            "detail": find(DETAIL_COLUMNS),
+            "category": find(CATEGORY_COLUMNS),
+            "subcategory": find(SUBCATEGORY_COLUMNS),
+            "amount": find(self.amount),
+            "debit": find(self.debit),
+            "credit": find(self.credit),
+        }
+        has_amount = index["amount"] >= 0 if self.amount else (
+            index["debit"] >= 0 and index["credit"] >= 0
+        )
+        if index["date"] < 0 or index["label"] < 0 or not has_amount:
+            return None
+        return index
+
+
+# Débit et crédit séparés : Crédit Agricole, Caisse d'Épargne, Banque Populaire
+DEBIT_CREDIT_LAYOUT = CSVLayout(name="debit_credit", debit=("debit",), credit=("credit",))
+# Montant signé : Société Générale, La Banque Postale, BNP Paribas
+SIGNED_AMOUNT_LAYOUT = CSVLayout(
+    name="signed_amount",
+    amount=("montant", "montant de l'operation", "montant operation"),
+)
+FRENCH_CSV_LAYOUTS = (DEBIT_CREDIT_LAYOUT, SIGNED_AMOUNT_LAYOUT)
+
+
+class LayoutCSVParser(StatementParser):
+    """Parser CSV générique piloté par une disposition de colonnes."""
+
+    def __init__(self, layout: CSVLayout):
+        self.layout = layout
+        self.name = f"csv:{layout.name}"
+
+    def matches(self, sample: StatementSample) -> bool:
+        """Cherche l'en-tête de la disposition après un éventuel préambule."""
+        return self._find_header(sample) is not None
+
+    def parse_stream(
+        self, stream: BinaryIO, sample: StatementSample
+    ) -> Iterator[ImportedTransaction]:
+        """Parse le fichier en flux à partir de la ligne d'en-tête détectée."""
+        header = self._find_header(sample)
+        if header is None:
+            raise ValueError(f"En-tête CSV introuvable ({self.layout.name})")
+        lines = skip_lines(iter_lines(stream, sample.encoding), header.line_index + 1)
+        parse_row = self._compile_row_parser(self.layout.resolve(header.columns))
+
+        for cells in csv.reader(lines, delimiter=header.delimiter):
+            if not cells:
+                continue
+            try:
+                transaction = parse_row(cells)
+            except Exception as e:
+                # Lignes de solde ou de pied de page : ignorées
+                logger.warning("Ligne ignorée: %s", e)
+                continue
+
+            if transaction:
+                yield transaction
+
+    def _find_header(self, sample: StatementSample):
+        return find_csv_header(
+            sample.lines, lambda columns: self.layout.resolve(columns) is not None
+        )
+
+    @staticmethod
+    def _compile_row_parser(
+        index: Dict[str, int]
+    ) -> Callable[[List[str]], Optional[ImportedTransaction]]:
+        """Construit le parseur de lignes (index résolus une seule fois)."""
+        width = max(index.values()) + 1
+        i_date = index["date"]
+        i_value_date = index["value_date"]
+        i_label = index["label"]
+        i_detail = index["detail"]
+        i_category = index["category"]
+        i_subcategory = index["subcategory"]
+        i_amount = index["amount"]
+        i_debit = index["debit"]
+        i_credit = index["credit"]
+        padding = [''] * width
+
+        def parse_row(cells: List[str]) -> Optional[ImportedTransaction]:
+            if len(cells) < width:
+                cells.extend(padding[len(cells):])
+            # Les colonnes absentes (-1) pointent vers cette cellule vide
+            cells.append('')
+
+            date_raw = cells[i_date].strip()
+            if i_amount >= 0:
+                amount_raw = cells[i_amount].strip()
+                if not date_raw or not amount_raw:
+                    return None
+                amount = parse_french_amount(amount_raw)
+            else:
+                debit_raw = cells[i_debit].strip()
+                credit_raw = cells[i_credit].strip()
+                if not date_raw or not (debit_raw or credit_raw):
+                    return None
+                amount = (abs(parse_french_amount(credit_raw)) if credit_raw else 0.0) - (
+                    abs(parse_french_amount(debit_raw)) if debit_raw else 0.0
+                )
+
+            label = " ".join(cells[i_label].split())
+            detail = " ".join(cells[i_detail].split())
+            category = cells[i_category].strip()
+            subcategory = cells[i_subcategory].strip()
+            return make_transaction(
+                date=parse_french_date(cells[i_value_date] or date_raw),
+                amount=amount,
+                description=label or detail,
+                category=subcategory or category,
+                category_parent=category if subcategory else "",
+                is_recurring=is_recurring_label(detail),
+            )
+
+        return parse_row
@@ -1,50 +1,97 @@
 """Parser pour les fichiers CSV bancaires."""
 
 import csv
+import logging
+import os
+import re
 from datetime import datetime
-from typing import List
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional
 from io import StringIO
 
 from app.domain.entities.import_result import ImportedTransaction
+from app.infrastructure.parsers.base import (
+    StatementParser,
+    StatementSample,
+    find_csv_header,
+    iter_lines,
+    skip_lines,
+)
+from app.infrastructure.parsers.conversion import (
+    CATEGORY_MAPPING,
+    RECURRING_KEYWORDS,
+    RECURRING_PATTERN,
+    make_transaction,
+    parse_french_amount,
+    parse_iso_date,
+)
+from app.infrastructure.parsers.parallel import (
+    LINE_ALIGNED_ENCODINGS,
+    get_parallel_threshold,
+    get_parse_workers,
+    iter_parallel,
+)
 
+logger = logging.getLogger(__name__)
 
-class BankCSVParser:
+__all__ = ["BankCSVParser", "parse_french_amount", "parse_iso_date"]
+
+
+class BankCSVParser(StatementParser):
     """Parser pour les fichiers CSV d'exports bancaires."""
 
+    name = "csv"
+
     # Mots-clés pour détecter les transactions récurrentes
-    RECURRING_KEYWORDS = [
-        "PRLV SEPA",
-        "PRLV",
-        "PRELEVEMENT",
-        "ABONNEMENT",
-        "VIR SEPA",
-        "VIR INST",
-    ]
+    RECURRING_KEYWORDS = RECURRING_KEYWORDS
+    RECURRING_PATTERN: re.Pattern = RECURRING_PATTERN
 
     # Mapping des catégories bancaires vers nos catégories
-    CATEGORY_MAPPING = {
-        "Alimentation": "Alimentation",
-        "Restaurants, bars, discothèques…": "Restaurants",
-        "Transports quotidiens (métro, bus…)": "Transport",
-        "Carburant": "Carburant",
-        "Téléphonie (fixe et mobile)": "Téléphonie",
-        "Multimedia à domicile (TV, internet, téléphonie…)": "Abonnements",
-        "Crédit conso": "Crédit",
-        "Complémentaires santé": "Santé",
-        "Assurances (Auto/Moto)": "Assurance",
-        "Divertissement - culture (ciné, théâtre, concerts…)": "Loisirs",
-        "Electronique et informatique": "Electronique",
-        "Bricolage et jardinage": "Bricolage",
-        "Club / association (sport, hobby, art…)": "Sport",
-        "Etudes (formation, fournitures, cantines…)": "Education",
-        "Frais bancaires et de gestion (dont agios)": "Frais bancaires",
-        "Livres, CD/DVD, bijoux, jouets…": "Shopping",
-        "Mobilier, électroménager, décoration…": "Equipement maison",
-        "Dépenses Jeux et paris": "Jeux",
-        "Epargne financière (retraite, prévoyance, PEA, assurance-vie…)": "Epargne",
-        "Vie Quotidienne - Autres": "Autres",
-        "Non catégorisé": "Autres",
-    }
+    CATEGORY_MAPPING = CATEGORY_MAPPING
+
+    def __init__(
+        self, parallel_threshold: Optional[int] = None, workers: Optional[int] = None
+    ):
+        """
+        Args:
+            parallel_threshold: Taille (octets) au-delà de laquelle un fichier sur disque
+                est parsé sur plusieurs processus (0 = jamais)
+            workers: Nombre de processus de parsing
+        """
+        self.parallel_threshold = (
+            get_parallel_threshold() if parallel_threshold is None else parallel_threshold
+        )
+        self.workers = workers or get_parse_workers()
+
+    def matches(self, sample: StatementSample) -> bool:
+        """Reconnaît l'en-tête dateOp + amount/montant, quel que soit le séparateur."""
+        return find_csv_header(sample.lines, self._has_required_columns) is not None
+
+    def parse_stream(
+        self, stream: BinaryIO, sample: StatementSample
+    ) -> Iterator[ImportedTransaction]:
+        """Parse le fichier binaire en flux, à partir de la ligne d'en-tête détectée."""
+        header = find_csv_header(sample.lines, self._has_required_columns)
+        if header is None:
+            raise ValueError("En-tête CSV introuvable")
+        path = self._parallel_path(stream, sample)
+        if path:
+            self._validate_columns(header.columns)
+            # Début des données : octet suivant la ligne d'en-tête
+            for _ in range(header.line_index + 1):
+                stream.readline()
+            data_start = stream.tell()
+            stream.seek(0)
+            return iter_parallel(
+                self,
+                path,
+                data_start,
+                header.columns,
+                header.delimiter,
+                sample.encoding,
+                self.workers,
+            )
+        lines = skip_lines(iter_lines(stream, sample.encoding), header.line_index)
+        return self.iter_parse(lines, delimiter=header.delimiter)
 
     def parse(self, file_content: str) -> List[ImportedTransaction]:
         """
@@ -56,45 +103,178 @@ class BankCSVParser:
         Returns:
             Liste de ImportedTransaction
         """
-        transactions = []
+        return list(self.iter_parse(StringIO(file_content)))
 
-        # Enlever le BOM UTF-8 si présent
-        if file_content.startswith('\ufeff'):
-            file_content = file_content[1:]
+    def iter_parse(
+        self, lines: Iterable[str], delimiter: str = ';'
+    ) -> Iterator[ImportedTransaction]:
+        """
+        Parse un CSV ligne à ligne et produit les transactions une par une.
 
-        # Parser le CSV avec point-virgule comme délimiteur
-        csv_reader = csv.DictReader(StringIO(file_content), delimiter=';')
+        La mémoire utilisée ne dépend pas de la taille du fichier. Les index des
+        colonnes sont résolus une fois depuis l'en-tête (csv.reader, sans dict par ligne).
 
-        # Valider que les colonnes requises sont présentes
-        if csv_reader.fieldnames:
-            required_columns = ['dateOp']
-            has_amount = 'amount' in csv_reader.fieldnames or 'montant' in csv_reader.fieldnames
-            has_date = 'dateOp' in csv_reader.fieldnames
+        Args:
+            lines: Lignes du fichier CSV (fichier texte ouvert, StringIO...)
+            delimiter: Séparateur de colonnes (point-virgule par défaut)
+
+        Yields:
+            ImportedTransaction
+        """
+        # BOM UTF-8 retiré si présent
+        csv_reader = csv.reader(self._strip_bom(lines), delimiter=delimiter)
+        header = next(csv_reader, None)
+        if header is None:
+            return
+        self._validate_columns(header)
+        parse_row = self._compile_row_parser(header)
+
+        yield from self._iter_cells(csv_reader, parse_row)
+
+    def iter_rows(
+        self, lines: Iterable[str], header: List[str], delimiter: str = ';'
+    ) -> Iterator[ImportedTransaction]:
+        """Parse des lignes de données sans en-tête (plage d'un fichier découpé)."""
+        csv_reader = csv.reader(lines, delimiter=delimiter)
+        yield from self._iter_cells(csv_reader, self._compile_row_parser(header))
+
+    def _parallel_path(self, stream: BinaryIO, sample: StatementSample) -> Optional[str]:
+        """Chemin du fichier si son parsing doit être réparti sur plusieurs processus."""
+        path = getattr(stream, "name", None)
+        if (
+            not self.parallel_threshold
+            or self.workers < 2
+            or not isinstance(path, str)
+            or sample.encoding not in LINE_ALIGNED_ENCODINGS
+            or b"\n" not in sample.head
+        ):
+            return None
+        try:
+            return path if os.path.getsize(path) >= self.parallel_threshold else None
+        except OSError:
+            return None
+
+    @staticmethod
+    def _iter_cells(
+        csv_reader: Iterable[List[str]],
+        parse_row: Callable[[List[str]], Optional[ImportedTransaction]],
+    ) -> Iterator[ImportedTransaction]:
+        """Applique le parseur compilé à chaque ligne (lignes invalides ignorées)."""
+        for cells in csv_reader:
+            # Ignorer les lignes vides
+            if not cells:
+                continue
+            try:
+                transaction = parse_row(cells)
+            except Exception as e:
+                # Log l'erreur mais continue le parsing
+                logger.warning("Ligne ignorée: %s", e)
+                continue
 
-            if not has_date or not has_amount:
-                raise ValueError(
-                    f"Format CSV invalide. Colonnes requises: dateOp et (amount ou montant). "
-                    f"Colonnes trouvées: {csv_reader.fieldnames}"
-                )
+            if transaction:
+                yield transaction
+
+    def iter_parse_dicts(self, lines: Iterable[str]) -> Iterator[ImportedTransaction]:
+        """
+        Parse un CSV avec csv.DictReader (un dict par ligne).
+
+        Chemin de référence, plus lent, conservé pour vérifier et mesurer `iter_parse`.
+        """
+        csv_reader = csv.DictReader(self._strip_bom(lines), delimiter=';')
+        if csv_reader.fieldnames:
+            self._validate_columns(csv_reader.fieldnames)
 
         for row in csv_reader:
             try:
-                # Ignorer les lignes vides
                 # Supporter à la fois 'amount' et 'montant'
                 amount_value = row.get('amount') or row.get('montant')
                 if not row.get('dateOp') or not amount_value:
                     continue
 
                 transaction = self._parse_row(row)
-                if transaction:
-                    transactions.append(transaction)
 
             except Exception as e:
-                # Log l'erreur mais continue le parsing
-                print(f"Erreur lors du parsing de la ligne: {e}")
+                logger.warning("Ligne ignorée: %s", e)
                 continue
 
-        return transactions
+            if transaction:
+                yield transaction
+
+    @staticmethod
+    def _has_required_columns(columns: List[str]) -> bool:
+        """Indique si l'en-tête contient dateOp et amount/montant."""
+        return 'dateOp' in columns and ('amount' in columns or 'montant' in columns)
+
+    @staticmethod
+    def _validate_columns(fieldnames: List[str]) -> None:
+        """Valide que les colonnes requises sont présentes."""
+        has_amount = 'amount' in fieldnames or 'montant' in fieldnames
+        has_date = 'dateOp' in fieldnames
+
+        if not has_date or not has_amount:
+            raise ValueError(
+                f"Format CSV invalide. Colonnes requises: dateOp et (amount ou montant). "
+                f"Colonnes trouvées: {fieldnames}"
+            )
+
+    def _compile_row_parser(
+        self, header: List[str]
+    ) -> Callable[[List[str]], Optional[ImportedTransaction]]:
+        """Construit le parseur de lignes pour un en-tête (index résolus une seule fois).
+
+        Le parseur retourne None pour les lignes sans date d'opération ni montant.
+        """
+        # En cas de colonne dupliquée, la dernière l'emporte (comme csv.DictReader)
+        index = {name: i for i, name in enumerate(header)}
+        width = len(header)
+        # Les colonnes absentes pointent vers une cellule vide ajoutée en fin de ligne
+        missing = -1
+        i_date_op = index['dateOp']
+        i_date_val = index.get('dateVal', missing)
+        i_amount = index.get('amount', missing)
+        i_montant = index.get('montant', missing)
+        i_label = index.get('label', missing)
+        i_category = index.get('category', missing)
+        i_category_parent = index.get('categoryParent', missing)
+        i_supplier = index.get('supplierFound', missing)
+        i_account = index.get('accountLabel', missing)
+
+        padding = [''] * width
+
+        def parse_row(cells: List[str]) -> Optional[ImportedTransaction]:
+            # csv.reader crée une liste par ligne : la compléter sur place
+            if len(cells) < width:
+                cells.extend(padding[len(cells):])
+            cells.append('')
+
+            date_op = cells[i_date_op]
+            # Supporter à la fois 'amount' et 'montant'
+            amount_raw = cells[i_amount] or cells[i_montant]
+            if not date_op or not amount_raw:
+                return None
+
+            # Date de valeur, montant signé (négatif = dépense)
+            return make_transaction(
+                date=parse_iso_date(cells[i_date_val] or date_op),
+                amount=parse_french_amount(amount_raw),
+                description=cells[i_label].strip('"'),
+                category=cells[i_category].strip('"'),
+                category_parent=cells[i_category_parent].strip('"'),
+                supplier=cells[i_supplier].strip('"'),
+                account_label=cells[i_account].strip('"'),
+            )
+
+        return parse_row
+
+    @staticmethod
+    def _strip_bom(lines: Iterable[str]) -> Iterator[str]:
+        """Retire le BOM UTF-8 de la première ligne."""
+        lines = iter(lines)
+        first = next(lines, None)
+        if first is None:
+            return
+        yield first[1:] if first.startswith('\ufeff') else first
+        yield from lines
 
     def _parse_row(self, row: dict) -> ImportedTransaction:
         """Parse une ligne du CSV en ImportedTransaction."""
@@ -149,5 +329,4 @@ class BankCSVParser:
 
     def _is_recurring(self, description: str) -> bool:
         """Détermine si une transaction est récurrente basé sur sa description."""
-        description_upper = description.upper()
-        return any(keyword in description_upper for keyword in self.RECURRING_KEYWORDS)
+        return self.RECURRING_PATTERN.search(description.upper()) is not None
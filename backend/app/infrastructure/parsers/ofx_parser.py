@@ -0,0 +1,104 @@
+"""Parser des relevés OFX/QFX (SGML 1.x et XML 2.x), lu en flux."""
+
+import html
+import io
+import logging
+import re
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterable, Iterator, Tuple
+
+from app.domain.entities.import_result import ImportedTransaction
+from app.infrastructure.parsers.base import StatementParser, StatementSample
+from app.infrastructure.parsers.conversion import (
+    is_recurring_label,
+    make_transaction,
+    parse_french_amount,
+)
+
+logger = logging.getLogger(__name__)
+
+# Balise ouvrante ou fermante suivie de sa valeur (les feuilles SGML ne sont pas fermées)
+_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+# Types de transaction OFX correspondant à des prélèvements récurrents
+RECURRING_TRNTYPES = {"DIRECTDEBIT", "REPEATPMT"}
+READ_SIZE = 64 * 1024
+
+
+def parse_ofx_date(value: str) -> datetime:
+    """Parse une date OFX 'AAAAMMJJ[HHMMSS[.XXX][TZ]]' (seul le jour est conservé)."""
+    digits = value.strip()[:8]
+    if len(digits) != 8 or not digits.isdigit():
+        raise ValueError(f"Date OFX invalide: {value}")
+    return datetime(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+
+
+def iter_tokens(chunks: Iterable[str]) -> Iterator[Tuple[bool, str, str]]:
+    """Découpe le flux en balises (fermante, nom, valeur), morceau par morceau."""
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        # Garder la dernière balise, peut-être incomplète, pour le morceau suivant
+        cut = pending.rfind("<")
+        if cut <= 0:
+            continue
+        for match in _TAG.finditer(pending, 0, cut):
+            yield match.group(1) == "/", match.group(2).upper(), match.group(3).strip()
+        pending = pending[cut:]
+    for match in _TAG.finditer(pending):
+        yield match.group(1) == "/", match.group(2).upper(), match.group(3).strip()
+
+
+class OFXParser(StatementParser):
+    """Parser des relevés OFX/QFX (Open Financial Exchange)."""
+
+    name = "ofx"
+
+    def matches(self, sample: StatementSample) -> bool:
+        """Reconnaît l'en-tête OFX (SGML) ou la racine <OFX> (XML)."""
+        head = sample.text.upper()
+        return "OFXHEADER" in head or "<OFX>" in head
+
+    def parse_stream(
+        self, stream: BinaryIO, sample: StatementSample
+    ) -> Iterator[ImportedTransaction]:
+        """Parse les blocs <STMTTRN> au fil de la lecture."""
+        text = io.TextIOWrapper(stream, encoding=sample.encoding)
+        try:
+            chunks = iter(lambda: text.read(READ_SIZE), "")
+            for fields in self._iter_records(iter_tokens(chunks)):
+                try:
+                    transaction = self._to_transaction(fields)
+                except Exception as e:
+                    logger.warning("Transaction OFX ignorée: %s", e)
+                    continue
+                yield transaction
+        finally:
+            text.detach()
+
+    @staticmethod
+    def _iter_records(tokens: Iterable[Tuple[bool, str, str]]) -> Iterator[Dict[str, str]]:
+        """Regroupe les champs de chaque <STMTTRN>."""
+        current = None
+        for closing, tag, value in tokens:
+            if tag == "STMTTRN":
+                if current:
+                    yield current
+                current = None if closing else {}
+            elif current is not None and not closing and value:
+                current.setdefault(tag, html.unescape(value))
+        if current:
+            yield current
+
+    @staticmethod
+    def _to_transaction(fields: Dict[str, str]) -> ImportedTransaction:
+        name = fields.get("NAME", "")
+        memo = fields.get("MEMO", "")
+        return make_transaction(
+            date=parse_ofx_date(fields["DTPOSTED"]),
+            amount=parse_french_amount(fields["TRNAMT"]),
+            description=name or memo,
+            is_recurring=(
+                fields.get("TRNTYPE", "").upper() in RECURRING_TRNTYPES
+                or is_recurring_label(memo)
+            ),
+        )
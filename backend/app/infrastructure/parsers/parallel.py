@@ -0,0 +1,125 @@
+"""Parsing parallèle des gros exports CSV par plages d'octets alignées sur les enregistrements."""
+
+import io
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Iterator, List, Optional, Tuple
+
+from app.domain.entities.import_result import ImportedTransaction
+
+# Taille de fichier à partir de laquelle le parsing est réparti sur plusieurs processus
+DEFAULT_PARALLEL_THRESHOLD = 16 * 1024 * 1024
+# Taille d'une plage confiée à un processus
+DEFAULT_RANGE_BYTES = 4 * 1024 * 1024
+# Encodages où b"\n" ne peut pas apparaître au milieu d'un caractère
+LINE_ALIGNED_ENCODINGS = {"utf-8", "utf-8-sig", "cp1252"}
+
+
+def get_parallel_threshold() -> int:
+    """Seuil (en octets) du parsing parallèle (IMPORT_PARALLEL_THRESHOLD, 0 = désactivé)."""
+    return int(os.getenv("IMPORT_PARALLEL_THRESHOLD", str(DEFAULT_PARALLEL_THRESHOLD)))
+
+
+def get_parse_workers() -> int:
+    """Nombre de processus de parsing (IMPORT_PARSE_WORKERS, par défaut un par CPU)."""
+    return int(os.getenv("IMPORT_PARSE_WORKERS", "0")) or os.cpu_count() or 1
+
+
+def split_ranges(
+    path: str, start: int, range_bytes: int = DEFAULT_RANGE_BYTES
+) -> List[Tuple[int, int]]:
+    """Découpe le fichier à partir de `start` en plages [début, fin) d'enregistrements entiers.
+
+    Un champ entre guillemets peut contenir des sauts de ligne (libellés, mémos) : une
+    plage ne se termine que sur un b"\n" précédé d'un nombre pair de guillemets depuis
+    `start`, les guillemets doublés ("") d'un champ comptant pour deux.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    range_start, target = start, start + range_bytes
+    in_quotes = False
+    with open(path, "rb") as f:
+        f.seek(start)
+        position = start
+        while block := f.read(range_bytes):
+            offset = 0
+            while offset < len(block):
+                if position + offset < target:
+                    # Avant la fin visée : seule la parité des guillemets compte
+                    skip = min(target - position, len(block))
+                    in_quotes ^= block.count(b'"', offset, skip) % 2 == 1
+                    offset = skip
+                    continue
+                newline = block.find(b"\n", offset)
+                if newline == -1:
+                    in_quotes ^= block.count(b'"', offset) % 2 == 1
+                    break
+                in_quotes ^= block.count(b'"', offset, newline) % 2 == 1
+                offset = newline + 1
+                if not in_quotes:
+                    end = position + offset
+                    ranges.append((range_start, end))
+                    range_start, target = end, end + range_bytes
+            position += len(block)
+    if range_start < size:
+        ranges.append((range_start, size))
+    return ranges
+
+
+def parse_range(
+    parser,
+    path: str,
+    start: int,
+    end: int,
+    header: List[str],
+    delimiter: str,
+    encoding: str,
+) -> List[ImportedTransaction]:
+    """Parse une plage du fichier (exécuté dans un processus du pool)."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    lines = io.StringIO(data.decode(encoding), newline="")
+    return list(parser.iter_rows(lines, header, delimiter))
+
+
+def iter_parallel(
+    parser,
+    path: str,
+    data_start: int,
+    header: List[str],
+    delimiter: str,
+    encoding: str,
+    workers: int,
+    range_bytes: int = DEFAULT_RANGE_BYTES,
+    executor: Optional[Executor] = None,
+) -> Iterator[ImportedTransaction]:
+    """Parse les plages en parallèle et produit les transactions dans l'ordre du fichier.
+
+    Au plus deux plages par processus sont en cours : la mémoire reste bornée même si
+    l'écriture en base est plus lente que le parsing.
+    """
+    ranges = iter(split_ranges(path, data_start, range_bytes))
+    owned = executor is None
+    if owned:
+        # 'spawn' : pas de fork d'un processus qui exécute des threads (ordonnanceur, pool SQL)
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+
+    def submit(byte_range: Tuple[int, int]):
+        return executor.submit(
+            parse_range, parser, path, *byte_range, header, delimiter, encoding
+        )
+
+    try:
+        pending = deque(submit(r) for _, r in zip(range(workers * 2), ranges))
+        while pending:
+            transactions = pending.popleft().result()
+            next_range = next(ranges, None)
+            if next_range:
+                pending.append(submit(next_range))
+            yield from transactions
+    finally:
+        if owned:
+            executor.shutdown(cancel_futures=True)
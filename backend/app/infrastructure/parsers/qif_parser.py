@@ -0,0 +1,85 @@
+"""Parser des relevés QIF (Quicken Interchange Format), lu en flux."""
+
+import logging
+import re
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterable, Iterator
+
+from app.domain.entities.import_result import ImportedTransaction
+from app.infrastructure.parsers.base import StatementParser, StatementSample, iter_lines
+from app.infrastructure.parsers.conversion import make_transaction, parse_french_amount
+
+logger = logging.getLogger(__name__)
+
+_DATE_PARTS = re.compile(r"[/.\-' ]+")
+
+
+def parse_qif_date(value: str) -> datetime:
+    """Parse une date QIF ('15/01/2024', '15/01/24', '1/15'24' au format US)."""
+    parts = [p for p in _DATE_PARTS.split(value.strip()) if p]
+    if len(parts) != 3 or not all(p.isdigit() for p in parts):
+        raise ValueError(f"Date QIF invalide: {value}")
+    day, month, year = (int(p) for p in parts)
+    if month > 12:
+        # Ordre américain MM/JJ
+        day, month = month, day
+    if year < 100:
+        year += 2000
+    return datetime(year, month, day)
+
+
+class QIFParser(StatementParser):
+    """Parser des relevés QIF : un enregistrement par bloc terminé par '^'."""
+
+    name = "qif"
+
+    def matches(self, sample: StatementSample) -> bool:
+        """Reconnaît la première directive '!Type:' ou '!Account'."""
+        first = next((line.strip() for line in sample.lines if line.strip()), "")
+        return first.upper().startswith(("!TYPE:", "!ACCOUNT", "!OPTION"))
+
+    def parse_stream(
+        self, stream: BinaryIO, sample: StatementSample
+    ) -> Iterator[ImportedTransaction]:
+        """Parse les enregistrements au fil des lignes."""
+        for record in self._iter_records(iter_lines(stream, sample.encoding)):
+            try:
+                transaction = self._to_transaction(record)
+            except Exception as e:
+                logger.warning("Transaction QIF ignorée: %s", e)
+                continue
+            yield transaction
+
+    @staticmethod
+    def _iter_records(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+        """Regroupe les champs (code d'une lettre) de chaque enregistrement."""
+        record: Dict[str, str] = {}
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("!"):
+                continue
+            if line.startswith("^"):
+                if "D" in record:
+                    yield record
+                record = {}
+                continue
+            # Premier champ de chaque code : les sous-lignes de ventilation (S, $) sont ignorées
+            record.setdefault(line[0], line[1:].strip())
+        if "D" in record:
+            yield record
+
+    @staticmethod
+    def _to_transaction(record: Dict[str, str]) -> ImportedTransaction:
+        amount_raw = record.get("T") or record.get("U")
+        if not amount_raw:
+            raise ValueError("Montant absent")
+        # Catégorie 'Parent:Sous-catégorie' ; les virements entre comptes sont entre []
+        category_path = record.get("L", "").strip("[]")
+        category = category_path.split(":")[0]
+        return make_transaction(
+            date=parse_qif_date(record["D"]),
+            amount=parse_french_amount(amount_raw),
+            description=record.get("P") or record.get("M", ""),
+            category=category,
+            category_parent=category_path if category_path != category else "",
+        )
@@ -0,0 +1,54 @@
+"""Registre des parsers de relevés : détection du format et lecture en flux."""
+
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from app.domain.entities.import_result import ImportedTransaction
+from app.infrastructure.parsers.base import SNIFF_SIZE, StatementParser, StatementSample
+from app.infrastructure.parsers.camt_parser import CAMT053Parser
+from app.infrastructure.parsers.csv_layouts import FRENCH_CSV_LAYOUTS, LayoutCSVParser
+from app.infrastructure.parsers.csv_parser import BankCSVParser
+from app.infrastructure.parsers.ofx_parser import OFXParser
+from app.infrastructure.parsers.qif_parser import QIFParser
+
+
+class ParserRegistry:
+    """Choisit le parser d'un relevé à partir de ses premiers octets."""
+
+    def __init__(self, parsers: Optional[List[StatementParser]] = None):
+        self.parsers: List[StatementParser] = list(parsers or [])
+
+    @classmethod
+    def default(cls) -> "ParserRegistry":
+        """Registre des formats supportés (formats structurés avant les CSV)."""
+        return cls(
+            [
+                CAMT053Parser(),
+                OFXParser(),
+                QIFParser(),
+                BankCSVParser(),
+                *(LayoutCSVParser(layout) for layout in FRENCH_CSV_LAYOUTS),
+            ]
+        )
+
+    def register(self, parser: StatementParser, first: bool = False) -> None:
+        """Ajoute un parser (en tête pour qu'il soit essayé avant les autres)."""
+        if first:
+            self.parsers.insert(0, parser)
+        else:
+            self.parsers.append(parser)
+
+    def detect(self, stream: BinaryIO) -> Tuple[StatementParser, StatementSample]:
+        """Lit le début du fichier, choisit le parser puis revient au début."""
+        head = stream.read(SNIFF_SIZE)
+        stream.seek(0)
+        sample = StatementSample.from_head(head)
+        for parser in self.parsers:
+            if parser.matches(sample):
+                return parser, sample
+        formats = ", ".join(parser.name for parser in self.parsers)
+        raise ValueError(f"Format de relevé non reconnu. Formats supportés: {formats}")
+
+    def iter_parse(self, stream: BinaryIO) -> Iterator[ImportedTransaction]:
+        """Détecte le format puis produit les transactions au fil de la lecture."""
+        parser, sample = self.detect(stream)
+        return parser.parse_stream(stream, sample)
@@ -0,0 +1,57 @@
+"""Requêtes d'agrégation partagées par les repositories de transactions."""
+
+from datetime import datetime
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.domain.entities.forecast import AggregatedAmount
+from app.infrastructure.db.utils import day_bucket, to_naive_utc, to_utc_day
+
+
+def fetch_daily_totals(
+    db: Session,
+    model,
+    user_id: str,
+    start_date: datetime,
+    end_date: datetime,
+    by_category: bool = False,
+) -> list[AggregatedAmount]:
+    """Calcule côté SQL les sommes journalières d'un modèle de transaction.
+
+    Le résultat contient au plus une ligne par jour, par statut de récurrence
+    et (si demandé) par catégorie, quel que soit le nombre de transactions.
+    """
+    day = day_bucket(db, model.date).label("day")
+    is_recurring = func.coalesce(model.is_recurring, False).label("is_recurring")
+    columns = [
+        day,
+        is_recurring,
+        func.sum(model.amount).label("amount"),
+        func.count(model.id).label("count"),
+    ]
+    group_by = [day, is_recurring]
+    if by_category:
+        columns.append(model.category)
+        group_by.append(model.category)
+
+    rows = (
+        db.query(*columns)
+        .filter(
+            model.user_id == user_id,
+            model.date >= to_naive_utc(start_date),
+            model.date <= to_naive_utc(end_date),
+        )
+        .group_by(*group_by)
+        .order_by(*group_by)
+        .all()
+    )
+
+    return [
+        AggregatedAmount(
+            date=to_utc_day(row.day),
+            amount=float(row.amount or 0.0),
+            count=row.count,
+            category=row.category.value if by_category and row.category else None,
+            is_recurring=bool(row.is_recurring),
+        )
+        for row in rows
+    ]
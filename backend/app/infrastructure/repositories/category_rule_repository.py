@@ -0,0 +1,75 @@
+"""Repository pour les catégories apprises des corrections utilisateur."""
+
+from datetime import UTC
+
+from sqlalchemy import case
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.domain.entities.category_rule import CategoryRule
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.interfaces.category_rule_repository_interface import (
+    CategoryRuleRepositoryInterface,
+)
+from app.infrastructure.db.models.category_rule_db import CategoryRuleDB
+
+KEY_COLUMNS = ["user_id", "kind", "key"]
+
+
+class SQLCategoryRuleRepository(CategoryRuleRepositoryInterface):
+    """Implémentation SQL du repository des catégories apprises."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_user_id(self, user_id: str) -> list[CategoryRule]:
+        """Récupère toutes les règles d'un utilisateur."""
+        rules = self.db.query(CategoryRuleDB).filter(CategoryRuleDB.user_id == user_id).all()
+        return [self._to_entity(rule_db) for rule_db in rules]
+
+    def upsert(self, rule: CategoryRule) -> CategoryRule:
+        """Crée ou remplace la règle (upsert atomique) et valide.
+
+        Une correction vers la même catégorie incrémente `hits`, une autre la remplace.
+        """
+        values = {
+            "user_id": rule.user_id,
+            "kind": rule.kind.value,
+            "key": rule.key,
+            "category": rule.category,
+            "hits": 1,
+            "updated_at": rule.updated_at,
+        }
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(CategoryRuleDB).values(**values)
+        same_category = CategoryRuleDB.category == statement.excluded.category
+        statement = statement.on_conflict_do_update(
+            index_elements=KEY_COLUMNS,
+            set_={
+                "category": statement.excluded.category,
+                "hits": case((same_category, CategoryRuleDB.hits + 1), else_=1),
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        try:
+            self.db.execute(statement)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        rule_db = self.db.get(CategoryRuleDB, (rule.user_id, rule.kind.value, rule.key))
+        return self._to_entity(rule_db)
+
+    @staticmethod
+    def _to_entity(rule_db: CategoryRuleDB) -> CategoryRule:
+        updated_at = rule_db.updated_at
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=UTC)
+        return CategoryRule(
+            user_id=rule_db.user_id,
+            kind=RollupKind(rule_db.kind),
+            key=rule_db.key,
+            category=rule_db.category,
+            hits=rule_db.hits,
+            updated_at=updated_at,
+        )
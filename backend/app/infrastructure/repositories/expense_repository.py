@@ -1,9 +1,17 @@
 """Module contenant le repository pour les opérations liées aux dépenses."""
 
+from datetime import datetime
+from typing import Iterator, Optional
 from sqlalchemy.orm import Session
 from app.domain.entities.expense import Expense
+from app.domain.entities.forecast import AggregatedAmount
+from app.domain.entities.transaction_query import TransactionQuery
+from app.domain.exceptions import DuplicateTransactionError
 from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
 from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.utils import insert_many_or_ignore, insert_or_ignore, to_naive_utc
+from app.infrastructure.repositories.aggregates import fetch_daily_totals
+from app.infrastructure.repositories.pagination import find_page, iter_keyset
 
 
 class SQLExpenseRepository(ExpenseRepositoryInterface):
@@ -13,7 +21,15 @@ class SQLExpenseRepository(ExpenseRepositoryInterface):
         self.db = db
 
     def create(self, expense: Expense) -> Expense:
-        """Crée une dépense."""
+        """Crée une dépense.
+
+        Une dépense avec empreinte (import) est insérée via ON CONFLICT DO NOTHING :
+        si l'empreinte existe déjà, la transaction (agrégats compris) est annulée et
+        DuplicateTransactionError est levée.
+        """
+        if expense.fingerprint is not None:
+            return self._create_unique(expense)
+
         expense_db = ExpenseDB(
             id=expense.id,
             user_id=expense.user_id,
@@ -35,6 +51,43 @@ class SQLExpenseRepository(ExpenseRepositoryInterface):
         expense_dict = {k: v for k, v in expense_db.__dict__.items() if not k.startswith('_')}
         return Expense(**expense_dict)
 
+    def _create_unique(self, expense: Expense) -> Expense:
+        """Crée une dépense importée, sauf si son empreinte existe déjà."""
+        values = {k: v for k, v in expense.__dict__.items() if not k.startswith('_')}
+        try:
+            inserted = insert_or_ignore(self.db, ExpenseDB, values, ["user_id", "fingerprint"])
+        except Exception:
+            self.db.rollback()
+            raise
+        if not inserted:
+            self.db.rollback()
+            raise DuplicateTransactionError(f"Dépense déjà importée: {expense.name}")
+        self.db.commit()
+        return expense
+
+    def bulk_create(self, expenses: list[Expense]) -> list[Expense]:
+        """Crée plusieurs dépenses en un seul INSERT multi-lignes, puis un seul commit.
+
+        Si une empreinte existe déjà, tout le lot (agrégats compris) est annulé et
+        DuplicateTransactionError est levée.
+        """
+        rows = [
+            {k: v for k, v in expense.__dict__.items() if not k.startswith('_')}
+            for expense in expenses
+        ]
+        try:
+            inserted = insert_many_or_ignore(self.db, ExpenseDB, rows, ["user_id", "fingerprint"])
+        except Exception:
+            self.db.rollback()
+            raise
+        if inserted < len(rows):
+            self.db.rollback()
+            raise DuplicateTransactionError(
+                f"Dépenses déjà importées: {len(rows) - inserted} sur {len(rows)}"
+            )
+        self.db.commit()
+        return expenses
+
     def get_all(self, user_id: str) -> list[Expense]:
         """Récupère toutes les dépenses."""
 
@@ -111,6 +164,61 @@ class SQLExpenseRepository(ExpenseRepositoryInterface):
             for expense in expenses
         ]
 
+    def iter_by_user_id(
+        self, user_id: str, since: Optional[datetime] = None, batch_size: int = 500
+    ) -> Iterator[Expense]:
+        """Parcourt les dépenses d'un utilisateur par lots, triées par date."""
+
+        for expense in iter_keyset(self.db, ExpenseDB, user_id, since, batch_size):
+            yield self._to_entity(expense)
+
+    def get_page(self, user_id: str, query: TransactionQuery) -> list[Expense]:
+        """Récupère les dépenses filtrées et triées d'un utilisateur, après `query.after`."""
+
+        expenses = find_page(self.db, ExpenseDB, user_id, query)
+        return [self._to_entity(expense) for expense in expenses]
+
+    def get_by_user_id_and_date_range(
+        self, user_id: str, start_date: datetime, end_date: datetime
+    ) -> list[Expense]:
+        """Récupère les dépenses d'un utilisateur comprises entre deux dates (incluses)."""
+
+        # Le filtre est résolu par l'index composite (user_id, date, id)
+        expenses = (
+            self.db.query(ExpenseDB)
+            .filter(
+                ExpenseDB.user_id == user_id,
+                ExpenseDB.date >= to_naive_utc(start_date),
+                ExpenseDB.date <= to_naive_utc(end_date),
+            )
+            .order_by(ExpenseDB.date)
+            .all()
+        )
+
+        return [self._to_entity(expense) for expense in expenses]
+
+    def get_recurring_by_user_id(self, user_id: str, since: datetime) -> list[Expense]:
+        """Récupère les dépenses récurrentes d'un utilisateur depuis une date, triées par date."""
+
+        expenses = (
+            self.db.query(ExpenseDB)
+            .filter(
+                ExpenseDB.user_id == user_id,
+                ExpenseDB.is_recurring.is_(True),
+                ExpenseDB.date >= to_naive_utc(since),
+            )
+            .order_by(ExpenseDB.date, ExpenseDB.id)
+            .all()
+        )
+
+        return [self._to_entity(expense) for expense in expenses]
+
+    def get_daily_totals(
+        self, user_id: str, start_date: datetime, end_date: datetime, by_category: bool = False
+    ) -> list[AggregatedAmount]:
+        """Récupère les sommes journalières des dépenses par récurrence (et catégorie)."""
+        return fetch_daily_totals(self.db, ExpenseDB, user_id, start_date, end_date, by_category)
+
     def update(self, expense: Expense, user_id: str) -> Expense:
         """Met à jour une dépense."""
 
@@ -123,9 +231,11 @@ class SQLExpenseRepository(ExpenseRepositoryInterface):
         if not expense_db:
             raise ValueError("Dépense non trouvée")
 
+        # L'empreinte d'une dépense importée est conservée lors de sa modification
+        values = {k: v for k, v in expense.__dict__.items() if k != "fingerprint"}
         self.db.query(ExpenseDB).filter(
             ExpenseDB.id == expense.id, ExpenseDB.user_id == user_id
-        ).update(expense.__dict__)
+        ).update(values)
         self.db.commit()
 
         return Expense(
@@ -148,3 +258,21 @@ class SQLExpenseRepository(ExpenseRepositoryInterface):
             ExpenseDB.id == expense_id, ExpenseDB.user_id == user_id
         ).delete()
         self.db.commit()
+
+    @staticmethod
+    def _to_entity(expense_db: ExpenseDB) -> Expense:
+        """Convertit un modèle ExpenseDB en entité Expense."""
+        return Expense(
+            id=expense_db.id,
+            user_id=expense_db.user_id,
+            name=expense_db.name,
+            amount=expense_db.amount,
+            date=expense_db.date,
+            category=expense_db.category,
+            description=expense_db.description,
+            is_recurring=expense_db.is_recurring,
+            frequency=expense_db.frequency,
+            fingerprint=expense_db.fingerprint,
+            created_at=expense_db.created_at,
+            updated_at=expense_db.updated_at,
+        )
@@ -0,0 +1,59 @@
+"""Repository pour les prévisions précalculées."""
+
+from typing import Optional
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.domain.entities.forecast import ForecastData, ForecastPeriod, ForecastSnapshot
+from app.domain.interfaces.forecast_snapshot_repository_interface import (
+    ForecastSnapshotRepositoryInterface,
+)
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB
+from app.infrastructure.db.utils import to_naive_utc
+from app.infrastructure.forecasting.forecast_serializer import (
+    deserialize_forecast,
+    serialize_forecast,
+)
+
+
+class SQLForecastSnapshotRepository(ForecastSnapshotRepositoryInterface):
+    """Implémentation SQL du repository des prévisions précalculées."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: str, period: ForecastPeriod) -> Optional[ForecastSnapshot]:
+        """Récupère la dernière prévision précalculée d'un utilisateur pour une période."""
+        snapshot = self.db.get(ForecastSnapshotDB, (user_id, period.value))
+        if snapshot is None:
+            return None
+        return ForecastSnapshot(
+            forecast=deserialize_forecast(snapshot.payload), data_version=snapshot.data_version
+        )
+
+    def save_all(self, forecasts: list[ForecastData], data_version: int) -> None:
+        """Enregistre (ou remplace) des prévisions calculées à une version des données."""
+        if not forecasts:
+            return
+
+        rows = [
+            {
+                "user_id": forecast.user_id,
+                "period": forecast.period.value,
+                "payload": serialize_forecast(forecast),
+                "data_version": data_version,
+                "computed_at": to_naive_utc(forecast.created_at),
+            }
+            for forecast in forecasts
+        ]
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(ForecastSnapshotDB).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "period"],
+            set_={
+                "payload": statement.excluded.payload,
+                "data_version": statement.excluded.data_version,
+                "computed_at": statement.excluded.computed_at,
+            },
+        )
+        self.db.execute(statement)
+        self.db.commit()
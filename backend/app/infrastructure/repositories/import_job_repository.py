@@ -0,0 +1,185 @@
+"""Repository pour les imports en arrière-plan."""
+
+import json
+from dataclasses import asdict
+from datetime import datetime, UTC
+from typing import Optional
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.domain.entities.import_job import ImportJob, ImportJobStatus
+from app.domain.entities.import_result import ImportChunkResult, ImportResult
+from app.domain.exceptions import DuplicateImportJobError
+from app.domain.interfaces.import_job_repository_interface import ImportJobRepositoryInterface
+from app.infrastructure.db.models.import_job_db import ImportJobDB
+from app.infrastructure.db.utils import to_naive_utc
+
+UNFINISHED_STATUSES = (ImportJobStatus.PENDING.value, ImportJobStatus.RUNNING.value)
+
+
+class SQLImportJobRepository(ImportJobRepositoryInterface):
+    """Implémentation SQL du repository des imports en arrière-plan."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, job: ImportJob) -> ImportJob:
+        """Enregistre un nouvel import (un seul import actif par fichier)."""
+        job_db = ImportJobDB(id=job.id, user_id=job.user_id)
+        self._copy(job, job_db)
+        job_db.created_at = to_naive_utc(job.created_at)
+        self.db.add(job_db)
+        self._commit_unique()
+        return job
+
+    def get_by_id(self, job_id: str, user_id: Optional[str] = None) -> Optional[ImportJob]:
+        """Récupère un import par son id (restreint à un utilisateur si précisé)."""
+        query = self.db.query(ImportJobDB).filter(ImportJobDB.id == job_id)
+        if user_id is not None:
+            query = query.filter(ImportJobDB.user_id == user_id)
+        job_db = query.first()
+        return self._to_entity(job_db) if job_db else None
+
+    def update(self, job: ImportJob) -> ImportJob:
+        """Enregistre l'état et l'avancement d'un import."""
+        job_db = self.db.get(ImportJobDB, job.id)
+        if job_db is None:
+            raise ValueError("L'import n'existe pas")
+        if job.owner and job_db.owner != job.owner:
+            # Bail expiré et repris : l'ancien worker ne doit plus rien écrire
+            self.db.rollback()
+            raise ValueError("L'import a été repris par un autre worker")
+        self._copy(job, job_db)
+        self._commit_unique()
+        return job
+
+    def claim(self, job_id: str, owner: str, stale_before: datetime) -> Optional[ImportJob]:
+        """Prend un import en attente ou abandonné (UPDATE conditionnel, atomique)."""
+        now = to_naive_utc(datetime.now(UTC))
+        claimed = (
+            self.db.query(ImportJobDB)
+            .filter(ImportJobDB.id == job_id, self._claimable(stale_before))
+            .update(
+                {
+                    ImportJobDB.status: ImportJobStatus.RUNNING.value,
+                    ImportJobDB.owner: owner,
+                    ImportJobDB.heartbeat_at: now,
+                    ImportJobDB.updated_at: now,
+                },
+                synchronize_session=False,
+            )
+        )
+        self.db.commit()
+        return self.get_by_id(job_id) if claimed else None
+
+    def renew(self, job_id: str, owner: str) -> bool:
+        """Renouvelle le bail d'un import en cours (UPDATE conditionnel sur le worker)."""
+        renewed = (
+            self.db.query(ImportJobDB)
+            .filter(
+                ImportJobDB.id == job_id,
+                ImportJobDB.owner == owner,
+                ImportJobDB.status == ImportJobStatus.RUNNING.value,
+            )
+            .update(
+                {ImportJobDB.heartbeat_at: to_naive_utc(datetime.now(UTC))},
+                synchronize_session=False,
+            )
+        )
+        self.db.commit()
+        return bool(renewed)
+
+    def get_unfinished(self, stale_before: Optional[datetime] = None) -> list[ImportJob]:
+        """Récupère les imports en attente ou interrompus, du plus ancien au plus récent."""
+        query = self.db.query(ImportJobDB)
+        if stale_before is None:
+            query = query.filter(ImportJobDB.status.in_(UNFINISHED_STATUSES))
+        else:
+            query = query.filter(self._claimable(stale_before))
+        jobs = query.order_by(ImportJobDB.created_at).all()
+        return [self._to_entity(job_db) for job_db in jobs]
+
+    def get_latest_by_content_hash(self, user_id: str, content_hash: str) -> Optional[ImportJob]:
+        """Récupère le dernier import d'un fichier identique de l'utilisateur."""
+        job_db = (
+            self.db.query(ImportJobDB)
+            .filter(ImportJobDB.user_id == user_id, ImportJobDB.content_hash == content_hash)
+            .order_by(ImportJobDB.created_at.desc())
+            .first()
+        )
+        return self._to_entity(job_db) if job_db else None
+
+    @staticmethod
+    def _claimable(stale_before: datetime):
+        """Imports en attente, ou en cours avec un bail expiré (ou sans bail)."""
+        return or_(
+            ImportJobDB.status == ImportJobStatus.PENDING.value,
+            and_(
+                ImportJobDB.status == ImportJobStatus.RUNNING.value,
+                or_(
+                    ImportJobDB.heartbeat_at.is_(None),
+                    ImportJobDB.heartbeat_at < to_naive_utc(stale_before),
+                ),
+            ),
+        )
+
+    def _commit_unique(self) -> None:
+        """Valide l'écriture ; un second import actif du même fichier est refusé."""
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise DuplicateImportJobError("Un import de ce fichier est déjà en cours")
+
+    @staticmethod
+    def _copy(job: ImportJob, job_db: ImportJobDB) -> None:
+        """Copie les champs modifiables de l'entité vers le modèle."""
+        job_db.filename = job.filename
+        job_db.file_path = job.file_path
+        job_db.content_hash = job.content_hash
+        job_db.status = job.status.value
+        job_db.rows_parsed = job.rows_parsed
+        job_db.expenses_created = job.expenses_created
+        job_db.incomes_created = job.incomes_created
+        job_db.skipped = job.skipped
+        job_db.result = json.dumps(asdict(job.result)) if job.result else None
+        job_db.error = job.error
+        job_db.updated_at = to_naive_utc(job.updated_at)
+        job_db.finished_at = to_naive_utc(job.finished_at) if job.finished_at else None
+        job_db.owner = job.owner
+        job_db.heartbeat_at = to_naive_utc(job.heartbeat_at) if job.heartbeat_at else None
+
+    @staticmethod
+    def _to_entity(job_db: ImportJobDB) -> ImportJob:
+        """Convertit un modèle en entité (dates en UTC)."""
+        return ImportJob(
+            id=job_db.id,
+            user_id=job_db.user_id,
+            filename=job_db.filename,
+            file_path=job_db.file_path,
+            content_hash=job_db.content_hash,
+            status=ImportJobStatus(job_db.status),
+            rows_parsed=job_db.rows_parsed,
+            expenses_created=job_db.expenses_created,
+            incomes_created=job_db.incomes_created,
+            skipped=job_db.skipped,
+            result=_load_result(job_db.result) if job_db.result else None,
+            error=job_db.error,
+            created_at=_as_utc(job_db.created_at),
+            updated_at=_as_utc(job_db.updated_at),
+            finished_at=_as_utc(job_db.finished_at) if job_db.finished_at else None,
+            owner=job_db.owner,
+            heartbeat_at=_as_utc(job_db.heartbeat_at) if job_db.heartbeat_at else None,
+        )
+
+
+def _load_result(raw: str) -> ImportResult:
+    """Reconstruit le résultat d'un import à partir de son JSON."""
+    payload = json.loads(raw)
+    chunks = [ImportChunkResult(**chunk) for chunk in payload.pop("chunks", [])]
+    return ImportResult(**payload, chunks=chunks)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Rattache une date stockée en UTC naïf au fuseau UTC."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
@@ -0,0 +1,58 @@
+"""Repository pour le registre des lots importés."""
+
+import json
+from datetime import UTC
+from sqlalchemy.orm import Session
+from app.domain.entities.import_ledger import ImportLedgerChunk
+from app.domain.interfaces.import_ledger_repository_interface import (
+    ImportLedgerRepositoryInterface,
+)
+from app.infrastructure.db.models.import_ledger_db import ImportLedgerChunkDB
+from app.infrastructure.db.utils import to_naive_utc
+
+
+class SQLImportLedgerRepository(ImportLedgerRepositoryInterface):
+    """Implémentation SQL du registre des lots importés."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_chunks(self, job_id: str) -> list[ImportLedgerChunk]:
+        """Récupère les lots déjà écrits d'un import, par index croissant."""
+        chunks = (
+            self.db.query(ImportLedgerChunkDB)
+            .filter(ImportLedgerChunkDB.job_id == job_id)
+            .order_by(ImportLedgerChunkDB.chunk_index)
+            .all()
+        )
+        return [
+            ImportLedgerChunk(
+                index=chunk_db.chunk_index,
+                chunk_hash=chunk_db.chunk_hash,
+                rows=chunk_db.rows,
+                expenses_created=chunk_db.expenses_created,
+                incomes_created=chunk_db.incomes_created,
+                skipped=chunk_db.skipped,
+                errors=json.loads(chunk_db.errors) if chunk_db.errors else [],
+                committed_at=chunk_db.committed_at.replace(tzinfo=UTC),
+            )
+            for chunk_db in chunks
+        ]
+
+    def add_chunk(self, job_id: str, chunk: ImportLedgerChunk) -> ImportLedgerChunk:
+        """Consigne un lot entièrement écrit (remplace une consignation précédente)."""
+        self.db.merge(
+            ImportLedgerChunkDB(
+                job_id=job_id,
+                chunk_index=chunk.index,
+                chunk_hash=chunk.chunk_hash,
+                rows=chunk.rows,
+                expenses_created=chunk.expenses_created,
+                incomes_created=chunk.incomes_created,
+                skipped=chunk.skipped,
+                errors=json.dumps(chunk.errors) if chunk.errors else None,
+                committed_at=to_naive_utc(chunk.committed_at),
+            )
+        )
+        self.db.commit()
+        return chunk
@@ -1,9 +1,17 @@
 """Implémentation du repository des revenus (synchrone)."""
 
+from datetime import datetime
+from typing import Iterator, Optional
 from sqlalchemy.orm import Session
+from app.domain.entities.forecast import AggregatedAmount
 from app.domain.entities.income import Income
+from app.domain.entities.transaction_query import TransactionQuery
+from app.domain.exceptions import DuplicateTransactionError
 from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
 from app.infrastructure.db.models.income_db import IncomeDB
+from app.infrastructure.db.utils import insert_many_or_ignore, insert_or_ignore, to_naive_utc
+from app.infrastructure.repositories.aggregates import fetch_daily_totals
+from app.infrastructure.repositories.pagination import find_page, iter_keyset
 
 
 class SQLIncomeRepository(IncomeRepositoryInterface):
@@ -13,7 +21,15 @@ class SQLIncomeRepository(IncomeRepositoryInterface):
         self.db = db
 
     def create(self, income: Income) -> Income:
-        """Crée un revenu."""
+        """Crée un revenu.
+
+        Un revenu avec empreinte (import) est inséré via ON CONFLICT DO NOTHING :
+        si l'empreinte existe déjà, la transaction (agrégats compris) est annulée et
+        DuplicateTransactionError est levée.
+        """
+        if income.fingerprint is not None:
+            return self._create_unique(income)
+
         income_db = IncomeDB(
             id=income.id,
             user_id=income.user_id,
@@ -32,6 +48,43 @@ class SQLIncomeRepository(IncomeRepositoryInterface):
         self.db.refresh(income_db)
         return Income(**{k: v for k, v in income_db.__dict__.items() if not k.startswith('_')})
 
+    def _create_unique(self, income: Income) -> Income:
+        """Crée un revenu importé, sauf si son empreinte existe déjà."""
+        values = {k: v for k, v in income.__dict__.items() if not k.startswith('_')}
+        try:
+            inserted = insert_or_ignore(self.db, IncomeDB, values, ["user_id", "fingerprint"])
+        except Exception:
+            self.db.rollback()
+            raise
+        if not inserted:
+            self.db.rollback()
+            raise DuplicateTransactionError(f"Revenu déjà importé: {income.name}")
+        self.db.commit()
+        return income
+
+    def bulk_create(self, incomes: list[Income]) -> list[Income]:
+        """Crée plusieurs revenus en un seul INSERT multi-lignes, puis un seul commit.
+
+        Si une empreinte existe déjà, tout le lot (agrégats compris) est annulé et
+        DuplicateTransactionError est levée.
+        """
+        rows = [
+            {k: v for k, v in income.__dict__.items() if not k.startswith('_')}
+            for income in incomes
+        ]
+        try:
+            inserted = insert_many_or_ignore(self.db, IncomeDB, rows, ["user_id", "fingerprint"])
+        except Exception:
+            self.db.rollback()
+            raise
+        if inserted < len(rows):
+            self.db.rollback()
+            raise DuplicateTransactionError(
+                f"Revenus déjà importés: {len(rows) - inserted} sur {len(rows)}"
+            )
+        self.db.commit()
+        return incomes
+
     def get_by_id(self, income_id: str, user_id: str) -> Income | None:
         """Récupère un revenu par son id et user_id."""
         income_db = (
@@ -43,14 +96,49 @@ class SQLIncomeRepository(IncomeRepositoryInterface):
             return None
         return Income(**{k: v for k, v in income_db.__dict__.items() if not k.startswith('_')})
 
-    def get_all_by_user_id(self, user_id: str, skip: int = 0, limit: int = 100) -> list[Income]:
-        """Récupère tous les revenus d'un utilisateur avec pagination."""
-        incomes_db = (
+    def get_all_by_user_id(
+        self, user_id: str, skip: int = 0, limit: Optional[int] = None
+    ) -> list[Income]:
+        """Récupère tous les revenus d'un utilisateur avec pagination (sans limite par défaut)."""
+        query = (
             self.db.query(IncomeDB)
             .filter(IncomeDB.user_id == user_id)
             .order_by(IncomeDB.date.desc())
             .offset(skip)
-            .limit(limit)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return [
+            Income(**{k: v for k, v in income_db.__dict__.items() if not k.startswith('_')})
+            for income_db in query.all()
+        ]
+
+    def iter_by_user_id(
+        self, user_id: str, since: Optional[datetime] = None, batch_size: int = 500
+    ) -> Iterator[Income]:
+        """Parcourt les revenus d'un utilisateur par lots, triés par date."""
+        for income_db in iter_keyset(self.db, IncomeDB, user_id, since, batch_size):
+            yield Income(**{k: v for k, v in income_db.__dict__.items() if not k.startswith('_')})
+
+    def get_page(self, user_id: str, query: TransactionQuery) -> list[Income]:
+        """Récupère les revenus filtrés et triés d'un utilisateur, après `query.after`."""
+        return [
+            Income(**{k: v for k, v in income_db.__dict__.items() if not k.startswith('_')})
+            for income_db in find_page(self.db, IncomeDB, user_id, query)
+        ]
+
+    def get_by_user_id_and_date_range(
+        self, user_id: str, start_date: datetime, end_date: datetime
+    ) -> list[Income]:
+        """Récupère les revenus d'un utilisateur compris entre deux dates (incluses)."""
+        incomes_db = (
+            self.db.query(IncomeDB)
+            .filter(
+                IncomeDB.user_id == user_id,
+                IncomeDB.date >= to_naive_utc(start_date),
+                IncomeDB.date <= to_naive_utc(end_date),
+            )
+            .order_by(IncomeDB.date)
             .all()
         )
         return [
@@ -58,6 +146,29 @@ class SQLIncomeRepository(IncomeRepositoryInterface):
             for income_db in incomes_db
         ]
 
+    def get_recurring_by_user_id(self, user_id: str, since: datetime) -> list[Income]:
+        """Récupère les revenus récurrents d'un utilisateur depuis une date, triés par date."""
+        incomes_db = (
+            self.db.query(IncomeDB)
+            .filter(
+                IncomeDB.user_id == user_id,
+                IncomeDB.is_recurring.is_(True),
+                IncomeDB.date >= to_naive_utc(since),
+            )
+            .order_by(IncomeDB.date, IncomeDB.id)
+            .all()
+        )
+        return [
+            Income(**{k: v for k, v in income_db.__dict__.items() if not k.startswith('_')})
+            for income_db in incomes_db
+        ]
+
+    def get_daily_totals(
+        self, user_id: str, start_date: datetime, end_date: datetime, by_category: bool = False
+    ) -> list[AggregatedAmount]:
+        """Récupère les sommes journalières des revenus par récurrence (et catégorie)."""
+        return fetch_daily_totals(self.db, IncomeDB, user_id, start_date, end_date, by_category)
+
     def update(self, income: Income) -> Income | None:
         """Met à jour un revenu existant."""
         income_db = (
@@ -69,6 +180,9 @@ class SQLIncomeRepository(IncomeRepositoryInterface):
             return None
 
         for attr, value in income.__dict__.items():
+            # L'empreinte d'un revenu importé est conservée lors de sa modification
+            if attr == "fingerprint":
+                continue
             if hasattr(income_db, attr):
                 setattr(income_db, attr, value)
         self.db.commit()
@@ -0,0 +1,119 @@
+"""Repository pour les agrégats mensuels des transactions."""
+
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
+from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.models.income_db import IncomeDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB
+from app.infrastructure.db.utils import month_bucket
+
+KEY_COLUMNS = ["user_id", "year_month", "kind", "category", "is_recurring"]
+
+
+class SQLMonthlyRollupRepository(MonthlyRollupRepositoryInterface):
+    """Implémentation SQL du repository des agrégats mensuels."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(self, delta: MonthlyRollup) -> None:
+        """Ajoute un delta à la ligne d'agrégat (upsert atomique, sans commit)."""
+        values = {
+            "user_id": delta.user_id,
+            "year_month": delta.year_month,
+            "kind": delta.kind.value,
+            "category": delta.category,
+            "is_recurring": delta.is_recurring,
+            "amount": delta.amount,
+            "count": delta.count,
+        }
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(MonthlyRollupDB).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=KEY_COLUMNS,
+            set_={
+                "amount": MonthlyRollupDB.amount + statement.excluded.amount,
+                "count": MonthlyRollupDB.count + statement.excluded.count,
+            },
+        )
+        self.db.execute(statement)
+
+    def rollback(self) -> None:
+        """Annule la transaction en cours de la session partagée."""
+        self.db.rollback()
+
+    def get_by_user_id(
+        self,
+        user_id: str,
+        start_month: str,
+        end_month: str,
+        kind: Optional[RollupKind] = None,
+    ) -> list[MonthlyRollup]:
+        """Récupère les agrégats d'un utilisateur entre deux mois 'YYYY-MM' (inclus)."""
+        query = self.db.query(MonthlyRollupDB).filter(
+            MonthlyRollupDB.user_id == user_id,
+            MonthlyRollupDB.year_month >= start_month,
+            MonthlyRollupDB.year_month <= end_month,
+            MonthlyRollupDB.count > 0,
+        )
+        if kind is not None:
+            query = query.filter(MonthlyRollupDB.kind == kind.value)
+
+        return [
+            MonthlyRollup(
+                user_id=rollup_db.user_id,
+                year_month=rollup_db.year_month,
+                kind=RollupKind(rollup_db.kind),
+                category=rollup_db.category,
+                is_recurring=rollup_db.is_recurring,
+                amount=rollup_db.amount,
+                count=rollup_db.count,
+            )
+            for rollup_db in query.order_by(MonthlyRollupDB.year_month).all()
+        ]
+
+    def rebuild(self, user_id: Optional[str] = None) -> int:
+        """Recalcule les agrégats depuis les transactions brutes et valide."""
+        delete_query = self.db.query(MonthlyRollupDB)
+        if user_id is not None:
+            delete_query = delete_query.filter(MonthlyRollupDB.user_id == user_id)
+        delete_query.delete(synchronize_session=False)
+
+        written = 0
+        for kind, model in ((RollupKind.EXPENSE, ExpenseDB), (RollupKind.INCOME, IncomeDB)):
+            month = month_bucket(self.db, model.date).label("year_month")
+            is_recurring = func.coalesce(model.is_recurring, False).label("is_recurring")
+            query = self.db.query(
+                model.user_id,
+                month,
+                model.category,
+                is_recurring,
+                func.sum(model.amount).label("amount"),
+                func.count(model.id).label("count"),
+            )
+            if user_id is not None:
+                query = query.filter(model.user_id == user_id)
+            rows = query.group_by(model.user_id, month, model.category, is_recurring).all()
+
+            self.db.add_all(
+                MonthlyRollupDB(
+                    user_id=row.user_id,
+                    year_month=row.year_month,
+                    kind=kind.value,
+                    category=row.category.value,
+                    is_recurring=bool(row.is_recurring),
+                    amount=float(row.amount or 0.0),
+                    count=row.count,
+                )
+                for row in rows
+            )
+            written += len(rows)
+
+        self.db.commit()
+        return written
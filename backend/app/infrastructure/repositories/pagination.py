@@ -0,0 +1,113 @@
+"""Pagination par curseur (keyset) partagée par les repositories SQL."""
+
+from datetime import datetime
+from typing import Iterator, Optional
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from app.domain.entities.transaction_query import TransactionQuery
+from app.infrastructure.db.utils import to_naive_utc
+
+
+def iter_keyset(
+    db: Session,
+    model,
+    user_id: str,
+    since: Optional[datetime] = None,
+    batch_size: int = 500,
+) -> Iterator:
+    """Parcourt les lignes d'un utilisateur par lots triés sur (date, id).
+
+    Chaque lot est une requête indépendante reprenant après la dernière
+    clé lue : la mémoire reste bornée à batch_size lignes et aucun curseur
+    serveur ne reste ouvert entre deux lots (les appelants peuvent donc
+    commiter pendant l'itération). L'identity map de la session ne garde
+    que des références faibles : les lots déjà parcourus sont libérés.
+    """
+    if batch_size <= 0:
+        raise ValueError("La taille de lot doit être positive")
+
+    query = db.query(model).filter(model.user_id == user_id)
+    if since is not None:
+        query = query.filter(model.date >= to_naive_utc(since))
+
+    last_date, last_id = None, None
+    while True:
+        batch_query = query
+        if last_id is not None:
+            batch_query = batch_query.filter(
+                or_(model.date > last_date, and_(model.date == last_date, model.id > last_id))
+            )
+        rows = batch_query.order_by(model.date, model.id).limit(batch_size).all()
+        if not rows:
+            return
+
+        for row in rows:
+            yield row
+
+        if len(rows) < batch_size:
+            return
+        last_date, last_id = rows[-1].date, rows[-1].id
+
+
+def transaction_filters(model, query: TransactionQuery) -> list:
+    """Conditions SQL des filtres d'une liste de dépenses ou de revenus."""
+    conditions = []
+    if query.start_date is not None:
+        conditions.append(model.date >= to_naive_utc(query.start_date))
+    if query.end_date is not None:
+        conditions.append(model.date <= to_naive_utc(query.end_date))
+    if query.categories:
+        conditions.append(model.category.in_(query.categories))
+    if query.is_recurring is not None:
+        conditions.append(model.is_recurring.is_(query.is_recurring))
+    if query.min_amount is not None:
+        conditions.append(model.amount >= query.min_amount)
+    if query.max_amount is not None:
+        conditions.append(model.amount <= query.max_amount)
+    if query.search:
+        pattern = f"%{escape_like(query.search.strip())}%"
+        conditions.append(
+            or_(
+                model.name.ilike(pattern, escape="\\"),
+                model.description.ilike(pattern, escape="\\"),
+            )
+        )
+    return conditions
+
+
+def find_page(db: Session, model, user_id: str, query: TransactionQuery) -> list:
+    """Lit une page de lignes filtrées et triées sur (champ trié, id), après `query.after`.
+
+    La page est résolue par les index (user_id, date, id) et (user_id, amount, id) :
+    le coût ne dépend pas de la position dans la liste, contrairement à un OFFSET.
+    """
+    column = getattr(model, query.sort.field)
+    sql = db.query(model).filter(model.user_id == user_id, *transaction_filters(model, query))
+    if query.after is not None:
+        sql = sql.filter(keyset_after(column, model.id, query.after, query.sort.descending))
+    sql = sql.order_by(*keyset_order(column, model.id, query.sort.descending))
+    if query.limit is not None:
+        sql = sql.limit(query.limit)
+    return sql.all()
+
+
+def keyset_after(column, id_column, after: tuple, descending: bool):
+    """Condition SQL « strictement après (valeur, id) » dans l'ordre du tri."""
+    value, last_id = after
+    if isinstance(value, datetime):
+        value = to_naive_utc(value)
+    if descending:
+        return or_(column < value, and_(column == value, id_column < last_id))
+    return or_(column > value, and_(column == value, id_column > last_id))
+
+
+def keyset_order(column, id_column, descending: bool) -> tuple:
+    """Tri (valeur, id) dans le sens demandé."""
+    if descending:
+        return column.desc(), id_column.desc()
+    return column, id_column
+
+
+def escape_like(term: str) -> str:
+    """Échappe les jokers d'un motif LIKE."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
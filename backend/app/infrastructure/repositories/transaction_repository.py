@@ -0,0 +1,237 @@
+"""Repository pour le fil unifié des dépenses et revenus."""
+
+from dataclasses import replace
+from typing import Iterator, Sequence
+from sqlalchemy import Float, String, cast, func, literal, literal_column, or_, select, union_all
+from sqlalchemy.orm import Session
+from app.domain.entities.expense import ExpenseCategory, ExpenseFrequency
+from app.domain.entities.income import IncomeCategory, IncomeFrequency
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction_query import TransactionQuery
+from app.domain.entities.transaction_search import TransactionSearch, TransactionSearchHit
+from app.domain.interfaces.transaction_repository_interface import (
+    TransactionRepositoryInterface,
+)
+from app.domain.services.text_search import InvertedIndex, search_terms
+from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.models.income_db import IncomeDB
+from app.infrastructure.repositories.pagination import (
+    keyset_after,
+    keyset_order,
+    transaction_filters,
+)
+
+# Modèle et énumérations de chaque type de transaction
+SOURCES = {
+    RollupKind.EXPENSE: (ExpenseDB, ExpenseCategory, ExpenseFrequency),
+    RollupKind.INCOME: (IncomeDB, IncomeCategory, IncomeFrequency),
+}
+# Configuration plein texte sans racinisation : les libellés sont surtout des noms de marchands
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+
+def search_document(model):
+    """Vecteur plein texte du libellé et de la description.
+
+    Expression identique à celle des index GIN ix_<table>_search_document.
+    """
+    text = (
+        func.coalesce(model.name, literal_column("''"))
+        .op("||")(literal_column("' '"))
+        .op("||")(func.coalesce(model.description, literal_column("''")))
+    )
+    return func.to_tsvector(SEARCH_CONFIG, text)
+
+
+def transaction_columns(kind: RollupKind) -> tuple:
+    """Colonnes communes aux deux types de transaction, avec le type en littéral."""
+    model = SOURCES[kind][0]
+    return (
+        model.id,
+        model.user_id,
+        literal(kind.value, String).label("kind"),
+        model.name,
+        model.amount,
+        model.date,
+        # Types énumérés distincts en base : fusionnés sous forme de texte
+        cast(model.category, String).label("category"),
+        model.description,
+        model.is_recurring,
+        cast(model.frequency, String).label("frequency"),
+        model.created_at,
+        model.updated_at,
+    )
+
+
+class SQLTransactionRepository(TransactionRepositoryInterface):
+    """Lecture des dépenses et revenus en un seul fil, fusionné par la base (UNION ALL).
+
+    Chaque branche applique les filtres, le keyset et la limite sur son propre index
+    (user_id, date, id) ou (user_id, amount, id) ; la requête externe ne fusionne donc
+    au plus que deux pages.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_page(
+        self,
+        user_id: str,
+        query: TransactionQuery,
+        kinds: Sequence[RollupKind] = (RollupKind.EXPENSE, RollupKind.INCOME),
+    ) -> list[Transaction]:
+        """Récupère les transactions filtrées et triées d'un utilisateur, après `query.after`."""
+        sql = self._feed(user_id, query, kinds)
+        if sql is None:
+            return []
+        return [self._to_entity(row) for row in self.db.execute(sql)]
+
+    def stream(
+        self,
+        user_id: str,
+        query: TransactionQuery,
+        kinds: Sequence[RollupKind] = (RollupKind.EXPENSE, RollupKind.INCOME),
+        batch_size: int = 1000,
+    ) -> Iterator[list[Transaction]]:
+        """Lit le fil par lots depuis un curseur côté serveur (mémoire constante)."""
+        sql = self._feed(user_id, query, kinds)
+        if sql is None:
+            return
+        result = self.db.execute(
+            sql, execution_options={"stream_results": True, "yield_per": batch_size}
+        )
+        for rows in result.partitions(batch_size):
+            yield [self._to_entity(row) for row in rows]
+
+    def _feed(self, user_id: str, query: TransactionQuery, kinds: Sequence[RollupKind]):
+        """Requête du fil fusionné et trié (None si aucun type ne peut correspondre)."""
+        branches = [
+            branch
+            for branch in (self._branch(kind, user_id, query) for kind in kinds)
+            if branch is not None
+        ]
+        if not branches:
+            return None
+
+        feed = union_all(*branches).subquery("feed")
+        column = feed.c[query.sort.field]
+        sql = select(feed).order_by(*keyset_order(column, feed.c.id, query.sort.descending))
+        if query.limit is not None:
+            sql = sql.limit(query.limit)
+        return sql
+
+    @staticmethod
+    def _branch(kind: RollupKind, user_id: str, query: TransactionQuery):
+        """Page d'un type de transaction (None si le filtre de catégories l'exclut)."""
+        model, category_enum, _ = SOURCES[kind]
+        values = {member.value for member in category_enum}
+        categories = [category_enum(value) for value in query.categories if value in values]
+        if query.categories and not categories:
+            return None
+
+        column = getattr(model, query.sort.field)
+        sql = select(*transaction_columns(kind)).where(
+            model.user_id == user_id,
+            *transaction_filters(model, replace(query, categories=categories)),
+        )
+        if query.after is not None:
+            sql = sql.where(keyset_after(column, model.id, query.after, query.sort.descending))
+        sql = sql.order_by(*keyset_order(column, model.id, query.sort.descending))
+        if query.limit is not None:
+            sql = sql.limit(query.limit)
+        # ORDER BY et LIMIT propres à la branche : sous-requête dans l'UNION ALL
+        return select(sql.subquery())
+
+    def search(self, user_id: str, search: TransactionSearch) -> list[TransactionSearchHit]:
+        """Recherche dans les libellés et descriptions, par pertinence décroissante.
+
+        PostgreSQL : plein texte (préfixes de mots) et similarité par trigrammes, servis par
+        les index GIN. Autres bases (SQLite des tests) : index inversé construit en mémoire.
+        """
+        terms = search_terms(search.text)
+        if not terms or not search.kinds:
+            return []
+        if self.db.get_bind().dialect.name != "postgresql":
+            return self._search_in_memory(user_id, search)
+
+        branches = [self._search_branch(kind, user_id, search, terms) for kind in search.kinds]
+        feed = union_all(*branches).subquery("hits")
+        sql = (
+            select(feed)
+            .order_by(*keyset_order(feed.c.score, feed.c.id, descending=True))
+            .limit(search.limit)
+        )
+        return [
+            TransactionSearchHit(self._to_entity(row), row.score) for row in self.db.execute(sql)
+        ]
+
+    @staticmethod
+    def _search_branch(kind: RollupKind, user_id: str, search: TransactionSearch, terms: list):
+        """Meilleurs résultats d'un type de transaction, après `search.after`."""
+        model = SOURCES[kind][0]
+        document = search_document(model)
+        # Termes réduits à des lettres et chiffres : sûrs dans la syntaxe tsquery
+        tsquery = func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{term}:*" for term in terms))
+        similarity = func.greatest(
+            func.similarity(model.name, search.text),
+            func.similarity(model.description, search.text),
+        )
+        score = cast(func.ts_rank(document, tsquery, type_=Float) + similarity, Float)
+
+        sql = select(*transaction_columns(kind), score.label("score")).where(
+            model.user_id == user_id,
+            or_(
+                document.op("@@")(tsquery),
+                model.name.op("%")(search.text),
+                model.description.op("%")(search.text),
+            ),
+        )
+        if search.after is not None:
+            sql = sql.where(keyset_after(score, model.id, search.after, descending=True))
+        sql = sql.order_by(*keyset_order(score, model.id, descending=True)).limit(search.limit)
+        return select(sql.subquery())
+
+    def _search_in_memory(
+        self, user_id: str, search: TransactionSearch
+    ) -> list[TransactionSearchHit]:
+        """Recherche de repli : index inversé des transactions de l'utilisateur."""
+        transactions: dict[str, Transaction] = {}
+        index = InvertedIndex()
+        for kind in search.kinds:
+            model = SOURCES[kind][0]
+            rows = self.db.execute(
+                select(*transaction_columns(kind)).where(model.user_id == user_id)
+            )
+            for row in rows:
+                transaction = self._to_entity(row)
+                transactions[transaction.id] = transaction
+                index.add(transaction.id, transaction.name, transaction.description)
+
+        hits = [
+            TransactionSearchHit(transactions[doc_id], score)
+            for doc_id, score in index.search(search.text)
+        ]
+        if search.after is not None:
+            hits = [hit for hit in hits if (hit.score, hit.id) < search.after]
+        return hits[:search.limit]
+
+    @staticmethod
+    def _to_entity(row) -> Transaction:
+        """Convertit une ligne du fil (énumérations stockées par nom) en entité."""
+        kind = RollupKind(row.kind)
+        _, category_enum, frequency_enum = SOURCES[kind]
+        return Transaction(
+            id=row.id,
+            user_id=row.user_id,
+            kind=kind,
+            name=row.name,
+            amount=row.amount,
+            date=row.date,
+            category=category_enum[row.category].value if row.category else None,
+            description=row.description,
+            is_recurring=bool(row.is_recurring),
+            frequency=frequency_enum[row.frequency].value if row.frequency else None,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
@@ -0,0 +1,126 @@
+"""Repository pour les agrégats statistiques des transactions."""
+
+from datetime import datetime
+from itertools import groupby
+from sqlalchemy import Float, String, cast, func, literal, literal_column, select, union_all
+from sqlalchemy.orm import Session
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction_stats import (
+    AmountStats,
+    StatsBucket,
+    StatsGranularity,
+    StatsGroup,
+    StatsQuery,
+)
+from app.domain.interfaces.transaction_stats_repository_interface import (
+    TransactionStatsRepositoryInterface,
+)
+from app.domain.services.statistics import percentile_cont
+from app.infrastructure.repositories.transaction_repository import SOURCES
+
+MEDIAN = 0.5
+P90 = 0.9
+# Début de période sous SQLite (date_trunc sous PostgreSQL), semaines commençant le lundi
+SQLITE_PERIODS = {
+    StatsGranularity.DAY: lambda column: func.date(column),
+    StatsGranularity.WEEK: lambda column: func.date(column, "weekday 0", "-6 days"),
+    StatsGranularity.MONTH: lambda column: func.strftime("%Y-%m-01", column),
+    StatsGranularity.YEAR: lambda column: func.strftime("%Y-01-01", column),
+}
+
+
+class SQLTransactionStatsRepository(TransactionStatsRepositoryInterface):
+    """Agrégats SQL groupés sur l'UNION ALL des dépenses et revenus de l'intervalle.
+
+    La lecture de l'intervalle suit les index (user_id, date, id). Les percentiles sont
+    calculés par `percentile_cont` sous PostgreSQL, en mémoire ailleurs (SQLite des tests).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def aggregate(self, user_id: str, query: StatsQuery, group: StatsGroup) -> list[StatsBucket]:
+        """Agrège les montants de l'intervalle par type de transaction et par clé."""
+        postgres = self.db.get_bind().dialect.name == "postgresql"
+        rows = union_all(
+            *(self._rows(kind, user_id, query) for kind in SOURCES)
+        ).subquery("rows")
+        keys = [rows.c.kind]
+        if group == StatsGroup.CATEGORY:
+            keys.append(rows.c.category)
+        elif group == StatsGroup.PERIOD:
+            keys.append(self._period(rows.c.date, query.granularity, postgres))
+
+        aggregates = [
+            func.sum(rows.c.amount).label("total"),
+            func.count().label("count"),
+            func.avg(rows.c.amount).label("average"),
+        ]
+        if postgres:
+            aggregates += [
+                func.percentile_cont(MEDIAN).within_group(rows.c.amount).label("median"),
+                func.percentile_cont(P90).within_group(rows.c.amount).label("p90"),
+            ]
+        sql = select(*keys, *aggregates).group_by(*keys).order_by(*keys)
+        result = self.db.execute(sql).all()
+        percentiles = {} if postgres else self._percentiles(keys, rows)
+
+        buckets = []
+        for row in result:
+            values = row._mapping
+            group_key = tuple(row[:len(keys)])
+            kind = RollupKind(group_key[0])
+            median, p90 = (
+                (values["median"], values["p90"]) if postgres else percentiles[group_key]
+            )
+            stats = AmountStats(
+                total=float(values["total"]),
+                count=values["count"],
+                average=float(values["average"]),
+                median=float(median),
+                p90=float(p90),
+            )
+            key = self._key(kind, group, group_key[1] if len(group_key) > 1 else None)
+            buckets.append(StatsBucket(kind=kind, key=key, stats=stats))
+        return buckets
+
+    @staticmethod
+    def _rows(kind: RollupKind, user_id: str, query: StatsQuery):
+        """Montants, catégories et dates d'un type de transaction dans l'intervalle."""
+        model = SOURCES[kind][0]
+        return select(
+            literal(kind.value, String).label("kind"),
+            cast(model.amount, Float).label("amount"),
+            cast(model.category, String).label("category"),
+            model.date,
+        ).where(
+            model.user_id == user_id,
+            model.date >= query.start_date,
+            model.date <= query.end_date,
+        )
+
+    @staticmethod
+    def _period(column, granularity: StatsGranularity, postgres: bool):
+        """Début de la période de chaque date."""
+        if postgres:
+            # Unité en littéral : expression identique dans SELECT et GROUP BY
+            return func.date_trunc(literal_column(f"'{granularity.value}'"), column)
+        return SQLITE_PERIODS[granularity](column)
+
+    def _percentiles(self, keys: list, rows) -> dict[tuple, tuple[float, float]]:
+        """Médiane et p90 de chaque groupe, sur les montants triés lus en un seul passage."""
+        sql = select(*keys, rows.c.amount).order_by(*keys, rows.c.amount)
+        percentiles = {}
+        for key, group in groupby(self.db.execute(sql), key=lambda row: tuple(row[:-1])):
+            amounts = [row[-1] for row in group]
+            percentiles[key] = (percentile_cont(amounts, MEDIAN), percentile_cont(amounts, P90))
+        return percentiles
+
+    @staticmethod
+    def _key(kind: RollupKind, group: StatsGroup, value):
+        """Clé du groupe : valeur de catégorie (stockée par nom) ou début de période."""
+        if group == StatsGroup.CATEGORY:
+            return SOURCES[kind][1][value].value
+        if group == StatsGroup.PERIOD and isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return value
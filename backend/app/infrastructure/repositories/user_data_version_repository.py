@@ -0,0 +1,54 @@
+"""Repository pour les versions de données utilisateur."""
+
+from datetime import datetime, UTC
+from sqlalchemy import select, union
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.domain.interfaces.user_data_version_repository_interface import (
+    UserDataVersionRepositoryInterface,
+)
+from app.infrastructure.db.models.session_db import SessionDB
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB
+from app.infrastructure.db.utils import to_naive_utc
+
+
+class SQLUserDataVersionRepository(UserDataVersionRepositoryInterface):
+    """Implémentation SQL du repository des versions de données utilisateur."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: str) -> int:
+        """Retourne la version courante des données (0 si jamais modifiées)."""
+        version = (
+            self.db.query(UserDataVersionDB.version)
+            .filter(UserDataVersionDB.user_id == user_id)
+            .scalar()
+        )
+        return version or 0
+
+    def bump(self, user_id: str) -> int:
+        """Incrémente la version des données (upsert atomique) et la retourne."""
+        now = to_naive_utc(datetime.now(UTC))
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(UserDataVersionDB).values(
+            user_id=user_id, version=1, updated_at=now
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={"version": UserDataVersionDB.version + 1, "updated_at": now},
+        )
+        self.db.execute(statement)
+        self.db.commit()
+        return self.get(user_id)
+
+    def get_active_user_ids(self, since: datetime) -> list[str]:
+        """Utilisateurs ayant modifié leurs données ou ouvert une session depuis une date."""
+        since = to_naive_utc(since)
+        query = union(
+            select(UserDataVersionDB.user_id).where(UserDataVersionDB.updated_at >= since),
+            select(SessionDB.user_id).where(
+                SessionDB.created_at >= since, SessionDB.revoked.is_(False)
+            ),
+        )
+        return sorted(row[0] for row in self.db.execute(query))
@@ -8,6 +8,12 @@ from app.infrastructure.db.models.expense_db import ExpenseDB
 from app.infrastructure.db.models.income_db import IncomeDB
 from app.infrastructure.db.models.session_db import SessionDB
 from app.infrastructure.db.models.refresh_token_db import RefreshTokenDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB
+from app.infrastructure.db.models.import_job_db import ImportJobDB
+from app.infrastructure.db.models.import_ledger_db import ImportLedgerChunkDB
+from app.infrastructure.db.models.category_rule_db import CategoryRuleDB
 
 
 class SQLUserRepository(UserRepositoryInterface):
@@ -162,6 +168,23 @@ class SQLUserRepository(UserRepositoryInterface):
         self.db.query(IncomeDB).filter(IncomeDB.user_id == user_id).delete(synchronize_session=False)
         self.db.flush()
 
+        # Supprimer le registre des lots importés avant les imports eux-mêmes
+        job_ids = self.db.query(ImportJobDB.id).filter(ImportJobDB.user_id == user_id)
+        self.db.query(ImportLedgerChunkDB).filter(
+            ImportLedgerChunkDB.job_id.in_(job_ids.scalar_subquery())
+        ).delete(synchronize_session=False)
+
+        # Supprimer les agrégats, prévisions précalculées, imports et catégories apprises
+        for model in (
+            MonthlyRollupDB,
+            ForecastSnapshotDB,
+            UserDataVersionDB,
+            ImportJobDB,
+            CategoryRuleDB,
+        ):
+            self.db.query(model).filter(model.user_id == user_id).delete(synchronize_session=False)
+        self.db.flush()
+
         # Supprimer toutes les sessions de l'utilisateur
         self.db.query(SessionDB).filter(SessionDB.user_id == user_id).delete(synchronize_session=False)
         self.db.flush()
@@ -3,6 +3,7 @@
 import os
 import json
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -13,6 +14,16 @@ from app.external_interfaces.api.income import router as income_router
 from app.external_interfaces.api.forecast import router as forecast_router
 from app.external_interfaces.api.health import health_router
 from app.external_interfaces.api.imports import import_router
+from app.external_interfaces.api.transactions import transaction_router
+from app.external_interfaces.api.stats import stats_router
+from app.external_interfaces.api.transaction_params import NEXT_CURSOR_HEADER
+from app.infrastructure.jobs.forecast_jobs import sweep_forecasts
+from app.infrastructure.jobs.import_jobs import (
+    get_import_lease,
+    get_import_scheduler,
+    resume_import_jobs,
+)
+from app.infrastructure.jobs.scheduler import get_job_scheduler
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
@@ -21,11 +32,38 @@ logger = logging.getLogger(__name__)
 # Les tables sont créées par le script d'initialisation
 # Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Démarre les tâches de fond (prévisions, imports) avec l'application."""
+    scheduler = get_job_scheduler()
+    await scheduler.start()
+    scheduler.schedule_daily(
+        int(os.getenv("FORECAST_SWEEP_HOUR", "2")), "forecast-sweep", sweep_forecasts, scheduler
+    )
+    logger.info("Ordonnanceur de tâches démarré avec %s workers", scheduler.workers)
+
+    # Pool dédié aux imports, pour ne pas retarder le précalcul des prévisions
+    import_scheduler = get_import_scheduler()
+    await import_scheduler.start()
+    # Imports en attente ou abandonnés par un worker arrêté, vérifiés à chaque bail
+    import_scheduler.schedule_every(
+        get_import_lease().total_seconds(), "import-resume", resume_import_jobs, import_scheduler
+    )
+    logger.info("Pool d'imports démarré avec %s workers", import_scheduler.workers)
+    try:
+        yield
+    finally:
+        await import_scheduler.stop()
+        await scheduler.stop()
+
+
 # Création de l'application FastAPI
 app = FastAPI(
     title="Forecast budget API",
     description="API pour l'application de gestion de budget",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configuration CORS
@@ -47,7 +85,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["*"],
+    # "*" est ignoré pour les requêtes avec identifiants : le curseur est listé explicitement
+    expose_headers=["*", NEXT_CURSOR_HEADER],
 )
 
 
@@ -93,3 +132,5 @@ app.include_router(income_router)
 app.include_router(forecast_router)
 app.include_router(health_router)
 app.include_router(import_router)
+app.include_router(transaction_router)
+app.include_router(stats_router)
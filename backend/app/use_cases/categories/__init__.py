@@ -0,0 +1 @@
+"""Use cases pour les catégories apprises."""
@@ -0,0 +1,33 @@
+"""Cas d'usage pour charger l'index des catégories apprises d'un utilisateur."""
+
+from typing import Optional
+
+from app.domain.interfaces.category_index_cache_interface import CategoryIndexCacheInterface
+from app.domain.interfaces.category_rule_repository_interface import (
+    CategoryRuleRepositoryInterface,
+)
+from app.domain.services.category_index import CategoryIndex
+
+
+class GetCategoryIndex:
+    """Cas d'usage pour charger l'index des catégories apprises (cache puis base)."""
+
+    def __init__(
+        self,
+        rule_repo: CategoryRuleRepositoryInterface,
+        cache: Optional[CategoryIndexCacheInterface] = None,
+    ):
+        self.rule_repo = rule_repo
+        self.cache = cache
+
+    def execute(self, user_id: str) -> CategoryIndex:
+        """Retourne l'index de l'utilisateur, construit en une requête si absent du cache."""
+        if self.cache:
+            index = self.cache.get(user_id)
+            if index is not None:
+                return index
+
+        index = CategoryIndex.from_rules(self.rule_repo.get_by_user_id(user_id))
+        if self.cache:
+            self.cache.set(user_id, index)
+        return index
@@ -0,0 +1,53 @@
+"""Cas d'usage pour apprendre une catégorie d'une correction de l'utilisateur."""
+
+from datetime import datetime, UTC
+from typing import Optional
+
+from app.domain.entities.category_rule import CategoryRule
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.interfaces.category_index_cache_interface import CategoryIndexCacheInterface
+from app.domain.interfaces.category_rule_repository_interface import (
+    CategoryRuleRepositoryInterface,
+)
+from app.domain.services.category_index import categorization_key
+
+
+class LearnCategory:
+    """Cas d'usage pour mémoriser la catégorie choisie pour un libellé.
+
+    Les imports suivants appliquent la règle à tous les libellés du même marchand.
+    """
+
+    def __init__(
+        self,
+        rule_repo: CategoryRuleRepositoryInterface,
+        cache: Optional[CategoryIndexCacheInterface] = None,
+    ):
+        self.rule_repo = rule_repo
+        self.cache = cache
+
+    def execute(
+        self, user_id: str, kind: RollupKind, label: str, category: str
+    ) -> Optional[CategoryRule]:
+        """Enregistre la règle ; retourne None si le libellé ne donne aucune clé."""
+        if not user_id:
+            raise ValueError("L'id de l'utilisateur est requis")
+        key = categorization_key(label)
+        if not key:
+            return None
+
+        rule = self.rule_repo.upsert(
+            CategoryRule(
+                user_id=user_id,
+                kind=kind,
+                key=key,
+                category=category,
+                updated_at=datetime.now(UTC),
+            )
+        )
+        if self.cache:
+            # Mise à jour de l'index en cache plutôt qu'un rechargement complet
+            index = self.cache.get(user_id)
+            if index is not None:
+                index.add(rule.kind, rule.key, rule.category)
+        return rule
@@ -1,44 +1,68 @@
 """Module contenant le cas d'utilisation pour créer une dépense."""
 
 from datetime import datetime, UTC
+from typing import Optional
 from app.domain.entities.expense import Expense, ExpenseCategory, ExpenseFrequency
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
 from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
 
 
 class CreateExpense:
     """Cas d'utilisation pour créer une dépense."""
 
-    def __init__(self, expense_repo: ExpenseRepositoryInterface):
+    def __init__(
+        self,
+        expense_repo: ExpenseRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+    ):
         self.expense_repo = expense_repo
+        self.rollup_repo = rollup_repo
 
     def execute(self, expense: Expense) -> Expense | None:
         """Exécute le cas d'utilisation."""
 
         try:
-            # Forcer la cohérence de is_recurring
-            if expense.frequency and expense.frequency != ExpenseFrequency.ONE_TIME:
-                expense.is_recurring = True
-            else:
-                expense.is_recurring = False
-
-            self.validate_expense(expense)
-            new_expense = Expense(
-                id=expense.id,
-                user_id=expense.user_id,
-                name=expense.name,
-                amount=expense.amount,
-                date=expense.date,
-                category=expense.category,
-                description=expense.description,
-                is_recurring=expense.is_recurring,
-                frequency=expense.frequency,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-            )
-            self.expense_repo.create(new_expense)
-            return new_expense
+            new_expense = self.prepare(expense)
         except ValueError:
             return None
+        return self.persist(new_expense)
+
+    def prepare(self, expense: Expense) -> Expense:
+        """Normalise et valide une dépense en mémoire (lève ValueError si invalide)."""
+
+        # Forcer la cohérence de is_recurring
+        if expense.frequency and expense.frequency != ExpenseFrequency.ONE_TIME:
+            expense.is_recurring = True
+        else:
+            expense.is_recurring = False
+
+        self.validate_expense(expense)
+        return Expense(
+            id=expense.id,
+            user_id=expense.user_id,
+            name=expense.name,
+            amount=expense.amount,
+            date=expense.date,
+            category=expense.category,
+            description=expense.description,
+            is_recurring=expense.is_recurring,
+            frequency=expense.frequency,
+            fingerprint=expense.fingerprint,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+
+    def persist(self, expense: Expense) -> Expense:
+        """Enregistre une dépense déjà préparée, avec son agrégat mensuel."""
+
+        # L'agrégat est validé par le commit de la création (même session)
+        if self.rollup_repo:
+            self.rollup_repo.apply(MonthlyRollup.from_transaction(RollupKind.EXPENSE, expense))
+        self.expense_repo.create(expense)
+        return expense
 
     def validate_expense(self, expense: Expense) -> None:
         """Valide la dépense."""
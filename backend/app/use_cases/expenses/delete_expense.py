@@ -1,29 +1,46 @@
 """Module contenant le cas d'utilisation de suppression d'une dépense."""
 
+from typing import Optional
+from app.domain.entities.expense import Expense
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
 from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
 
 
 class DeleteExpense:
     """Cas d'utilisation de suppression d'une dépense."""
 
-    def __init__(self, expense_repo: ExpenseRepositoryInterface):
+    def __init__(
+        self,
+        expense_repo: ExpenseRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+    ):
         self.expense_repo = expense_repo
+        self.rollup_repo = rollup_repo
 
     def execute(self, expense_id: str, user_id: str) -> None:
         """Exécute le cas d'utilisation."""
 
-        self.validate_expense_id(expense_id, user_id)
+        expense = self.validate_expense_id(expense_id, user_id)
         self.validate_user_id(user_id)
+        if self.rollup_repo:
+            self.rollup_repo.apply(
+                MonthlyRollup.from_transaction(RollupKind.EXPENSE, expense).negated()
+            )
         self.expense_repo.delete(expense_id, user_id)
 
-    def validate_expense_id(self, expense_id: str, user_id: str) -> None:
-        """Valide l'id de la dépense."""
+    def validate_expense_id(self, expense_id: str, user_id: str) -> Expense:
+        """Valide l'id de la dépense et retourne la dépense."""
 
         if not expense_id:
             raise ValueError("L'id de la dépense est requis")
 
-        if not self.expense_repo.get_by_id(expense_id, user_id):
+        expense = self.expense_repo.get_by_id(expense_id, user_id)
+        if not expense:
             raise ValueError("La dépense n'existe pas")
+        return expense
 
     def validate_user_id(self, user_id: str) -> None:
         """Valide l'id de l'utilisateur."""
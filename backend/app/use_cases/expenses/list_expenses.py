@@ -1,8 +1,10 @@
 """Module contenant le cas d'utilisation pour lister les dépenses."""
 
-from typing import List
+from typing import List, Optional
 from app.domain.entities.expense import Expense
+from app.domain.entities.transaction_query import TransactionPage, TransactionQuery
 from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
+from app.domain.services.page_cursor import paginate
 
 
 class ListExpenses:
@@ -20,3 +22,12 @@ class ListExpenses:
             return self.expense_repo.get_by_user_id(user_id)
         except ValueError:
             return []
+
+    def execute_page(
+        self, user_id: str, query: TransactionQuery, cursor: Optional[str] = None
+    ) -> TransactionPage[Expense]:
+        """Liste une page de dépenses filtrées et triées (ValueError si curseur invalide)."""
+
+        if not user_id:
+            raise ValueError("L'utilisateur est requis")
+        return paginate(lambda page: self.expense_repo.get_page(user_id, page), query, cursor)
@@ -1,14 +1,27 @@
 """Module contenant le cas d'utilisation de mise à jour d'une dépense."""
 
+from typing import Optional
 from app.domain.entities.expense import Expense, ExpenseCategory, ExpenseFrequency
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
 from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
+from app.use_cases.categories.learn_category import LearnCategory
 
 
 class UpdateExpense:
     """Cas d'utilisation de mise à jour d'une dépense."""
 
-    def __init__(self, expense_repo: ExpenseRepositoryInterface):
+    def __init__(
+        self,
+        expense_repo: ExpenseRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+        learn_category: Optional[LearnCategory] = None,
+    ):
         self.expense_repo = expense_repo
+        self.rollup_repo = rollup_repo
+        self.learn_category = learn_category
 
     def execute(self, expense: Expense, user_id: str) -> Expense:
         """Exécute le cas d'utilisation."""
@@ -21,9 +34,27 @@ class UpdateExpense:
 
         self.validate_expense(expense)
         self.validate_user_id(user_id)
+        previous = None
+        if self.rollup_repo or self.learn_category:
+            previous = self.expense_repo.get_by_id(expense.id, user_id)
+        if self.rollup_repo and previous:
+            self.rollup_repo.apply(
+                MonthlyRollup.from_transaction(RollupKind.EXPENSE, previous).negated()
+            )
+            self.rollup_repo.apply(MonthlyRollup.from_transaction(RollupKind.EXPENSE, expense))
         updated_expense = self.expense_repo.update(expense, user_id)
         if not updated_expense:
             raise ValueError("La dépense n'existe pas ou n'a pas pu être mise à jour")
+        if (
+            self.learn_category
+            and previous
+            and updated_expense.category
+            and previous.category != updated_expense.category
+        ):
+            # Correction de catégorie : appliquée aux prochains imports du même libellé
+            self.learn_category.execute(
+                user_id, RollupKind.EXPENSE, updated_expense.name, updated_expense.category.value
+            )
         return updated_expense
 
     def validate_expense(self, expense: Expense) -> None:
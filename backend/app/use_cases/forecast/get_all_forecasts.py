@@ -0,0 +1,114 @@
+"""Cas d'usage pour récupérer les prévisions de toutes les périodes."""
+
+from dataclasses import replace
+from datetime import datetime, UTC
+from typing import Dict, List, Optional
+from app.domain.entities.forecast import ForecastData, ForecastPeriod
+from app.domain.services.forecast_service import ForecastService
+from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.domain.interfaces.forecast_engine_interface import ForecastEngineInterface
+from app.domain.interfaces.forecast_snapshot_repository_interface import (
+    ForecastSnapshotRepositoryInterface,
+)
+from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
+from app.domain.interfaces.user_data_version_repository_interface import (
+    UserDataVersionRepositoryInterface,
+)
+
+
+def has_breakdown(forecast: ForecastData, by_category: bool) -> bool:
+    """Indique si une prévision déjà calculée répond à la demande de détail par catégorie."""
+    return not by_category or forecast.expense_categories is not None
+
+
+class GetAllForecasts:
+    """Cas d'usage pour récupérer les prévisions de plusieurs périodes en une passe."""
+
+    def __init__(
+        self,
+        expense_repo: ExpenseRepositoryInterface,
+        income_repo: IncomeRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+        forecast_cache: Optional[ForecastCacheInterface] = None,
+        engine: Optional[ForecastEngineInterface] = None,
+        snapshot_repo: Optional[ForecastSnapshotRepositoryInterface] = None,
+        version_repo: Optional[UserDataVersionRepositoryInterface] = None,
+    ):
+        self.forecast_service = ForecastService(expense_repo, income_repo, rollup_repo, engine)
+        self.forecast_cache = forecast_cache
+        self.snapshot_repo = snapshot_repo
+        self.version_repo = version_repo
+
+    def execute(
+        self,
+        user_id: str,
+        periods: Optional[List[ForecastPeriod]] = None,
+        allow_stale: bool = False,
+        by_category: bool = False,
+    ) -> Dict[ForecastPeriod, ForecastData]:
+        """Exécute le cas d'usage.
+
+        Ordre de résolution : cache, prévision précalculée à jour, puis calcul à la
+        demande des seules périodes manquantes. Avec `allow_stale`, une prévision
+        précalculée périmée est renvoyée telle quelle (marquée `stale`) plutôt que
+        recalculée. Avec `by_category`, seules les prévisions comportant le détail
+        par catégorie sont réutilisées.
+        """
+
+        if not user_id:
+            raise ValueError("L'utilisateur est requis")
+
+        periods = list(dict.fromkeys(periods or ForecastPeriod))
+
+        forecasts: Dict[ForecastPeriod, ForecastData] = {}
+        if self.forecast_cache is not None:
+            for period in periods:
+                cached = self.forecast_cache.get(user_id, period)
+                if cached is not None and has_breakdown(cached, by_category):
+                    forecasts[period] = cached
+
+        version = self._current_version(user_id)
+        if self.snapshot_repo is not None:
+            today = datetime.now(UTC).date()
+            fresh = []
+            for period in periods:
+                if period in forecasts:
+                    continue
+                snapshot = self.snapshot_repo.get(user_id, period)
+                if snapshot is None or not has_breakdown(snapshot.forecast, by_category):
+                    continue
+                if not snapshot.is_stale(version, today):
+                    forecasts[period] = snapshot.forecast
+                    fresh.append(snapshot.forecast)
+                elif allow_stale:
+                    forecasts[period] = replace(snapshot.forecast, stale=True)
+            # Une écriture concurrente a pu vider le cache depuis la lecture de la version
+            if fresh and self._current_version(user_id) == version:
+                for forecast in fresh:
+                    self._cache(forecast)
+
+        missing = [period for period in periods if period not in forecasts]
+        if missing:
+            computed = self.forecast_service.calculate_forecasts(user_id, missing, by_category)
+            # Une écriture concurrente rendrait le résultat obsolète : on ne le garde pas
+            if self._current_version(user_id) == version:
+                for forecast in computed.values():
+                    self._cache(forecast)
+            forecasts.update(computed)
+
+        return {period: forecasts[period] for period in periods}
+
+    def _current_version(self, user_id: str) -> int:
+        """Version courante des données de l'utilisateur (0 sans repository de versions)."""
+        if self.version_repo is None:
+            return 0
+        return self.version_repo.get(user_id)
+
+    def _cache(self, forecast: ForecastData) -> None:
+        """Met une prévision en cache si un cache est configuré."""
+        if self.forecast_cache is not None:
+            self.forecast_cache.set(forecast)
@@ -1,20 +1,53 @@
 """Cas d'usage pour récupérer les prévisions."""
 
+from typing import Optional
 from app.domain.entities.forecast import ForecastData, ForecastPeriod
-from app.domain.services.forecast_service import ForecastService
 from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.domain.interfaces.forecast_engine_interface import ForecastEngineInterface
+from app.domain.interfaces.forecast_snapshot_repository_interface import (
+    ForecastSnapshotRepositoryInterface,
+)
 from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
+from app.domain.interfaces.user_data_version_repository_interface import (
+    UserDataVersionRepositoryInterface,
+)
+from app.use_cases.forecast.get_all_forecasts import GetAllForecasts
 
 
 class GetForecast:
     """Cas d'usage pour récupérer les prévisions."""
 
     def __init__(
-        self, expense_repo: ExpenseRepositoryInterface, income_repo: IncomeRepositoryInterface
+        self,
+        expense_repo: ExpenseRepositoryInterface,
+        income_repo: IncomeRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+        forecast_cache: Optional[ForecastCacheInterface] = None,
+        engine: Optional[ForecastEngineInterface] = None,
+        snapshot_repo: Optional[ForecastSnapshotRepositoryInterface] = None,
+        version_repo: Optional[UserDataVersionRepositoryInterface] = None,
     ):
-        self.forecast_service = ForecastService(expense_repo, income_repo)
-
-    def execute(self, user_id: str, period: ForecastPeriod) -> ForecastData:
+        self.get_all_forecasts = GetAllForecasts(
+            expense_repo,
+            income_repo,
+            rollup_repo,
+            forecast_cache,
+            engine,
+            snapshot_repo,
+            version_repo,
+        )
+
+    def execute(
+        self,
+        user_id: str,
+        period: ForecastPeriod,
+        allow_stale: bool = False,
+        by_category: bool = False,
+    ) -> ForecastData:
         """Exécute le cas d'usage."""
 
         if not user_id:
@@ -23,4 +56,5 @@ class GetForecast:
         if not period:
             raise ValueError("La période est requise")
 
-        return self.forecast_service.calculate_forecast(user_id, period)
+        forecasts = self.get_all_forecasts.execute(user_id, [period], allow_stale, by_category)
+        return forecasts[period]
@@ -0,0 +1,62 @@
+"""Cas d'usage pour précalculer les prévisions d'un utilisateur."""
+
+from typing import Optional
+from app.domain.services.forecast_service import ForecastService
+from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
+from app.domain.interfaces.forecast_cache_interface import ForecastCacheInterface
+from app.domain.interfaces.forecast_engine_interface import ForecastEngineInterface
+from app.domain.interfaces.forecast_snapshot_repository_interface import (
+    ForecastSnapshotRepositoryInterface,
+)
+from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
+from app.domain.interfaces.user_data_version_repository_interface import (
+    UserDataVersionRepositoryInterface,
+)
+
+
+class PrecomputeForecasts:
+    """Cas d'usage pour calculer et enregistrer les prévisions de toutes les périodes."""
+
+    def __init__(
+        self,
+        expense_repo: ExpenseRepositoryInterface,
+        income_repo: IncomeRepositoryInterface,
+        snapshot_repo: ForecastSnapshotRepositoryInterface,
+        version_repo: UserDataVersionRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+        forecast_cache: Optional[ForecastCacheInterface] = None,
+        engine: Optional[ForecastEngineInterface] = None,
+    ):
+        self.forecast_service = ForecastService(expense_repo, income_repo, rollup_repo, engine)
+        self.snapshot_repo = snapshot_repo
+        self.version_repo = version_repo
+        self.forecast_cache = forecast_cache
+
+    def execute(self, user_id: str) -> int:
+        """Exécute le cas d'usage et retourne le nombre de prévisions enregistrées.
+
+        Les prévisions incluent le détail par catégorie, pour servir les deux vues.
+        Si les données changent pendant le calcul, rien n'est enregistré : l'écriture
+        concurrente a déjà programmé un nouveau précalcul.
+        """
+
+        if not user_id:
+            raise ValueError("L'utilisateur est requis")
+
+        version = self.version_repo.get(user_id)
+        forecasts = list(
+            self.forecast_service.calculate_forecasts(user_id, by_category=True).values()
+        )
+
+        if self.version_repo.get(user_id) != version:
+            return 0
+
+        self.snapshot_repo.save_all(forecasts, version)
+        if self.forecast_cache is not None:
+            for forecast in forecasts:
+                self.forecast_cache.set(forecast)
+
+        return len(forecasts)
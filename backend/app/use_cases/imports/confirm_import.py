@@ -0,0 +1,23 @@
+"""Cas d'usage pour confirmer un import prévisualisé."""
+
+from app.domain.entities.import_result import ImportResult
+from app.domain.interfaces.import_preview_cache_interface import ImportPreviewCacheInterface
+from app.use_cases.imports.get_import_preview import GetImportPreview
+from app.use_cases.imports.import_csv import ImportCSV
+
+
+class ConfirmImport:
+    """Cas d'usage pour écrire les transactions d'un aperçu, sans relire le fichier."""
+
+    def __init__(self, import_csv: ImportCSV, preview_cache: ImportPreviewCacheInterface):
+        self.import_csv = import_csv
+        self.preview_cache = preview_cache
+
+    def execute(self, token: str, user_id: str) -> ImportResult:
+        """Écrit l'aperçu puis le retire du cache (ValueError s'il a expiré)."""
+        GetImportPreview(self.preview_cache).execute(token, user_id)
+        preview = self.preview_cache.pop(token)
+        if not preview:
+            # Confirmé ou expiré entre-temps
+            raise ValueError("L'aperçu n'existe pas ou a expiré")
+        return self.import_csv.commit_preview(preview)
@@ -0,0 +1,76 @@
+"""Cas d'usage pour programmer un import de relevé en arrière-plan."""
+
+import uuid
+from datetime import datetime, UTC
+from typing import Optional
+
+from app.domain.entities.import_job import ImportJob, ImportJobStatus
+from app.domain.exceptions import DuplicateImportJobError
+from app.domain.interfaces.import_job_repository_interface import ImportJobRepositoryInterface
+
+# Extensions des relevés acceptés (CSV, OFX/QFX, QIF, CAMT.053)
+SUPPORTED_EXTENSIONS = (".csv", ".txt", ".ofx", ".qfx", ".qif", ".xml")
+
+
+class CreateImportJob:
+    """Cas d'usage pour enregistrer un import de relevé à exécuter en arrière-plan."""
+
+    def __init__(self, job_repo: ImportJobRepositoryInterface):
+        self.job_repo = job_repo
+
+    def execute(
+        self, user_id: str, filename: str, file_path: str, content_hash: Optional[str] = None
+    ) -> ImportJob:
+        """
+        Enregistre un import en attente pour un fichier déjà stocké.
+
+        Pour un fichier identique (même `content_hash`), l'import existant est retourné
+        s'il est en cours ou s'il s'est terminé sans erreur ; sinon il est reprogrammé
+        sur le nouveau fichier et reprend après ses lots déjà écrits. Un import dont
+        `file_path` diffère du fichier fourni n'est donc pas à exécuter ; c'est aussi le
+        cas lorsqu'un envoi simultané du même fichier a créé l'import le premier.
+        """
+        if not user_id:
+            raise ValueError("L'id de l'utilisateur est requis")
+        if not filename.lower().endswith(SUPPORTED_EXTENSIONS):
+            raise ValueError(
+                "Format de fichier non supporté. Formats acceptés: CSV, OFX/QFX, QIF, CAMT.053"
+            )
+
+        previous = None
+        if content_hash:
+            previous = self.job_repo.get_latest_by_content_hash(user_id, content_hash)
+        if previous and (
+            not previous.is_finished
+            or (
+                previous.status == ImportJobStatus.COMPLETED
+                and previous.result is not None
+                and previous.result.success
+            )
+        ):
+            return previous
+
+        try:
+            if previous:
+                return self._retry(previous, filename, file_path)
+            job = ImportJob(
+                id=str(uuid.uuid4()),
+                user_id=user_id,
+                filename=filename,
+                file_path=file_path,
+                content_hash=content_hash,
+            )
+            return self.job_repo.create(job)
+        except DuplicateImportJobError:
+            # Envoi simultané du même fichier : l'import actif est celui de l'autre envoi
+            return self.job_repo.get_latest_by_content_hash(user_id, content_hash)
+
+    def _retry(self, job: ImportJob, filename: str, file_path: str) -> ImportJob:
+        """Remet en attente un import en échec, sur le fichier envoyé à nouveau."""
+        job.filename = filename
+        job.file_path = file_path
+        job.status = ImportJobStatus.PENDING
+        job.error = None
+        job.finished_at = None
+        job.updated_at = datetime.now(UTC)
+        return self.job_repo.update(job)
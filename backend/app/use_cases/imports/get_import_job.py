@@ -0,0 +1,18 @@
+"""Cas d'usage pour suivre un import en arrière-plan."""
+
+from app.domain.entities.import_job import ImportJob
+from app.domain.interfaces.import_job_repository_interface import ImportJobRepositoryInterface
+
+
+class GetImportJob:
+    """Cas d'usage pour récupérer l'état et l'avancement d'un import."""
+
+    def __init__(self, job_repo: ImportJobRepositoryInterface):
+        self.job_repo = job_repo
+
+    def execute(self, job_id: str, user_id: str) -> ImportJob:
+        """Récupère un import de l'utilisateur (ValueError s'il n'existe pas)."""
+        job = self.job_repo.get_by_id(job_id, user_id)
+        if not job:
+            raise ValueError("L'import n'existe pas")
+        return job
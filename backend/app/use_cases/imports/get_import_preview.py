@@ -0,0 +1,18 @@
+"""Cas d'usage pour consulter l'aperçu d'un import."""
+
+from app.domain.entities.import_preview import ImportPreview
+from app.domain.interfaces.import_preview_cache_interface import ImportPreviewCacheInterface
+
+
+class GetImportPreview:
+    """Cas d'usage pour récupérer un aperçu d'import de l'utilisateur."""
+
+    def __init__(self, preview_cache: ImportPreviewCacheInterface):
+        self.preview_cache = preview_cache
+
+    def execute(self, token: str, user_id: str) -> ImportPreview:
+        """Récupère l'aperçu (ValueError s'il n'existe pas ou a expiré)."""
+        preview = self.preview_cache.get(token)
+        if not preview or preview.user_id != user_id:
+            raise ValueError("L'aperçu n'existe pas ou a expiré")
+        return preview
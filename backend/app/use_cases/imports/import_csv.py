@@ -2,20 +2,52 @@
 
 import uuid
 from datetime import datetime, UTC
-from typing import List
+from io import StringIO
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
 
 from app.domain.entities.expense import Expense, ExpenseCategory, ExpenseFrequency
 from app.domain.entities.income import Income, IncomeCategory, IncomeFrequency
-from app.domain.entities.import_result import ImportedTransaction, ImportResult
+from app.domain.entities.import_ledger import ImportLedgerChunk
+from app.domain.entities.import_preview import (
+    ImportPreview,
+    ImportPreviewRow,
+    PreviewRowStatus,
+)
+from app.domain.entities.import_result import (
+    ImportChunkResult,
+    ImportedTransaction,
+    ImportResult,
+)
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind, merge_rollups
+from app.domain.exceptions import DuplicateTransactionError
 from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
 from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
+from app.domain.services.category_index import CategoryIndex
+from app.domain.services.dedupe_index import DedupeIndex
+from app.domain.services.transaction_fingerprint import (
+    chunk_hash,
+    fingerprint_of,
+    transaction_fingerprint,
+)
 from app.infrastructure.parsers.csv_parser import BankCSVParser
+from app.infrastructure.parsers.registry import ParserRegistry
+from app.use_cases.categories.get_category_index import GetCategoryIndex
 from app.use_cases.expenses.create_expense import CreateExpense
 from app.use_cases.income.create_income import CreateIncome
 
 
+DEFAULT_CHUNK_SIZE = 500
+
+
 class ImportCSV:
-    """Cas d'usage pour importer des transactions depuis un fichier CSV."""
+    """Cas d'usage pour importer des transactions depuis un fichier CSV.
+
+    Le fichier est lu en flux par lots de `chunk_size` lignes : chaque lot est
+    validé en mémoire puis écrit avec un INSERT multi-lignes et un commit.
+    """
 
     # Mapping des catégories vers les enums
     EXPENSE_CATEGORY_MAPPING = {
@@ -54,12 +86,24 @@ class ImportCSV:
         self,
         expense_repo: ExpenseRepositoryInterface,
         income_repo: IncomeRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        parser_registry: Optional[ParserRegistry] = None,
+        get_category_index: Optional[GetCategoryIndex] = None,
     ):
+        if chunk_size < 1:
+            raise ValueError("La taille des lots doit être positive")
         self.expense_repo = expense_repo
         self.income_repo = income_repo
+        self.rollup_repo = rollup_repo
+        self.chunk_size = chunk_size
         self.csv_parser = BankCSVParser()
-        self.create_expense_use_case = CreateExpense(expense_repo)
-        self.create_income_use_case = CreateIncome(income_repo)
+        self.parser_registry = parser_registry or ParserRegistry.default()
+        self.get_category_index = get_category_index
+        # Catégories apprises de l'utilisateur, chargées une fois par import
+        self.learned_categories = CategoryIndex()
+        self.create_expense_use_case = CreateExpense(expense_repo, rollup_repo)
+        self.create_income_use_case = CreateIncome(income_repo, rollup_repo)
 
     def execute(self, user_id: str, file_content: str) -> ImportResult:
         """
@@ -72,7 +116,184 @@ class ImportCSV:
         Returns:
             ImportResult avec les statistiques de l'import
         """
-        result = ImportResult(
+        return self.execute_stream(user_id, StringIO(file_content))
+
+    def execute_stream(
+        self,
+        user_id: str,
+        lines: Iterable[str],
+        on_progress: Optional[Callable[[ImportResult], None]] = None,
+    ) -> ImportResult:
+        """
+        Importe des transactions depuis un CSV lu ligne à ligne.
+
+        Les transactions sont parsées une à une et traitées par lots de `chunk_size` :
+        la mémoire utilisée ne dépend pas de la taille du fichier.
+
+        Args:
+            user_id: ID de l'utilisateur
+            lines: Lignes du fichier CSV (fichier texte ouvert, StringIO...)
+            on_progress: Appelé avec le résultat partiel après chaque lot écrit
+
+        Returns:
+            ImportResult avec les statistiques de l'import
+
+        Raises:
+            UnicodeDecodeError: si le fichier n'est pas en UTF-8 (décodage au fil de l'eau)
+        """
+        return self._import_transactions(
+            user_id, lambda: self.csv_parser.iter_parse(lines), on_progress, "du CSV"
+        )
+
+    def execute_file(
+        self,
+        user_id: str,
+        stream: BinaryIO,
+        on_progress: Optional[Callable[[ImportResult], None]] = None,
+        committed: Optional[list[ImportLedgerChunk]] = None,
+        on_commit: Optional[Callable[[ImportLedgerChunk], None]] = None,
+    ) -> ImportResult:
+        """
+        Importe un relevé (CSV, OFX/QFX, QIF, CAMT.053) dont le format est détecté.
+
+        Le format, l'encodage et le séparateur sont déduits des premiers octets, puis
+        le fichier est lu en flux comme pour `execute_stream`. Pour reprendre un
+        import interrompu, les lots de `committed` dont l'empreinte est inchangée
+        sont reportés sans déduplication ni écriture.
+
+        Args:
+            user_id: ID de l'utilisateur
+            stream: Fichier binaire positionnable (fichier ouvert en 'rb', BytesIO...)
+            on_progress: Appelé avec le résultat partiel après chaque lot écrit
+            committed: Lots déjà écrits par une tentative précédente
+            on_commit: Appelé avec chaque lot entièrement écrit, à consigner
+
+        Returns:
+            ImportResult avec les statistiques de l'import
+        """
+        return self._import_transactions(
+            user_id,
+            lambda: self.parser_registry.iter_parse(stream),
+            on_progress,
+            "du fichier",
+            committed,
+            on_commit,
+        )
+
+    def preview(self, user_id: str, stream: BinaryIO, filename: str = "") -> ImportPreview:
+        """
+        Simule l'import d'un relevé sans rien écrire.
+
+        Le fichier est parsé, catégorisé et dédupliqué contre les transactions
+        existantes (lectures seules) ; les transactions nouvelles sont préparées
+        pour être écrites par `commit_preview` sans relire le fichier.
+
+        Args:
+            user_id: ID de l'utilisateur
+            stream: Fichier binaire positionnable
+            filename: Nom du fichier envoyé
+
+        Returns:
+            ImportPreview avec une ligne par transaction lue
+
+        Raises:
+            UnicodeDecodeError: si le fichier ne peut pas être décodé
+        """
+        preview = ImportPreview(token=str(uuid.uuid4()), user_id=user_id, filename=filename)
+        result = self._new_result()
+        self._load_learned_categories(user_id)
+        # Rien n'est écrit : les empreintes vues s'accumulent sur tout le fichier
+        dedupe = self._new_dedupe_index(user_id)
+
+        try:
+            for batch in self._iter_batches(self.parser_registry.iter_parse(stream)):
+                self._cover_batch(dedupe, batch)
+                expenses, incomes = self._prepare_batch(
+                    result, user_id, batch, dedupe.expenses, dedupe.incomes, preview.rows
+                )
+                preview.expenses.extend(expenses)
+                preview.incomes.extend(incomes)
+
+        except UnicodeDecodeError:
+            raise
+
+        except Exception as e:
+            preview.errors.append(f"Erreur lors du parsing du fichier: {str(e)}")
+
+        return preview
+
+    def commit_preview(self, preview: ImportPreview) -> ImportResult:
+        """
+        Écrit les transactions préparées par `preview`, par lots de `chunk_size`.
+
+        Les transactions importées entre-temps sont refusées par l'index unique des
+        empreintes et comptées comme ignorées.
+        """
+        result = self._new_result()
+        result.total_transactions = preview.total_transactions
+        result.skipped = preview.count(PreviewRowStatus.DUPLICATE)
+        for row in preview.rows:
+            if row.status == PreviewRowStatus.ERROR:
+                result.add_error(row.error)
+        for error in preview.errors:
+            result.add_error(error)
+
+        for kind, entities in (
+            (RollupKind.EXPENSE, preview.expenses),
+            (RollupKind.INCOME, preview.incomes),
+        ):
+            for index, start in enumerate(range(0, len(entities), self.chunk_size)):
+                chunk = entities[start:start + self.chunk_size]
+                self._write_chunk_result(result, kind, chunk, index)
+
+        return result
+
+    def _import_transactions(
+        self,
+        user_id: str,
+        parse: Callable[[], Iterable[ImportedTransaction]],
+        on_progress: Optional[Callable[[ImportResult], None]],
+        source: str,
+        committed: Optional[list[ImportLedgerChunk]] = None,
+        on_commit: Optional[Callable[[ImportLedgerChunk], None]] = None,
+    ) -> ImportResult:
+        """Traite les transactions parsées par lots de `chunk_size`."""
+        result = self._new_result()
+        chunk_indexes = {RollupKind.EXPENSE: 0, RollupKind.INCOME: 0}
+        committed_by_index = {chunk.index: chunk for chunk in committed or []}
+        self._load_learned_categories(user_id)
+        dedupe = self._new_dedupe_index(user_id)
+
+        try:
+            for index, batch in enumerate(self._iter_batches(parse())):
+                if committed_by_index or on_commit:
+                    batch_hash = chunk_hash(batch)
+                    done = committed_by_index.get(index)
+                    if done and done.chunk_hash == batch_hash:
+                        self._replay_chunk(result, done, chunk_indexes)
+                    else:
+                        ledger_chunk = self._import_batch(
+                            result, user_id, batch, dedupe, chunk_indexes, index, batch_hash
+                        )
+                        if ledger_chunk and on_commit:
+                            on_commit(ledger_chunk)
+                else:
+                    self._import_batch(result, user_id, batch, dedupe, chunk_indexes)
+                if on_progress and len(batch) == self.chunk_size:
+                    on_progress(result)
+
+        except UnicodeDecodeError:
+            raise
+
+        except Exception as e:
+            result.add_error(f"Erreur lors du parsing {source}: {str(e)}")
+            result.success = False
+
+        return result
+
+    @staticmethod
+    def _new_result() -> ImportResult:
+        return ImportResult(
             total_transactions=0,
             expenses_created=0,
             incomes_created=0,
@@ -81,86 +302,270 @@ class ImportCSV:
             success=True,
         )
 
-        try:
-            # Parser le fichier CSV
-            transactions = self.csv_parser.parse(file_content)
-            result.total_transactions = len(transactions)
+    def _load_learned_categories(self, user_id: str) -> None:
+        """Charge les catégories apprises de l'utilisateur, une fois par import."""
+        if self.get_category_index:
+            self.learned_categories = self.get_category_index.execute(user_id)
 
-            # Récupérer les transactions existantes pour détecter les doublons
-            existing_expenses = self.expense_repo.get_by_user_id(user_id)
-            existing_incomes = self.income_repo.get_all_by_user_id(user_id)
+    def _iter_batches(
+        self, transactions: Iterable[ImportedTransaction]
+    ) -> Iterator[list[ImportedTransaction]]:
+        """Regroupe les transactions parsées en lots de `chunk_size`."""
+        batch: list[ImportedTransaction] = []
+        for transaction in transactions:
+            batch.append(transaction)
+            if len(batch) >= self.chunk_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
-            # Importer chaque transaction
-            for transaction in transactions:
-                try:
-                    # Vérifier les doublons
-                    if self._is_duplicate(transaction, existing_expenses, existing_incomes):
-                        result.skipped += 1
-                        continue
-
-                    if transaction.is_expense:
-                        expense = self._create_expense_from_transaction(user_id, transaction)
-                        created = self.create_expense_use_case.execute(expense)
-                        if created:
-                            result.expenses_created += 1
-                            existing_expenses.append(created)
-                        else:
-                            result.add_error(
-                                f"Échec de création de la dépense: {transaction.description}"
-                            )
-                    else:
-                        income = self._create_income_from_transaction(user_id, transaction)
-                        created = self.create_income_use_case.execute(income)
-                        if created:
-                            result.incomes_created += 1
-                            existing_incomes.append(created)
-                        else:
-                            result.add_error(
-                                f"Échec de création du revenu: {transaction.description}"
-                            )
-
-                except Exception as e:
-                    result.add_error(
-                        f"Erreur lors de l'import de '{transaction.description}': {str(e)}"
+    def _import_batch(
+        self,
+        result: ImportResult,
+        user_id: str,
+        batch: list[ImportedTransaction],
+        dedupe: DedupeIndex,
+        chunk_indexes: dict[RollupKind, int],
+        index: int = 0,
+        batch_hash: str = "",
+    ) -> Optional[ImportLedgerChunk]:
+        """
+        Déduplique et valide un lot de transactions en mémoire, puis l'écrit.
+
+        Retourne le lot à consigner dans le registre, ou None si une écriture a échoué.
+        """
+        before = (result.expenses_created, result.incomes_created, result.skipped)
+        errors_before, chunks_before = len(result.errors), len(result.chunks)
+
+        # L'index ne relit que les jours du lot pas encore chargés ; les empreintes des
+        # lots précédents y ont été ajoutées, les doublons du fichier y sont donc vus
+        self._cover_batch(dedupe, batch)
+        expenses, incomes = self._prepare_batch(
+            result, user_id, batch, dedupe.expenses, dedupe.incomes
+        )
+
+        # Écrire chaque type dans sa propre transaction
+        for kind, chunk in ((RollupKind.EXPENSE, expenses), (RollupKind.INCOME, incomes)):
+            if chunk:
+                self._write_chunk_result(result, kind, chunk, chunk_indexes[kind])
+                chunk_indexes[kind] += 1
+                if result.chunks[-1].error:
+                    # Lot non écrit : ses empreintes ne sont pas en base
+                    dedupe.discard(
+                        kind == RollupKind.EXPENSE, (fingerprint_of(t) for t in chunk)
                     )
 
-        except Exception as e:
-            result.add_error(f"Erreur lors du parsing du CSV: {str(e)}")
-            result.success = False
+        if any(chunk.error for chunk in result.chunks[chunks_before:]):
+            # Lot à retraiter lors d'une reprise
+            return None
+        return ImportLedgerChunk(
+            index=index,
+            chunk_hash=batch_hash,
+            rows=len(batch),
+            expenses_created=result.expenses_created - before[0],
+            incomes_created=result.incomes_created - before[1],
+            skipped=result.skipped - before[2],
+            errors=result.errors[errors_before:],
+        )
 
-        return result
+    @staticmethod
+    def _replay_chunk(
+        result: ImportResult, chunk: ImportLedgerChunk, chunk_indexes: dict[RollupKind, int]
+    ) -> None:
+        """Reporte un lot déjà écrit par une tentative précédente de l'import."""
+        result.total_transactions += chunk.rows
+        result.resumed += chunk.rows
+        result.expenses_created += chunk.expenses_created
+        result.incomes_created += chunk.incomes_created
+        result.skipped += chunk.skipped
+        for error in chunk.errors:
+            result.add_error(error)
+        if chunk.expenses_created:
+            chunk_indexes[RollupKind.EXPENSE] += 1
+        if chunk.incomes_created:
+            chunk_indexes[RollupKind.INCOME] += 1
 
-    def _is_duplicate(
+    def _prepare_batch(
         self,
+        result: ImportResult,
+        user_id: str,
+        batch: list[ImportedTransaction],
+        seen_expenses: set[str],
+        seen_incomes: set[str],
+        rows: Optional[list[ImportPreviewRow]] = None,
+    ) -> tuple[list[Expense], list[Income]]:
+        """Déduplique et valide un lot en mémoire ; consigne l'issue de chaque ligne."""
+        result.total_transactions += len(batch)
+        expenses: list[Expense] = []
+        incomes: list[Income] = []
+        for transaction in batch:
+            status, entity, error = self._prepare_transaction(
+                user_id, transaction, seen_expenses, seen_incomes
+            )
+            if status == PreviewRowStatus.DUPLICATE:
+                result.skipped += 1
+            elif status == PreviewRowStatus.ERROR:
+                result.add_error(error)
+            elif transaction.is_expense:
+                expenses.append(entity)
+            else:
+                incomes.append(entity)
+
+            if rows is not None:
+                rows.append(
+                    ImportPreviewRow(
+                        index=len(rows) + 1,
+                        date=transaction.date,
+                        description=transaction.description,
+                        amount=transaction.amount,
+                        is_expense=transaction.is_expense,
+                        status=status,
+                        category=entity.category.value if entity and entity.category else None,
+                        error=error,
+                    )
+                )
+        return expenses, incomes
+
+    def _prepare_transaction(
+        self,
+        user_id: str,
         transaction: ImportedTransaction,
-        existing_expenses: List[Expense],
-        existing_incomes: List[Income],
-    ) -> bool:
-        """Vérifie si une transaction est un doublon."""
-        # Comparer par date, montant et description (ou nom)
-        if transaction.is_expense:
-            return any(
-                expense.date.date() == transaction.date.date()
-                and abs(expense.amount - transaction.amount) < 0.01
-                and expense.name == transaction.description
-                for expense in existing_expenses
+        seen_expenses: set[str],
+        seen_incomes: set[str],
+    ) -> tuple[PreviewRowStatus, Optional[Expense | Income], Optional[str]]:
+        """Retourne l'issue d'une transaction, l'entité prête à écrire et l'erreur."""
+        try:
+            # Vérifier les doublons (recherche O(1) dans l'index)
+            fingerprint = transaction_fingerprint(
+                transaction.date, transaction.amount, transaction.description
             )
-        else:
-            return any(
-                income.date.date() == transaction.date.date()
-                and abs(income.amount - transaction.amount) < 0.01
-                and income.name == transaction.description
-                for income in existing_incomes
+            seen = seen_expenses if transaction.is_expense else seen_incomes
+            if fingerprint in seen:
+                return PreviewRowStatus.DUPLICATE, None, None
+
+            if transaction.is_expense:
+                expense = self._create_expense_from_transaction(user_id, transaction)
+                expense.fingerprint = fingerprint
+                try:
+                    entity = self.create_expense_use_case.prepare(expense)
+                except ValueError:
+                    return (
+                        PreviewRowStatus.ERROR,
+                        None,
+                        f"Échec de création de la dépense: {transaction.description}",
+                    )
+            else:
+                income = self._create_income_from_transaction(user_id, transaction)
+                income.fingerprint = fingerprint
+                try:
+                    entity = self.create_income_use_case.prepare(income)
+                except ValueError:
+                    return (
+                        PreviewRowStatus.ERROR,
+                        None,
+                        f"Échec de création du revenu: {transaction.description}",
+                    )
+            seen.add(fingerprint)
+            return PreviewRowStatus.NEW, entity, None
+
+        except Exception as e:
+            return (
+                PreviewRowStatus.ERROR,
+                None,
+                f"Erreur lors de l'import de '{transaction.description}': {str(e)}",
             )
 
+    def _new_dedupe_index(self, user_id: str) -> DedupeIndex:
+        """Index des empreintes existantes de l'utilisateur, chargé au fil des lots."""
+        return DedupeIndex(
+            lambda start, end: (
+                self.expense_repo.get_by_user_id_and_date_range(user_id, start, end),
+                self.income_repo.get_by_user_id_and_date_range(user_id, start, end),
+            )
+        )
+
+    @staticmethod
+    def _cover_batch(dedupe: DedupeIndex, batch: list[ImportedTransaction]) -> None:
+        """Charge dans l'index les jours couverts par le lot."""
+        dedupe.cover(min(t.date for t in batch), max(t.date for t in batch))
+
+    def _write_chunk_result(
+        self, result: ImportResult, kind: RollupKind, chunk: list, index: int
+    ) -> None:
+        """Écrit un lot validé et consigne son résultat."""
+        chunk_result = ImportChunkResult(kind=kind.value, index=index, size=len(chunk))
+        try:
+            self._write_chunk(kind, chunk)
+            chunk_result.created = len(chunk)
+        except DuplicateTransactionError:
+            # Lot refusé par l'index unique (import concurrent) : écriture ligne à ligne
+            self._write_rows(result, kind, chunk, chunk_result)
+        except Exception as e:
+            self._rollback_pending()
+            chunk_result.error = str(e)
+            result.add_error(f"Erreur lors de l'écriture du lot {index + 1}: {str(e)}")
+
+        result.chunks.append(chunk_result)
+        result.skipped += chunk_result.skipped
+        if kind == RollupKind.EXPENSE:
+            result.expenses_created += chunk_result.created
+        else:
+            result.incomes_created += chunk_result.created
+
+    def _write_chunk(self, kind: RollupKind, chunk: list) -> None:
+        """Écrit un lot : agrégats fusionnés puis INSERT multi-lignes (même commit)."""
+        if self.rollup_repo:
+            deltas = (MonthlyRollup.from_transaction(kind, t) for t in chunk)
+            for delta in merge_rollups(deltas):
+                self.rollup_repo.apply(delta)
+        if kind == RollupKind.EXPENSE:
+            self.expense_repo.bulk_create(chunk)
+        else:
+            self.income_repo.bulk_create(chunk)
+
+    def _write_rows(
+        self,
+        result: ImportResult,
+        kind: RollupKind,
+        chunk: list,
+        chunk_result: ImportChunkResult,
+    ) -> None:
+        """Écrit un lot ligne à ligne ; les doublons détectés par la base sont ignorés."""
+        if kind == RollupKind.EXPENSE:
+            use_case = self.create_expense_use_case
+        else:
+            use_case = self.create_income_use_case
+        for transaction in chunk:
+            try:
+                use_case.persist(transaction)
+                chunk_result.created += 1
+            except DuplicateTransactionError:
+                chunk_result.skipped += 1
+            except Exception as e:
+                self._rollback_pending()
+                chunk_result.error = str(e)
+                result.add_error(f"Erreur lors de l'import de '{transaction.name}': {str(e)}")
+
+    def _rollback_pending(self) -> None:
+        """Annule les agrégats d'une écriture en échec avant de passer à la suivante.
+
+        Sans cela la session resterait interrompue et le commit suivant validerait
+        les agrégats de la ligne refusée.
+        """
+        if self.rollup_repo:
+            self.rollup_repo.rollback()
+
     def _create_expense_from_transaction(
         self, user_id: str, transaction: ImportedTransaction
     ) -> Expense:
         """Crée une entité Expense depuis une ImportedTransaction."""
-        # Mapper la catégorie
-        category = self.EXPENSE_CATEGORY_MAPPING.get(
-            transaction.category, ExpenseCategory.OTHER
-        )
+        # Catégorie apprise des corrections de l'utilisateur, sinon mapping bancaire
+        category = self._learned_category(RollupKind.EXPENSE, transaction, ExpenseCategory)
+        if category is None:
+            category = self.EXPENSE_CATEGORY_MAPPING.get(
+                transaction.category, ExpenseCategory.OTHER
+            )
 
         # Déterminer la fréquence si récurrent
         frequency = None
@@ -184,13 +589,23 @@ class ImportCSV:
             updated_at=datetime.now(UTC),
         )
 
-    def _create_income_from_transaction(
-        self, user_id: str, transaction: ImportedTransaction
-    ) -> Income:
-        """Crée une entité Income depuis une ImportedTransaction."""
-        # Déterminer la catégorie basée sur la description
+    def _learned_category(self, kind: RollupKind, transaction: ImportedTransaction, enum):
+        """Catégorie apprise pour le libellé ou le fournisseur, ou None."""
+        learned = self.learned_categories
+        value = learned.lookup(kind, transaction.description) or learned.lookup(
+            kind, transaction.supplier
+        )
+        try:
+            return enum(value) if value else None
+        except ValueError:
+            # Catégorie apprise qui n'existe plus
+            return None
+
+    @staticmethod
+    def _income_category_from_description(description: str) -> IncomeCategory:
+        """Déduit la catégorie d'un revenu de mots-clés de sa description."""
         category = IncomeCategory.OTHER
-        description_upper = transaction.description.upper()
+        description_upper = description.upper()
 
         if "SALAIRE" in description_upper or "SALARY" in description_upper:
             category = IncomeCategory.SALARY
@@ -201,6 +616,17 @@ class ImportCSV:
         elif "REMBOURSEMENT" in description_upper:
             category = IncomeCategory.OTHER
 
+        return category
+
+    def _create_income_from_transaction(
+        self, user_id: str, transaction: ImportedTransaction
+    ) -> Income:
+        """Crée une entité Income depuis une ImportedTransaction."""
+        # Catégorie apprise des corrections de l'utilisateur, sinon d'après la description
+        category = self._learned_category(RollupKind.INCOME, transaction, IncomeCategory)
+        if category is None:
+            category = self._income_category_from_description(transaction.description)
+
         # Déterminer la fréquence si récurrent
         frequency = None
         if transaction.is_recurring:
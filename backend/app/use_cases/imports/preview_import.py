@@ -0,0 +1,29 @@
+"""Cas d'usage pour prévisualiser un import sans écrire."""
+
+from typing import BinaryIO
+
+from app.domain.entities.import_preview import ImportPreview
+from app.domain.interfaces.import_preview_cache_interface import ImportPreviewCacheInterface
+from app.use_cases.imports.create_import_job import SUPPORTED_EXTENSIONS
+from app.use_cases.imports.import_csv import ImportCSV
+
+
+class PreviewImport:
+    """Cas d'usage pour simuler un import et conserver son résultat sous un jeton."""
+
+    def __init__(self, import_csv: ImportCSV, preview_cache: ImportPreviewCacheInterface):
+        self.import_csv = import_csv
+        self.preview_cache = preview_cache
+
+    def execute(self, user_id: str, filename: str, stream: BinaryIO) -> ImportPreview:
+        """Parse, catégorise et déduplique le fichier en mémoire, sans écriture."""
+        if not user_id:
+            raise ValueError("L'id de l'utilisateur est requis")
+        if not filename.lower().endswith(SUPPORTED_EXTENSIONS):
+            raise ValueError(
+                "Format de fichier non supporté. Formats acceptés: CSV, OFX/QFX, QIF, CAMT.053"
+            )
+
+        preview = self.import_csv.preview(user_id, stream, filename)
+        self.preview_cache.set(preview)
+        return preview
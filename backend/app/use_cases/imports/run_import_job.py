@@ -0,0 +1,83 @@
+"""Cas d'usage pour exécuter un import de relevé en arrière-plan."""
+
+from datetime import datetime, UTC
+from typing import BinaryIO, Optional
+
+from app.domain.entities.import_job import ImportJob, ImportJobStatus
+from app.domain.entities.import_ledger import ImportLedgerChunk
+from app.domain.interfaces.import_job_repository_interface import ImportJobRepositoryInterface
+from app.domain.interfaces.import_ledger_repository_interface import (
+    ImportLedgerRepositoryInterface,
+)
+from app.use_cases.imports.import_csv import ImportCSV
+
+
+class RunImportJob:
+    """Cas d'usage pour exécuter un import en persistant son avancement.
+
+    Un import interrompu (redémarrage, échec) peut être relancé : les lots consignés
+    dans le registre sont reportés sans être réécrits, et les transactions écrites
+    d'un lot non consigné sont reconnues par leur empreinte.
+    """
+
+    def __init__(
+        self,
+        job_repo: ImportJobRepositoryInterface,
+        import_csv: ImportCSV,
+        ledger_repo: Optional[ImportLedgerRepositoryInterface] = None,
+    ):
+        self.job_repo = job_repo
+        self.import_csv = import_csv
+        self.ledger_repo = ledger_repo
+
+    def execute(self, job: ImportJob, stream: BinaryIO) -> ImportJob:
+        """Importe le fichier (format détecté) et enregistre l'état final de l'import."""
+        job.status = ImportJobStatus.RUNNING
+        job.error = None
+        job.updated_at = datetime.now(UTC)
+        self.job_repo.update(job)
+
+        # Lots déjà écrits par une tentative précédente de cet import
+        committed = self.ledger_repo.get_chunks(job.id) if self.ledger_repo else None
+
+        try:
+            result = self.import_csv.execute_file(
+                job.user_id,
+                stream,
+                on_progress=lambda partial: self._report(job, partial),
+                committed=committed,
+                on_commit=(lambda chunk: self._commit(job, chunk)) if self.ledger_repo else None,
+            )
+        except UnicodeDecodeError:
+            return self._finish(
+                job,
+                error="Erreur de décodage du fichier. Encodages supportés: "
+                "UTF-8, UTF-16 et Windows-1252.",
+            )
+        except Exception as e:
+            return self._finish(job, error=f"Erreur lors de l'import: {str(e)}")
+
+        job.report(result)
+        job.result = result
+        return self._finish(job)
+
+    def fail(self, job: ImportJob, error: str) -> ImportJob:
+        """Marque un import en échec sans l'exécuter (fichier introuvable...)."""
+        return self._finish(job, error=error)
+
+    def _report(self, job: ImportJob, partial) -> None:
+        """Persiste l'avancement après un lot."""
+        job.report(partial)
+        self.job_repo.update(job)
+
+    def _commit(self, job: ImportJob, chunk: ImportLedgerChunk) -> None:
+        """Consigne un lot entièrement écrit dans le registre."""
+        self.ledger_repo.add_chunk(job.id, chunk)
+
+    def _finish(self, job: ImportJob, error: str | None = None) -> ImportJob:
+        """Enregistre la fin de l'import (succès ou échec)."""
+        job.status = ImportJobStatus.FAILED if error else ImportJobStatus.COMPLETED
+        job.error = error
+        job.finished_at = datetime.now(UTC)
+        job.updated_at = job.finished_at
+        return self.job_repo.update(job)
@@ -1,45 +1,69 @@
 """Cas d'usage pour créer un revenu."""
 
 from datetime import datetime, UTC
+from typing import Optional
 
 from app.domain.entities.income import Income, IncomeCategory, IncomeFrequency
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
 from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
 
 
 class CreateIncome:
     """Cas d'usage pour créer un revenu."""
 
-    def __init__(self, income_repo: IncomeRepositoryInterface):
+    def __init__(
+        self,
+        income_repo: IncomeRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+    ):
         self.income_repo = income_repo
+        self.rollup_repo = rollup_repo
 
     def execute(self, income: Income) -> Income | None:
         """Exécute le cas d'usage."""
 
         try:
-            self.validate_income(income)
-            # Déterminer si le revenu est récurrent basé sur la fréquence
-            if income.frequency and income.frequency != IncomeFrequency.ONE_TIME:
-                income.is_recurring = True
-            else:
-                income.is_recurring = False
-
-            new_income = Income(
-                id=income.id,
-                user_id=income.user_id,
-                name=income.name,
-                amount=income.amount,
-                date=income.date,
-                category=income.category,
-                description=income.description,
-                is_recurring=income.is_recurring,
-                frequency=income.frequency,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-            )
-            self.income_repo.create(new_income)
-            return new_income
+            new_income = self.prepare(income)
         except ValueError:
             return None
+        return self.persist(new_income)
+
+    def prepare(self, income: Income) -> Income:
+        """Valide et normalise un revenu en mémoire (lève ValueError si invalide)."""
+
+        self.validate_income(income)
+        # Déterminer si le revenu est récurrent basé sur la fréquence
+        if income.frequency and income.frequency != IncomeFrequency.ONE_TIME:
+            income.is_recurring = True
+        else:
+            income.is_recurring = False
+
+        return Income(
+            id=income.id,
+            user_id=income.user_id,
+            name=income.name,
+            amount=income.amount,
+            date=income.date,
+            category=income.category,
+            description=income.description,
+            is_recurring=income.is_recurring,
+            frequency=income.frequency,
+            fingerprint=income.fingerprint,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+
+    def persist(self, income: Income) -> Income:
+        """Enregistre un revenu déjà préparé, avec son agrégat mensuel."""
+
+        # L'agrégat est validé par le commit de la création (même session)
+        if self.rollup_repo:
+            self.rollup_repo.apply(MonthlyRollup.from_transaction(RollupKind.INCOME, income))
+        self.income_repo.create(income)
+        return income
 
     def validate_income(self, income: Income) -> None:
         """Valide le revenu."""
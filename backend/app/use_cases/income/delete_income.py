@@ -1,29 +1,47 @@
 """Cas d'usage pour supprimer un revenu."""
 
+from typing import Optional
+
+from app.domain.entities.income import Income
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
 from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
 
 
 class DeleteIncome:
     """Cas d'usage pour supprimer un revenu."""
 
-    def __init__(self, income_repo: IncomeRepositoryInterface):
+    def __init__(
+        self,
+        income_repo: IncomeRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+    ):
         self.income_repo = income_repo
+        self.rollup_repo = rollup_repo
 
     def execute(self, income_id: str, user_id: str) -> None:
         """Exécute le cas d'usage."""
 
         self.validate_user_id(user_id)
-        self.validate_income_id(income_id, user_id)
+        income = self.validate_income_id(income_id, user_id)
+        if self.rollup_repo:
+            self.rollup_repo.apply(
+                MonthlyRollup.from_transaction(RollupKind.INCOME, income).negated()
+            )
         self.income_repo.delete(income_id, user_id)
 
-    def validate_income_id(self, income_id: str, user_id: str) -> None:
-        """Valide l'id du revenu."""
+    def validate_income_id(self, income_id: str, user_id: str) -> Income:
+        """Valide l'id du revenu et retourne le revenu."""
 
         if not income_id:
             raise ValueError("L'id du revenu est requis")
 
-        if not self.income_repo.get_by_id(income_id, user_id):
+        income = self.income_repo.get_by_id(income_id, user_id)
+        if not income:
             raise ValueError("Le revenu n'existe pas")
+        return income
 
     def validate_user_id(self, user_id: str) -> None:
         """Valide l'id de l'utilisateur."""
@@ -1,9 +1,11 @@
 """Cas d'usage pour lister les revenus."""
 
-from typing import List
+from typing import List, Optional
 
 from app.domain.entities.income import Income
+from app.domain.entities.transaction_query import TransactionPage, TransactionQuery
 from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.services.page_cursor import paginate
 
 
 class ListIncomes:
@@ -21,3 +23,12 @@ class ListIncomes:
             return self.income_repo.get_all_by_user_id(user_id)
         except ValueError:
             return []
+
+    def execute_page(
+        self, user_id: str, query: TransactionQuery, cursor: Optional[str] = None
+    ) -> TransactionPage[Income]:
+        """Liste une page de revenus filtrés et triés (ValueError si curseur invalide)."""
+
+        if not user_id:
+            raise ValueError("L'utilisateur est requis")
+        return paginate(lambda page: self.income_repo.get_page(user_id, page), query, cursor)
@@ -1,14 +1,28 @@
 """Cas d'usage pour mettre à jour un revenu."""
 
+from typing import Optional
+
 from app.domain.entities.income import Income, IncomeCategory, IncomeFrequency
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
 from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.interfaces.monthly_rollup_repository_interface import (
+    MonthlyRollupRepositoryInterface,
+)
+from app.use_cases.categories.learn_category import LearnCategory
 
 
 class UpdateIncome:
     """Cas d'usage pour mettre à jour un revenu."""
 
-    def __init__(self, income_repo: IncomeRepositoryInterface):
+    def __init__(
+        self,
+        income_repo: IncomeRepositoryInterface,
+        rollup_repo: Optional[MonthlyRollupRepositoryInterface] = None,
+        learn_category: Optional[LearnCategory] = None,
+    ):
         self.income_repo = income_repo
+        self.rollup_repo = rollup_repo
+        self.learn_category = learn_category
 
     def execute(self, income: Income, user_id: str) -> Income:
         """Exécute le cas d'usage."""
@@ -21,9 +35,27 @@ class UpdateIncome:
 
         self.validate_income(income)
         self.validate_user_id(user_id)
+        previous = None
+        if self.rollup_repo or self.learn_category:
+            previous = self.income_repo.get_by_id(income.id, user_id)
+        if self.rollup_repo and previous:
+            self.rollup_repo.apply(
+                MonthlyRollup.from_transaction(RollupKind.INCOME, previous).negated()
+            )
+            self.rollup_repo.apply(MonthlyRollup.from_transaction(RollupKind.INCOME, income))
         updated_income = self.income_repo.update(income)
         if not updated_income:
             raise ValueError("Le revenu n'existe pas ou n'a pas pu être mis à jour")
+        if (
+            self.learn_category
+            and previous
+            and updated_income.category
+            and previous.category != updated_income.category
+        ):
+            # Correction de catégorie : appliquée aux prochains imports du même libellé
+            self.learn_category.execute(
+                user_id, RollupKind.INCOME, updated_income.name, updated_income.category.value
+            )
         return updated_income
 
     def validate_income(self, income: Income) -> None:
@@ -0,0 +1 @@
+"""Package des cas d'usage pour les statistiques."""
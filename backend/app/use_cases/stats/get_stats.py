@@ -0,0 +1,135 @@
+"""Cas d'usage pour calculer les statistiques des transactions."""
+
+import hashlib
+from itertools import islice
+from typing import Optional
+
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction_stats import (
+    AmountStats,
+    CategoryStats,
+    PeriodStats,
+    StatsGroup,
+    StatsQuery,
+    TransactionStats,
+)
+from app.domain.interfaces.transaction_stats_repository_interface import (
+    TransactionStatsRepositoryInterface,
+)
+from app.domain.interfaces.user_data_version_repository_interface import (
+    UserDataVersionRepositoryInterface,
+)
+from app.domain.services.statistics import period_starts
+
+# Nombre maximal de périodes d'une réponse (ex. un an de jours)
+MAX_STATS_PERIODS = 400
+
+
+class GetStats:
+    """Cas d'usage pour calculer totaux, catégories et périodes sur un intervalle."""
+
+    def __init__(
+        self,
+        stats_repo: TransactionStatsRepositoryInterface,
+        version_repo: UserDataVersionRepositoryInterface,
+    ):
+        self.stats_repo = stats_repo
+        self.version_repo = version_repo
+
+    def etag(self, user_id: str, query: StatsQuery) -> str:
+        """ETag des statistiques : version des données de l'utilisateur et paramètres.
+
+        À lire avant le calcul : une écriture concurrente change la version, donc l'ETag
+        suivant, et ne peut pas être masquée.
+        """
+        version = self.version_repo.get(user_id)
+        params = "|".join(
+            (
+                user_id,
+                query.start_date.isoformat(),
+                query.end_date.isoformat(),
+                query.granularity.value,
+            )
+        )
+        digest = hashlib.sha256(params.encode()).hexdigest()[:16]
+        return f'"{version}-{digest}"'
+
+    def execute(self, user_id: str, query: StatsQuery) -> TransactionStats:
+        """Exécute le cas d'usage.
+
+        Lève ValueError si l'utilisateur manque, si l'intervalle est inversé ou s'il
+        compte plus de MAX_STATS_PERIODS périodes.
+        """
+        if not user_id:
+            raise ValueError("L'utilisateur est requis")
+        if query.start_date > query.end_date:
+            raise ValueError("La date de début doit précéder la date de fin")
+        # Borne l'itération : un intervalle démesuré est rejeté sans être énuméré
+        starts = list(
+            islice(
+                period_starts(query.start_date, query.end_date, query.granularity),
+                MAX_STATS_PERIODS + 1,
+            )
+        )
+        if len(starts) > MAX_STATS_PERIODS:
+            raise ValueError(
+                f"L'intervalle compte plus de {MAX_STATS_PERIODS} périodes : "
+                "réduisez-le ou choisissez un pas plus grand"
+            )
+
+        totals = {
+            bucket.kind: bucket.stats
+            for bucket in self.stats_repo.aggregate(user_id, query, StatsGroup.TOTAL)
+        }
+        expenses = totals.get(RollupKind.EXPENSE, AmountStats())
+        incomes = totals.get(RollupKind.INCOME, AmountStats())
+
+        categories = [
+            CategoryStats(
+                kind=bucket.kind,
+                category=bucket.key,
+                stats=bucket.stats,
+                share=bucket.stats.total / totals[bucket.kind].total
+                if totals[bucket.kind].total else 0.0,
+            )
+            for bucket in self.stats_repo.aggregate(user_id, query, StatsGroup.CATEGORY)
+        ]
+        categories.sort(key=lambda c: (c.kind != RollupKind.EXPENSE, -c.stats.total))
+
+        by_period = {
+            (bucket.kind, bucket.key): bucket.stats
+            for bucket in self.stats_repo.aggregate(user_id, query, StatsGroup.PERIOD)
+        }
+        periods: list[PeriodStats] = []
+        for start in starts:
+            period_expenses = by_period.get((RollupKind.EXPENSE, start), AmountStats())
+            period_incomes = by_period.get((RollupKind.INCOME, start), AmountStats())
+            previous = periods[-1] if periods else None
+            periods.append(
+                PeriodStats(
+                    start=start,
+                    expenses=period_expenses,
+                    incomes=period_incomes,
+                    net=period_incomes.total - period_expenses.total,
+                    expense_change=_change(previous and previous.expenses, period_expenses),
+                    income_change=_change(previous and previous.incomes, period_incomes),
+                )
+            )
+
+        return TransactionStats(
+            start_date=query.start_date,
+            end_date=query.end_date,
+            granularity=query.granularity,
+            expenses=expenses,
+            incomes=incomes,
+            net_balance=incomes.total - expenses.total,
+            categories=categories,
+            periods=periods,
+        )
+
+
+def _change(previous: Optional[AmountStats], current: AmountStats) -> Optional[float]:
+    """Variation relative du total par rapport à la période précédente (None si vide)."""
+    if not previous or not previous.total:
+        return None
+    return round((current.total - previous.total) / previous.total, 4)
@@ -0,0 +1 @@
+"""Use cases pour le fil unifié des transactions."""
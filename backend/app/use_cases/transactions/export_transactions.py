@@ -0,0 +1,39 @@
+"""Cas d'usage pour exporter les dépenses et revenus."""
+
+from dataclasses import replace
+from typing import Iterator, Optional
+
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction_query import TransactionQuery
+from app.domain.interfaces.transaction_repository_interface import (
+    TransactionRepositoryInterface,
+)
+
+# Transactions lues et écrites par lot : borne la mémoire de l'export
+EXPORT_BATCH_SIZE = 5000
+
+
+class ExportTransactions:
+    """Cas d'usage pour parcourir toutes les transactions filtrées d'un utilisateur."""
+
+    def __init__(self, transaction_repo: TransactionRepositoryInterface):
+        self.transaction_repo = transaction_repo
+
+    def execute(
+        self,
+        user_id: str,
+        query: TransactionQuery,
+        kind: Optional[RollupKind] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[list[Transaction]]:
+        """Retourne les lots de transactions, sans pagination.
+
+        Lève ValueError si l'utilisateur manque.
+        """
+        if not user_id:
+            raise ValueError("L'utilisateur est requis")
+        kinds = (kind,) if kind else (RollupKind.EXPENSE, RollupKind.INCOME)
+        return self.transaction_repo.stream(
+            user_id, replace(query, limit=None, after=None), kinds, batch_size
+        )
@@ -0,0 +1,36 @@
+"""Cas d'usage pour lister les dépenses et revenus en un seul fil."""
+
+from typing import Optional
+
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction_query import TransactionPage, TransactionQuery
+from app.domain.interfaces.transaction_repository_interface import (
+    TransactionRepositoryInterface,
+)
+from app.domain.services.page_cursor import paginate
+
+
+class ListTransactions:
+    """Cas d'usage pour lister les transactions d'un utilisateur, triées et paginées."""
+
+    def __init__(self, transaction_repo: TransactionRepositoryInterface):
+        self.transaction_repo = transaction_repo
+
+    def execute(
+        self,
+        user_id: str,
+        query: TransactionQuery,
+        cursor: Optional[str] = None,
+        kind: Optional[RollupKind] = None,
+    ) -> TransactionPage[Transaction]:
+        """Liste une page de transactions, d'un seul type si `kind` est précisé.
+
+        Lève ValueError si l'utilisateur manque ou si le curseur est invalide.
+        """
+        if not user_id:
+            raise ValueError("L'utilisateur est requis")
+        kinds = (kind,) if kind else (RollupKind.EXPENSE, RollupKind.INCOME)
+        return paginate(
+            lambda page: self.transaction_repo.get_page(user_id, page, kinds), query, cursor
+        )
@@ -0,0 +1,42 @@
+"""Cas d'usage pour rechercher dans les dépenses et revenus."""
+
+from typing import Optional
+
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction_query import TransactionPage
+from app.domain.entities.transaction_search import TransactionSearch, TransactionSearchHit
+from app.domain.interfaces.transaction_repository_interface import (
+    TransactionRepositoryInterface,
+)
+from app.domain.services.page_cursor import paginate_search
+from app.domain.services.text_search import search_terms
+
+
+class SearchTransactions:
+    """Cas d'usage pour rechercher les transactions d'un utilisateur par pertinence."""
+
+    def __init__(self, transaction_repo: TransactionRepositoryInterface):
+        self.transaction_repo = transaction_repo
+
+    def execute(
+        self,
+        user_id: str,
+        text: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        kind: Optional[RollupKind] = None,
+    ) -> TransactionPage[TransactionSearchHit]:
+        """Recherche une page de résultats, d'un seul type si `kind` est précisé.
+
+        Lève ValueError si l'utilisateur manque, si la recherche ne contient aucun mot
+        ou si le curseur est invalide.
+        """
+        if not user_id:
+            raise ValueError("L'utilisateur est requis")
+        if not search_terms(text):
+            raise ValueError("La recherche doit contenir au moins un mot")
+        kinds = (kind,) if kind else (RollupKind.EXPENSE, RollupKind.INCOME)
+        search = TransactionSearch(text=text.strip(), kinds=kinds, limit=limit)
+        return paginate_search(
+            lambda page: self.transaction_repo.search(user_id, page), search, cursor
+        )
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark du parser CSV bancaire (csv.DictReader vs chemin compilé).
+
+Usage (depuis backend/):
+    python -m benchmarks.benchmark_csv_parser
+    python -m benchmarks.benchmark_csv_parser --sizes 10000 1000000 --repeat 5
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from io import StringIO
+
+from app.infrastructure.parsers.csv_parser import BankCSVParser
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+HEADER = "dateOp;dateVal;label;category;categoryParent;supplierFound;amount;accountLabel;\n"
+LABELS = [
+    ("CB CARREFOUR MARKET", "Alimentation", "carrefour"),
+    ("PRLV SEPA EDF", "Multimedia à domicile (TV, internet, téléphonie…)", "edf"),
+    ("CB SNCF INTERNET", "Transports quotidiens (métro, bus…)", "sncf"),
+    ("VIR SEPA SALAIRE", "Non catégorisé", ""),
+    ("CB RESTAURANT LE ZINC", "Restaurants, bars, discothèques…", ""),
+]
+
+
+def generate_csv(size, seed=42):
+    """Génère un export bancaire de `size` lignes (montants au format français)."""
+    rng = random.Random(seed)
+    start = date(2020, 1, 1)
+    lines = [HEADER]
+    for _ in range(size):
+        day = (start + timedelta(days=rng.randint(0, 1825))).isoformat()
+        label, category, supplier = rng.choice(LABELS)
+        amount = f"{rng.uniform(-2500, 3000):.2f}".replace(".", ",")
+        lines.append(
+            f'{day};{day};"{label}";"{category}";"Vie quotidienne";'
+            f'{supplier};"{amount}";"Compte";\n'
+        )
+    return "".join(lines)
+
+
+def best_time(parse, content, repeat):
+    """Retourne le meilleur temps (en secondes) et le nombre de transactions parsées."""
+    timings = []
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in parse(StringIO(content)))
+        timings.append(time.perf_counter() - start)
+    return min(timings), count
+
+
+def main():
+    """Point d'entrée du benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    csv_parser = BankCSVParser()
+    paths = [
+        ("csv.DictReader", csv_parser.iter_parse_dicts),
+        ("compilé (csv.reader)", csv_parser.iter_parse),
+    ]
+
+    print(f"{'lignes':>10}  {'chemin':<24}{'temps (ms)':>12}{'lignes/s':>14}{'vs dict':>10}")
+    for size in args.sizes:
+        content = generate_csv(size)
+        baseline = None
+        for name, parse in paths:
+            elapsed, count = best_time(parse, content, args.repeat)
+            assert count == size, f"{name}: {count} transactions parsées sur {size}"
+            baseline = baseline or elapsed
+            print(
+                f"{size:>10}  {name:<24}{elapsed * 1000:>12.1f}{size / elapsed:>14,.0f}"
+                f"{baseline / elapsed:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
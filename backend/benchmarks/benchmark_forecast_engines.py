@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark des moteurs de prévision (Python pur vs NumPy).
+
+Usage (depuis backend/):
+    python -m benchmarks.benchmark_forecast_engines
+    python -m benchmarks.benchmark_forecast_engines --sizes 1000 100000 --repeat 5
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, UTC
+
+from app.domain.entities.forecast import AggregatedAmount
+from app.domain.services.average_forecast_engine import AverageForecastEngine
+from app.infrastructure.forecasting.numpy_forecast_engine import METHODS, NumpyForecastEngine
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+
+def generate_transactions(size, seed=42):
+    """Génère `size` transactions réparties sur l'année écoulée (30 % récurrentes)."""
+    rng = random.Random(seed)
+    end_date = datetime.now(UTC)
+    return [
+        AggregatedAmount(
+            date=end_date - timedelta(days=rng.randint(0, 364), minutes=rng.randint(0, 1439)),
+            amount=round(rng.uniform(1, 2000), 2),
+            count=1,
+            is_recurring=rng.random() < 0.3,
+        )
+        for _ in range(size)
+    ]
+
+
+def run_engine(engine, transactions, end_date):
+    """Calcule la série journalière et la projection à 12 mois."""
+    engine.aggregate(transactions)
+    engine.project([t for t in transactions if t.is_recurring], end_date, 12)
+
+
+def best_time(engine, transactions, repeat):
+    """Retourne le meilleur temps (en secondes) sur `repeat` exécutions."""
+    end_date = datetime.now(UTC)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_engine(engine, transactions, end_date)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Point d'entrée du benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engines = [("python (average)", AverageForecastEngine())] + [
+        (f"numpy ({method})", NumpyForecastEngine(method=method)) for method in METHODS
+    ]
+
+    print(f"{'transactions':>12}  {'moteur':<32}{'temps (ms)':>12}{'vs python':>11}")
+    for size in args.sizes:
+        transactions = generate_transactions(size)
+        baseline = None
+        for name, engine in engines:
+            elapsed = best_time(engine, transactions, args.repeat)
+            baseline = baseline or elapsed
+            print(f"{size:>12}  {name:<32}{elapsed * 1000:>12.1f}{baseline / elapsed:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
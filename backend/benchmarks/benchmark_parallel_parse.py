@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark du parsing parallèle des gros exports CSV (processus vs séquentiel).
+
+Usage (depuis backend/):
+    python -m benchmarks.benchmark_parallel_parse
+    python -m benchmarks.benchmark_parallel_parse --rows 1000000 --workers 2 4 8
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from app.infrastructure.parsers.csv_parser import BankCSVParser
+from app.infrastructure.parsers.registry import ParserRegistry
+from benchmarks.benchmark_csv_parser import HEADER, LABELS
+
+DEFAULT_ROWS = 1_000_000
+
+
+def write_csv(path, rows, seed=42):
+    """Écrit un export bancaire synthétique de `rows` lignes, sans le garder en mémoire."""
+    rng = random.Random(seed)
+    start = date(2020, 1, 1)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(HEADER)
+        for _ in range(rows):
+            day = (start + timedelta(days=rng.randint(0, 1825))).isoformat()
+            label, category, supplier = rng.choice(LABELS)
+            amount = f"{rng.uniform(-2500, 3000):.2f}".replace(".", ",")
+            f.write(
+                f'{day};{day};"{label}";"{category}";"Vie quotidienne";'
+                f'{supplier};"{amount}";"Compte";\n'
+            )
+
+
+def best_time(parser, path, repeat):
+    """Meilleur temps (en secondes) du parsing complet du fichier, détection comprise."""
+    registry = ParserRegistry([parser])
+    timings = []
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with open(path, "rb") as stream:
+            count = sum(1 for _ in registry.iter_parse(stream))
+        timings.append(time.perf_counter() - start)
+    return min(timings), count
+
+
+def main():
+    """Point d'entrée du benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "export.csv")
+        write_csv(path, args.rows)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"{args.rows} lignes, {size_mb:.1f} Mo ({os.cpu_count()} CPU)")
+
+        configurations = [("séquentiel", BankCSVParser(parallel_threshold=0))] + [
+            (f"{workers} processus", BankCSVParser(parallel_threshold=1, workers=workers))
+            for workers in sorted(set(args.workers))
+            if workers > 1
+        ]
+
+        print(f"{'chemin':<16}{'temps (ms)':>12}{'lignes/s':>14}{'vs séquentiel':>15}")
+        baseline = None
+        for name, csv_parser in configurations:
+            elapsed, count = best_time(csv_parser, path, args.repeat)
+            assert count == args.rows, f"{name}: {count} transactions parsées sur {args.rows}"
+            baseline = baseline or elapsed
+            print(
+                f"{name:<16}{elapsed * 1000:>12.1f}{args.rows / elapsed:>14,.0f}"
+                f"{baseline / elapsed:>14.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
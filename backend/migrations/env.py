@@ -19,6 +19,12 @@ from app.infrastructure.db.models.session_db import SessionDB
 from app.infrastructure.db.models.expense_db import ExpenseDB
 from app.infrastructure.db.models.income_db import IncomeDB  # Ajout du modèle Income
 from app.infrastructure.db.models.password_reset_code_db import PasswordResetCodeDB  # Ajout du modèle PasswordResetCode
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB  # Agrégats mensuels
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB  # Prévisions précalculées
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB  # Versions des données
+from app.infrastructure.db.models.import_job_db import ImportJobDB  # Imports en arrière-plan
+from app.infrastructure.db.models.category_rule_db import CategoryRuleDB  # Catégories apprises
+from app.infrastructure.db.models.import_ledger_db import ImportLedgerChunkDB  # Registre des imports
 from app.infrastructure.db.database import DATABASE_URL
 
 # this is the Alembic Config object, which provides
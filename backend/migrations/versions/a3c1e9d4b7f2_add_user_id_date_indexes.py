@@ -0,0 +1,29 @@
+"""add (user_id, date) indexes on expenses and incomes
+
+Revision ID: a3c1e9d4b7f2
+Revises: f1707b26c96e
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c1e9d4b7f2'
+down_revision: Union[str, None] = 'f1707b26c96e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_expenses_user_id_date', 'expenses', ['user_id', 'date'], unique=False)
+    op.create_index('ix_incomes_user_id_date', 'incomes', ['user_id', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_incomes_user_id_date', table_name='incomes')
+    op.drop_index('ix_expenses_user_id_date', table_name='expenses')
@@ -0,0 +1,47 @@
+"""add transaction search indexes
+
+Revision ID: b5f2c8e1d4a3
+Revises: f4a7d1c9e2b5
+Create Date: 2026-10-18 23:02:11.482305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5f2c8e1d4a3'
+down_revision: Union[str, None] = 'f4a7d1c9e2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Même expression que search_document() du SQLTransactionRepository
+SEARCH_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, coalesce(name, '') || ' ' || coalesce(description, ''))"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table in ('expenses', 'incomes'):
+        op.create_index(
+            f'ix_{table}_search_document', table, [sa.text(SEARCH_DOCUMENT)],
+            postgresql_using='gin',
+        )
+        # Trigrammes : libellés approchants (%) et filtres ILIKE '%...%' des listes
+        for column in ('name', 'description'):
+            op.create_index(
+                f'ix_{table}_{column}_trgm', table, [column],
+                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('expenses', 'incomes'):
+        op.drop_index(f'ix_{table}_description_trgm', table_name=table)
+        op.drop_index(f'ix_{table}_name_trgm', table_name=table)
+        op.drop_index(f'ix_{table}_search_document', table_name=table)
@@ -0,0 +1,61 @@
+"""create monthly_rollups table
+
+Revision ID: b8e2f4c61d05
+Revises: a3c1e9d4b7f2
+Create Date: 2026-10-18 10:02:17.554912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f4c61d05'
+down_revision: Union[str, None] = 'a3c1e9d4b7f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'monthly_rollups',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('year_month', sa.String(length=7), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('is_recurring', sa.Boolean(), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'year_month', 'kind', 'category', 'is_recurring')
+    )
+
+    # Remplir la table à partir des transactions existantes
+    op.execute(
+        """
+        INSERT INTO monthly_rollups
+            (user_id, year_month, kind, category, is_recurring, amount, count)
+        SELECT user_id, to_char(date, 'YYYY-MM'), 'expense', lower(category::text),
+               coalesce(is_recurring, false), sum(amount), count(id)
+        FROM expenses
+        GROUP BY user_id, to_char(date, 'YYYY-MM'), category, coalesce(is_recurring, false)
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO monthly_rollups
+            (user_id, year_month, kind, category, is_recurring, amount, count)
+        SELECT user_id, to_char(date, 'YYYY-MM'), 'income', lower(category::text),
+               coalesce(is_recurring, false), sum(amount), count(id)
+        FROM incomes
+        GROUP BY user_id, to_char(date, 'YYYY-MM'), category, coalesce(is_recurring, false)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('monthly_rollups')
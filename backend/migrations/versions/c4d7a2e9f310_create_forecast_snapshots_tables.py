@@ -0,0 +1,50 @@
+"""create forecast_snapshots and user_data_versions tables
+
+Revision ID: c4d7a2e9f310
+Revises: b8e2f4c61d05
+Create Date: 2026-10-18 14:21:43.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7a2e9f310'
+down_revision: Union[str, None] = 'b8e2f4c61d05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'forecast_snapshots',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('period', sa.String(length=3), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('data_version', sa.Integer(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'period')
+    )
+    op.create_table(
+        'user_data_versions',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index(
+        'ix_user_data_versions_updated_at', 'user_data_versions', ['updated_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_data_versions_updated_at', table_name='user_data_versions')
+    op.drop_table('user_data_versions')
+    op.drop_table('forecast_snapshots')
@@ -0,0 +1,50 @@
+"""add import ledger
+
+Revision ID: c6e3b8f2a4d7
+Revises: a9d4e2c7b1f6
+Create Date: 2026-10-18 20:41:07.530218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e3b8f2a4d7'
+down_revision: Union[str, None] = 'a9d4e2c7b1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('import_jobs', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index(
+        'ix_import_jobs_user_id_content_hash',
+        'import_jobs',
+        ['user_id', 'content_hash'],
+        unique=False,
+    )
+    op.create_table(
+        'import_ledger',
+        sa.Column('job_id', sa.String(), nullable=False),
+        sa.Column('chunk_index', sa.Integer(), nullable=False),
+        sa.Column('chunk_hash', sa.String(length=64), nullable=False),
+        sa.Column('rows', sa.Integer(), nullable=False),
+        sa.Column('expenses_created', sa.Integer(), nullable=False),
+        sa.Column('incomes_created', sa.Integer(), nullable=False),
+        sa.Column('skipped', sa.Integer(), nullable=False),
+        sa.Column('errors', sa.Text(), nullable=True),
+        sa.Column('committed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['import_jobs.id']),
+        sa.PrimaryKeyConstraint('job_id', 'chunk_index')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('import_ledger')
+    op.drop_index('ix_import_jobs_user_id_content_hash', table_name='import_jobs')
+    op.drop_column('import_jobs', 'content_hash')
@@ -0,0 +1,61 @@
+"""add fingerprint column to expenses and incomes
+
+Revision ID: d2b9f7c3a8e1
+Revises: c4d7a2e9f310
+Create Date: 2026-10-18 16:05:12.480317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.domain.services.transaction_fingerprint import transaction_fingerprint
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b9f7c3a8e1'
+down_revision: Union[str, None] = 'c4d7a2e9f310'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('expenses', 'incomes')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+    for table in TABLES:
+        op.add_column(table, sa.Column('fingerprint', sa.String(length=64), nullable=True))
+
+        # Empreintes des transactions déjà importées (les saisies manuelles restent NULL).
+        # En cas de doublon existant, seule la première transaction reçoit l'empreinte.
+        rows = connection.execute(
+            sa.text(
+                f"SELECT id, user_id, date, amount, name FROM {table} "
+                "WHERE description LIKE 'Importé depuis CSV%' ORDER BY user_id, date, id"
+            ).columns(date=sa.DateTime())
+        )
+        seen = set()
+        updates = []
+        for row in rows:
+            key = (row.user_id, transaction_fingerprint(row.date, row.amount, row.name))
+            if key in seen:
+                continue
+            seen.add(key)
+            updates.append({'id': row.id, 'fingerprint': key[1]})
+        if updates:
+            connection.execute(
+                sa.text(f"UPDATE {table} SET fingerprint = :fingerprint WHERE id = :id"), updates
+            )
+
+        op.create_index(
+            f'ux_{table}_user_id_fingerprint', table, ['user_id', 'fingerprint'], unique=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f'ux_{table}_user_id_fingerprint', table_name=table)
+        op.drop_column(table, 'fingerprint')
@@ -0,0 +1,51 @@
+"""add import job leases
+
+Revision ID: e9b4d6a2c8f5
+Revises: b5f2c8e1d4a3
+Create Date: 2026-10-19 09:14:36.207518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b4d6a2c8f5'
+down_revision: Union[str, None] = 'b5f2c8e1d4a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = "status IN ('pending', 'running')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('import_jobs', sa.Column('owner', sa.String(), nullable=True))
+    op.add_column('import_jobs', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+
+    # Imports actifs en double (envois simultanés) : seul le plus récent est conservé
+    op.execute(
+        "UPDATE import_jobs SET status = 'failed', error = 'Import en double' "
+        f"WHERE {ACTIVE} AND content_hash IS NOT NULL AND EXISTS ("
+        "SELECT 1 FROM import_jobs newer WHERE newer.user_id = import_jobs.user_id "
+        "AND newer.content_hash = import_jobs.content_hash "
+        "AND newer.status IN ('pending', 'running') "
+        "AND newer.created_at > import_jobs.created_at)"
+    )
+    op.create_index(
+        'ux_import_jobs_active_content_hash',
+        'import_jobs',
+        ['user_id', 'content_hash'],
+        unique=True,
+        postgresql_where=sa.text(ACTIVE),
+        sqlite_where=sa.text(ACTIVE),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_import_jobs_active_content_hash', table_name='import_jobs')
+    op.drop_column('import_jobs', 'heartbeat_at')
+    op.drop_column('import_jobs', 'owner')
@@ -0,0 +1,38 @@
+"""add keyset pagination indexes
+
+Revision ID: f4a7d1c9e2b5
+Revises: c6e3b8f2a4d7
+Create Date: 2026-10-18 21:26:53.114902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a7d1c9e2b5'
+down_revision: Union[str, None] = 'c6e3b8f2a4d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('expenses', 'incomes'):
+        # (user_id, date, id) couvre aussi les requêtes qui utilisaient (user_id, date)
+        op.create_index(
+            f'ix_{table}_user_id_date_id', table, ['user_id', 'date', 'id'], unique=False
+        )
+        op.create_index(
+            f'ix_{table}_user_id_amount_id', table, ['user_id', 'amount', 'id'], unique=False
+        )
+        op.drop_index(f'ix_{table}_user_id_date', table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('expenses', 'incomes'):
+        op.create_index(f'ix_{table}_user_id_date', table, ['user_id', 'date'], unique=False)
+        op.drop_index(f'ix_{table}_user_id_amount_id', table_name=table)
+        op.drop_index(f'ix_{table}_user_id_date_id', table_name=table)
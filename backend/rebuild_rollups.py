@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Script de reconstruction des agrégats mensuels (monthly_rollups)."""
+
+import sys
+import argparse
+import logging
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild_rollups(user_id=None):
+    """Recalcule les agrégats mensuels depuis les dépenses et revenus."""
+    from app.infrastructure.db.database import SessionLocal
+    from app.infrastructure.repositories.monthly_rollup_repository import (
+        SQLMonthlyRollupRepository,
+    )
+
+    db = SessionLocal()
+    try:
+        scope = f"l'utilisateur {user_id}" if user_id else "tous les utilisateurs"
+        logger.info("Rebuilding monthly rollups for %s...", scope)
+        written = SQLMonthlyRollupRepository(db).rebuild(user_id)
+        logger.info("%d rollup rows written", written)
+        return True
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Rollup rebuild failed: {e}")
+        return False
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", help="Ne recalculer que cet utilisateur")
+    args = parser.parse_args()
+
+    success = rebuild_rollups(args.user_id)
+    if not success:
+        sys.exit(1)
+    logger.info("Rollup rebuild completed successfully")
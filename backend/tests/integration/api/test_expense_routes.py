@@ -11,6 +11,10 @@ from app.infrastructure.db.models.user_db import UserDB
 from app.infrastructure.db.models.expense_db import ExpenseDB
 from app.infrastructure.db.models.refresh_token_db import RefreshTokenDB
 from app.infrastructure.db.models.session_db import SessionDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB
+from app.infrastructure.db.models.category_rule_db import CategoryRuleDB
 from app.infrastructure.security.password_hasher import PasswordHasher
 from app.domain.entities.expense import ExpenseCategory, ExpenseFrequency
 
@@ -24,6 +28,10 @@ def clean_db():
     db = SessionLocal()
     try:
         db.query(ExpenseDB).delete()
+        db.query(MonthlyRollupDB).delete()
+        db.query(ForecastSnapshotDB).delete()
+        db.query(UserDataVersionDB).delete()
+        db.query(CategoryRuleDB).delete()
         db.query(RefreshTokenDB).delete()
         db.query(SessionDB).delete()
         db.query(UserDB).delete()
@@ -150,6 +158,42 @@ def test_create_expense_success(client, auth_headers):
     assert "id" in data
 
 
+def test_create_and_delete_expense_maintain_monthly_rollup(client, auth_headers):
+    """Test que la création et la suppression maintiennent l'agrégat mensuel."""
+    today = date.today()
+    response = client.post(
+        "/expenses",
+        json={
+            "name": "Courses",
+            "amount": 40.0,
+            "date": today.isoformat(),
+            "category": ExpenseCategory.FOOD.value,
+        },
+        headers=auth_headers
+    )
+    expense_id = response.json()["id"]
+
+    db = SessionLocal()
+    try:
+        rollup = db.query(MonthlyRollupDB).filter_by(
+            user_id="test-user-id", year_month=today.strftime("%Y-%m"), category="food"
+        ).one()
+        assert (rollup.amount, rollup.count) == (40.0, 1)
+    finally:
+        db.close()
+
+    client.delete(f"/expenses/{expense_id}", headers=auth_headers)
+
+    db = SessionLocal()
+    try:
+        rollup = db.query(MonthlyRollupDB).filter_by(
+            user_id="test-user-id", year_month=today.strftime("%Y-%m"), category="food"
+        ).one()
+        assert (rollup.amount, rollup.count) == (0.0, 0)
+    finally:
+        db.close()
+
+
 def test_create_expense_recurring(client, auth_headers):
     """Test de création d'une dépense récurrente."""
     response = client.post(
@@ -209,6 +253,82 @@ def test_list_expenses_with_data(client, auth_headers, test_expense):
     assert data[0]["name"] == "Test Expense"
 
 
+def test_list_expenses_paginates_with_cursor(client, auth_headers):
+    """Test de la pagination par curseur, des filtres et du tri."""
+    for day, (name, amount, category) in enumerate(
+        [("Boulangerie", 5, "food"), ("Essence", 60, "transport"), ("Marché", 25, "food")],
+        start=1,
+    ):
+        client.post(
+            "/expenses",
+            json={
+                "name": name,
+                "amount": amount,
+                "date": f"2025-01-0{day}",
+                "category": category,
+            },
+            headers=auth_headers,
+        )
+
+    response = client.get("/expenses?limit=2", headers=auth_headers)
+    assert [e["name"] for e in response.json()] == ["Marché", "Essence"]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(f"/expenses?limit=2&cursor={cursor}", headers=auth_headers)
+    assert [e["name"] for e in response.json()] == ["Boulangerie"]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get(
+        "/expenses?category=food&min_amount=10&end_date=2025-01-03&sort=amount",
+        headers=auth_headers,
+    )
+    assert [e["name"] for e in response.json()] == ["Marché"]
+    response = client.get("/expenses?q=ESSENCE", headers=auth_headers)
+    assert [e["name"] for e in response.json()] == ["Essence"]
+
+    # Un curseur n'est valable que pour le tri qui l'a émis
+    response = client.get(f"/expenses?sort=amount&cursor={cursor}", headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_list_expenses_is_paginated_by_default(client, auth_headers):
+    """Test que la liste est paginée même sans `limit` (100 lignes par page)."""
+    db = SessionLocal()
+    try:
+        db.add_all(
+            ExpenseDB(
+                id=f"expense-{i:03d}",
+                user_id="test-user-id",
+                name=f"Achat {i}",
+                amount=10,
+                date=datetime(2025, 1, 1 + i % 28),
+                category=ExpenseCategory.FOOD,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+            )
+            for i in range(101)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get("/expenses", headers=auth_headers)
+    assert len(response.json()) == 100
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/expenses?cursor={cursor}", headers=auth_headers)
+    assert len(response.json()) == 1
+
+
+def test_next_cursor_header_is_exposed_to_browsers(client, auth_headers):
+    """Test que l'en-tête du curseur est exposé explicitement aux requêtes CORS."""
+    response = client.get(
+        "/expenses", headers={**auth_headers, "Origin": "http://localhost:3000"}
+    )
+
+    exposed = response.headers["Access-Control-Expose-Headers"].split(", ")
+    assert "X-Next-Cursor" in exposed
+
+
 def test_list_expenses_without_auth(client):
     """Test de listage sans authentification."""
     response = client.get("/expenses")
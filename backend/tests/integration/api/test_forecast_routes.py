@@ -12,6 +12,12 @@ from app.infrastructure.db.models.expense_db import ExpenseDB
 from app.infrastructure.db.models.income_db import IncomeDB
 from app.infrastructure.db.models.refresh_token_db import RefreshTokenDB
 from app.infrastructure.db.models.session_db import SessionDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB
+from app.infrastructure.cache.forecast_cache_factory import get_forecast_cache
+from app.infrastructure.jobs.forecast_jobs import precompute_user_forecasts
+from app.infrastructure.repositories.monthly_rollup_repository import SQLMonthlyRollupRepository
 from app.infrastructure.security.password_hasher import PasswordHasher
 from app.domain.entities.expense import ExpenseCategory, ExpenseFrequency
 from app.domain.entities.income import IncomeCategory, IncomeFrequency
@@ -28,12 +34,16 @@ def clean_db():
     try:
         db.query(ExpenseDB).delete()
         db.query(IncomeDB).delete()
+        db.query(MonthlyRollupDB).delete()
+        db.query(ForecastSnapshotDB).delete()
+        db.query(UserDataVersionDB).delete()
         db.query(RefreshTokenDB).delete()
         db.query(SessionDB).delete()
         db.query(UserDB).delete()
         db.commit()
     finally:
         db.close()
+    get_forecast_cache().clear()
 
 
 @pytest.fixture
@@ -144,6 +154,8 @@ def test_expenses_and_incomes(test_user):
             db.add(income)
 
         db.commit()
+        # Données insérées directement : reconstruire les agrégats mensuels
+        SQLMonthlyRollupRepository(db).rebuild("test-user-id")
     finally:
         db.close()
 
@@ -374,6 +386,7 @@ def test_user_forecast_isolation(client, auth_headers, test_user):
         )
         db.add(income2)
         db.commit()
+        SQLMonthlyRollupRepository(db).rebuild("test-user-2-id")
     finally:
         db.close()
 
@@ -459,3 +472,169 @@ def test_forecast_with_only_income(client, auth_headers, test_user):
     assert data["total_expenses"] == 0.0
     assert data["total_income"] > 0
     assert data["net_balance"] > 0  # Positif car seulement des revenus
+
+
+def test_forecast_served_from_cache(client, auth_headers):
+    """Test qu'une deuxième requête identique est servie depuis le cache."""
+    params = {"period": ForecastPeriod.ONE_MONTH.value}
+    first = client.get("/forecasts", params=params, headers=auth_headers)
+    hits_before = get_forecast_cache().stats().hits
+
+    second = client.get("/forecasts", params=params, headers=auth_headers)
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert get_forecast_cache().stats().hits == hits_before + 1
+
+
+def test_forecast_cache_invalidated_by_expense_write(client, auth_headers):
+    """Test que la création d'une dépense invalide les prévisions en cache."""
+    params = {"period": ForecastPeriod.ONE_MONTH.value}
+    first = client.get("/forecasts", params=params, headers=auth_headers)
+    assert first.json()["total_expenses"] == 0.0
+
+    client.post(
+        "/expenses",
+        json={
+            "name": "Courses",
+            "amount": 40.0,
+            "date": date.today().isoformat(),
+            "category": ExpenseCategory.FOOD.value,
+        },
+        headers=auth_headers
+    )
+
+    second = client.get("/forecasts", params=params, headers=auth_headers)
+    assert second.json()["total_expenses"] == 40.0
+
+
+def test_forecast_cache_stats_endpoint(client):
+    """Test de l'exposition des compteurs du cache des prévisions."""
+    response = client.get("/health/forecast-cache")
+
+    assert response.status_code == 200
+    data = response.json()
+    for field in ["hits", "misses", "evictions", "expirations", "invalidations"]:
+        assert field in data
+
+
+def test_get_all_forecasts(client, auth_headers, test_expenses_and_incomes):
+    """Test de récupération des prévisions de toutes les périodes en une requête."""
+    response = client.get("/forecasts/all", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["user_id"] == "test-user-id"
+    assert set(data["forecasts"]) == {period.value for period in ForecastPeriod}
+
+    get_forecast_cache().clear()
+    for period in ForecastPeriod:
+        single = client.get(
+            "/forecasts", params={"period": period.value}, headers=auth_headers
+        ).json()
+        batch = data["forecasts"][period.value]
+        assert batch["period"] == period.value
+        assert batch["total_expenses"] == single["total_expenses"]
+        assert batch["total_income"] == single["total_income"]
+        assert batch["forecast_total_expenses"] == single["forecast_total_expenses"]
+
+
+def test_get_all_forecasts_subset_of_periods(client, auth_headers):
+    """Test de récupération d'un sous-ensemble de périodes."""
+    response = client.get(
+        "/forecasts/all",
+        params={"periods": [ForecastPeriod.ONE_MONTH.value, ForecastPeriod.ONE_YEAR.value]},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert list(response.json()["forecasts"]) == ["1m", "1y"]
+
+
+def test_get_all_forecasts_invalid_period(client, auth_headers):
+    """Test avec une période invalide."""
+    response = client.get(
+        "/forecasts/all", params={"periods": ["invalid"]}, headers=auth_headers
+    )
+
+    assert response.status_code == 400
+
+
+def test_precomputed_forecast_served_with_staleness_metadata(client, auth_headers):
+    """Test qu'une prévision précalculée est servie, puis marquée périmée après écriture."""
+    assert precompute_user_forecasts("test-user-id") == len(ForecastPeriod)
+    get_forecast_cache().clear()
+    params = {"period": ForecastPeriod.ONE_MONTH.value}
+
+    fresh = client.get("/forecasts", params=params, headers=auth_headers)
+    assert fresh.status_code == 200
+    assert fresh.json()["stale"] is False
+    assert fresh.json()["computed_at"] == fresh.json()["created_at"]
+
+    client.post(
+        "/expenses",
+        json={
+            "name": "Courses",
+            "amount": 40.0,
+            "date": date.today().isoformat(),
+            "category": ExpenseCategory.FOOD.value,
+        },
+        headers=auth_headers
+    )
+
+    stale = client.get(
+        "/forecasts", params={**params, "allow_stale": "true"}, headers=auth_headers
+    )
+    assert stale.json()["stale"] is True
+    assert stale.json()["total_expenses"] == 0.0
+
+    live = client.get("/forecasts", params=params, headers=auth_headers)
+    assert live.json()["stale"] is False
+    assert live.json()["total_expenses"] == 40.0
+
+
+def test_get_forecast_grouped_by_category(client, auth_headers, test_expenses_and_incomes):
+    """Test du détail des prévisions par catégorie."""
+    response = client.get(
+        "/forecasts",
+        params={"period": ForecastPeriod.ONE_YEAR.value, "group_by": "category"},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    expenses = {c["category"]: c for c in data["expense_categories"]}
+    assert set(expenses) == {"food", "housing"}
+    assert expenses["food"]["total"] == 900.0
+    assert expenses["housing"]["total"] == 3000.0
+    assert sum(c["total"] for c in expenses.values()) == data["total_expenses"]
+    assert expenses["food"]["forecast_total"] == 0.0
+    assert expenses["housing"]["forecast_total"] > 0.0
+    assert all(point["category"] == "housing" for point in expenses["housing"]["forecast"])
+    assert [c["category"] for c in data["income_categories"]] == ["salary"]
+
+
+def test_get_forecast_without_group_by_omits_breakdown(
+    client, auth_headers, test_expenses_and_incomes
+):
+    """Test que le détail par catégorie n'est renvoyé qu'à la demande."""
+    params = {"period": ForecastPeriod.ONE_MONTH.value}
+    grouped = client.get(
+        "/forecasts", params={**params, "group_by": "category"}, headers=auth_headers
+    )
+
+    response = client.get("/forecasts", params=params, headers=auth_headers)
+
+    assert response.json()["expense_categories"] is None
+    assert response.json()["total_expenses"] == grouped.json()["total_expenses"]
+
+
+def test_get_forecast_invalid_group_by(client, auth_headers):
+    """Test qu'un regroupement inconnu est refusé."""
+    response = client.get(
+        "/forecasts",
+        params={"period": ForecastPeriod.ONE_MONTH.value, "group_by": "merchant"},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 400
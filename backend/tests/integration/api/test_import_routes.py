@@ -0,0 +1,268 @@
+"""Tests d'intégration pour les routes d'import."""
+
+import pytest
+from fastapi.testclient import TestClient
+from datetime import datetime, UTC
+
+from app.main import app
+from app.infrastructure.cache.forecast_cache_factory import get_forecast_cache
+from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.db.models.user_db import UserDB
+from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.models.income_db import IncomeDB
+from app.infrastructure.db.models.refresh_token_db import RefreshTokenDB
+from app.infrastructure.db.models.session_db import SessionDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB
+from app.infrastructure.db.models.category_rule_db import CategoryRuleDB
+from app.infrastructure.db.models.import_job_db import ImportJobDB
+from app.infrastructure.db.models.import_ledger_db import ImportLedgerChunkDB
+from app.infrastructure.security.password_hasher import PasswordHasher
+
+
+CSV_CONTENT = (
+    "\ufeffdateOp;dateVal;label;category;categoryParent;montant;\n"
+    "2024-01-15;2024-01-15;CARREFOUR MARKET;Alimentation;Alimentation;-45,50;\n"
+    "2024-01-16;2024-01-16;VIREMENT SALAIRE;Salaire;Revenus;2000,00;\n"
+    "2024-01-15;2024-01-15;CARREFOUR  MARKET;Alimentation;Alimentation;-45,50;\n"
+)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clean_db():
+    """Nettoie la base de données entre chaque test."""
+    yield
+    # IMPORTANT: Respecter l'ordre des clés étrangères
+    db = SessionLocal()
+    try:
+        db.query(ExpenseDB).delete()
+        db.query(IncomeDB).delete()
+        db.query(MonthlyRollupDB).delete()
+        db.query(ForecastSnapshotDB).delete()
+        db.query(UserDataVersionDB).delete()
+        db.query(CategoryRuleDB).delete()
+        db.query(ImportLedgerChunkDB).delete()
+        db.query(ImportJobDB).delete()
+        db.query(RefreshTokenDB).delete()
+        db.query(SessionDB).delete()
+        db.query(UserDB).delete()
+        db.commit()
+    finally:
+        db.close()
+    get_forecast_cache().clear()
+
+
+@pytest.fixture
+def client():
+    """Crée un client de test FastAPI."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Crée un utilisateur de test et récupère les headers d'authentification."""
+    db = SessionLocal()
+    try:
+        db.add(
+            UserDB(
+                id="test-user-id",
+                first_name="Test",
+                last_name="User",
+                email="test@example.com",
+                password=PasswordHasher().hash("password123"),
+                phone_number="+33612345678",
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.post(
+        "/auth/login", data={"username": "test@example.com", "password": "password123"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_import_csv_streams_upload(client, auth_headers):
+    """Test l'import d'un fichier envoyé (décodé en flux, BOM et doublons gérés)."""
+    response = client.post(
+        "/imports/csv",
+        files={"file": ("export.csv", CSV_CONTENT.encode("utf-8"), "text/csv")},
+        headers=auth_headers,
+    )
+
+    # Sans ordonnanceur démarré (pas de lifespan), l'import est exécuté immédiatement
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "completed"
+    assert (job["rows_parsed"], job["rows_inserted"], job["skipped"]) == (3, 2, 1)
+    data = job["result"]
+    assert data["total_transactions"] == 3
+    assert (data["expenses_created"], data["incomes_created"], data["skipped"]) == (1, 1, 1)
+    assert [(c["kind"], c["created"]) for c in data["chunks"]] == [("expense", 1), ("income", 1)]
+
+
+def test_identical_upload_returns_previous_import(client, auth_headers):
+    """Test qu'un nouvel envoi du même fichier retourne l'import déjà terminé."""
+    first = client.post(
+        "/imports/csv",
+        files={"file": ("export.csv", CSV_CONTENT.encode("utf-8"), "text/csv")},
+        headers=auth_headers,
+    ).json()
+
+    response = client.post(
+        "/imports/csv",
+        files={"file": ("export (1).csv", CSV_CONTENT.encode("utf-8"), "text/csv")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 202
+    again = response.json()
+    assert (again["id"], again["status"], again["filename"]) == (
+        first["id"],
+        "completed",
+        "export.csv",
+    )
+    db = SessionLocal()
+    try:
+        assert db.query(ImportJobDB).count() == 1
+        assert db.query(ExpenseDB).count() == 1
+        assert db.query(ImportLedgerChunkDB).count() == 1
+    finally:
+        db.close()
+
+
+def test_get_import_job_reports_persisted_state(client, auth_headers):
+    """Test que l'état d'un import est relu depuis la base."""
+    job_id = client.post(
+        "/imports/csv",
+        files={"file": ("export.csv", CSV_CONTENT.encode("utf-8"), "text/csv")},
+        headers=auth_headers,
+    ).json()["id"]
+
+    response = client.get(f"/imports/jobs/{job_id}", headers=auth_headers)
+
+    assert response.status_code == 200
+    job = response.json()
+    assert job["filename"] == "export.csv"
+    assert job["finished_at"] is not None
+    assert job["result"]["chunks"][0]["size"] == 1
+    assert client.get("/imports/jobs/unknown", headers=auth_headers).status_code == 404
+
+
+def test_import_detects_bank_layout_and_encoding(client, auth_headers):
+    """Test qu'un export Windows-1252 d'une autre banque est détecté et importé."""
+    content = (
+        "Téléchargement du 31/01/2024;\n"
+        "\n"
+        "Date;Libellé;Débit euros;Crédit euros;\n"
+        "15/01/2024;CARREFOUR MARKET;45,50;;\n"
+        "16/01/2024;VIREMENT SALAIRE;;2 000,00;\n"
+    ).encode("cp1252")
+    response = client.post(
+        "/imports/csv",
+        files={"file": ("releve.csv", content, "text/csv")},
+        headers=auth_headers,
+    )
+
+    job = response.json()
+    assert job["status"] == "completed"
+    assert job["result"]["expenses_created"] == 1
+    assert job["result"]["incomes_created"] == 1
+
+
+def test_import_csv_fails_on_undecodable_content(client, auth_headers):
+    """Test qu'un octet invalide après l'en-tête détecté fait échouer l'import."""
+    content = (
+        CSV_CONTENT.encode("utf-8")
+        + b"2024-01-17;2024-01-17;" + b"A" * 10000 + b"\xff;Autres;Autres;-1,00;\n"
+    )
+    response = client.post(
+        "/imports/csv",
+        files={"file": ("export.csv", content, "text/csv")},
+        headers=auth_headers,
+    )
+
+    job = response.json()
+    assert job["status"] == "failed"
+    assert "UTF-8" in job["error"]
+
+
+def test_import_reports_unknown_format(client, auth_headers):
+    """Test qu'un fichier au format non reconnu est signalé dans le résultat."""
+    response = client.post(
+        "/imports/csv",
+        files={"file": ("notes.txt", b"bonjour\n", "text/plain")},
+        headers=auth_headers,
+    )
+
+    job = response.json()
+    assert job["result"]["success"] is False
+    assert "non reconnu" in job["result"]["errors"][0]
+
+
+def test_category_correction_is_applied_to_next_import(client, auth_headers):
+    """Test qu'une catégorie corrigée à la main est appliquée aux imports suivants."""
+    client.post(
+        "/imports/csv",
+        files={"file": ("export.csv", CSV_CONTENT.encode("utf-8"), "text/csv")},
+        headers=auth_headers,
+    )
+    expense = client.get("/expenses", headers=auth_headers).json()[0]
+    response = client.put(
+        f"/expenses/{expense['id']}",
+        json={**expense, "category": "shopping"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+    next_month = (
+        "dateOp;dateVal;label;category;categoryParent;montant;\n"
+        "2024-02-15;2024-02-15;CB CARREFOUR MARKET 15/02;Alimentation;Alimentation;-30,00;\n"
+    )
+    client.post(
+        "/imports/csv",
+        files={"file": ("fevrier.csv", next_month.encode("utf-8"), "text/csv")},
+        headers=auth_headers,
+    )
+
+    expenses = client.get("/expenses", headers=auth_headers).json()
+    assert {e["name"]: e["category"] for e in expenses} == {
+        "CARREFOUR MARKET": "shopping",
+        "CB CARREFOUR MARKET 15/02": "shopping",
+    }
+
+
+def test_preview_then_confirm_import(client, auth_headers):
+    """Test qu'un aperçu n'écrit rien et que sa confirmation importe sans relire le fichier."""
+    response = client.post(
+        "/imports/preview?page_size=1",
+        files={"file": ("export.csv", CSV_CONTENT.encode("utf-8"), "text/csv")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    preview = response.json()
+    assert (preview["new_expenses"], preview["new_incomes"], preview["duplicates"]) == (1, 1, 1)
+    assert (preview["total_rows"], len(preview["rows"])) == (3, 1)
+    db = SessionLocal()
+    try:
+        assert db.query(ExpenseDB).count() == 0
+    finally:
+        db.close()
+
+    token = preview["token"]
+    response = client.get(f"/imports/preview/{token}?status=duplicate", headers=auth_headers)
+    assert response.status_code == 200
+    assert [row["status"] for row in response.json()["rows"]] == ["duplicate"]
+
+    response = client.post(f"/imports/preview/{token}/confirm", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["expenses_created"], data["incomes_created"], data["skipped"]) == (1, 1, 1)
+
+    response = client.post(f"/imports/preview/{token}/confirm", headers=auth_headers)
+    assert response.status_code == 404
@@ -11,6 +11,10 @@ from app.infrastructure.db.models.user_db import UserDB
 from app.infrastructure.db.models.income_db import IncomeDB
 from app.infrastructure.db.models.refresh_token_db import RefreshTokenDB
 from app.infrastructure.db.models.session_db import SessionDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB
+from app.infrastructure.db.models.category_rule_db import CategoryRuleDB
 from app.infrastructure.security.password_hasher import PasswordHasher
 from app.domain.entities.income import IncomeCategory, IncomeFrequency
 
@@ -24,6 +28,10 @@ def clean_db():
     db = SessionLocal()
     try:
         db.query(IncomeDB).delete()
+        db.query(MonthlyRollupDB).delete()
+        db.query(ForecastSnapshotDB).delete()
+        db.query(UserDataVersionDB).delete()
+        db.query(CategoryRuleDB).delete()
         db.query(RefreshTokenDB).delete()
         db.query(SessionDB).delete()
         db.query(UserDB).delete()
@@ -209,6 +217,40 @@ def test_list_incomes_with_data(client, auth_headers, test_income):
     assert data[0]["name"] == "Test Salary"
 
 
+def test_list_incomes_paginates_with_cursor(client, auth_headers):
+    """Test de la pagination par curseur et des filtres des revenus."""
+    incomes = [
+        ("Salaire", "salary", "monthly"),
+        ("Mission", "freelance", None),
+        ("Prime", "salary", None),
+    ]
+    for day, (name, category, frequency) in enumerate(incomes, start=1):
+        client.post(
+            "/incomes",
+            json={
+                "name": name,
+                "amount": 100 * day,
+                "date": f"2025-01-0{day}",
+                "category": category,
+                "description": name,
+                "frequency": frequency,
+            },
+            headers=auth_headers,
+        )
+
+    response = client.get("/incomes?limit=1&sort=date", headers=auth_headers)
+    assert [i["name"] for i in response.json()] == ["Salaire"]
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/incomes?limit=5&sort=date&cursor={cursor}", headers=auth_headers)
+    assert [i["name"] for i in response.json()] == ["Mission", "Prime"]
+
+    response = client.get(
+        "/incomes?category=salary&is_recurring=false&max_amount=500", headers=auth_headers
+    )
+    assert [i["name"] for i in response.json()] == ["Prime"]
+    assert client.get("/incomes?cursor=invalide", headers=auth_headers).status_code == 400
+
+
 def test_list_incomes_without_auth(client):
     """Test de listage sans authentification."""
     response = client.get("/incomes")
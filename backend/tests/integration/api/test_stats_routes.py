@@ -0,0 +1,155 @@
+"""Tests d'intégration pour les routes des statistiques."""
+
+import pytest
+from fastapi.testclient import TestClient
+from datetime import datetime, UTC
+
+from app.main import app
+from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.db.models.user_db import UserDB
+from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.models.income_db import IncomeDB
+from app.infrastructure.db.models.refresh_token_db import RefreshTokenDB
+from app.infrastructure.db.models.session_db import SessionDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB
+from app.infrastructure.db.models.category_rule_db import CategoryRuleDB
+from app.infrastructure.security.password_hasher import PasswordHasher
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clean_db():
+    """Nettoie la base de données entre chaque test."""
+    yield
+    # Nettoyer toutes les tables après chaque test
+    # IMPORTANT: Respecter l'ordre des clés étrangères
+    db = SessionLocal()
+    try:
+        db.query(ExpenseDB).delete()
+        db.query(IncomeDB).delete()
+        db.query(MonthlyRollupDB).delete()
+        db.query(ForecastSnapshotDB).delete()
+        db.query(UserDataVersionDB).delete()
+        db.query(CategoryRuleDB).delete()
+        db.query(RefreshTokenDB).delete()
+        db.query(SessionDB).delete()
+        db.query(UserDB).delete()
+        db.commit()
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def client():
+    """Crée un client de test FastAPI."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Crée un utilisateur de test et récupère les headers d'authentification."""
+    db = SessionLocal()
+    try:
+        db.add(
+            UserDB(
+                id="test-user-id",
+                first_name="Test",
+                last_name="User",
+                email="test@example.com",
+                password=PasswordHasher().hash("password123"),
+                phone_number="+33612345678",
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.post(
+        "/auth/login",
+        data={"username": "test@example.com", "password": "password123"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def add_expense(client, auth_headers, name, amount, day, category="food"):
+    """Crée une dépense via l'API."""
+    client.post(
+        "/expenses",
+        json={"name": name, "amount": amount, "date": day, "category": category},
+        headers=auth_headers,
+    )
+
+
+def test_get_stats_aggregates_the_range(client, auth_headers):
+    """Test des totaux, catégories et périodes sur un intervalle."""
+    add_expense(client, auth_headers, "Courses", 30, "2025-01-05")
+    add_expense(client, auth_headers, "Loyer", 800, "2025-01-10", "housing")
+    add_expense(client, auth_headers, "Courses", 60, "2025-02-05")
+
+    response = client.get(
+        "/stats?start_date=2025-01-01&end_date=2025-02-28&granularity=month",
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["expenses"]["total"] == 890.0
+    assert data["expenses"]["count"] == 3
+    assert data["expenses"]["median"] == 60.0
+    assert data["incomes"]["count"] == 0
+    assert data["net_balance"] == -890.0
+    assert [c["category"] for c in data["categories"]] == ["housing", "food"]
+    assert data["categories"][0]["kind"] == "expense"
+    assert [p["expenses"]["total"] for p in data["periods"]] == [830.0, 60.0]
+    assert data["periods"][1]["expense_change"] == round((60 - 830) / 830, 4)
+
+
+def test_get_stats_etag_returns_304_until_next_write(client, auth_headers):
+    """Test de l'ETag : 304 tant que les données ne changent pas."""
+    url = "/stats?start_date=2025-01-01&end_date=2025-12-31"
+    add_expense(client, auth_headers, "Courses", 30, "2025-01-05")
+
+    response = client.get(url, headers=auth_headers)
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    cached = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    weak = client.get(url, headers={**auth_headers, "If-None-Match": f'"x", W/{etag}'})
+    assert weak.status_code == 304
+    other_range = client.get(
+        url.replace("2025-12-31", "2025-06-30"), headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert other_range.status_code == 200
+
+    add_expense(client, auth_headers, "Loyer", 800, "2025-01-10", "housing")
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["expenses"]["total"] == 830.0
+
+
+def test_get_stats_validation(client, auth_headers):
+    """Test des erreurs de paramètres et de l'authentification."""
+    assert client.get(
+        "/stats?start_date=2025-02-01&end_date=2025-01-01", headers=auth_headers
+    ).status_code == 400
+    assert client.get(
+        "/stats?start_date=2020-01-01&end_date=2025-01-01&granularity=day", headers=auth_headers
+    ).status_code == 400
+    assert client.get("/stats?granularity=hour", headers=auth_headers).status_code == 422
+    assert client.get("/stats").status_code == 401
+
+
+def test_get_stats_defaults_to_the_last_twelve_months(client, auth_headers):
+    """Test de l'intervalle par défaut : douze mois, mois courant compris."""
+    response = client.get("/stats", headers=auth_headers)
+
+    assert response.status_code == 200
+    periods = response.json()["periods"]
+    assert len(periods) == 12
+    assert periods[-1]["start"].startswith(datetime.now().strftime("%Y-%m-01"))
@@ -0,0 +1,269 @@
+"""Tests d'intégration pour les routes du fil unifié des transactions."""
+
+import csv
+import io
+import json
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+from datetime import datetime, UTC
+
+from app.domain.entities.expense import ExpenseCategory
+from app.main import app
+from app.infrastructure.db.database import SessionLocal
+from app.infrastructure.db.models.user_db import UserDB
+from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.models.income_db import IncomeDB
+from app.infrastructure.db.models.refresh_token_db import RefreshTokenDB
+from app.infrastructure.db.models.session_db import SessionDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB
+from app.infrastructure.db.models.category_rule_db import CategoryRuleDB
+from app.infrastructure.security.password_hasher import PasswordHasher
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clean_db():
+    """Nettoie la base de données entre chaque test."""
+    yield
+    # Nettoyer toutes les tables après chaque test
+    # IMPORTANT: Respecter l'ordre des clés étrangères
+    db = SessionLocal()
+    try:
+        db.query(ExpenseDB).delete()
+        db.query(IncomeDB).delete()
+        db.query(MonthlyRollupDB).delete()
+        db.query(ForecastSnapshotDB).delete()
+        db.query(UserDataVersionDB).delete()
+        db.query(CategoryRuleDB).delete()
+        db.query(RefreshTokenDB).delete()
+        db.query(SessionDB).delete()
+        db.query(UserDB).delete()
+        db.commit()
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def client():
+    """Crée un client de test FastAPI."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Crée un utilisateur de test et récupère les headers d'authentification."""
+    db = SessionLocal()
+    try:
+        db.add(
+            UserDB(
+                id="test-user-id",
+                first_name="Test",
+                last_name="User",
+                email="test@example.com",
+                password=PasswordHasher().hash("password123"),
+                phone_number="+33612345678",
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.post(
+        "/auth/login",
+        data={"username": "test@example.com", "password": "password123"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_list_transactions_merges_and_paginates(client, auth_headers):
+    """Test du fil unifié : fusion triée, pagination par curseur et filtres."""
+    client.post(
+        "/expenses",
+        json={"name": "Courses", "amount": 40, "date": "2025-01-01", "category": "food"},
+        headers=auth_headers,
+    )
+    client.post(
+        "/incomes",
+        json={
+            "name": "Salaire",
+            "amount": 2000,
+            "date": "2025-01-02",
+            "category": "salary",
+            "description": "Salaire",
+            "frequency": "monthly",
+        },
+        headers=auth_headers,
+    )
+    client.post(
+        "/expenses",
+        json={"name": "Loyer", "amount": 800, "date": "2025-01-03", "category": "housing"},
+        headers=auth_headers,
+    )
+
+    response = client.get("/transactions?limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert [(t["name"], t["type"]) for t in data] == [("Loyer", "expense"), ("Salaire", "income")]
+    assert data[1]["category"] == "salary"
+    assert data[1]["frequency"] == "monthly"
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/transactions?limit=2&cursor={cursor}", headers=auth_headers)
+    assert [t["name"] for t in response.json()] == ["Courses"]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get("/transactions?type=income", headers=auth_headers)
+    assert [t["name"] for t in response.json()] == ["Salaire"]
+    response = client.get(
+        "/transactions?category=food&category=salary&sort=amount", headers=auth_headers
+    )
+    assert [t["name"] for t in response.json()] == ["Courses", "Salaire"]
+    assert client.get("/transactions?cursor=invalide", headers=auth_headers).status_code == 400
+    assert client.get("/transactions?category=inconnue", headers=auth_headers).status_code == 422
+
+
+def test_list_transactions_is_paginated_by_default(client, auth_headers):
+    """Test que le fil unifié est paginé même sans `limit` (100 lignes par page)."""
+    db = SessionLocal()
+    try:
+        db.add_all(
+            ExpenseDB(
+                id=f"expense-{i:03d}",
+                user_id="test-user-id",
+                name=f"Achat {i}",
+                amount=10,
+                date=datetime(2025, 1, 1 + i % 28),
+                category=ExpenseCategory.FOOD,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+            )
+            for i in range(101)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get("/transactions", headers=auth_headers)
+    assert len(response.json()) == 100
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/transactions?cursor={cursor}", headers=auth_headers)
+    assert len(response.json()) == 1
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_search_transactions_ranked_and_paginated(client, auth_headers):
+    """Test de la recherche : pertinence, curseur et validation."""
+    for name, description in (
+        ("CB CARREFOUR MARKET", "Courses"),
+        ("CARREFOUR CITY", "Courses du soir"),
+        ("Boulangerie", "Pain"),
+    ):
+        client.post(
+            "/expenses",
+            json={
+                "name": name,
+                "amount": 20,
+                "date": "2025-01-01",
+                "category": "food",
+                "description": description,
+            },
+            headers=auth_headers,
+        )
+
+    response = client.get("/transactions/search?q=carrefour&limit=1", headers=auth_headers)
+    assert response.status_code == 200
+    first = response.json()
+    assert len(first) == 1 and first[0]["type"] == "expense" and first[0]["score"] > 0
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(
+        f"/transactions/search?q=carrefour&limit=1&cursor={cursor}", headers=auth_headers
+    )
+    names = {first[0]["name"], response.json()[0]["name"]}
+    assert names == {"CB CARREFOUR MARKET", "CARREFOUR CITY"}
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get("/transactions/search?q=courses soir", headers=auth_headers)
+    assert [t["name"] for t in response.json()] == ["CARREFOUR CITY"]
+    response = client.get("/transactions/search?q=pain&type=income", headers=auth_headers)
+    assert response.json() == []
+    assert client.get("/transactions/search?q=%21%21", headers=auth_headers).status_code == 400
+    assert client.get("/transactions/search", headers=auth_headers).status_code == 422
+
+
+def test_export_transactions_streams_formats(client, auth_headers):
+    """Test de l'export en flux : CSV compressé, NDJSON, filtres et Parquet."""
+    client.post(
+        "/expenses",
+        json={"name": "Loyer", "amount": 800, "date": "2025-01-03", "category": "housing"},
+        headers=auth_headers,
+    )
+    client.post(
+        "/incomes",
+        json={
+            "name": "Salaire",
+            "amount": 2000,
+            "date": "2025-01-02",
+            "category": "salary",
+            "description": "Janvier",
+            "frequency": "monthly",
+        },
+        headers=auth_headers,
+    )
+
+    response = client.get(
+        "/transactions/export", headers={**auth_headers, "Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="transactions.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(r["name"], r["type"]) for r in rows] == [("Loyer", "expense"), ("Salaire", "income")]
+    assert rows[1]["frequency"] == "monthly"
+
+    response = client.get(
+        "/transactions/export?format=ndjson&type=income&limit=1",
+        headers={**auth_headers, "Accept-Encoding": "identity"},
+    )
+    assert "content-encoding" not in response.headers
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["name"] for line in lines] == ["Salaire"]
+
+    response = client.get(
+        "/transactions/export?format=arrow&sort=amount",
+        headers={**auth_headers, "Accept-Encoding": "identity"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("name").to_pylist() == ["Loyer", "Salaire"]
+    assert table.schema.field("amount").type == pa.float64()
+
+    response = client.get("/transactions/export?format=parquet&sort=amount", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert "content-encoding" not in response.headers
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.column("amount").to_pylist() == [800.0, 2000.0]
+    assert table.schema.field("date").type == pa.timestamp("us")
+
+
+def test_export_transactions_rejects_unknown_format(client, auth_headers):
+    """Test de la validation du format et de l'authentification."""
+    assert client.get("/transactions/export?format=xlsx", headers=auth_headers).status_code == 422
+    response = client.get("/transactions/export?category=inconnue", headers=auth_headers)
+    assert response.status_code == 422
+    assert client.get("/transactions/export").status_code == 401
+
+
+def test_list_transactions_without_auth(client):
+    """Test de listage sans authentification."""
+    response = client.get("/transactions")
+
+    assert response.status_code == 401
@@ -0,0 +1,212 @@
+"""Tests pour les caches des prévisions (mémoire et Redis)."""
+
+from datetime import datetime, UTC
+
+import pytest
+
+from app.domain.entities.forecast import (
+    CategoryForecast,
+    DataPoint,
+    ForecastData,
+    ForecastPeriod,
+)
+from app.infrastructure.cache.fake_redis_client import FakeRedisClient
+from app.infrastructure.cache.forecast_cache_factory import create_forecast_cache
+from app.infrastructure.cache.in_memory_forecast_cache import InMemoryForecastCache
+from app.infrastructure.cache.redis_forecast_cache import RedisForecastCache
+
+
+class FakeClock:
+    """Horloge manipulable pour tester l'expiration."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_forecast(user_id="user-1", period=ForecastPeriod.ONE_MONTH, total=100.0):
+    """Crée une prévision minimale."""
+    now = datetime(2024, 6, 1, tzinfo=UTC)
+    point = DataPoint(date=now, amount=total, category="food")
+    return ForecastData(
+        user_id=user_id,
+        period=period,
+        start_date=now,
+        end_date=now,
+        expenses_data=[point],
+        income_data=[],
+        forecast_expenses=[point],
+        forecast_income=[],
+        total_expenses=total,
+        total_income=0.0,
+        net_balance=-total,
+        forecast_total_expenses=total,
+        forecast_total_income=0.0,
+        forecast_net_balance=-total,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def clock():
+    """Horloge de test."""
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request, clock):
+    """Chaque backend de cache, avec une horloge contrôlée."""
+    if request.param == "memory":
+        return InMemoryForecastCache(max_entries=2, ttl_seconds=60, clock=clock)
+    return RedisForecastCache(FakeRedisClient(max_keys=4, clock=clock), ttl_seconds=60)
+
+
+class TestForecastCache:
+    """Comportement commun aux backends de cache."""
+
+    def test_miss_then_hit(self, cache):
+        """Test d'un miss suivi d'un hit après mise en cache."""
+        assert cache.get("user-1", ForecastPeriod.ONE_MONTH) is None
+
+        cache.set(make_forecast())
+        cached = cache.get("user-1", ForecastPeriod.ONE_MONTH)
+
+        assert cached == make_forecast()
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    def test_entries_are_keyed_by_period(self, cache):
+        """Test que chaque période a sa propre entrée."""
+        cache.set(make_forecast(period=ForecastPeriod.ONE_MONTH))
+
+        assert cache.get("user-1", ForecastPeriod.ONE_YEAR) is None
+
+    def test_entry_expires_after_ttl(self, cache, clock):
+        """Test de l'expiration d'une entrée après le TTL."""
+        cache.set(make_forecast())
+        clock.now = 61
+
+        assert cache.get("user-1", ForecastPeriod.ONE_MONTH) is None
+        assert cache.stats().expirations == 1
+
+    def test_invalidate_user_only_drops_that_user(self, cache):
+        """Test que l'invalidation ne touche que l'utilisateur concerné."""
+        cache.set(make_forecast(user_id="user-1"))
+        cache.set(make_forecast(user_id="user-2"))
+
+        cache.invalidate_user("user-1")
+
+        assert cache.get("user-1", ForecastPeriod.ONE_MONTH) is None
+        assert cache.get("user-2", ForecastPeriod.ONE_MONTH) is not None
+        assert cache.stats().invalidations == 1
+
+    def test_clear_drops_everything(self, cache):
+        """Test du vidage complet du cache."""
+        cache.set(make_forecast(user_id="user-1"))
+        cache.set(make_forecast(user_id="user-2"))
+
+        cache.clear()
+
+        assert cache.get("user-1", ForecastPeriod.ONE_MONTH) is None
+        assert cache.get("user-2", ForecastPeriod.ONE_MONTH) is None
+
+
+class TestInMemoryForecastCache:
+    """Tests spécifiques au cache en mémoire."""
+
+    def test_lru_eviction(self, clock):
+        """Test que l'entrée la moins récemment utilisée est évincée."""
+        cache = InMemoryForecastCache(max_entries=2, ttl_seconds=60, clock=clock)
+        cache.set(make_forecast(user_id="user-1"))
+        cache.set(make_forecast(user_id="user-2"))
+        cache.get("user-1", ForecastPeriod.ONE_MONTH)
+
+        cache.set(make_forecast(user_id="user-3"))
+
+        assert cache.get("user-2", ForecastPeriod.ONE_MONTH) is None
+        assert cache.get("user-1", ForecastPeriod.ONE_MONTH) is not None
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.entries == 2
+
+    def test_invalid_configuration(self):
+        """Test des paramètres invalides."""
+        with pytest.raises(ValueError):
+            InMemoryForecastCache(max_entries=0)
+        with pytest.raises(ValueError):
+            InMemoryForecastCache(ttl_seconds=0)
+
+
+class TestRedisForecastCache:
+    """Tests spécifiques au cache Redis (via le client factice)."""
+
+    def test_forecast_is_stored_as_json_with_ttl(self, clock):
+        """Test que la prévision est sérialisée et stockée avec un TTL."""
+        client = FakeRedisClient(clock=clock)
+        cache = RedisForecastCache(client, ttl_seconds=30)
+        cache.set(make_forecast(period=ForecastPeriod.SIX_MONTHS, total=42.5))
+
+        cached = cache.get("user-1", ForecastPeriod.SIX_MONTHS)
+
+        assert cached.period == ForecastPeriod.SIX_MONTHS
+        assert cached.forecast_expenses[0].amount == 42.5
+        assert cached.start_date.tzinfo is not None
+        clock.now = 31
+        assert cache.get("user-1", ForecastPeriod.SIX_MONTHS) is None
+
+    def test_category_breakdown_round_trip(self, clock):
+        """Test que le détail par catégorie survit à la sérialisation."""
+        cache = RedisForecastCache(FakeRedisClient(clock=clock), ttl_seconds=30)
+        forecast = make_forecast()
+        point = forecast.expenses_data[0]
+        forecast.expense_categories = [CategoryForecast("food", [point], [point], 100.0, 100.0)]
+        forecast.income_categories = []
+        cache.set(forecast)
+
+        cached = cache.get("user-1", ForecastPeriod.ONE_MONTH)
+
+        assert cached == forecast
+        assert cached.expense_categories[0].data[0].date.tzinfo is not None
+
+    def test_server_evictions_are_reported(self, clock):
+        """Test que les évictions LRU du serveur sont remontées."""
+        client = FakeRedisClient(max_keys=2, clock=clock)
+        cache = RedisForecastCache(client, ttl_seconds=60)
+
+        for user_id in ["user-1", "user-2", "user-3"]:
+            cache.set(make_forecast(user_id=user_id))
+
+        assert cache.stats().evictions == 1
+
+
+class TestCreateForecastCache:
+    """Tests de la factory du cache."""
+
+    def test_default_backend_is_memory(self, monkeypatch):
+        """Test du backend par défaut."""
+        monkeypatch.delenv("FORECAST_CACHE_BACKEND", raising=False)
+        assert isinstance(create_forecast_cache(), InMemoryForecastCache)
+
+    def test_fake_redis_backend(self, monkeypatch):
+        """Test du backend Redis factice."""
+        monkeypatch.setenv("FORECAST_CACHE_BACKEND", "fake-redis")
+        cache = create_forecast_cache()
+        assert isinstance(cache, RedisForecastCache)
+        assert isinstance(cache.client, FakeRedisClient)
+
+    def test_redis_backend_requires_url(self, monkeypatch):
+        """Test que Redis exige REDIS_URL."""
+        monkeypatch.setenv("FORECAST_CACHE_BACKEND", "redis")
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        with pytest.raises(ValueError):
+            create_forecast_cache()
+
+    def test_unknown_backend(self, monkeypatch):
+        """Test d'un backend inconnu."""
+        monkeypatch.setenv("FORECAST_CACHE_BACKEND", "memcached")
+        with pytest.raises(ValueError):
+            create_forecast_cache()
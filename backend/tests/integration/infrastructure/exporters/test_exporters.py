@@ -0,0 +1,91 @@
+"""Tests d'intégration pour les writers d'export des transactions."""
+
+import csv
+import gzip
+import io
+import json
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from datetime import datetime
+
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction_export import ExportFormat
+from app.infrastructure.exporters.base import EXPORT_COLUMNS, gzip_chunks
+from app.infrastructure.exporters.registry import get_exporter
+
+
+def make_transaction(i: int) -> Transaction:
+    """Crée une transaction de test (libellé à échapper en CSV)."""
+    return Transaction(
+        id=f"transaction-{i}",
+        user_id="user-1",
+        kind=RollupKind.EXPENSE if i % 2 else RollupKind.INCOME,
+        name=f'Achat "{i}", magasin',
+        amount=10.5 * i,
+        date=datetime(2025, 1, 1 + i),
+        category="food" if i % 2 else "salary",
+        description=None,
+        is_recurring=bool(i % 2),
+        frequency=None,
+        created_at=datetime(2025, 2, 1),
+        updated_at=datetime(2025, 2, 1),
+    )
+
+
+@pytest.fixture
+def batches():
+    """Deux lots de transactions."""
+    return [[make_transaction(0), make_transaction(1)], [make_transaction(2)]]
+
+
+def test_csv_export_writes_one_chunk_per_batch(batches):
+    """Test du CSV : en-tête, échappement et un morceau par lot."""
+    chunks = list(get_exporter(ExportFormat.CSV).write(iter(batches)))
+
+    assert len(chunks) == 2
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert rows[0] == list(EXPORT_COLUMNS)
+    assert rows[1][:4] == ["transaction-0", "income", "2025-01-01T00:00:00", 'Achat "0", magasin']
+    assert len(rows) == 4
+
+    empty = b"".join(get_exporter(ExportFormat.CSV).write([]))
+    assert empty == ",".join(EXPORT_COLUMNS).encode() + b"\n"
+
+
+def test_ndjson_export_writes_one_object_per_line(batches):
+    """Test du NDJSON : un objet par ligne, dates ISO et valeurs nulles."""
+    data = b"".join(get_exporter(ExportFormat.NDJSON).write(batches)).decode("utf-8")
+
+    lines = [json.loads(line) for line in data.splitlines()]
+    assert [line["id"] for line in lines] == ["transaction-0", "transaction-1", "transaction-2"]
+    assert lines[1]["type"] == "expense"
+    assert lines[1]["date"] == "2025-01-02T00:00:00"
+    assert lines[1]["description"] is None
+    assert lines[1]["is_recurring"] is True
+
+
+def test_gzip_chunks_round_trip(batches):
+    """Test de la compression gzip en flux."""
+    raw = b"".join(get_exporter(ExportFormat.CSV).write(batches))
+    compressed = b"".join(gzip_chunks(get_exporter(ExportFormat.CSV).write(batches)))
+
+    assert gzip.decompress(compressed) == raw
+
+
+def test_arrow_and_parquet_exports_keep_types(batches):
+    """Test des exports colonnes : schéma typé et un lot Arrow par lot lu."""
+    stream = b"".join(get_exporter(ExportFormat.ARROW).write(batches))
+    reader = pa.ipc.open_stream(stream)
+    assert [batch.num_rows for batch in reader] == [2, 1]
+
+    parquet = get_exporter(ExportFormat.PARQUET)
+    assert parquet.compressible is False
+    data = io.BytesIO(b"".join(parquet.write(batches)))
+    table = pq.read_table(data)
+    assert table.column_names == list(EXPORT_COLUMNS)
+    assert table.schema.field("amount").type == pa.float64()
+    assert table.schema.field("date").type == pa.timestamp("us")
+    assert table.column("amount").to_pylist() == [0.0, 10.5, 21.0]
+    assert pq.ParquetFile(data).num_row_groups == 2
@@ -0,0 +1,225 @@
+"""Tests pour le moteur de prévision NumPy."""
+
+import random
+from datetime import datetime, UTC, timedelta
+
+import numpy as np
+import pytest
+
+from app.domain.entities.forecast import AggregatedAmount
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
+from app.domain.services.average_forecast_engine import AverageForecastEngine
+from app.domain.services.recurrence_forecast_engine import RecurrenceForecastEngine
+from app.infrastructure.forecasting.forecast_engine_factory import create_forecast_engine
+from app.infrastructure.forecasting.numpy_forecast_engine import (
+    NumpyForecastEngine,
+    bin_monthly,
+    exponential_smoothing,
+    linear_trend,
+)
+
+
+def monthly_rows(amounts):
+    """Crée une ligne récurrente le 5 de chaque mois à partir de janvier 2024."""
+    return [
+        AggregatedAmount(
+            date=datetime(2024 + i // 12, i % 12 + 1, 5, tzinfo=UTC),
+            amount=amount,
+            count=1,
+            is_recurring=True,
+        )
+        for i, amount in enumerate(amounts)
+    ]
+
+
+class TestBinning:
+    """Tests du regroupement journalier et mensuel."""
+
+    def test_aggregate_matches_pure_python_engine(self):
+        """Test que la série journalière est identique à celle du moteur Python."""
+        rng = random.Random(42)
+        start = datetime(2024, 1, 1, 8, 30, tzinfo=UTC)
+        items = [
+            AggregatedAmount(
+                date=start + timedelta(days=rng.randint(0, 90), hours=rng.randint(0, 12)),
+                amount=round(rng.uniform(1, 500), 2),
+                count=1,
+            )
+            for _ in range(500)
+        ]
+
+        assert NumpyForecastEngine().aggregate(items) == AverageForecastEngine().aggregate(items)
+
+    def test_aggregate_empty(self):
+        """Test d'agrégation sans données."""
+        assert NumpyForecastEngine().aggregate([]) == []
+
+    def test_bin_monthly_keeps_gaps(self):
+        """Test que les mois sans transaction valent 0 dans la série."""
+        rows = monthly_rows([100.0, 200.0]) + [
+            AggregatedAmount(date=datetime(2024, 4, 1, tzinfo=UTC), amount=50.0, count=1)
+        ]
+
+        np.testing.assert_array_equal(bin_monthly(rows), [100.0, 200.0, 0.0, 50.0])
+
+    def test_bin_monthly_accepts_rollups(self):
+        """Test que les agrégats mensuels sont regroupés par year_month."""
+        rows = [
+            MonthlyRollup("u", "2023-12", RollupKind.EXPENSE, "food", True, 10.0, 1),
+            MonthlyRollup("u", "2024-01", RollupKind.EXPENSE, "food", True, 20.0, 2),
+            MonthlyRollup("u", "2024-01", RollupKind.EXPENSE, "housing", True, 5.0, 1),
+        ]
+
+        np.testing.assert_array_equal(bin_monthly(rows), [10.0, 25.0])
+
+
+class TestMethods:
+    """Tests des méthodes de prévision."""
+
+    def test_exponential_smoothing_matches_recursive_definition(self):
+        """Test que la forme vectorisée équivaut à la récurrence du lissage."""
+        series = np.array([100.0, 120.0, 90.0, 130.0, 110.0])
+        level = series[0]
+        for value in series[1:]:
+            level = 0.3 * value + 0.7 * level
+
+        assert exponential_smoothing(series, 0.3) == pytest.approx(level)
+
+    def test_linear_trend_extends_line(self):
+        """Test que la tendance prolonge une série linéaire."""
+        values = linear_trend(np.array([100.0, 110.0, 120.0]), 2)
+
+        np.testing.assert_allclose(values, [130.0, 140.0])
+
+    def test_linear_trend_never_negative(self):
+        """Test que la tendance est bornée à 0."""
+        values = linear_trend(np.array([30.0, 20.0, 10.0]), 3)
+
+        np.testing.assert_allclose(values, [0.0, 0.0, 0.0], atol=1e-9)
+
+
+class TestNumpyForecastEngine:
+    """Tests de la projection."""
+
+    def test_moving_average_projection(self):
+        """Test de la projection par moyenne mobile."""
+        engine = NumpyForecastEngine(method="moving_average", window=2)
+        end_date = datetime(2024, 4, 1, tzinfo=UTC)
+
+        points = engine.project(monthly_rows([100.0, 300.0, 500.0]), end_date, 3)
+
+        assert [point.amount for point in points] == [400.0, 400.0, 400.0]
+        assert points[1].date == end_date + timedelta(days=30)
+
+    def test_projection_is_time_based(self):
+        """Test que la moyenne porte sur les mois et non sur les transactions."""
+        rows = monthly_rows([100.0]) + [
+            AggregatedAmount(
+                date=datetime(2024, 1, 20, tzinfo=UTC), amount=100.0, count=1, is_recurring=True
+            )
+        ]
+        engine = NumpyForecastEngine(method="moving_average")
+
+        points = engine.project(rows, datetime(2024, 2, 1, tzinfo=UTC), 1)
+
+        assert points[0].amount == 200.0
+        assert AverageForecastEngine().project(rows, datetime(2024, 2, 1, tzinfo=UTC), 1)[
+            0
+        ].amount == 100.0
+
+    @pytest.mark.parametrize("method", ["moving_average", "exponential_smoothing", "linear_trend"])
+    def test_partial_edge_months_are_ignored(self, method):
+        """Test qu'avec un « aujourd'hui » en milieu de mois, les mois partiels sont exclus.
+
+        La fenêtre commence le 18 janvier : janvier et juin (en cours) ne contiennent
+        qu'une des deux échéances mensuelles.
+        """
+        window_start = datetime(2024, 1, 18, tzinfo=UTC)
+        today = datetime(2024, 6, 18, tzinfo=UTC)
+        rows = [
+            AggregatedAmount(
+                date=datetime(2024, month, day, tzinfo=UTC),
+                amount=50.0,
+                count=1,
+                is_recurring=True,
+            )
+            for month in range(1, 7)
+            for day in (5, 25)
+            if window_start <= datetime(2024, month, day, tzinfo=UTC) <= today
+        ]
+        engine = NumpyForecastEngine(method=method)
+
+        points = engine.project(rows, today, 3)
+
+        assert [point.amount for point in points] == pytest.approx([100.0, 100.0, 100.0])
+
+    def test_trailing_empty_months_count_as_zero(self):
+        """Test que les mois sans transaction avant aujourd'hui valent 0."""
+        engine = NumpyForecastEngine(method="moving_average", window=2)
+
+        points = engine.project(
+            monthly_rows([100.0, 100.0, 100.0]), datetime(2024, 6, 18, tzinfo=UTC), 1
+        )
+
+        np.testing.assert_array_equal(
+            bin_monthly(monthly_rows([100.0]), end_month=2024 * 12 + 2), [100.0, 0.0, 0.0]
+        )
+        assert points[0].amount == 0.0
+
+    def test_short_history_counts_as_one_month(self):
+        """Test qu'un historique sans mois complet compte pour un seul mois."""
+        rows = [
+            AggregatedAmount(
+                date=datetime(2024, 5, 25, tzinfo=UTC), amount=60.0, count=1, is_recurring=True
+            ),
+            AggregatedAmount(
+                date=datetime(2024, 6, 5, tzinfo=UTC), amount=40.0, count=1, is_recurring=True
+            ),
+        ]
+
+        points = NumpyForecastEngine().project(rows, datetime(2024, 6, 18, tzinfo=UTC), 1)
+
+        assert points[0].amount == 100.0
+
+    def test_empty_history_projects_zeros(self):
+        """Test de la projection sans historique."""
+        points = NumpyForecastEngine().project([], datetime.now(UTC), 6)
+
+        assert [point.amount for point in points] == [0.0] * 6
+
+    def test_invalid_configuration(self):
+        """Test des paramètres invalides."""
+        with pytest.raises(ValueError):
+            NumpyForecastEngine(method="arima")
+        with pytest.raises(ValueError):
+            NumpyForecastEngine(window=0)
+        with pytest.raises(ValueError):
+            NumpyForecastEngine(alpha=0)
+
+
+class TestCreateForecastEngine:
+    """Tests de la factory du moteur."""
+
+    def test_default_engine(self, monkeypatch):
+        """Test du moteur par défaut."""
+        monkeypatch.delenv("FORECAST_ENGINE", raising=False)
+        assert isinstance(create_forecast_engine(), RecurrenceForecastEngine)
+
+    def test_average_engine(self, monkeypatch):
+        """Test du moteur historique."""
+        monkeypatch.setenv("FORECAST_ENGINE", "average")
+        assert type(create_forecast_engine()) is AverageForecastEngine
+
+    def test_numpy_engine(self, monkeypatch):
+        """Test du moteur NumPy configuré par l'environnement."""
+        monkeypatch.setenv("FORECAST_ENGINE", "numpy")
+        monkeypatch.setenv("FORECAST_ENGINE_METHOD", "linear_trend")
+        engine = create_forecast_engine()
+        assert isinstance(engine, NumpyForecastEngine)
+        assert engine.method == "linear_trend"
+
+    def test_unknown_engine(self, monkeypatch):
+        """Test d'un moteur inconnu."""
+        monkeypatch.setenv("FORECAST_ENGINE", "prophet")
+        with pytest.raises(ValueError):
+            create_forecast_engine()
@@ -0,0 +1,21 @@
+"""Tests pour les jobs de prévision."""
+
+from unittest.mock import Mock
+
+from app.infrastructure.jobs import forecast_jobs
+
+
+def test_refresh_bumps_version_before_invalidating_cache(monkeypatch):
+    """Test que la version est incrémentée avant l'invalidation du cache."""
+    calls = Mock()
+    version_repo = Mock()
+    version_repo.bump.side_effect = lambda user_id: calls.bump(user_id)
+    monkeypatch.setattr(forecast_jobs, "SQLUserDataVersionRepository", lambda db: version_repo)
+    forecast_cache = Mock()
+    forecast_cache.invalidate_user.side_effect = lambda user_id: calls.invalidate(user_id)
+    scheduler = Mock()
+
+    forecast_jobs.refresh_user_forecasts(Mock(), forecast_cache, "user-1", scheduler)
+
+    assert [name for name, _, _ in calls.mock_calls] == ["bump", "invalidate"]
+    scheduler.enqueue.assert_called_once()
@@ -0,0 +1,49 @@
+"""Tests pour les jobs d'import."""
+
+import threading
+
+from app.infrastructure.jobs.import_jobs import LeaseRenewer
+
+
+def test_lease_renewer_renews_until_stopped():
+    """Test que le bail est renouvelé à intervalle régulier, sans attendre de lot."""
+    renewed = threading.Semaphore(0)
+
+    def renew():
+        renewed.release()
+        return True
+
+    with LeaseRenewer(renew, interval=0.01):
+        assert renewed.acquire(timeout=1) and renewed.acquire(timeout=1)
+
+
+def test_lease_renewer_stops_once_the_job_is_taken_over():
+    """Test que le renouvellement s'arrête si l'import a été repris ailleurs."""
+    calls = []
+
+    def renew():
+        calls.append(1)
+        return False
+
+    renewer = LeaseRenewer(renew, interval=0.01)
+    with renewer:
+        renewer._thread.join(timeout=1)
+        assert not renewer._thread.is_alive()
+
+    assert calls == [1]
+
+
+def test_lease_renewer_survives_a_failed_renewal():
+    """Test qu'une erreur de renouvellement (base indisponible) n'arrête pas le thread."""
+    results = iter([RuntimeError("connexion perdue"), True])
+    renewed = threading.Event()
+
+    def renew():
+        result = next(results, False)
+        if isinstance(result, Exception):
+            raise result
+        renewed.set()
+        return result
+
+    with LeaseRenewer(renew, interval=0.01):
+        assert renewed.wait(timeout=1)
@@ -0,0 +1,115 @@
+"""Tests de l'ordonnanceur de tâches de fond."""
+
+import asyncio
+import threading
+from datetime import datetime, UTC
+
+import pytest
+
+from app.infrastructure.jobs.scheduler import JobScheduler, seconds_until
+
+
+@pytest.mark.asyncio
+async def test_enqueue_runs_job_in_worker():
+    """Test qu'une tâche programmée est exécutée par un worker."""
+    scheduler = JobScheduler(workers=2)
+    await scheduler.start()
+    results = []
+    try:
+        assert scheduler.enqueue("job", results.append, 42) is True
+        await scheduler.join()
+    finally:
+        await scheduler.stop()
+
+    assert results == [42]
+    assert scheduler.stats().completed == 1
+
+
+@pytest.mark.asyncio
+async def test_pending_jobs_with_same_key_are_coalesced():
+    """Test qu'une tâche déjà en attente n'est pas dupliquée."""
+    scheduler = JobScheduler(workers=1)
+    await scheduler.start()
+    release = threading.Event()
+    calls = []
+    try:
+        scheduler.enqueue("blocker", release.wait)
+        for _ in range(3):
+            scheduler.enqueue("user-1", calls.append, "user-1")
+        release.set()
+        await scheduler.join()
+    finally:
+        await scheduler.stop()
+
+    assert calls == ["user-1"]
+    assert scheduler.stats().coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_enqueue_from_another_thread():
+    """Test que les routes synchrones (threads) peuvent programmer des tâches."""
+    scheduler = JobScheduler(workers=1)
+    await scheduler.start()
+    results = []
+    try:
+        await asyncio.to_thread(scheduler.enqueue, "job", results.append, "ok")
+        await asyncio.sleep(0)
+        await scheduler.join()
+    finally:
+        await scheduler.stop()
+
+    assert results == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_failing_job_does_not_stop_workers():
+    """Test qu'une tâche en échec est comptée sans arrêter le worker."""
+    scheduler = JobScheduler(workers=1)
+    await scheduler.start()
+    results = []
+    try:
+        scheduler.enqueue("bad", int, "not-a-number")
+        scheduler.enqueue("good", results.append, 1)
+        await scheduler.join()
+    finally:
+        await scheduler.stop()
+
+    stats = scheduler.stats()
+    assert results == [1]
+    assert (stats.completed, stats.failed) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_schedule_every_runs_immediately_then_periodically():
+    """Test qu'une tâche périodique est exécutée au démarrage puis à chaque intervalle."""
+    scheduler = JobScheduler(workers=1)
+    await scheduler.start()
+    results = []
+    try:
+        scheduler.schedule_every(0.01, "job", results.append, 1)
+        await asyncio.sleep(0.05)
+    finally:
+        await scheduler.stop()
+
+    assert len(results) >= 2
+    with pytest.raises(ValueError):
+        JobScheduler().schedule_every(1, "job", print)
+
+
+def test_enqueue_without_running_scheduler():
+    """Test qu'aucune tâche n'est acceptée avant le démarrage."""
+    assert JobScheduler().enqueue("job", print) is False
+
+
+def test_invalid_worker_count():
+    """Test qu'au moins un worker est requis."""
+    with pytest.raises(ValueError):
+        JobScheduler(workers=0)
+
+
+def test_seconds_until_next_occurrence():
+    """Test du délai jusqu'à la prochaine exécution quotidienne."""
+    now = datetime(2025, 1, 1, 3, 30, tzinfo=UTC)
+
+    assert seconds_until(4, now) == 30 * 60
+    assert seconds_until(2, now) == 22.5 * 3600
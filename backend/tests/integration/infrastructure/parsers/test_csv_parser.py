@@ -0,0 +1,59 @@
+"""Tests pour le parser CSV bancaire."""
+
+from datetime import datetime
+from io import StringIO
+
+import pytest
+
+from app.infrastructure.parsers.csv_parser import (
+    BankCSVParser,
+    parse_french_amount,
+    parse_iso_date,
+)
+
+CSV_CONTENT = (
+    "\ufeffdateOp;dateVal;label;category;categoryParent;supplierFound;montant;accountLabel;\n"
+    '2024-01-15;2024-01-16;"PRLV SEPA EDF";Alimentation;Alim;edf;"-1 234,56";Compte;\n'
+    "\n"
+    "2024-01-15;;VIR SALAIRE;;;;2000;\n"
+    "2024-13-01;;DATE INVALIDE;;;;1;\n"
+    ";;SANS DATE;;;;1;\n"
+    "2024-01-17;2024-01-17;LIGNE COURTE\n"
+    "2024-01-17;2024-01-17;COLONNES EN TROP;Carburant;A;B;-3;C;D;E\n"
+)
+
+
+def test_compiled_path_matches_dict_reader_path():
+    """Test que le chemin compilé produit exactement les transactions du chemin DictReader."""
+    parser = BankCSVParser()
+
+    compiled = list(parser.iter_parse(StringIO(CSV_CONTENT)))
+
+    assert compiled == list(parser.iter_parse_dicts(StringIO(CSV_CONTENT)))
+    assert [t.description for t in compiled] == [
+        "PRLV SEPA EDF", "VIR SALAIRE", "COLONNES EN TROP"
+    ]
+    edf = compiled[0]
+    assert (edf.date, edf.amount, edf.is_expense, edf.is_recurring) == (
+        datetime(2024, 1, 16), 1234.56, True, True
+    )
+
+
+def test_missing_required_columns_are_rejected():
+    """Test qu'un en-tête sans date ni montant est refusé."""
+    with pytest.raises(ValueError, match="Colonnes requises"):
+        list(BankCSVParser().iter_parse(StringIO("date;label\n2024-01-01;x\n")))
+
+
+def test_parse_iso_date_falls_back_to_strptime():
+    """Test le découpage fixe et le repli sur strptime pour les autres formats."""
+    assert parse_iso_date("2024-02-29") == datetime(2024, 2, 29)
+    assert parse_iso_date("2024-2-9") == datetime(2024, 2, 9)
+    with pytest.raises(ValueError):
+        parse_iso_date("2023-02-29")
+
+
+def test_parse_french_amount():
+    """Test le format français (milliers, guillemets, virgule décimale)."""
+    assert parse_french_amount('"-1 234,56"') == -1234.56
+    assert parse_french_amount("12.5") == 12.5
@@ -0,0 +1,120 @@
+"""Tests pour le parsing parallèle des gros exports CSV."""
+
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+from app.infrastructure.parsers.csv_parser import BankCSVParser
+from app.infrastructure.parsers.parallel import iter_parallel, split_ranges
+from app.infrastructure.parsers.registry import ParserRegistry
+
+HEADER = "dateOp;dateVal;label;category;montant;\n"
+
+
+def _label(day):
+    return f"ACHAT {day} é"
+
+
+def _write_export(tmp_path, rows=200, label=_label):
+    content = HEADER + "".join(
+        f"2024-01-{day % 28 + 1:02d};;{label(day)};Alimentation;-{day},50;\n"
+        for day in range(rows)
+    )
+    path = tmp_path / "export.csv"
+    path.write_bytes(("\ufeff" + content).encode("utf-8"))
+    return str(path), content
+
+
+def test_split_ranges_are_line_aligned_and_cover_the_file(tmp_path):
+    """Test que les plages couvrent le fichier et se terminent en fin de ligne."""
+    path, _ = _write_export(tmp_path)
+    data = open(path, "rb").read()
+
+    ranges = split_ranges(path, 10, range_bytes=100)
+
+    assert ranges[0][0] == 10 and ranges[-1][1] == len(data)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    assert all(data[end - 1:end] == b"\n" for _, end in ranges)
+
+
+def test_parallel_parse_matches_sequential_order(tmp_path):
+    """Test que les plages parsées en parallèle sont fusionnées dans l'ordre du fichier."""
+    path, content = _write_export(tmp_path)
+    parser = BankCSVParser(parallel_threshold=0)
+    data_start = len(("\ufeff" + HEADER).encode("utf-8"))
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        parallel = list(
+            iter_parallel(
+                parser,
+                path,
+                data_start,
+                HEADER.strip().split(";"),
+                ";",
+                "utf-8",
+                workers=3,
+                range_bytes=256,
+                executor=executor,
+            )
+        )
+
+    assert parallel == list(parser.iter_parse(StringIO(content)))
+    assert len(parallel) == 200
+
+
+def _multiline_label(day):
+    """Libellé entre guillemets sur plusieurs lignes, avec guillemets doublés."""
+    if day % 3:
+        return _label(day)
+    return f'"ACHAT {day}\nmémo ""carte"" ;\nfin"'
+
+
+def test_split_ranges_keep_quoted_multiline_fields_whole(tmp_path):
+    """Test qu'une plage ne se termine jamais dans un champ entre guillemets."""
+    path, _ = _write_export(tmp_path, label=_multiline_label)
+    data = open(path, "rb").read()
+
+    ranges = split_ranges(path, 10, range_bytes=64)
+
+    assert ranges[-1][1] == len(data)
+    assert all(data[start:end].count(b'"') % 2 == 0 for start, end in ranges)
+    assert all(data[end - 1:end] == b"\n" for _, end in ranges)
+
+
+def test_parallel_parse_of_quoted_multiline_labels(tmp_path):
+    """Test que les libellés sur plusieurs lignes sont parsés comme en séquentiel."""
+    path, content = _write_export(tmp_path, label=_multiline_label)
+    parser = BankCSVParser(parallel_threshold=0)
+    data_start = len(("\ufeff" + HEADER).encode("utf-8"))
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        parallel = list(
+            iter_parallel(
+                parser,
+                path,
+                data_start,
+                HEADER.strip().split(";"),
+                ";",
+                "utf-8",
+                workers=3,
+                range_bytes=64,
+                executor=executor,
+            )
+        )
+
+    sequential = list(parser.iter_parse(StringIO(content)))
+    assert parallel == sequential
+    assert len(parallel) == 200
+    assert parallel[0].description == 'ACHAT 0\nmémo "carte" ;\nfin'
+
+
+def test_large_file_is_parsed_across_processes(tmp_path):
+    """Test que le parsing passe par le pool de processus au-delà du seuil."""
+    path, content = _write_export(tmp_path)
+    parser = BankCSVParser(parallel_threshold=1, workers=2)
+
+    with open(path, "rb") as stream:
+        detected, sample = ParserRegistry([parser]).detect(stream)
+        assert detected._parallel_path(stream, sample) == path
+        transactions = list(detected.parse_stream(stream, sample))
+
+    assert transactions == list(parser.iter_parse(StringIO(content)))
@@ -0,0 +1,194 @@
+"""Tests pour la détection du format des relevés et les parsers associés."""
+
+from datetime import datetime
+from io import BytesIO
+
+import pytest
+
+from app.infrastructure.parsers.conversion import parse_french_amount, parse_french_date
+from app.infrastructure.parsers.registry import ParserRegistry
+
+OFX_CONTENT = """OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+CHARSET:1252
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DIRECTDEBIT
+<DTPOSTED>20240115120000.000[+1:CET]
+<TRNAMT>-45.50
+<NAME>EDF &amp; CO
+<MEMO>PRLV SEPA EDF
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20240116
+<TRNAMT>2000,00
+<NAME>VIREMENT SALAIRE
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+QIF_CONTENT = """!Type:Bank
+D15/01/2024
+T-1,234.56
+PCARREFOUR MARKET
+LAlimentation:Courses
+^
+D1/16'24
+T2 000,00
+PVIREMENT SALAIRE
+^
+"""
+
+CAMT_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02">
+<BkToCstmrStmt><Stmt>
+<Acct><Id><IBAN>FR7612345678901234567890123</IBAN></Id></Acct>
+<Ntry>
+  <Amt Ccy="EUR">45.50</Amt><CdtDbtInd>DBIT</CdtDbtInd><Sts>BOOK</Sts>
+  <BookgDt><Dt>2024-01-15</Dt></BookgDt><ValDt><Dt>2024-01-16</Dt></ValDt>
+  <NtryDtls><TxDtls>
+    <RltdPties><Cdtr><Nm>EDF</Nm></Cdtr></RltdPties>
+    <RmtInf><Ustrd>PRLV SEPA EDF FACTURE</Ustrd></RmtInf>
+  </TxDtls></NtryDtls>
+</Ntry>
+<Ntry>
+  <Amt Ccy="EUR">10.00</Amt><CdtDbtInd>DBIT</CdtDbtInd><Sts>PDNG</Sts>
+  <BookgDt><Dt>2024-01-17</Dt></BookgDt>
+</Ntry>
+<Ntry>
+  <Amt Ccy="EUR">2000.00</Amt><CdtDbtInd>CRDT</CdtDbtInd><Sts>BOOK</Sts>
+  <BookgDt><DtTm>2024-01-18T09:00:00</DtTm></BookgDt>
+  <AddtlNtryInf>VIR SALAIRE</AddtlNtryInf>
+</Ntry>
+</Stmt></BkToCstmrStmt>
+</Document>
+"""
+
+
+def _parse(content: bytes):
+    registry = ParserRegistry.default()
+    parser, _ = registry.detect(BytesIO(content))
+    return parser.name, list(registry.iter_parse(BytesIO(content)))
+
+
+def test_conversion_helpers_accept_french_and_us_formats():
+    """Test des conversions partagées (dates françaises, séparateurs de milliers)."""
+    assert parse_french_date("15/01/2024") == datetime(2024, 1, 15)
+    assert parse_french_date("15.01.24") == datetime(2024, 1, 15)
+    assert parse_french_date("2024-01-15") == datetime(2024, 1, 15)
+    assert parse_french_amount("1.234,56 €") == pytest.approx(1234.56)
+    assert parse_french_amount("-1,234.56") == pytest.approx(-1234.56)
+    assert parse_french_amount("-1 234,56") == pytest.approx(-1234.56)
+
+
+def test_detects_debit_credit_layout_with_preamble_in_cp1252():
+    """Test d'un export débit/crédit avec préambule, encodé en Windows-1252."""
+    content = (
+        "Compte courant n° 123;\r\n"
+        "Solde au 31/01/2024;1 954,50 €\r\n"
+        "\r\n"
+        "Date;Libellé;Débit euros;Crédit euros;\r\n"
+        '15/01/2024;"PRLV SEPA EDF\r\nFACTURE";45,50;;\r\n'
+        "16/01/2024;VIREMENT SALAIRE;;2 000,00;\r\n"
+        "Total;;45,50;2 000,00;\r\n"
+    ).encode("cp1252")
+
+    name, transactions = _parse(content)
+
+    assert name == "csv:debit_credit"
+    assert [(t.date, t.amount, t.is_expense) for t in transactions] == [
+        (datetime(2024, 1, 15), 45.5, True),
+        (datetime(2024, 1, 16), 2000.0, False),
+    ]
+    assert transactions[0].description == "PRLV SEPA EDF FACTURE"
+    assert transactions[0].is_recurring
+
+
+def test_detects_signed_amount_layout_with_comma_delimiter_in_utf16():
+    """Test d'un export à montant signé, séparé par des virgules, en UTF-16."""
+    content = (
+        "Date de l'opération,Libellé,Détail de l'écriture,Montant de l'opération,Devise\n"
+        '15/01/2024,CARTE CARREFOUR,CARTE X1234,"-45,50",EUR\n'
+    ).encode("utf-16")
+
+    name, transactions = _parse(content)
+
+    assert name == "csv:signed_amount"
+    assert transactions[0].description == "CARTE CARREFOUR"
+    assert transactions[0].amount == pytest.approx(45.5)
+    assert transactions[0].is_expense
+
+
+def test_detects_native_csv_with_another_delimiter():
+    """Test que le format dateOp/amount est reconnu quel que soit le séparateur."""
+    content = b"dateOp,dateVal,label,category,amount\n2024-01-15,,CARREFOUR,Alimentation,-4.5\n"
+
+    name, transactions = _parse(content)
+
+    assert name == "csv"
+    assert transactions[0].category == "Alimentation"
+    assert transactions[0].amount == pytest.approx(4.5)
+
+
+def test_parses_ofx_statement():
+    """Test du parsing d'un relevé OFX SGML (feuilles non fermées, entités)."""
+    name, transactions = _parse(OFX_CONTENT.encode("ascii"))
+
+    assert name == "ofx"
+    assert [(t.date, t.amount, t.is_expense) for t in transactions] == [
+        (datetime(2024, 1, 15), 45.5, True),
+        (datetime(2024, 1, 16), 2000.0, False),
+    ]
+    assert transactions[0].description == "EDF & CO"
+    assert transactions[0].is_recurring
+    assert not transactions[1].is_recurring
+
+
+def test_parses_qif_statement():
+    """Test du parsing d'un relevé QIF (dates françaises et américaines)."""
+    name, transactions = _parse(QIF_CONTENT.encode("utf-8"))
+
+    assert name == "qif"
+    assert [(t.date, t.amount, t.is_expense) for t in transactions] == [
+        (datetime(2024, 1, 15), 1234.56, True),
+        (datetime(2024, 1, 16), 2000.0, False),
+    ]
+    assert transactions[0].category == "Alimentation"
+    assert transactions[0].category_parent == "Alimentation:Courses"
+
+
+def test_invalid_qif_record_is_logged_and_skipped(caplog):
+    """Test qu'un enregistrement invalide est journalisé puis ignoré."""
+    content = QIF_CONTENT.replace("D1/16'24", "Dpas une date")
+
+    with caplog.at_level("WARNING", logger="app.infrastructure.parsers.qif_parser"):
+        _, transactions = _parse(content.encode("utf-8"))
+
+    assert [t.amount for t in transactions] == [1234.56]
+    assert "Transaction QIF ignorée" in caplog.text
+
+
+def test_parses_camt053_statement_and_skips_pending_entries():
+    """Test du parsing CAMT.053 : écritures comptabilisées uniquement, signe du débit."""
+    name, transactions = _parse(CAMT_CONTENT.encode("utf-8"))
+
+    assert name == "camt.053"
+    assert [(t.date, t.amount, t.is_expense) for t in transactions] == [
+        (datetime(2024, 1, 16), 45.5, True),
+        (datetime(2024, 1, 18), 2000.0, False),
+    ]
+    assert transactions[0].description == "PRLV SEPA EDF FACTURE"
+    assert transactions[0].supplier == "EDF"
+    assert transactions[0].account_label == "FR7612345678901234567890123"
+    assert transactions[0].is_recurring
+
+
+def test_rejects_unknown_format():
+    """Test qu'un format non reconnu lève une erreur explicite."""
+    with pytest.raises(ValueError, match="non reconnu"):
+        ParserRegistry.default().detect(BytesIO(b"bonjour\n"))
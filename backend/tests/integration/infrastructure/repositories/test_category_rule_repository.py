@@ -0,0 +1,71 @@
+"""Tests d'intégration pour le SQLCategoryRuleRepository."""
+
+import pytest
+from datetime import datetime, UTC
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.models.user_db import Base, UserDB
+from app.infrastructure.db.models.category_rule_db import CategoryRuleDB  # noqa: F401
+from app.infrastructure.repositories.category_rule_repository import SQLCategoryRuleRepository
+from app.domain.entities.category_rule import CategoryRule
+from app.domain.entities.monthly_rollup import RollupKind
+
+
+@pytest.fixture
+def db_session():
+    """Crée une session de base de données en mémoire pour les tests."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+
+    user = UserDB(
+        id="test-user-id",
+        first_name="Test",
+        last_name="User",
+        email="test@example.com",
+        password="hashed_password",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC)
+    )
+    session.add(user)
+    session.commit()
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def repository(db_session):
+    """Crée une instance du repository."""
+    return SQLCategoryRuleRepository(db_session)
+
+
+def _rule(category="food", kind=RollupKind.EXPENSE, key="carrefour"):
+    return CategoryRule(user_id="test-user-id", kind=kind, key=key, category=category)
+
+
+def test_upsert_counts_confirmations_and_replaces_corrections(repository):
+    """Test que la même catégorie incrémente hits et qu'une autre la remplace."""
+    assert repository.upsert(_rule()).hits == 1
+    assert repository.upsert(_rule()).hits == 2
+
+    replaced = repository.upsert(_rule(category="shopping"))
+
+    assert replaced.category == "shopping"
+    assert replaced.hits == 1
+
+
+def test_get_by_user_id_returns_rules_of_each_kind(repository):
+    """Test que les règles sont distinctes par type de transaction."""
+    repository.upsert(_rule())
+    repository.upsert(_rule(category="salary", kind=RollupKind.INCOME))
+
+    rules = sorted(repository.get_by_user_id("test-user-id"), key=lambda r: r.kind.value)
+
+    assert [(r.kind, r.category) for r in rules] == [
+        (RollupKind.EXPENSE, "food"),
+        (RollupKind.INCOME, "salary"),
+    ]
+    assert repository.get_by_user_id("other-user") == []
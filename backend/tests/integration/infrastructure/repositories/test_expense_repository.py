@@ -1,15 +1,21 @@
 """Tests d'intégration pour le SQLExpenseRepository."""
 
 import pytest
-from datetime import datetime, date, UTC
+from datetime import datetime, date, timedelta, UTC
 from decimal import Decimal
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import IntegrityError
 
 from app.infrastructure.db.models.user_db import Base, UserDB
 from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB
+from app.infrastructure.repositories.monthly_rollup_repository import SQLMonthlyRollupRepository
 from app.infrastructure.repositories.expense_repository import SQLExpenseRepository
 from app.domain.entities.expense import Expense, ExpenseCategory, ExpenseFrequency
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
+from app.domain.entities.transaction_query import TransactionQuery, TransactionSort
+from app.domain.exceptions import DuplicateTransactionError
 
 
 @pytest.fixture
@@ -227,6 +233,164 @@ def test_get_by_user_id_empty(repository):
     assert expenses == []
 
 
+def test_get_by_user_id_and_date_range(repository, db_session):
+    """Test de récupération des dépenses filtrées par plage de dates."""
+    today = datetime(2025, 6, 15)
+    for i, days_ago in enumerate([0, 10, 40, 400]):
+        db_session.add(
+            ExpenseDB(
+                id=f"expense-{i}",
+                user_id="test-user-id",
+                name=f"Dépense {i}",
+                amount=Decimal("10.00"),
+                date=today - timedelta(days=days_ago),
+                category=ExpenseCategory.FOOD,
+                description=None,
+                is_recurring=False,
+                frequency=None,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    db_session.commit()
+
+    expenses = repository.get_by_user_id_and_date_range(
+        "test-user-id",
+        datetime(2025, 5, 16, tzinfo=UTC),
+        datetime(2025, 6, 15, tzinfo=UTC),
+    )
+
+    assert [expense.id for expense in expenses] == ["expense-1", "expense-0"]
+
+
+def test_get_by_user_id_and_date_range_other_user(repository, db_session):
+    """Test que le filtre par plage de dates respecte l'utilisateur."""
+    expenses = repository.get_by_user_id_and_date_range(
+        "other-user-id", datetime(2000, 1, 1, tzinfo=UTC), datetime.now(UTC)
+    )
+    assert expenses == []
+
+
+def test_iter_by_user_id_batches(repository, db_session):
+    """Test du parcours par lots (keyset) des dépenses."""
+    for i in range(5):
+        db_session.add(
+            ExpenseDB(
+                id=f"expense-{i}",
+                user_id="test-user-id",
+                name=f"Dépense {i}",
+                amount=Decimal("10.00"),
+                date=datetime(2025, 1, 1) + timedelta(days=i),
+                category=ExpenseCategory.FOOD,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    db_session.commit()
+
+    expenses = list(repository.iter_by_user_id("test-user-id", batch_size=2))
+
+    assert [expense.id for expense in expenses] == [f"expense-{i}" for i in range(5)]
+    assert list(repository.iter_by_user_id("other-user-id")) == []
+
+
+def test_get_page_keyset_and_filters(repository, db_session):
+    """Test de la lecture par keyset (ex æquo départagés par l'id) et des filtres."""
+    rows = [
+        (1, 10, ExpenseCategory.FOOD),
+        (2, 50, ExpenseCategory.TRANSPORT),
+        (2, 20, ExpenseCategory.FOOD),
+        (3, 50, ExpenseCategory.FOOD),
+    ]
+    for i, (day, amount, category) in enumerate(rows):
+        db_session.add(
+            ExpenseDB(
+                id=f"expense-{i}",
+                user_id="test-user-id",
+                name=f"Achat 100% {i}",
+                amount=amount,
+                date=datetime(2025, 1, day),
+                category=category,
+                is_recurring=i == 0,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    db_session.commit()
+
+    first = repository.get_page("test-user-id", TransactionQuery(limit=2))
+    assert [e.id for e in first] == ["expense-3", "expense-2"]
+    after = (first[-1].date, first[-1].id)
+    rest = repository.get_page("test-user-id", TransactionQuery(after=after))
+    assert [e.id for e in rest] == ["expense-1", "expense-0"]
+
+    by_amount = repository.get_page(
+        "test-user-id",
+        TransactionQuery(sort=TransactionSort.AMOUNT_ASC, after=(20.0, "expense-2")),
+    )
+    assert [e.id for e in by_amount] == ["expense-1", "expense-3"]
+
+    filtered = repository.get_page(
+        "test-user-id",
+        TransactionQuery(
+            start_date=datetime(2025, 1, 2),
+            categories=[ExpenseCategory.FOOD],
+            min_amount=15,
+            search="100%",
+        ),
+    )
+    assert [e.id for e in filtered] == ["expense-3", "expense-2"]
+    assert repository.get_page("test-user-id", TransactionQuery(search="10%0")) == []
+    recurring = repository.get_page("test-user-id", TransactionQuery(is_recurring=True))
+    assert [e.id for e in recurring] == ["expense-0"]
+
+
+def test_get_daily_totals(repository, db_session):
+    """Test de l'agrégation journalière calculée par la base de données."""
+    rows = [
+        ("expense-0", datetime(2025, 6, 10, 9, 0), 30.0, ExpenseCategory.FOOD, False),
+        ("expense-1", datetime(2025, 6, 10, 18, 30), 20.0, ExpenseCategory.TRANSPORT, False),
+        ("expense-2", datetime(2025, 6, 10, 12, 0), 800.0, ExpenseCategory.HOUSING, True),
+        ("expense-3", datetime(2025, 6, 12, 8, 0), 15.0, ExpenseCategory.FOOD, False),
+    ]
+    for expense_id, expense_date, amount, category, is_recurring in rows:
+        db_session.add(
+            ExpenseDB(
+                id=expense_id,
+                user_id="test-user-id",
+                name=expense_id,
+                amount=amount,
+                date=expense_date,
+                category=category,
+                is_recurring=is_recurring,
+                frequency=ExpenseFrequency.MONTHLY if is_recurring else None,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    db_session.commit()
+
+    totals = repository.get_daily_totals(
+        "test-user-id", datetime(2025, 6, 1, tzinfo=UTC), datetime(2025, 6, 30, tzinfo=UTC)
+    )
+
+    assert [(t.date, t.amount, t.count, t.is_recurring) for t in totals] == [
+        (datetime(2025, 6, 10, tzinfo=UTC), 50.0, 2, False),
+        (datetime(2025, 6, 10, tzinfo=UTC), 800.0, 1, True),
+        (datetime(2025, 6, 12, tzinfo=UTC), 15.0, 1, False),
+    ]
+
+    by_category = repository.get_daily_totals(
+        "test-user-id",
+        datetime(2025, 6, 1, tzinfo=UTC),
+        datetime(2025, 6, 30, tzinfo=UTC),
+        by_category=True,
+    )
+
+    assert len(by_category) == 4
+    assert {t.category for t in by_category} == {"food", "transport", "housing"}
+
+
 def test_update_expense(repository, db_session):
     """Test de mise à jour d'une dépense."""
     # Créer une dépense
@@ -467,3 +631,132 @@ def test_multiple_users_expenses_isolation(repository, db_session):
     assert len(user2_expenses) == 1
     assert user1_expenses[0].name == "Dépense User 1"
     assert user2_expenses[0].name == "Dépense User 2"
+
+
+def test_get_recurring_by_user_id(repository, db_session):
+    """Test de récupération des dépenses récurrentes depuis une date."""
+    rows = [
+        ("expense-old", datetime(2024, 1, 5), True),
+        ("expense-rent", datetime(2025, 5, 5), True),
+        ("expense-food", datetime(2025, 5, 6), False),
+        ("expense-rent-2", datetime(2025, 6, 5), True),
+    ]
+    for expense_id, expense_date, is_recurring in rows:
+        db_session.add(
+            ExpenseDB(
+                id=expense_id,
+                user_id="test-user-id",
+                name="Loyer",
+                amount=Decimal("900.00"),
+                date=expense_date,
+                category=ExpenseCategory.HOUSING,
+                is_recurring=is_recurring,
+                frequency=ExpenseFrequency.MONTHLY if is_recurring else None,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    db_session.commit()
+
+    expenses = repository.get_recurring_by_user_id(
+        "test-user-id", datetime(2025, 1, 1, tzinfo=UTC)
+    )
+
+    assert [expense.id for expense in expenses] == ["expense-rent", "expense-rent-2"]
+    assert expenses[0].frequency == ExpenseFrequency.MONTHLY
+
+
+def _imported_expense(expense_id, fingerprint="f" * 64):
+    return Expense(
+        id=expense_id,
+        user_id="test-user-id",
+        name="CARREFOUR",
+        amount=45.5,
+        date=datetime(2024, 1, 15),
+        category=ExpenseCategory.FOOD,
+        description="Importé depuis CSV - ",
+        fingerprint=fingerprint,
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+
+
+def test_create_with_existing_fingerprint_is_ignored(repository, db_session):
+    """Test que l'index unique refuse une empreinte déjà importée, agrégats compris."""
+    rollups = SQLMonthlyRollupRepository(db_session)
+    for expense_id in ("imported-1", "imported-2"):
+        expense = _imported_expense(expense_id)
+        rollups.apply(MonthlyRollup.from_transaction(RollupKind.EXPENSE, expense))
+        if expense_id == "imported-1":
+            repository.create(expense)
+        else:
+            with pytest.raises(DuplicateTransactionError):
+                repository.create(expense)
+
+    assert db_session.query(ExpenseDB).count() == 1
+    assert db_session.query(MonthlyRollupDB).one().count == 1
+
+
+def test_manual_expenses_without_fingerprint_may_repeat(repository, db_session):
+    """Test que les saisies manuelles identiques restent autorisées."""
+    repository.create(_imported_expense("manual-1", fingerprint=None))
+    repository.create(_imported_expense("manual-2", fingerprint=None))
+
+    assert db_session.query(ExpenseDB).count() == 2
+
+
+def test_update_keeps_fingerprint(repository, db_session):
+    """Test que la modification d'une dépense importée conserve son empreinte."""
+    repository.create(_imported_expense("imported-1"))
+    edited = _imported_expense("imported-1", fingerprint=None)
+    edited.amount = 50.0
+
+    repository.update(edited, "test-user-id")
+
+    assert db_session.query(ExpenseDB).one().fingerprint == "f" * 64
+
+
+def test_bulk_create_inserts_all_rows_in_one_commit(repository, db_session):
+    """Test que bulk_create insère toutes les dépenses du lot."""
+    expenses = [_imported_expense(f"imported-{i}", fingerprint=f"{i:064d}") for i in range(3)]
+
+    created = repository.bulk_create(expenses)
+
+    assert [e.id for e in created] == ["imported-0", "imported-1", "imported-2"]
+    stored = db_session.query(ExpenseDB).order_by(ExpenseDB.id).all()
+    assert [e.fingerprint for e in stored] == [f"{i:064d}" for i in range(3)]
+    assert stored[0].category == ExpenseCategory.FOOD
+
+
+def test_bulk_create_with_existing_fingerprint_rolls_back_chunk(repository, db_session):
+    """Test qu'un doublon annule tout le lot, agrégats compris."""
+    repository.create(_imported_expense("imported-0", fingerprint="0" * 64))
+    rollups = SQLMonthlyRollupRepository(db_session)
+    chunk = [
+        _imported_expense("imported-1", fingerprint="1" * 64),
+        _imported_expense("imported-2", fingerprint="0" * 64),
+    ]
+    rollups.apply(MonthlyRollup.from_transaction(RollupKind.EXPENSE, chunk[0]))
+
+    with pytest.raises(DuplicateTransactionError):
+        repository.bulk_create(chunk)
+
+    assert [e.id for e in db_session.query(ExpenseDB).all()] == ["imported-0"]
+    assert db_session.query(MonthlyRollupDB).count() == 0
+
+
+def test_failed_create_rolls_back_pending_rollups(repository, db_session):
+    """Test qu'une erreur autre qu'un doublon annule la transaction, agrégats compris."""
+    rollups = SQLMonthlyRollupRepository(db_session)
+    invalid = _imported_expense("imported-1")
+    invalid.category = None
+    rollups.apply(MonthlyRollup.from_transaction(RollupKind.EXPENSE, invalid))
+    with pytest.raises(IntegrityError):
+        repository.create(invalid)
+
+    expense = _imported_expense("imported-2", fingerprint="e" * 64)
+    rollups.apply(MonthlyRollup.from_transaction(RollupKind.EXPENSE, expense))
+    repository.create(expense)
+
+    assert [row.id for row in db_session.query(ExpenseDB)] == ["imported-2"]
+    assert db_session.query(MonthlyRollupDB).one().count == 1
@@ -0,0 +1,94 @@
+"""Tests d'intégration pour le SQLForecastSnapshotRepository."""
+
+import pytest
+from datetime import datetime, UTC
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.models.user_db import Base, UserDB
+from app.infrastructure.db.models.forecast_snapshot_db import ForecastSnapshotDB
+from app.infrastructure.repositories.forecast_snapshot_repository import (
+    SQLForecastSnapshotRepository,
+)
+from app.domain.entities.forecast import DataPoint, ForecastData, ForecastPeriod
+
+
+@pytest.fixture
+def db_session():
+    """Crée une session de base de données en mémoire pour les tests."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+
+    user = UserDB(
+        id="test-user-id",
+        first_name="Test",
+        last_name="User",
+        email="test@example.com",
+        password="hashed_password",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC)
+    )
+    session.add(user)
+    session.commit()
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def repository(db_session):
+    """Crée une instance du repository."""
+    return SQLForecastSnapshotRepository(db_session)
+
+
+def _forecast(period=ForecastPeriod.ONE_MONTH, total_expenses=100.0):
+    now = datetime.now(UTC)
+    return ForecastData(
+        user_id="test-user-id",
+        period=period,
+        start_date=now,
+        end_date=now,
+        expenses_data=[DataPoint(date=now, amount=total_expenses, category="expenses")],
+        income_data=[],
+        forecast_expenses=[],
+        forecast_income=[],
+        total_expenses=total_expenses,
+        total_income=0.0,
+        net_balance=-total_expenses,
+        forecast_total_expenses=0.0,
+        forecast_total_income=0.0,
+        forecast_net_balance=0.0,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_get_missing_snapshot(repository):
+    """Test qu'aucune prévision n'est renvoyée avant le premier précalcul."""
+    assert repository.get("test-user-id", ForecastPeriod.ONE_MONTH) is None
+
+
+def test_save_all_then_get(repository):
+    """Test de l'aller-retour d'une prévision précalculée."""
+    forecast = _forecast()
+
+    repository.save_all([forecast, _forecast(ForecastPeriod.ONE_YEAR)], data_version=3)
+    snapshot = repository.get("test-user-id", ForecastPeriod.ONE_MONTH)
+
+    assert snapshot.data_version == 3
+    assert snapshot.forecast.total_expenses == 100.0
+    assert snapshot.forecast.expenses_data == forecast.expenses_data
+
+
+def test_save_all_replaces_previous_snapshot(repository, db_session):
+    """Test qu'un nouveau précalcul remplace le précédent."""
+    repository.save_all([_forecast(total_expenses=100.0)], data_version=1)
+    repository.save_all([_forecast(total_expenses=250.0)], data_version=2)
+
+    snapshot = repository.get("test-user-id", ForecastPeriod.ONE_MONTH)
+
+    assert snapshot.data_version == 2
+    assert snapshot.forecast.total_expenses == 250.0
+    assert db_session.query(ForecastSnapshotDB).count() == 1
@@ -0,0 +1,204 @@
+"""Tests d'intégration pour le SQLImportJobRepository."""
+
+import pytest
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.entities.import_job import ImportJob, ImportJobStatus
+from app.domain.entities.import_ledger import ImportLedgerChunk
+from app.domain.entities.import_result import ImportChunkResult, ImportResult
+from app.domain.exceptions import DuplicateImportJobError
+from app.infrastructure.db.models.user_db import Base, UserDB
+from app.infrastructure.db.models.import_job_db import ImportJobDB  # noqa: F401
+from app.infrastructure.repositories.import_job_repository import SQLImportJobRepository
+from app.infrastructure.repositories.import_ledger_repository import SQLImportLedgerRepository
+
+
+@pytest.fixture
+def db_session():
+    """Crée une session de base de données en mémoire pour les tests."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+
+    user = UserDB(
+        id="test-user-id",
+        first_name="Test",
+        last_name="User",
+        email="test@example.com",
+        password="hashed_password",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC)
+    )
+    session.add(user)
+    session.commit()
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def repository(db_session):
+    """Crée une instance du repository."""
+    return SQLImportJobRepository(db_session)
+
+
+def _job(job_id="job-1", content_hash=None):
+    return ImportJob(
+        id=job_id,
+        user_id="test-user-id",
+        filename="export.csv",
+        file_path=f"/tmp/{job_id}.csv",
+        content_hash=content_hash,
+    )
+
+
+def test_create_and_get_job(repository):
+    """Test la création et la lecture d'un import."""
+    repository.create(_job())
+
+    job = repository.get_by_id("job-1")
+
+    assert job.status == ImportJobStatus.PENDING
+    assert job.created_at.tzinfo is not None
+    assert repository.get_by_id("job-1", "other-user") is None
+
+
+def test_update_persists_progress_and_result(repository):
+    """Test que l'avancement et le résultat (lots compris) sont relus à l'identique."""
+    job = repository.create(_job())
+    result = ImportResult(
+        total_transactions=3,
+        expenses_created=2,
+        incomes_created=0,
+        errors=["Échec"],
+        skipped=1,
+        success=False,
+        chunks=[ImportChunkResult(kind="expense", index=0, size=2, created=2)],
+    )
+    job.report(result)
+    job.result = result
+    job.status = ImportJobStatus.COMPLETED
+    job.finished_at = datetime.now(UTC)
+
+    repository.update(job)
+
+    stored = repository.get_by_id("job-1", "test-user-id")
+    assert (stored.rows_parsed, stored.rows_inserted, stored.skipped) == (3, 2, 1)
+    assert stored.result == result
+    assert stored.is_finished
+
+
+def test_get_unfinished_returns_pending_and_running_jobs(repository):
+    """Test que les imports interrompus sont retrouvés (reprise après redémarrage)."""
+    for job_id, status in (
+        ("pending", ImportJobStatus.PENDING),
+        ("running", ImportJobStatus.RUNNING),
+        ("done", ImportJobStatus.COMPLETED),
+    ):
+        job = _job(job_id)
+        job.status = status
+        repository.create(job)
+
+    assert [job.id for job in repository.get_unfinished()] == ["pending", "running"]
+
+
+def test_get_latest_by_content_hash(repository):
+    """Test que le dernier import d'un fichier identique est retrouvé par son empreinte."""
+    old = _job("old", content_hash="a" * 64)
+    old.created_at = datetime(2024, 1, 1, tzinfo=UTC)
+    old.status = ImportJobStatus.FAILED
+    repository.create(old)
+    repository.create(_job("new", content_hash="a" * 64))
+    repository.create(_job("other", content_hash="b" * 64))
+
+    assert repository.get_latest_by_content_hash("test-user-id", "a" * 64).id == "new"
+    assert repository.get_latest_by_content_hash("other-user", "a" * 64) is None
+
+
+def test_claim_is_exclusive_until_the_lease_expires(repository):
+    """Test qu'un import n'est pris que par un worker, sauf bail expiré."""
+    repository.create(_job())
+    now = datetime.now(UTC)
+
+    claimed = repository.claim("job-1", "worker-a", now - timedelta(minutes=5))
+
+    assert (claimed.status, claimed.owner) == (ImportJobStatus.RUNNING, "worker-a")
+    assert claimed.heartbeat_at is not None
+    assert repository.claim("job-1", "worker-b", now - timedelta(minutes=5)) is None
+    assert repository.get_unfinished(now - timedelta(minutes=5)) == []
+
+    # Worker arrêté : le bail n'est plus renouvelé
+    later = datetime.now(UTC) + timedelta(minutes=10)
+    assert [job.id for job in repository.get_unfinished(later)] == ["job-1"]
+    assert repository.claim("job-1", "worker-b", later).owner == "worker-b"
+
+    # L'ancien worker ne peut plus écrire l'état de l'import
+    claimed.rows_parsed = 10
+    with pytest.raises(ValueError, match="repris"):
+        repository.update(claimed)
+    assert repository.get_by_id("job-1").rows_parsed == 0
+
+
+def test_renew_extends_the_lease_of_its_owner_only(repository):
+    """Test que seul le worker propriétaire renouvelle le bail d'un import en cours."""
+    job = repository.create(_job())
+    before = datetime.now(UTC).replace(tzinfo=None)
+    repository.claim("job-1", "worker-a", datetime.now(UTC))
+
+    assert repository.renew("job-1", "worker-b") is False
+    assert repository.renew("job-1", "worker-a") is True
+    assert repository.get_by_id("job-1").heartbeat_at.replace(tzinfo=None) >= before
+
+    job.status, job.owner = ImportJobStatus.COMPLETED, "worker-a"
+    repository.update(job)
+    assert repository.renew("job-1", "worker-a") is False
+
+
+def test_claim_skips_finished_jobs(repository):
+    """Test qu'un import terminé n'est jamais repris."""
+    job = _job()
+    job.status = ImportJobStatus.COMPLETED
+    repository.create(job)
+
+    assert repository.claim("job-1", "worker-a", datetime.now(UTC)) is None
+    assert repository.claim("unknown", "worker-a", datetime.now(UTC)) is None
+
+
+def test_only_one_active_job_per_file(repository):
+    """Test qu'un second import actif du même fichier est refusé par l'index unique."""
+    first = repository.create(_job("first", content_hash="a" * 64))
+
+    with pytest.raises(DuplicateImportJobError):
+        repository.create(_job("second", content_hash="a" * 64))
+
+    first.status = ImportJobStatus.FAILED
+    repository.update(first)
+    repository.create(_job("second", content_hash="a" * 64))
+    repository.create(_job("no-hash"))
+    repository.create(_job("no-hash-2"))
+    assert repository.get_latest_by_content_hash("test-user-id", "a" * 64).id == "second"
+
+
+def test_ledger_records_committed_chunks(db_session, repository):
+    """Test que les lots consignés sont relus dans l'ordre, erreurs comprises."""
+    repository.create(_job())
+    ledger = SQLImportLedgerRepository(db_session)
+    ledger.add_chunk("job-1", ImportLedgerChunk(index=1, chunk_hash="h1", rows=2, skipped=2))
+    ledger.add_chunk(
+        "job-1",
+        ImportLedgerChunk(
+            index=0, chunk_hash="h0", rows=3, expenses_created=2, errors=["Échec de création"]
+        ),
+    )
+    # Une reprise peut consigner à nouveau un lot
+    ledger.add_chunk("job-1", ImportLedgerChunk(index=1, chunk_hash="h1", rows=2, skipped=1))
+
+    chunks = ledger.get_chunks("job-1")
+
+    assert [(c.index, c.chunk_hash, c.skipped) for c in chunks] == [(0, "h0", 0), (1, "h1", 1)]
+    assert chunks[0].errors == ["Échec de création"]
+    assert chunks[0].committed_at.tzinfo is not None
+    assert ledger.get_chunks("unknown") == []
@@ -1,7 +1,7 @@
 """Tests d'intégration pour le SQLIncomeRepository."""
 
 import pytest
-from datetime import datetime, date, UTC
+from datetime import datetime, date, timedelta, UTC
 from decimal import Decimal
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -187,6 +187,84 @@ def test_get_all_by_user_id_with_pagination(repository, db_session):
     assert len(incomes) == 2
 
 
+def test_get_by_user_id_and_date_range(repository, db_session):
+    """Test de récupération des revenus filtrés par plage de dates."""
+    today = datetime(2025, 6, 15)
+    for i, days_ago in enumerate([0, 10, 40, 400]):
+        db_session.add(
+            IncomeDB(
+                id=f"income-{i}",
+                user_id="test-user-id",
+                name=f"Revenu {i}",
+                amount=Decimal("100.00"),
+                date=today - timedelta(days=days_ago),
+                category=IncomeCategory.SALARY,
+                description=None,
+                is_recurring=False,
+                frequency=None,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    db_session.commit()
+
+    incomes = repository.get_by_user_id_and_date_range(
+        "test-user-id",
+        datetime(2025, 5, 16, tzinfo=UTC),
+        datetime(2025, 6, 15, tzinfo=UTC),
+    )
+
+    assert [income.id for income in incomes] == ["income-1", "income-0"]
+
+
+def test_get_all_by_user_id_has_no_default_limit(repository, db_session):
+    """Test que la récupération sans limite renvoie plus de 100 revenus."""
+    for i in range(150):
+        db_session.add(
+            IncomeDB(
+                id=f"income-{i:03d}",
+                user_id="test-user-id",
+                name=f"Revenu {i}",
+                amount=Decimal("10.00"),
+                date=date.today(),
+                category=IncomeCategory.OTHER,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    db_session.commit()
+
+    assert len(repository.get_all_by_user_id("test-user-id")) == 150
+
+
+def test_iter_by_user_id_batches(repository, db_session):
+    """Test du parcours par lots (keyset) des revenus."""
+    base_date = datetime(2025, 1, 1)
+    for i in range(7):
+        db_session.add(
+            IncomeDB(
+                id=f"income-{i}",
+                user_id="test-user-id",
+                name=f"Revenu {i}",
+                amount=Decimal("10.00"),
+                # Deux revenus par jour pour vérifier le départage sur l'id
+                date=base_date + timedelta(days=i // 2),
+                category=IncomeCategory.OTHER,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    db_session.commit()
+
+    incomes = list(repository.iter_by_user_id("test-user-id", batch_size=2))
+    assert [income.id for income in incomes] == [f"income-{i}" for i in range(7)]
+
+    recent = list(
+        repository.iter_by_user_id("test-user-id", since=datetime(2025, 1, 3), batch_size=3)
+    )
+    assert [income.id for income in recent] == ["income-4", "income-5", "income-6"]
+
+
 def test_update_income(repository, db_session):
     """Test de mise à jour d'un revenu."""
     income_db = IncomeDB(
@@ -379,3 +457,58 @@ def test_multiple_users_incomes_isolation(repository, db_session):
     assert len(user2_incomes) == 1
     assert user1_incomes[0].name == "Revenu User 1"
     assert user2_incomes[0].name == "Revenu User 2"
+
+
+def test_get_recurring_by_user_id(repository, db_session):
+    """Test de récupération des revenus récurrents depuis une date."""
+    rows = [
+        ("income-old", datetime(2024, 1, 28), True),
+        ("income-salary", datetime(2025, 5, 28), True),
+        ("income-bonus", datetime(2025, 6, 1), False),
+    ]
+    for income_id, income_date, is_recurring in rows:
+        db_session.add(
+            IncomeDB(
+                id=income_id,
+                user_id="test-user-id",
+                name="Salaire",
+                amount=Decimal("2500.00"),
+                date=income_date,
+                category=IncomeCategory.SALARY,
+                is_recurring=is_recurring,
+                frequency=IncomeFrequency.MONTHLY if is_recurring else None,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    db_session.commit()
+
+    incomes = repository.get_recurring_by_user_id(
+        "test-user-id", datetime(2025, 1, 1, tzinfo=UTC)
+    )
+
+    assert [income.id for income in incomes] == ["income-salary"]
+
+
+def test_bulk_create_inserts_all_rows(repository, db_session):
+    """Test que bulk_create insère tous les revenus du lot avec leur empreinte."""
+    incomes = [
+        Income(
+            id=f"imported-{i}",
+            user_id="test-user-id",
+            name="VIREMENT",
+            amount=100.0 + i,
+            date=datetime(2024, 1, 15 + i),
+            category=IncomeCategory.OTHER,
+            description="Importé depuis CSV - ",
+            fingerprint=f"{i:064d}",
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+        for i in range(2)
+    ]
+
+    repository.bulk_create(incomes)
+
+    stored = db_session.query(IncomeDB).order_by(IncomeDB.id).all()
+    assert [(i.id, i.amount) for i in stored] == [("imported-0", 100.0), ("imported-1", 101.0)]
@@ -0,0 +1,132 @@
+"""Tests d'intégration pour le SQLMonthlyRollupRepository."""
+
+import pytest
+from datetime import datetime, UTC
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.models.user_db import Base, UserDB
+from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.models.income_db import IncomeDB
+from app.infrastructure.db.models.monthly_rollup_db import MonthlyRollupDB  # noqa: F401
+from app.infrastructure.repositories.monthly_rollup_repository import SQLMonthlyRollupRepository
+from app.domain.entities.expense import ExpenseCategory
+from app.domain.entities.income import IncomeCategory
+from app.domain.entities.monthly_rollup import MonthlyRollup, RollupKind
+
+
+@pytest.fixture
+def db_session():
+    """Crée une session de base de données en mémoire pour les tests."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+
+    user = UserDB(
+        id="test-user-id",
+        first_name="Test",
+        last_name="User",
+        email="test@example.com",
+        password="hashed_password",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC)
+    )
+    session.add(user)
+    session.commit()
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def repository(db_session):
+    """Crée une instance du repository."""
+    return SQLMonthlyRollupRepository(db_session)
+
+
+def _delta(year_month="2025-01", amount=100.0, count=1, kind=RollupKind.EXPENSE):
+    return MonthlyRollup(
+        user_id="test-user-id",
+        year_month=year_month,
+        kind=kind,
+        category="food",
+        is_recurring=False,
+        amount=amount,
+        count=count,
+    )
+
+
+def test_apply_accumulates_on_same_key(repository, db_session):
+    """Test que les deltas successifs s'additionnent sur la même ligne."""
+    repository.apply(_delta(amount=100.0))
+    repository.apply(_delta(amount=50.0))
+    repository.apply(_delta(amount=-100.0, count=-1))
+    db_session.commit()
+
+    rollups = repository.get_by_user_id("test-user-id", "2025-01", "2025-01")
+
+    assert len(rollups) == 1
+    assert (rollups[0].amount, rollups[0].count) == (50.0, 1)
+
+
+def test_apply_is_not_committed(repository, db_session):
+    """Test que apply laisse le commit à la transaction appelante."""
+    repository.apply(_delta())
+    db_session.rollback()
+
+    assert repository.get_by_user_id("test-user-id", "2000-01", "2100-12") == []
+
+
+def test_get_by_user_id_filters_months_and_kind(repository, db_session):
+    """Test du filtre sur les mois et le type."""
+    repository.apply(_delta(year_month="2024-12"))
+    repository.apply(_delta(year_month="2025-02"))
+    repository.apply(_delta(year_month="2025-02", kind=RollupKind.INCOME))
+    repository.apply(_delta(year_month="2025-04"))
+    db_session.commit()
+
+    rollups = repository.get_by_user_id("test-user-id", "2025-01", "2025-03", RollupKind.EXPENSE)
+
+    assert [(r.year_month, r.kind) for r in rollups] == [("2025-02", RollupKind.EXPENSE)]
+
+
+def test_rebuild_from_transactions(repository, db_session):
+    """Test de la reconstruction des agrégats depuis les transactions."""
+    expenses = [(datetime(2025, 1, 3), 10.0), (datetime(2025, 1, 20), 5.0)]
+    for i, (day, amount) in enumerate(expenses):
+        db_session.add(
+            ExpenseDB(
+                id=f"expense-{i}",
+                user_id="test-user-id",
+                name="Courses",
+                amount=amount,
+                date=day,
+                category=ExpenseCategory.FOOD,
+                is_recurring=False,
+            )
+        )
+    db_session.add(
+        IncomeDB(
+            id="income-1",
+            user_id="test-user-id",
+            name="Salaire",
+            amount=3000.0,
+            date=datetime(2025, 2, 1),
+            category=IncomeCategory.SALARY,
+            is_recurring=True,
+        )
+    )
+    # Une ligne obsolète doit être remplacée
+    repository.apply(_delta(year_month="2025-01", amount=999.0, count=9))
+    db_session.commit()
+
+    written = repository.rebuild("test-user-id")
+    rollups = repository.get_by_user_id("test-user-id", "2025-01", "2025-12")
+
+    assert written == 2
+    assert [(r.year_month, r.kind, r.category, r.is_recurring, r.amount, r.count)
+            for r in rollups] == [
+        ("2025-01", RollupKind.EXPENSE, "food", False, 15.0, 2),
+        ("2025-02", RollupKind.INCOME, "salary", True, 3000.0, 1),
+    ]
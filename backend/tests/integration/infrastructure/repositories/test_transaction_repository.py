@@ -0,0 +1,180 @@
+"""Tests d'intégration pour le SQLTransactionRepository."""
+
+import pytest
+from datetime import datetime, UTC
+from decimal import Decimal
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.models.user_db import Base, UserDB
+from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.models.income_db import IncomeDB
+from app.infrastructure.repositories.transaction_repository import SQLTransactionRepository
+from app.domain.entities.expense import ExpenseCategory
+from app.domain.entities.income import IncomeCategory, IncomeFrequency
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction_query import TransactionQuery, TransactionSort
+from app.domain.entities.transaction_search import TransactionSearch
+
+
+@pytest.fixture
+def db_session():
+    """Crée une session de base de données en mémoire avec des dépenses et revenus."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+
+    session.add(
+        UserDB(
+            id="test-user-id",
+            first_name="Test",
+            last_name="User",
+            email="test@example.com",
+            password="hashed_password",
+            phone_number="+33612345678",
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC)
+        )
+    )
+    for day, amount in ((1, 10), (3, 30), (3, 5)):
+        session.add(
+            ExpenseDB(
+                id=f"expense-{day}-{amount}",
+                user_id="test-user-id",
+                name="Courses",
+                amount=Decimal(amount),
+                date=datetime(2025, 1, day),
+                category=ExpenseCategory.FOOD,
+                is_recurring=False,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    for day, amount in ((2, 2000), (3, 100)):
+        session.add(
+            IncomeDB(
+                id=f"income-{day}-{amount}",
+                user_id="test-user-id",
+                name="Salaire",
+                amount=Decimal(amount),
+                date=datetime(2025, 1, day),
+                category=IncomeCategory.SALARY,
+                is_recurring=True,
+                frequency=IncomeFrequency.MONTHLY,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    session.commit()
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def repository(db_session):
+    """Crée une instance du repository."""
+    return SQLTransactionRepository(db_session)
+
+
+def test_get_page_merges_both_kinds(repository):
+    """Test de la fusion triée des dépenses et revenus (ex æquo départagés par l'id)."""
+    transactions = repository.get_page("test-user-id", TransactionQuery())
+
+    assert [t.id for t in transactions] == [
+        "income-3-100",
+        "expense-3-5",
+        "expense-3-30",
+        "income-2-2000",
+        "expense-1-10",
+    ]
+    income = transactions[0]
+    assert income.kind == RollupKind.INCOME
+    assert income.category == "salary"
+    assert income.frequency == "monthly"
+    assert income.is_recurring is True
+    assert transactions[1].kind == RollupKind.EXPENSE
+    assert transactions[1].category == "food"
+    assert transactions[1].frequency is None
+
+
+def test_get_page_keyset_across_kinds(repository):
+    """Test de la reprise par keyset sur le fil fusionné."""
+    first = repository.get_page("test-user-id", TransactionQuery(limit=2))
+    assert [t.id for t in first] == ["income-3-100", "expense-3-5"]
+
+    after = (first[-1].date, first[-1].id)
+    rest = repository.get_page("test-user-id", TransactionQuery(limit=2, after=after))
+    assert [t.id for t in rest] == ["expense-3-30", "income-2-2000"]
+
+    by_amount = repository.get_page(
+        "test-user-id",
+        TransactionQuery(sort=TransactionSort.AMOUNT_DESC, limit=2, after=(100.0, "income-3-100")),
+    )
+    assert [t.id for t in by_amount] == ["expense-3-30", "expense-1-10"]
+
+
+def test_get_page_filters_kinds_and_categories(repository):
+    """Test des filtres par type et par catégorie."""
+    incomes = repository.get_page("test-user-id", TransactionQuery(), (RollupKind.INCOME,))
+    assert [t.id for t in incomes] == ["income-3-100", "income-2-2000"]
+
+    food = repository.get_page("test-user-id", TransactionQuery(categories=["food"]))
+    assert {t.kind for t in food} == {RollupKind.EXPENSE}
+    assert len(food) == 3
+
+    assert repository.get_page("test-user-id", TransactionQuery(categories=["inconnue"])) == []
+    assert repository.get_page("other-user", TransactionQuery()) == []
+
+
+def test_search_ranks_and_paginates_with_in_memory_index(repository, db_session):
+    """Test de la recherche de repli (SQLite) : pertinence, types et keyset (score, id)."""
+    db_session.add(
+        ExpenseDB(
+            id="expense-netflix",
+            user_id="test-user-id",
+            name="NETFLIX.COM",
+            amount=Decimal("13.49"),
+            date=datetime(2025, 1, 5),
+            category=ExpenseCategory.SUBSCRIPTIONS,
+            description="Prélevé sur salaires",
+            is_recurring=False,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC)
+        )
+    )
+    db_session.commit()
+
+    hits = repository.search("test-user-id", TransactionSearch(text="salaire"))
+    assert [hit.id for hit in hits] == ["income-3-100", "income-2-2000", "expense-netflix"]
+    assert hits[0].transaction.kind == RollupKind.INCOME
+    assert hits[0].score > hits[-1].score
+
+    after = (hits[0].score, hits[0].id)
+    rest = repository.search(
+        "test-user-id", TransactionSearch(text="salaire", limit=1, after=after)
+    )
+    assert [hit.id for hit in rest] == ["income-2-2000"]
+
+    expenses = repository.search(
+        "test-user-id", TransactionSearch(text="netfl", kinds=(RollupKind.EXPENSE,))
+    )
+    assert [hit.transaction.category for hit in expenses] == ["subscriptions"]
+    assert repository.search("test-user-id", TransactionSearch(text="salaire inconnu")) == []
+    assert repository.search("other-user", TransactionSearch(text="salaire")) == []
+
+
+def test_stream_reads_the_whole_feed_in_batches(repository):
+    """Test de la lecture par lots (curseur côté serveur), sans limite ni keyset."""
+    batches = list(repository.stream("test-user-id", TransactionQuery(), batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [t.id for batch in batches for t in batch] == [
+        t.id for t in repository.get_page("test-user-id", TransactionQuery())
+    ]
+    incomes = repository.stream(
+        "test-user-id", TransactionQuery(sort=TransactionSort.AMOUNT_ASC), (RollupKind.INCOME,)
+    )
+    assert [[t.amount for t in batch] for batch in incomes] == [[100.0, 2000.0]]
+    assert list(repository.stream("test-user-id", TransactionQuery(categories=["x"]))) == []
@@ -0,0 +1,139 @@
+"""Tests d'intégration pour le SQLTransactionStatsRepository."""
+
+import pytest
+from datetime import datetime, UTC
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.models.user_db import Base, UserDB
+from app.infrastructure.db.models.expense_db import ExpenseDB
+from app.infrastructure.db.models.income_db import IncomeDB
+from app.infrastructure.repositories.transaction_stats_repository import (
+    SQLTransactionStatsRepository,
+)
+from app.domain.entities.expense import ExpenseCategory
+from app.domain.entities.income import IncomeCategory
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction_stats import StatsGranularity, StatsGroup, StatsQuery
+
+
+@pytest.fixture
+def db_session():
+    """Crée une session de base de données en mémoire avec des dépenses et revenus."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+
+    session.add(
+        UserDB(
+            id="test-user-id",
+            first_name="Test",
+            last_name="User",
+            email="test@example.com",
+            password="hashed_password",
+            phone_number="+33612345678",
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC)
+        )
+    )
+    expenses = [
+        (datetime(2025, 1, 6), 10, ExpenseCategory.FOOD),
+        (datetime(2025, 1, 12, 20), 30, ExpenseCategory.FOOD),
+        (datetime(2025, 1, 20), 800, ExpenseCategory.HOUSING),
+        (datetime(2025, 2, 3), 20, ExpenseCategory.FOOD),
+        # Hors intervalle
+        (datetime(2025, 4, 1), 999, ExpenseCategory.FOOD),
+    ]
+    for i, (on, amount, category) in enumerate(expenses):
+        session.add(
+            ExpenseDB(
+                id=f"expense-{i}",
+                user_id="test-user-id",
+                name="Dépense",
+                amount=amount,
+                date=on,
+                category=category,
+                is_recurring=False,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    session.add(
+        IncomeDB(
+            id="income-0",
+            user_id="test-user-id",
+            name="Salaire",
+            amount=2000,
+            date=datetime(2025, 2, 1),
+            category=IncomeCategory.SALARY,
+            is_recurring=False,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC)
+        )
+    )
+    session.commit()
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def repository(db_session):
+    """Crée une instance du repository."""
+    return SQLTransactionStatsRepository(db_session)
+
+
+@pytest.fixture
+def query():
+    """Premier trimestre 2025, par mois."""
+    return StatsQuery(datetime(2025, 1, 1), datetime(2025, 3, 31, 23, 59, 59))
+
+
+def test_aggregate_totals(repository, query):
+    """Test des agrégats par type : somme, nombre, moyenne et percentiles."""
+    buckets = {b.kind: b for b in repository.aggregate("test-user-id", query, StatsGroup.TOTAL)}
+
+    expenses = buckets[RollupKind.EXPENSE].stats
+    assert buckets[RollupKind.EXPENSE].key is None
+    assert (expenses.total, expenses.count, expenses.average) == (860.0, 4, 215.0)
+    assert expenses.median == 25.0
+    assert expenses.p90 == pytest.approx(569.0)
+    assert buckets[RollupKind.INCOME].stats.total == 2000.0
+    assert repository.aggregate("other-user", query, StatsGroup.TOTAL) == []
+
+
+def test_aggregate_by_category_and_period(repository, query):
+    """Test des regroupements par catégorie (valeurs) et par début de période."""
+    categories = {
+        (b.kind, b.key): b.stats.total
+        for b in repository.aggregate("test-user-id", query, StatsGroup.CATEGORY)
+    }
+    assert categories == {
+        (RollupKind.EXPENSE, "food"): 60.0,
+        (RollupKind.EXPENSE, "housing"): 800.0,
+        (RollupKind.INCOME, "salary"): 2000.0,
+    }
+
+    months = {
+        (b.kind, b.key): b.stats.count
+        for b in repository.aggregate("test-user-id", query, StatsGroup.PERIOD)
+    }
+    assert months == {
+        (RollupKind.EXPENSE, datetime(2025, 1, 1)): 3,
+        (RollupKind.EXPENSE, datetime(2025, 2, 1)): 1,
+        (RollupKind.INCOME, datetime(2025, 2, 1)): 1,
+    }
+
+    weekly = StatsQuery(query.start_date, query.end_date, StatsGranularity.WEEK)
+    weeks = {
+        b.key: b.stats.total
+        for b in repository.aggregate("test-user-id", weekly, StatsGroup.PERIOD)
+        if b.kind == RollupKind.EXPENSE
+    }
+    # Le dimanche 12 janvier appartient à la semaine du lundi 6
+    assert weeks == {
+        datetime(2025, 1, 6): 40.0,
+        datetime(2025, 1, 20): 800.0,
+        datetime(2025, 2, 3): 20.0,
+    }
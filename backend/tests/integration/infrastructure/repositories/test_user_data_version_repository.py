@@ -0,0 +1,79 @@
+"""Tests d'intégration pour le SQLUserDataVersionRepository."""
+
+import pytest
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.models.user_db import Base, UserDB
+from app.infrastructure.db.models.session_db import SessionDB
+from app.infrastructure.db.models.user_data_version_db import UserDataVersionDB
+from app.infrastructure.repositories.user_data_version_repository import (
+    SQLUserDataVersionRepository,
+)
+
+
+@pytest.fixture
+def db_session():
+    """Crée une session de base de données en mémoire pour les tests."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+
+    for user_id in ("user-1", "user-2", "user-3"):
+        session.add(
+            UserDB(
+                id=user_id,
+                first_name="Test",
+                last_name="User",
+                email=f"{user_id}@example.com",
+                password="hashed_password",
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC)
+            )
+        )
+    session.commit()
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def repository(db_session):
+    """Crée une instance du repository."""
+    return SQLUserDataVersionRepository(db_session)
+
+
+def test_get_defaults_to_zero(repository):
+    """Test que la version vaut 0 tant que l'utilisateur n'a rien écrit."""
+    assert repository.get("user-1") == 0
+
+
+def test_bump_increments_version(repository):
+    """Test que chaque écriture incrémente la version."""
+    assert repository.bump("user-1") == 1
+    assert repository.bump("user-1") == 2
+    assert repository.get("user-1") == 2
+    assert repository.get("user-2") == 0
+
+
+def test_get_active_user_ids(repository, db_session):
+    """Test que les utilisateurs actifs sont ceux ayant écrit ou ouvert une session."""
+    now = datetime.now(UTC)
+    repository.bump("user-1")
+    db_session.add(
+        UserDataVersionDB(user_id="user-3", version=4, updated_at=now - timedelta(days=90))
+    )
+    db_session.add(
+        SessionDB(
+            id="session-1",
+            user_id="user-2",
+            refresh_token="token",
+            created_at=now - timedelta(days=1),
+            revoked=False,
+        )
+    )
+    db_session.commit()
+
+    assert repository.get_active_user_ids(now - timedelta(days=30)) == ["user-1", "user-2"]
@@ -0,0 +1,40 @@
+"""Tests pour l'index des catégories apprises."""
+
+from app.domain.entities.category_rule import CategoryRule
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.services.category_index import CategoryIndex, categorization_key
+
+
+def test_categorization_key_drops_bank_prefixes_and_references():
+    """Test que la clé ne garde que les mots du marchand."""
+    assert categorization_key("CB CARREFOUR MARKET 15/01 X1234") == "carrefour market"
+    assert categorization_key("PRLV SEPA Électricité-de-France") == "électricité de france"
+    assert categorization_key("CB 15/01") == ""
+
+
+def test_lookup_returns_most_specific_rule_for_the_kind():
+    """Test que la règle la plus spécifique préfixant le libellé l'emporte."""
+    index = CategoryIndex.from_rules(
+        [
+            CategoryRule("user-1", RollupKind.EXPENSE, "carrefour", "food"),
+            CategoryRule("user-1", RollupKind.EXPENSE, "carrefour location", "transport"),
+        ]
+    )
+
+    assert index.lookup(RollupKind.EXPENSE, "CB CARREFOUR CITY 12/03") == "food"
+    assert index.lookup(RollupKind.EXPENSE, "CARREFOUR LOCATION ORLY") == "transport"
+    assert index.lookup(RollupKind.EXPENSE, "AUCHAN") is None
+    assert index.lookup(RollupKind.INCOME, "CARREFOUR") is None
+    assert len(index) == 2
+
+
+def test_learn_replaces_the_category_of_a_key():
+    """Test qu'une nouvelle correction remplace la catégorie apprise."""
+    index = CategoryIndex()
+
+    assert index.learn(RollupKind.INCOME, "VIR SEPA ACME SAS", "salary") == "acme sas"
+    index.learn(RollupKind.INCOME, "VIR INST ACME SAS 0423", "freelance")
+
+    assert index.lookup(RollupKind.INCOME, "VIR ACME SAS") == "freelance"
+    assert index.learn(RollupKind.INCOME, "VIR 123", "other") is None
+    assert len(index) == 1
@@ -3,9 +3,16 @@
 from datetime import datetime, UTC, timedelta
 from unittest.mock import Mock
 
-from app.domain.entities.forecast import ForecastData, ForecastPeriod
-from app.domain.entities.expense import Expense, ExpenseCategory, ExpenseFrequency
-from app.domain.entities.income import Income, IncomeCategory, IncomeFrequency
+import pytest
+
+from app.domain.entities.forecast import AggregatedAmount, ForecastData, ForecastPeriod
+from app.domain.entities.monthly_rollup import (
+    MonthlyRollup,
+    RollupKind,
+    merge_rollups,
+    year_month_of,
+)
+from app.domain.services.average_forecast_engine import AverageForecastEngine
 from app.domain.services.forecast_service import ForecastService
 
 
@@ -25,37 +32,25 @@ class TestForecastService:
         period = ForecastPeriod.ONE_MONTH
 
         mock_expenses = [
-            Expense(
-                id="expense-1",
-                user_id=user_id,
-                name="Loyer",
-                amount=800.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=15),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.HOUSING,
+                amount=800.0,
+                count=1,
                 is_recurring=True,
-                frequency=ExpenseFrequency.MONTHLY,
             )
         ]
 
         mock_incomes = [
-            Income(
-                id="income-1",
-                user_id=user_id,
-                name="Salaire",
-                amount=3000.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=10),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=IncomeCategory.SALARY,
+                amount=3000.0,
+                count=1,
                 is_recurring=True,
-                frequency=IncomeFrequency.MONTHLY,
             )
         ]
 
-        self.mock_expense_repo.get_by_user_id.return_value = mock_expenses
-        self.mock_income_repo.get_all_by_user_id.return_value = mock_incomes
+        self.mock_expense_repo.get_daily_totals.return_value = mock_expenses
+        self.mock_income_repo.get_daily_totals.return_value = mock_incomes
 
         # Act
         result = self.service.calculate_forecast(user_id, period)
@@ -74,8 +69,8 @@ class TestForecastService:
         user_id = "user-123"
         period = ForecastPeriod.ONE_MONTH
 
-        self.mock_expense_repo.get_by_user_id.return_value = []
-        self.mock_income_repo.get_all_by_user_id.return_value = []
+        self.mock_expense_repo.get_daily_totals.return_value = []
+        self.mock_income_repo.get_daily_totals.return_value = []
 
         # Act
         result = self.service.calculate_forecast(user_id, period)
@@ -92,25 +87,15 @@ class TestForecastService:
         # Arrange
         same_date = datetime.now(UTC) - timedelta(days=10)
         expenses = [
-            Expense(
-                id="expense-1",
-                user_id="user-123",
-                name="Courses",
-                amount=100.0,
+            AggregatedAmount(
                 date=same_date,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.FOOD,
+                amount=100.0,
+                count=1,
             ),
-            Expense(
-                id="expense-2",
-                user_id="user-123",
-                name="Transport",
-                amount=50.0,
+            AggregatedAmount(
                 date=same_date,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.TRANSPORT,
+                amount=50.0,
+                count=1,
             ),
         ]
 
@@ -128,25 +113,15 @@ class TestForecastService:
         date1 = datetime.now(UTC) - timedelta(days=10)
         date2 = datetime.now(UTC) - timedelta(days=5)
         expenses = [
-            Expense(
-                id="expense-1",
-                user_id="user-123",
-                name="Courses",
-                amount=100.0,
+            AggregatedAmount(
                 date=date1,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.FOOD,
+                amount=100.0,
+                count=1,
             ),
-            Expense(
-                id="expense-2",
-                user_id="user-123",
-                name="Transport",
-                amount=50.0,
+            AggregatedAmount(
                 date=date2,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.TRANSPORT,
+                amount=50.0,
+                count=1,
             ),
         ]
 
@@ -162,38 +137,42 @@ class TestForecastService:
         """Test de calcul de la moyenne mensuelle."""
         # Arrange
         expenses = [
-            Expense(
-                id="expense-1",
-                user_id="user-123",
-                name="Loyer",
-                amount=800.0,
+            AggregatedAmount(
                 date=datetime.now(UTC),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.HOUSING,
+                amount=800.0,
+                count=1,
             ),
-            Expense(
-                id="expense-2",
-                user_id="user-123",
-                name="Électricité",
-                amount=200.0,
+            AggregatedAmount(
                 date=datetime.now(UTC),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.UTILITIES,
+                amount=200.0,
+                count=1,
             ),
         ]
 
         # Act
-        result = self.service._calculate_monthly_average(expenses)
+        result = AverageForecastEngine().monthly_average(expenses)
 
         # Assert
         assert result == 500.0  # (800 + 200) / 2
 
+    def test_calculate_monthly_average_weighted_by_count(self):
+        """Test que la moyenne tient compte du nombre de transactions agrégées."""
+        # Arrange
+        expenses = [
+            AggregatedAmount(date=datetime.now(UTC), amount=1000.0, count=2, is_recurring=True),
+            AggregatedAmount(date=datetime.now(UTC), amount=200.0, count=1, is_recurring=True),
+        ]
+
+        # Act
+        result = AverageForecastEngine().monthly_average(expenses)
+
+        # Assert
+        assert result == 400.0  # 1200 / 3 transactions
+
     def test_calculate_monthly_average_empty(self):
         """Test de calcul de la moyenne avec une liste vide."""
         # Act
-        result = self.service._calculate_monthly_average([])
+        result = AverageForecastEngine().monthly_average([])
 
         # Assert
         assert result == 0.0
@@ -229,38 +208,26 @@ class TestForecastService:
 
         # Dépenses récurrentes
         mock_expenses = [
-            Expense(
-                id="expense-1",
-                user_id=user_id,
-                name="Loyer",
-                amount=800.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=30),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.HOUSING,
+                amount=800.0,
+                count=1,
                 is_recurring=True,
-                frequency=ExpenseFrequency.MONTHLY,
             )
         ]
 
         # Revenus récurrents
         mock_incomes = [
-            Income(
-                id="income-1",
-                user_id=user_id,
-                name="Salaire",
-                amount=3000.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=30),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=IncomeCategory.SALARY,
+                amount=3000.0,
+                count=1,
                 is_recurring=True,
-                frequency=IncomeFrequency.MONTHLY,
             )
         ]
 
-        self.mock_expense_repo.get_by_user_id.return_value = mock_expenses
-        self.mock_income_repo.get_all_by_user_id.return_value = mock_incomes
+        self.mock_expense_repo.get_daily_totals.return_value = mock_expenses
+        self.mock_income_repo.get_daily_totals.return_value = mock_incomes
 
         # Act
         result = self.service.calculate_forecast(user_id, period)
@@ -271,3 +238,279 @@ class TestForecastService:
         # Les prévisions devraient être basées sur les moyennes des éléments récurrents
         assert result.forecast_total_expenses == 800.0 * 3  # 800 par mois * 3 mois
         assert result.forecast_total_income == 3000.0 * 3  # 3000 par mois * 3 mois
+
+    def test_forecast_uses_monthly_rollups_when_available(self):
+        """Test que les prévisions s'appuient sur les agrégats des mois complets."""
+        # Arrange
+        rollup_repo = Mock()
+        service = ForecastService(self.mock_expense_repo, self.mock_income_repo, rollup_repo)
+        self.mock_expense_repo.get_daily_totals.return_value = []
+        self.mock_income_repo.get_daily_totals.return_value = []
+        full_month = (datetime.now(UTC) - timedelta(days=45)).strftime("%Y-%m")
+
+        def rollups(user_id, start_month, end_month, kind):
+            return [
+                MonthlyRollup(user_id, full_month, kind, "other", True, 1200.0, 2),
+                MonthlyRollup(user_id, full_month, kind, "other", False, 999.0, 5),
+                # Mois incomplet : remplacé par les sommes journalières
+                MonthlyRollup(user_id, end_month, kind, "other", True, 5000.0, 1),
+            ]
+
+        rollup_repo.get_by_user_id.side_effect = rollups
+
+        # Act
+        result = service.calculate_forecast("user-123", ForecastPeriod.THREE_MONTHS)
+
+        # Assert
+        kinds = [c.args[3] for c in rollup_repo.get_by_user_id.call_args_list]
+        assert kinds == [RollupKind.EXPENSE, RollupKind.INCOME]
+        # Seules les lignes récurrentes comptent : 1200 / 2 = 600 par mois
+        assert result.forecast_total_expenses == 600.0 * 3
+        assert result.forecast_total_income == 600.0 * 3
+
+    def test_rollup_forecasts_match_raw_rows(self):
+        """Test que les agrégats mensuels donnent les prévisions des lignes brutes.
+
+        Les périodes commencent en milieu de mois et le mois courant contient des
+        transactions futures : seuls les mois complets viennent des agrégats.
+        """
+        # Arrange
+        now = datetime.now(UTC)
+        rows = [(now - timedelta(days=d, hours=1), float(d + 20)) for d in range(-20, 400, 3)]
+
+        def daily_totals(user_id, start, end, by_category=False):
+            return [
+                AggregatedAmount(
+                    date=date.replace(hour=0, minute=0, second=0, microsecond=0),
+                    amount=amount,
+                    count=1,
+                    is_recurring=True,
+                )
+                for date, amount in rows
+                if start <= date <= end
+            ]
+
+        def rollups(user_id, start_month, end_month, kind):
+            merged = merge_rollups(
+                MonthlyRollup(user_id, year_month_of(date), kind, "other", True, amount, 1)
+                for date, amount in rows
+            )
+            return [r for r in merged if start_month <= r.year_month <= end_month]
+
+        self.mock_expense_repo.get_daily_totals.side_effect = daily_totals
+        self.mock_income_repo.get_daily_totals.return_value = []
+        rollup_repo = Mock()
+        rollup_repo.get_by_user_id.side_effect = rollups
+        service = ForecastService(self.mock_expense_repo, self.mock_income_repo, rollup_repo)
+
+        # Act
+        raw = self.service.calculate_forecasts("user-123")
+        rolled = service.calculate_forecasts("user-123")
+
+        # Assert
+        for period in ForecastPeriod:
+            assert rolled[period].forecast_total_expenses == pytest.approx(
+                raw[period].forecast_total_expenses
+            )
+            single = service.calculate_forecast("user-123", period)
+            assert single.forecast_total_expenses == pytest.approx(
+                raw[period].forecast_total_expenses
+            )
+
+    def test_calculate_forecasts_fetches_widest_window_once(self):
+        """Test que toutes les périodes sont calculées à partir d'une seule lecture."""
+        # Arrange
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.mock_expense_repo.get_daily_totals.return_value = [
+            AggregatedAmount(date=today - timedelta(days=200), amount=50.0, count=1),
+            AggregatedAmount(date=today - timedelta(days=60), amount=100.0, count=1),
+            AggregatedAmount(
+                date=today - timedelta(days=10), amount=800.0, count=1, is_recurring=True
+            ),
+        ]
+        self.mock_income_repo.get_daily_totals.return_value = []
+
+        # Act
+        results = self.service.calculate_forecasts("user-123")
+
+        # Assert
+        assert set(results) == set(ForecastPeriod)
+        self.mock_expense_repo.get_daily_totals.assert_called_once()
+        self.mock_income_repo.get_daily_totals.assert_called_once()
+        start_date = self.mock_expense_repo.get_daily_totals.call_args.args[1]
+        assert start_date == results[ForecastPeriod.ONE_YEAR].start_date
+
+        assert results[ForecastPeriod.ONE_MONTH].total_expenses == 800.0
+        assert results[ForecastPeriod.THREE_MONTHS].total_expenses == 900.0
+        assert results[ForecastPeriod.SIX_MONTHS].total_expenses == 900.0
+        assert results[ForecastPeriod.ONE_YEAR].total_expenses == 950.0
+        assert results[ForecastPeriod.SIX_MONTHS].forecast_total_expenses == 800.0 * 6
+
+    def test_calculate_forecasts_matches_single_period(self):
+        """Test que le calcul groupé donne les mêmes totaux que le calcul par période."""
+        # Arrange
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.mock_expense_repo.get_daily_totals.side_effect = (
+            lambda user_id, start, end, by_category=False: [
+                row
+                for row in [
+                    AggregatedAmount(date=today - timedelta(days=d), amount=d, count=1)
+                    for d in range(0, 365, 7)
+                ]
+                if row.date >= start
+            ]
+        )
+        self.mock_income_repo.get_daily_totals.return_value = []
+
+        # Act
+        batch = self.service.calculate_forecasts("user-123")
+
+        # Assert
+        for period in ForecastPeriod:
+            single = self.service.calculate_forecast("user-123", period)
+            assert batch[period].total_expenses == single.total_expenses
+            assert batch[period].expenses_data == single.expenses_data
+
+    def test_calculate_forecasts_matches_single_period_on_start_day(self):
+        """Test que chaque période groupée égale sa lecture dédiée, jour de début compris.
+
+        Le dépôt filtre les horodatages bruts (`date >= start`) puis regroupe par jour,
+        avec des transactions à toute heure, y compris le jour de début de chaque période.
+        """
+        # Arrange
+        now = datetime.now(UTC)
+        rows = [
+            (now - timedelta(days=d, hours=h), float(d + h))
+            for d in range(0, 400)
+            for h in (0, 6, 18)
+        ]
+
+        def daily_totals(user_id, start, end, by_category=False):
+            totals = {}
+            for date, amount in rows:
+                if start <= date <= end:
+                    day = date.replace(hour=0, minute=0, second=0, microsecond=0)
+                    totals[day] = totals.get(day, 0.0) + amount
+            return [
+                AggregatedAmount(date=day, amount=amount, count=1, is_recurring=True)
+                for day, amount in sorted(totals.items())
+            ]
+
+        def rollups(user_id, start_month, end_month, kind):
+            merged = merge_rollups(
+                MonthlyRollup(user_id, year_month_of(date), kind, "other", True, amount, 1)
+                for date, amount in rows
+            )
+            return [r for r in merged if start_month <= r.year_month <= end_month]
+
+        self.mock_expense_repo.get_daily_totals.side_effect = daily_totals
+        self.mock_income_repo.get_daily_totals.return_value = []
+        rollup_repo = Mock()
+        rollup_repo.get_by_user_id.side_effect = rollups
+
+        for service in (
+            self.service,
+            ForecastService(self.mock_expense_repo, self.mock_income_repo, rollup_repo),
+        ):
+            # Act
+            batch = service.calculate_forecasts("user-123")
+
+            # Assert
+            for period in ForecastPeriod:
+                single = service.calculate_forecast("user-123", period)
+                assert batch[period].start_date == single.start_date
+                assert batch[period].expenses_data == single.expenses_data
+                assert batch[period].total_expenses == pytest.approx(single.total_expenses)
+                assert [point.amount for point in batch[period].forecast_expenses] == (
+                    pytest.approx([point.amount for point in single.forecast_expenses])
+                )
+
+    def test_calculate_forecasts_reads_rollups_once(self):
+        """Test que les agrégats mensuels sont lus une fois puis découpés par période."""
+        # Arrange
+        rollup_repo = Mock()
+        service = ForecastService(self.mock_expense_repo, self.mock_income_repo, rollup_repo)
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.mock_expense_repo.get_daily_totals.return_value = [
+            AggregatedAmount(date=today, amount=1000.0, count=1, is_recurring=True)
+        ]
+        self.mock_income_repo.get_daily_totals.return_value = []
+        old_month = (datetime.now(UTC) - timedelta(days=300)).strftime("%Y-%m")
+        rollup_repo.get_by_user_id.side_effect = lambda user_id, start, end, kind: [
+            MonthlyRollup(user_id, old_month, kind, "other", True, 3000.0, 1),
+        ]
+
+        # Act
+        results = service.calculate_forecasts(
+            "user-123", [ForecastPeriod.ONE_MONTH, ForecastPeriod.ONE_YEAR]
+        )
+
+        # Assert
+        assert rollup_repo.get_by_user_id.call_count == 2
+        assert results[ForecastPeriod.ONE_MONTH].forecast_total_expenses == 1000.0
+        assert results[ForecastPeriod.ONE_YEAR].forecast_total_expenses == 2000.0 * 12
+
+    def test_forecast_delegates_to_engine_with_recurring_rows(self):
+        """Test que seules les lignes récurrentes sont transmises au moteur."""
+        # Arrange
+        engine = Mock()
+        engine.aggregate.return_value = []
+        engine.project.return_value = []
+        service = ForecastService(self.mock_expense_repo, self.mock_income_repo, engine=engine)
+        recurring = AggregatedAmount(
+            date=datetime.now(UTC), amount=800.0, count=1, is_recurring=True
+        )
+        one_off = AggregatedAmount(date=datetime.now(UTC), amount=50.0, count=1)
+        self.mock_expense_repo.get_daily_totals.return_value = [recurring, one_off]
+        self.mock_income_repo.get_daily_totals.return_value = []
+
+        # Act
+        service.calculate_forecast("user-123", ForecastPeriod.SIX_MONTHS)
+
+        # Assert
+        expense_call = engine.project.call_args_list[0]
+        assert expense_call.args[0] == [recurring]
+        assert expense_call.args[2] == 6
+
+    def test_calculate_forecast_by_category(self):
+        """Test du détail par catégorie calculé à partir d'une seule lecture groupée."""
+        # Arrange
+        day = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.mock_expense_repo.get_daily_totals.return_value = [
+            AggregatedAmount(day - timedelta(days=5), 800.0, 1, "housing", True),
+            AggregatedAmount(day - timedelta(days=5), 60.0, 2, "food", False),
+            AggregatedAmount(day - timedelta(days=2), 40.0, 1, "food", False),
+        ]
+        self.mock_income_repo.get_daily_totals.return_value = [
+            AggregatedAmount(day - timedelta(days=3), 3000.0, 1, "salary", True),
+        ]
+
+        # Act
+        result = self.service.calculate_forecast(
+            "user-123", ForecastPeriod.THREE_MONTHS, by_category=True
+        )
+
+        # Assert
+        self.mock_expense_repo.get_daily_totals.assert_called_once()
+        assert self.mock_expense_repo.get_daily_totals.call_args.kwargs["by_category"] is True
+        assert result.total_expenses == 900.0
+        assert len(result.expenses_data) == 2
+
+        categories = {c.category: c for c in result.expense_categories}
+        assert list(categories) == ["food", "housing"]
+        assert categories["food"].total == 100.0
+        assert all(point.category == "food" for point in categories["food"].data)
+        assert categories["food"].forecast_total == 0.0
+        assert categories["housing"].forecast_total == 800.0 * 3
+        assert [c.category for c in result.income_categories] == ["salary"]
+        assert result.income_categories[0].forecast[0].category == "salary"
+
+    def test_calculate_forecast_without_breakdown(self):
+        """Test que le détail par catégorie n'est calculé qu'à la demande."""
+        self.mock_expense_repo.get_daily_totals.return_value = []
+        self.mock_income_repo.get_daily_totals.return_value = []
+
+        result = self.service.calculate_forecast("user-123", ForecastPeriod.ONE_MONTH)
+
+        assert result.expense_categories is None
+        assert result.income_categories is None
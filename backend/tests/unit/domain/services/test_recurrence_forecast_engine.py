@@ -0,0 +1,148 @@
+"""Tests pour le moteur de prévision par déroulement des séries récurrentes."""
+
+from datetime import date, datetime, UTC
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from app.domain.entities.expense import ExpenseFrequency
+from app.domain.entities.forecast import ForecastPeriod
+from app.domain.services.forecast_service import ForecastService
+from app.domain.services.recurrence_forecast_engine import (
+    RecurrenceForecastEngine,
+    add_months,
+    build_series,
+    occurrence_counts,
+)
+
+NOW = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+
+
+def transaction(name, day, amount, frequency=ExpenseFrequency.MONTHLY):
+    """Crée une transaction récurrente minimale."""
+    return SimpleNamespace(
+        name=name,
+        date=datetime.combine(day, datetime.min.time(), tzinfo=UTC),
+        amount=amount,
+        frequency=frequency,
+        is_recurring=True,
+    )
+
+
+class TestCalendar:
+    """Tests du calcul calendaire."""
+
+    def test_add_months_clamps_to_end_of_month(self):
+        """Test que le jour est ramené à la fin du mois sans dériver."""
+        anchor = date(2024, 1, 31)
+
+        assert add_months(anchor, 1) == date(2024, 2, 29)
+        assert add_months(anchor, 2) == date(2024, 3, 31)
+        assert add_months(anchor, 13) == date(2025, 2, 28)
+
+    def test_occurrence_counts_per_month(self):
+        """Test du décompte des occurrences dans chaque mois à venir."""
+        today = date(2024, 1, 15)
+
+        assert occurrence_counts(date(2024, 1, 5), "monthly", today, 3) == (1, 1, 1)
+        assert occurrence_counts(date(2023, 3, 1), "yearly", today, 3) == (0, 1, 0)
+        weekly = occurrence_counts(date(2024, 1, 12), "weekly", today, 12)
+        assert sum(weekly) == 52
+        assert set(weekly) <= {4, 5}
+
+    def test_future_anchor_is_counted(self):
+        """Test qu'une échéance saisie dans le futur est projetée."""
+        assert occurrence_counts(date(2024, 2, 20), "monthly", date(2024, 1, 15), 2) == (0, 1)
+
+
+class TestBuildSeries:
+    """Tests du regroupement en séries."""
+
+    def test_series_keyed_on_normalized_name_and_frequency(self):
+        """Test que les libellés bancaires variables forment une seule série."""
+        series = build_series(
+            [
+                transaction("PRLV NETFLIX 0524", date(2023, 12, 3), 13.49),
+                transaction("Prlv Netflix 0624", date(2024, 1, 3), 15.99),
+                transaction("PRLV NETFLIX", date(2024, 1, 3), 99.0, ExpenseFrequency.YEARLY),
+            ]
+        )
+
+        monthly = [s for s in series if s.frequency == "monthly"]
+        assert len(series) == 2
+        assert monthly[0].anchor == date(2024, 1, 3)
+        assert monthly[0].amount == 15.99
+
+    def test_one_time_items_are_ignored(self):
+        """Test que les transactions ponctuelles ne forment pas de série."""
+        assert build_series(
+            [transaction("Meuble", date(2024, 1, 3), 300.0, ExpenseFrequency.ONE_TIME)]
+        ) == []
+
+
+class TestRecurrenceForecastEngine:
+    """Tests de la projection."""
+
+    def test_project_folds_occurrences_into_months(self):
+        """Test que chaque série contribue selon sa fréquence."""
+        history = [
+            transaction("Loyer", date(2024, 1, 1), 900.0),
+            transaction("Sport", date(2024, 1, 10), 10.0, ExpenseFrequency.WEEKLY),
+            transaction("Assurance", date(2023, 3, 1), 240.0, ExpenseFrequency.YEARLY),
+        ]
+
+        points = RecurrenceForecastEngine().project(history, NOW, 3)
+
+        weekly = occurrence_counts(date(2024, 1, 10), "weekly", date(2024, 1, 15), 12)
+        assert [point.amount for point in points] == [
+            900.0 + 10.0 * weekly[0],
+            900.0 + 10.0 * weekly[1] + 240.0,
+            900.0 + 10.0 * weekly[2],
+        ]
+        assert points[1].date == datetime(2024, 2, 15, 10, 0, tzinfo=UTC)
+
+    def test_stale_series_is_not_projected(self):
+        """Test qu'une série interrompue depuis plusieurs mois n'est plus projetée."""
+        history = [transaction("Ancien abonnement", date(2023, 9, 1), 20.0)]
+
+        points = RecurrenceForecastEngine().project(history, NOW, 1)
+
+        assert points[0].amount == 0.0
+
+    def test_only_edited_series_is_expanded_again(self):
+        """Test que la modification d'une série ne ré-déroule qu'elle."""
+        occurrence_counts.cache_clear()
+        engine = RecurrenceForecastEngine()
+        history = [
+            transaction("Loyer", date(2024, 1, 1), 900.0),
+            transaction("Salle de sport", date(2024, 1, 8), 30.0),
+        ]
+        engine.project(history, NOW, 12)
+        misses = occurrence_counts.cache_info().misses
+
+        history[1] = transaction("Salle de sport", date(2024, 1, 9), 35.0)
+        engine.project(history, NOW, 12)
+
+        assert occurrence_counts.cache_info().misses == misses + 1
+
+
+class TestForecastServiceWithRecurrence:
+    """Tests de l'intégration du moteur dans ForecastService."""
+
+    def test_service_reads_recurring_transactions(self):
+        """Test que le service fournit les transactions récurrentes au moteur."""
+        expense_repo = Mock()
+        income_repo = Mock()
+        expense_repo.get_daily_totals.return_value = []
+        income_repo.get_daily_totals.return_value = []
+        expense_repo.get_recurring_by_user_id.return_value = [
+            transaction("Loyer", datetime.now(UTC).date(), 900.0)
+        ]
+        income_repo.get_recurring_by_user_id.return_value = []
+        service = ForecastService(expense_repo, income_repo, engine=RecurrenceForecastEngine())
+
+        results = service.calculate_forecasts("user-123")
+
+        expense_repo.get_recurring_by_user_id.assert_called_once()
+        income_repo.get_recurring_by_user_id.assert_called_once()
+        assert results[ForecastPeriod.ONE_MONTH].forecast_total_expenses == 900.0
+        assert results[ForecastPeriod.ONE_YEAR].forecast_total_expenses == 900.0 * 12
@@ -0,0 +1,41 @@
+"""Tests pour les calculs statistiques."""
+
+from datetime import datetime
+
+from app.domain.entities.transaction_stats import StatsGranularity
+from app.domain.services.statistics import percentile_cont, period_starts, truncate
+
+
+def test_truncate_to_period_start():
+    """Test du début de période (semaines commençant le lundi)."""
+    value = datetime(2025, 3, 16, 18, 30)  # dimanche
+
+    assert truncate(value, StatsGranularity.DAY) == datetime(2025, 3, 16)
+    assert truncate(value, StatsGranularity.WEEK) == datetime(2025, 3, 10)
+    assert truncate(value, StatsGranularity.MONTH) == datetime(2025, 3, 1)
+    assert truncate(value, StatsGranularity.YEAR) == datetime(2025, 1, 1)
+
+
+def test_period_starts_cover_the_range():
+    """Test du découpage d'un intervalle, y compris à cheval sur deux années."""
+    months = list(
+        period_starts(datetime(2024, 11, 15), datetime(2025, 2, 1), StatsGranularity.MONTH)
+    )
+    assert months == [
+        datetime(2024, 11, 1),
+        datetime(2024, 12, 1),
+        datetime(2025, 1, 1),
+        datetime(2025, 2, 1),
+    ]
+    weeks = list(
+        period_starts(datetime(2025, 3, 12), datetime(2025, 3, 24), StatsGranularity.WEEK)
+    )
+    assert weeks == [datetime(2025, 3, 10), datetime(2025, 3, 17), datetime(2025, 3, 24)]
+
+
+def test_percentile_cont_interpolates_like_postgresql():
+    """Test de l'interpolation linéaire entre les deux valeurs encadrantes."""
+    assert percentile_cont([10.0, 20.0, 30.0, 40.0], 0.5) == 25.0
+    assert percentile_cont([10.0, 20.0, 30.0, 40.0], 0.9) == 37.0
+    assert percentile_cont([7.0], 0.9) == 7.0
+    assert percentile_cont([], 0.5) == 0.0
@@ -0,0 +1,40 @@
+"""Tests pour la recherche plein texte en mémoire."""
+
+from app.domain.services.text_search import InvertedIndex, search_terms
+
+
+def test_search_terms_are_normalized_and_distinct():
+    """Test que les termes sont normalisés, sans ponctuation ni doublon."""
+    assert search_terms("Carrefour  MARKET, carrefour") == ["carrefour", "market"]
+    assert search_terms("l'Épicerie_du-coin") == ["l", "épicerie", "du", "coin"]
+    assert search_terms(" ,; ") == []
+    assert search_terms(None) == []
+
+
+def test_search_requires_every_term_as_word_prefix():
+    """Test du ET logique entre les termes, chacun préfixant un mot."""
+    index = InvertedIndex()
+    index.add("a", "CB CARREFOUR MARKET", "Courses")
+    index.add("b", "CARREFOUR CITY", None)
+    index.add("c", "Auchan", "courses carrefour")
+
+    assert {doc for doc, _ in index.search("carre")} == {"a", "b", "c"}
+    assert {doc for doc, _ in index.search("carrefour courses")} == {"a", "c"}
+    assert index.search("market auchan") == []
+    assert index.search("!!") == []
+    assert len(index) == 3
+
+
+def test_search_ranks_exact_and_rare_words_first():
+    """Test que les mots exacts et rares pèsent plus que les préfixes et mots courants."""
+    index = InvertedIndex()
+    index.add("exact", "Netflix")
+    index.add("prefix", "Netflixcom abonnement")
+    index.add("common-1", "abonnement salle")
+    index.add("common-2", "abonnement presse")
+
+    assert [doc for doc, _ in index.search("netflix")] == ["exact", "prefix"]
+    results = index.search("abonnement")
+    assert len(results) == 3
+    # Scores égaux : départagés par l'id décroissant
+    assert [doc for doc, _ in results] == ["prefix", "common-2", "common-1"]
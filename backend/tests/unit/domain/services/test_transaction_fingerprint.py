@@ -0,0 +1,48 @@
+"""Tests pour l'empreinte de déduplication des transactions."""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+
+from app.domain.services.transaction_fingerprint import (
+    amount_cents,
+    dedupe_key,
+    fingerprint_of,
+    normalize_name,
+    transaction_fingerprint,
+)
+
+
+def test_normalize_name_ignores_case_and_spacing():
+    """Test que la casse et les espaces multiples n'influent pas sur le libellé."""
+    assert normalize_name("  Carrefour   MARKET ") == "carrefour market"
+
+
+def test_amount_cents_rounds_half_up():
+    """Test de l'arrondi au centime sans erreur de virgule flottante."""
+    assert amount_cents(45.5) == 4550
+    assert amount_cents(0.125) == 13
+    assert amount_cents(19.99) == 1999
+
+
+def test_dedupe_key_uses_day_only():
+    """Test que l'heure de la transaction est ignorée."""
+    assert dedupe_key(datetime(2024, 1, 15, 18, 30), 10.0, "A") == (date(2024, 1, 15), 1000, "a")
+
+
+def test_fingerprint_is_stable_and_discriminant():
+    """Test que l'empreinte ne dépend que de la clé de déduplication."""
+    reference = transaction_fingerprint(datetime(2024, 1, 15), 45.5, "CARREFOUR MARKET")
+
+    assert len(reference) == 64
+    assert transaction_fingerprint(date(2024, 1, 15), 45.50, "carrefour market") == reference
+    assert transaction_fingerprint(date(2024, 1, 16), 45.50, "carrefour market") != reference
+    assert transaction_fingerprint(date(2024, 1, 15), 45.51, "carrefour market") != reference
+
+
+def test_fingerprint_of_prefers_stored_value():
+    """Test que l'empreinte stockée (transaction modifiée) est conservée."""
+    row = SimpleNamespace(date=date(2024, 1, 15), amount=1.0, name="A", fingerprint="stored")
+
+    assert fingerprint_of(row) == "stored"
+    row.fingerprint = None
+    assert fingerprint_of(row) == transaction_fingerprint(date(2024, 1, 15), 1.0, "A")
@@ -2,7 +2,9 @@
 
 from uuid import uuid4
 from datetime import datetime, UTC
-from app.domain.entities.expense import Expense, ExpenseCategory
+from unittest.mock import Mock
+from app.domain.entities.expense import Expense, ExpenseCategory, ExpenseFrequency
+from app.domain.entities.monthly_rollup import RollupKind
 from app.use_cases.expenses.create_expense import CreateExpense
 
 
@@ -51,6 +53,36 @@ def test_create_expense_success():
     assert result.frequency == expense.frequency
 
 
+def test_create_expense_updates_monthly_rollup():
+    """Test que la création d'une dépense met à jour l'agrégat mensuel."""
+
+    repo = InMemoryExpenseRepository()
+    rollup_repo = Mock()
+    use_case = CreateExpense(repo, rollup_repo)
+
+    expense = Expense(
+        id=uuid4(),
+        user_id="user-123",
+        name="Loyer",
+        amount=800,
+        date=datetime(2025, 3, 5, tzinfo=UTC),
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+        category=ExpenseCategory.HOUSING,
+        frequency=ExpenseFrequency.MONTHLY,
+    )
+
+    use_case.execute(expense)
+
+    delta = rollup_repo.apply.call_args.args[0]
+    assert delta.user_id == "user-123"
+    assert delta.year_month == "2025-03"
+    assert delta.kind == RollupKind.EXPENSE
+    assert delta.category == "housing"
+    assert delta.is_recurring is True
+    assert (delta.amount, delta.count) == (800.0, 1)
+
+
 def test_create_expense_with_invalid_user_id():
     """Test pour le cas d'utilisation de création d'une dépense avec un user_id invalide."""
 
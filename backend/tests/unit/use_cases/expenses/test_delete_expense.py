@@ -3,7 +3,8 @@
 import pytest
 from uuid import uuid4
 from datetime import datetime, UTC
-from app.domain.entities.expense import Expense
+from unittest.mock import Mock
+from app.domain.entities.expense import Expense, ExpenseCategory
 from app.use_cases.expenses.delete_expense import DeleteExpense
 
 
@@ -12,10 +13,12 @@ class InMemoryExpenseRepository:
 
     def __init__(self):
         self.expenses = {}
+        self.lookups = 0
 
     def get_by_id(self, expense_id: str, user_id: str) -> Expense | None:
         """Récupère une dépense par son id."""
 
+        self.lookups += 1
         expense = self.expenses.get(expense_id)
         if expense and expense.user_id == user_id:
             return expense
@@ -58,6 +61,31 @@ def test_delete_expense_success():
     assert expense_id not in repo.expenses
 
 
+def test_delete_expense_decrements_monthly_rollup():
+    """Test que la suppression d'une dépense retire son montant de l'agrégat."""
+
+    expense = Expense(
+        id="expense-1",
+        user_id="user-1",
+        name="Courses",
+        amount=42.0,
+        date=datetime(2025, 4, 30),
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+        category=ExpenseCategory.FOOD,
+    )
+    repo = InMemoryExpenseRepository()
+    repo.expenses["expense-1"] = expense
+    rollup_repo = Mock()
+
+    DeleteExpense(repo, rollup_repo).execute("expense-1", "user-1")
+
+    delta = rollup_repo.apply.call_args.args[0]
+    assert (delta.year_month, delta.category) == ("2025-04", "food")
+    assert (delta.amount, delta.count) == (-42.0, -1)
+    assert repo.lookups == 1
+
+
 def test_delete_expense_failure_with_invalid_expense_id():
     """Test pour le cas d'utilisation de suppression d'une dépense avec un id invalide."""
 
@@ -2,7 +2,9 @@
 
 from uuid import uuid4
 from datetime import datetime, UTC
+import pytest
 from app.domain.entities.expense import Expense
+from app.domain.entities.transaction_query import TransactionQuery, TransactionSort
 from app.use_cases.expenses.list_expenses import ListExpenses
 
 
@@ -17,6 +19,16 @@ class InMemoryExpenseRepository:
 
         return [expense for expense in self.expenses if expense.user_id == user_id]
 
+    def get_page(self, user_id: str, query: TransactionQuery) -> list[Expense]:
+        """Récupère les dépenses triées par (date, id) décroissants, après `query.after`."""
+
+        expenses = sorted(
+            self.get_by_user_id(user_id), key=lambda e: (e.date, e.id), reverse=True
+        )
+        if query.after is not None:
+            expenses = [e for e in expenses if (e.date, e.id) < query.after]
+        return expenses[:query.limit]
+
 
 def test_list_expense_for_user_success():
     """Test pour le cas d'utilisation de liste des dépenses pour un utilisateur avec succès."""
@@ -77,3 +89,38 @@ def test_list_expense_for_user_failure_with_invalid_user_id():
     result = use_case.execute(user_id)
 
     assert result == []
+
+
+def test_list_expenses_page_chains_cursors():
+    """Test du parcours de toutes les pages par curseurs successifs."""
+
+    expenses = [
+        Expense(
+            id=f"expense-{i}",
+            user_id="user-1",
+            name=f"Dépense {i}",
+            amount=10.0,
+            date=datetime(2025, 1, 1 + i // 2),
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+        for i in range(5)
+    ]
+    use_case = ListExpenses(InMemoryExpenseRepository(expenses))
+
+    pages, cursor = [], None
+    while True:
+        page = use_case.execute_page("user-1", TransactionQuery(limit=2), cursor)
+        pages.append([expense.id for expense in page.items])
+        if not page.next_cursor:
+            break
+        cursor = page.next_cursor
+
+    assert pages == [["expense-4", "expense-3"], ["expense-2", "expense-1"], ["expense-0"]]
+    unpaged = use_case.execute_page("user-1", TransactionQuery())
+    assert len(unpaged.items) == 5 and unpaged.next_cursor is None
+
+    with pytest.raises(ValueError, match="Curseur"):
+        use_case.execute_page(
+            "user-1", TransactionQuery(sort=TransactionSort.AMOUNT_ASC, limit=2), cursor
+        )
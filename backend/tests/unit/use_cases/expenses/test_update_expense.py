@@ -1,9 +1,11 @@
 """Module contenant les tests pour le cas d'utilisation de mise à jour d'une dépense."""
 
 import pytest
+from unittest.mock import Mock
 from uuid import uuid4
 from datetime import datetime, UTC
-from app.domain.entities.expense import Expense
+from app.domain.entities.expense import Expense, ExpenseCategory
+from app.domain.entities.monthly_rollup import RollupKind
 from app.use_cases.expenses.update_expense import UpdateExpense
 
 
@@ -89,3 +91,34 @@ def test_update_expense_failure_with_invalid_expense_id():
 
     with pytest.raises(ValueError, match="La dépense n'existe pas"):
         use_case.execute(updated_expense, user_id)
+
+
+def test_update_expense_learns_category_correction():
+    """Test qu'un changement de catégorie est appris pour les prochains imports."""
+
+    repo = InMemoryExpenseRepository()
+    learn_category = Mock()
+    expense = Expense(
+        id="expense-1",
+        user_id="user-1",
+        name="CB CARREFOUR 12/01",
+        amount=45.5,
+        date=datetime.now(UTC),
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+        category=ExpenseCategory.OTHER,
+    )
+    repo.expenses[expense.id] = expense
+    use_case = UpdateExpense(repo, learn_category=learn_category)
+
+    use_case.execute(
+        Expense(**{**expense.__dict__, "category": ExpenseCategory.FOOD}), "user-1"
+    )
+    use_case.execute(
+        Expense(**{**expense.__dict__, "category": ExpenseCategory.FOOD, "amount": 50.0}),
+        "user-1",
+    )
+
+    learn_category.execute.assert_called_once_with(
+        "user-1", RollupKind.EXPENSE, "CB CARREFOUR 12/01", "food"
+    )
@@ -4,9 +4,8 @@ from datetime import datetime, UTC, timedelta
 from unittest.mock import Mock
 import pytest
 
-from app.domain.entities.forecast import ForecastData, ForecastPeriod
-from app.domain.entities.expense import Expense, ExpenseCategory, ExpenseFrequency
-from app.domain.entities.income import Income, IncomeCategory, IncomeFrequency
+from app.domain.entities.forecast import AggregatedAmount, ForecastData, ForecastPeriod
+from app.use_cases.forecast.get_all_forecasts import GetAllForecasts
 from app.use_cases.forecast.get_forecast import GetForecast
 
 
@@ -27,48 +26,31 @@ class TestGetForecast:
 
         # Mock des données historiques
         mock_expenses = [
-            Expense(
-                id="expense-1",
-                user_id=user_id,
-                name="Loyer",
-                amount=800.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=15),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.HOUSING,
+                amount=800.0,
+                count=1,
                 is_recurring=True,
-                frequency=ExpenseFrequency.MONTHLY,
             ),
-            Expense(
-                id="expense-2",
-                user_id=user_id,
-                name="Courses",
-                amount=200.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=5),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.FOOD,
+                amount=200.0,
+                count=1,
                 is_recurring=False,
             ),
         ]
 
         mock_incomes = [
-            Income(
-                id="income-1",
-                user_id=user_id,
-                name="Salaire",
-                amount=3000.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=10),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=IncomeCategory.SALARY,
+                amount=3000.0,
+                count=1,
                 is_recurring=True,
-                frequency=IncomeFrequency.MONTHLY,
             )
         ]
 
-        self.mock_expense_repo.get_by_user_id.return_value = mock_expenses
-        self.mock_income_repo.get_all_by_user_id.return_value = mock_incomes
+        self.mock_expense_repo.get_daily_totals.return_value = mock_expenses
+        self.mock_income_repo.get_daily_totals.return_value = mock_incomes
 
         # Act
         result = self.use_case.execute(user_id, period)
@@ -93,37 +75,25 @@ class TestGetForecast:
 
         # Mock des données historiques
         mock_expenses = [
-            Expense(
-                id="expense-1",
-                user_id=user_id,
-                name="Loyer",
-                amount=800.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=30),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.HOUSING,
+                amount=800.0,
+                count=1,
                 is_recurring=True,
-                frequency=ExpenseFrequency.MONTHLY,
             )
         ]
 
         mock_incomes = [
-            Income(
-                id="income-1",
-                user_id=user_id,
-                name="Salaire",
-                amount=3000.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=30),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=IncomeCategory.SALARY,
+                amount=3000.0,
+                count=1,
                 is_recurring=True,
-                frequency=IncomeFrequency.MONTHLY,
             )
         ]
 
-        self.mock_expense_repo.get_by_user_id.return_value = mock_expenses
-        self.mock_income_repo.get_all_by_user_id.return_value = mock_incomes
+        self.mock_expense_repo.get_daily_totals.return_value = mock_expenses
+        self.mock_income_repo.get_daily_totals.return_value = mock_incomes
 
         # Act
         result = self.use_case.execute(user_id, period)
@@ -141,8 +111,8 @@ class TestGetForecast:
         user_id = "user-123"
         period = ForecastPeriod.ONE_MONTH
 
-        self.mock_expense_repo.get_by_user_id.return_value = []
-        self.mock_income_repo.get_all_by_user_id.return_value = []
+        self.mock_expense_repo.get_daily_totals.return_value = []
+        self.mock_income_repo.get_daily_totals.return_value = []
 
         # Act
         result = self.use_case.execute(user_id, period)
@@ -188,30 +158,20 @@ class TestGetForecast:
         # Créer des dépenses pour la même date
         same_date = datetime.now(UTC) - timedelta(days=10)
         mock_expenses = [
-            Expense(
-                id="expense-1",
-                user_id=user_id,
-                name="Courses",
-                amount=100.0,
+            AggregatedAmount(
                 date=same_date,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.FOOD,
+                amount=100.0,
+                count=1,
             ),
-            Expense(
-                id="expense-2",
-                user_id=user_id,
-                name="Transport",
-                amount=50.0,
+            AggregatedAmount(
                 date=same_date,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.TRANSPORT,
+                amount=50.0,
+                count=1,
             ),
         ]
 
-        self.mock_expense_repo.get_by_user_id.return_value = mock_expenses
-        self.mock_income_repo.get_all_by_user_id.return_value = []
+        self.mock_expense_repo.get_daily_totals.return_value = mock_expenses
+        self.mock_income_repo.get_daily_totals.return_value = []
 
         # Act
         result = self.use_case.execute(user_id, period)
@@ -227,37 +187,25 @@ class TestGetForecast:
         period = ForecastPeriod.SIX_MONTHS
 
         mock_expenses = [
-            Expense(
-                id="expense-1",
-                user_id=user_id,
-                name="Loyer",
-                amount=800.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=30),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=ExpenseCategory.HOUSING,
+                amount=800.0,
+                count=1,
                 is_recurring=True,
-                frequency=ExpenseFrequency.MONTHLY,
             )
         ]
 
         mock_incomes = [
-            Income(
-                id="income-1",
-                user_id=user_id,
-                name="Salaire",
-                amount=3000.0,
+            AggregatedAmount(
                 date=datetime.now(UTC) - timedelta(days=30),
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-                category=IncomeCategory.SALARY,
+                amount=3000.0,
+                count=1,
                 is_recurring=True,
-                frequency=IncomeFrequency.MONTHLY,
             )
         ]
 
-        self.mock_expense_repo.get_by_user_id.return_value = mock_expenses
-        self.mock_income_repo.get_all_by_user_id.return_value = mock_incomes
+        self.mock_expense_repo.get_daily_totals.return_value = mock_expenses
+        self.mock_income_repo.get_daily_totals.return_value = mock_incomes
 
         # Act
         result = self.use_case.execute(user_id, period)
@@ -275,8 +223,8 @@ class TestGetForecast:
         user_id = "user-123"
         period = ForecastPeriod.ONE_YEAR
 
-        self.mock_expense_repo.get_by_user_id.return_value = []
-        self.mock_income_repo.get_all_by_user_id.return_value = []
+        self.mock_expense_repo.get_daily_totals.return_value = []
+        self.mock_income_repo.get_daily_totals.return_value = []
 
         # Act
         result = self.use_case.execute(user_id, period)
@@ -285,3 +233,101 @@ class TestGetForecast:
         assert result.period == ForecastPeriod.ONE_YEAR
         assert len(result.forecast_expenses) == 12  # 12 mois
         assert len(result.forecast_income) == 12  # 12 mois
+
+
+class TestGetForecastCache:
+    """Tests du cache des prévisions dans GetForecast."""
+
+    def setup_method(self):
+        """Configuration initiale pour chaque test."""
+        self.mock_expense_repo = Mock()
+        self.mock_income_repo = Mock()
+        self.mock_expense_repo.get_daily_totals.return_value = []
+        self.mock_income_repo.get_daily_totals.return_value = []
+        self.mock_cache = Mock()
+        self.use_case = GetForecast(
+            self.mock_expense_repo, self.mock_income_repo, forecast_cache=self.mock_cache
+        )
+
+    def test_cache_hit_skips_computation(self):
+        """Test qu'un hit du cache évite tout accès aux repositories."""
+        cached = Mock(spec=ForecastData)
+        self.mock_cache.get.return_value = cached
+
+        result = self.use_case.execute("user-123", ForecastPeriod.ONE_MONTH)
+
+        assert result is cached
+        self.mock_cache.get.assert_called_once_with("user-123", ForecastPeriod.ONE_MONTH)
+        self.mock_expense_repo.get_daily_totals.assert_not_called()
+        self.mock_cache.set.assert_not_called()
+
+    def test_cache_miss_computes_and_stores(self):
+        """Test qu'un miss calcule la prévision puis la met en cache."""
+        self.mock_cache.get.return_value = None
+
+        result = self.use_case.execute("user-123", ForecastPeriod.THREE_MONTHS)
+
+        assert isinstance(result, ForecastData)
+        self.mock_expense_repo.get_daily_totals.assert_called_once()
+        self.mock_cache.set.assert_called_once_with(result)
+
+
+class TestGetAllForecasts:
+    """Tests pour le cas d'usage GetAllForecasts."""
+
+    def setup_method(self):
+        """Configuration initiale pour chaque test."""
+        self.mock_expense_repo = Mock()
+        self.mock_income_repo = Mock()
+        self.mock_expense_repo.get_daily_totals.return_value = []
+        self.mock_income_repo.get_daily_totals.return_value = []
+
+    def test_returns_every_period_from_one_fetch(self):
+        """Test que toutes les périodes sont renvoyées avec une seule lecture."""
+        use_case = GetAllForecasts(self.mock_expense_repo, self.mock_income_repo)
+
+        result = use_case.execute("user-123")
+
+        assert list(result) == list(ForecastPeriod)
+        self.mock_expense_repo.get_daily_totals.assert_called_once()
+        self.mock_income_repo.get_daily_totals.assert_called_once()
+
+    def test_only_missing_periods_are_computed(self):
+        """Test que les périodes en cache ne sont pas recalculées."""
+        cache = Mock()
+        cached = Mock(spec=ForecastData)
+        cache.get.side_effect = (
+            lambda user_id, period: cached if period == ForecastPeriod.ONE_YEAR else None
+        )
+        use_case = GetAllForecasts(
+            self.mock_expense_repo, self.mock_income_repo, forecast_cache=cache
+        )
+
+        result = use_case.execute("user-123")
+
+        assert result[ForecastPeriod.ONE_YEAR] is cached
+        # La fenêtre lue est celle de la plus large période manquante (6 mois)
+        start, end = self.mock_expense_repo.get_daily_totals.call_args.args[1:3]
+        assert (end - start).days == 180
+        assert cache.set.call_count == 3
+
+    def test_cached_forecast_without_breakdown_is_recomputed(self):
+        """Test qu'une prévision en cache sans détail par catégorie n'est pas réutilisée."""
+        cache = Mock()
+        cache.get.return_value = Mock(spec=ForecastData, expense_categories=None)
+        use_case = GetAllForecasts(
+            self.mock_expense_repo, self.mock_income_repo, forecast_cache=cache
+        )
+
+        result = use_case.execute("user-123", [ForecastPeriod.ONE_MONTH], by_category=True)
+
+        assert result[ForecastPeriod.ONE_MONTH].expense_categories == []
+        self.mock_expense_repo.get_daily_totals.assert_called_once()
+        cache.set.assert_called_once_with(result[ForecastPeriod.ONE_MONTH])
+
+    def test_execute_without_user_id(self):
+        """Test que l'utilisateur est requis."""
+        use_case = GetAllForecasts(self.mock_expense_repo, self.mock_income_repo)
+
+        with pytest.raises(ValueError, match="L'utilisateur est requis"):
+            use_case.execute("")
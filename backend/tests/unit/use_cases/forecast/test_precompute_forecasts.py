@@ -0,0 +1,132 @@
+"""Tests pour le précalcul des prévisions et leur lecture."""
+
+from datetime import datetime, timedelta, UTC
+from unittest.mock import Mock
+
+from app.domain.entities.forecast import ForecastPeriod, ForecastSnapshot
+from app.use_cases.forecast.get_all_forecasts import GetAllForecasts
+from app.use_cases.forecast.precompute_forecasts import PrecomputeForecasts
+
+
+class InMemorySnapshotRepository:
+    """Repository de prévisions précalculées en mémoire."""
+
+    def __init__(self):
+        self.snapshots = {}
+
+    def get(self, user_id, period):
+        return self.snapshots.get((user_id, period))
+
+    def save_all(self, forecasts, data_version):
+        for forecast in forecasts:
+            self.snapshots[(forecast.user_id, forecast.period)] = ForecastSnapshot(
+                forecast, data_version
+            )
+
+
+class TestPrecomputeForecasts:
+    """Tests pour le cas d'usage PrecomputeForecasts."""
+
+    def setup_method(self):
+        """Configuration initiale pour chaque test."""
+        self.mock_expense_repo = Mock()
+        self.mock_income_repo = Mock()
+        self.mock_expense_repo.get_daily_totals.return_value = []
+        self.mock_income_repo.get_daily_totals.return_value = []
+        self.snapshot_repo = InMemorySnapshotRepository()
+        self.version_repo = Mock()
+        self.version_repo.get.return_value = 2
+
+    def _precompute(self, forecast_cache=None):
+        return PrecomputeForecasts(
+            self.mock_expense_repo,
+            self.mock_income_repo,
+            self.snapshot_repo,
+            self.version_repo,
+            forecast_cache=forecast_cache,
+        )
+
+    def _get_all(self, forecast_cache=None):
+        return GetAllForecasts(
+            self.mock_expense_repo,
+            self.mock_income_repo,
+            forecast_cache=forecast_cache,
+            snapshot_repo=self.snapshot_repo,
+            version_repo=self.version_repo,
+        )
+
+    def test_precompute_stores_every_period(self):
+        """Test que toutes les périodes sont enregistrées avec la version lue."""
+        cache = Mock()
+
+        saved = self._precompute(cache).execute("user-123")
+
+        assert saved == len(ForecastPeriod)
+        snapshot = self.snapshot_repo.get("user-123", ForecastPeriod.ONE_YEAR)
+        assert snapshot.data_version == 2
+        assert cache.set.call_count == len(ForecastPeriod)
+
+    def test_precompute_discarded_after_concurrent_write(self):
+        """Test qu'un calcul concurrent d'une écriture n'est pas enregistré."""
+        self.version_repo.get.side_effect = [2, 3]
+
+        assert self._precompute().execute("user-123") == 0
+        assert self.snapshot_repo.snapshots == {}
+
+    def test_fresh_snapshot_served_without_computation(self):
+        """Test qu'une prévision précalculée à jour évite le calcul."""
+        self._precompute().execute("user-123")
+        self.mock_expense_repo.get_daily_totals.reset_mock()
+
+        result = self._get_all().execute("user-123", [ForecastPeriod.ONE_MONTH])
+
+        assert result[ForecastPeriod.ONE_MONTH].stale is False
+        self.mock_expense_repo.get_daily_totals.assert_not_called()
+
+    def test_fresh_snapshot_not_cached_after_concurrent_write(self):
+        """Test qu'une prévision précalculée lue pendant une écriture n'est pas mise en cache."""
+        self._precompute().execute("user-123")
+        self.version_repo.get.side_effect = [2, 3]
+        cache = Mock()
+        cache.get.return_value = None
+
+        result = self._get_all(cache).execute("user-123", [ForecastPeriod.ONE_MONTH])
+
+        assert result[ForecastPeriod.ONE_MONTH].stale is False
+        cache.set.assert_not_called()
+
+    def test_stale_snapshot_recomputed_by_default(self):
+        """Test qu'une prévision précalculée périmée est recalculée."""
+        self._precompute().execute("user-123")
+        self.version_repo.get.return_value = 3
+        self.mock_expense_repo.get_daily_totals.reset_mock()
+
+        result = self._get_all().execute("user-123", [ForecastPeriod.ONE_MONTH])
+
+        assert result[ForecastPeriod.ONE_MONTH].stale is False
+        self.mock_expense_repo.get_daily_totals.assert_called_once()
+
+    def test_stale_snapshot_served_when_allowed(self):
+        """Test qu'une prévision périmée est servie, marquée, si l'appelant l'accepte."""
+        self._precompute().execute("user-123")
+        self.version_repo.get.return_value = 3
+        self.mock_expense_repo.get_daily_totals.reset_mock()
+        cache = Mock()
+        cache.get.return_value = None
+
+        result = self._get_all(cache).execute(
+            "user-123", [ForecastPeriod.ONE_MONTH], allow_stale=True
+        )
+
+        assert result[ForecastPeriod.ONE_MONTH].stale is True
+        self.mock_expense_repo.get_daily_totals.assert_not_called()
+        cache.set.assert_not_called()
+
+    def test_snapshot_from_previous_day_is_stale(self):
+        """Test qu'une prévision calculée un autre jour est périmée."""
+        self._precompute().execute("user-123")
+        snapshot = self.snapshot_repo.get("user-123", ForecastPeriod.ONE_MONTH)
+        tomorrow = (datetime.now(UTC) + timedelta(days=1)).date()
+
+        assert snapshot.is_stale(2, datetime.now(UTC).date()) is False
+        assert snapshot.is_stale(2, tomorrow) is True
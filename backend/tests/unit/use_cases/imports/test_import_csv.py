@@ -2,11 +2,16 @@
 
 import uuid
 from datetime import datetime, UTC
+from unittest.mock import Mock
 from app.use_cases.imports.import_csv import ImportCSV
 from app.domain.entities.expense import Expense, ExpenseCategory, ExpenseFrequency
 from app.domain.entities.income import Income, IncomeCategory, IncomeFrequency
+from app.domain.exceptions import DuplicateTransactionError
 from app.domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
 from app.domain.interfaces.income_repository_interface import IncomeRepositoryInterface
+from app.domain.entities.category_rule import CategoryRule
+from app.domain.entities.monthly_rollup import RollupKind
+from app.use_cases.categories.get_category_index import GetCategoryIndex
 
 
 class InMemoryExpenseRepository(ExpenseRepositoryInterface):
@@ -20,6 +25,11 @@ class InMemoryExpenseRepository(ExpenseRepositoryInterface):
         self.expenses[expense.id] = expense
         return expense
 
+    def bulk_create(self, expenses: list[Expense]) -> list[Expense]:
+        """Crée plusieurs dépenses (via create, pour les sous-classes de test)."""
+        self.bulk_calls = getattr(self, "bulk_calls", 0) + 1
+        return [self.create(expense) for expense in expenses]
+
     def add(self, expense: Expense) -> Expense:
         self.expenses[expense.id] = expense
         return expense
@@ -30,6 +40,23 @@ class InMemoryExpenseRepository(ExpenseRepositoryInterface):
     def get_by_user_id(self, user_id: str) -> list[Expense]:
         return [e for e in self.expenses.values() if e.user_id == user_id]
 
+    def get_by_user_id_and_date_range(self, user_id: str, start_date, end_date) -> list[Expense]:
+        return [e for e in self.get_by_user_id(user_id) if start_date <= e.date <= end_date]
+
+    def iter_by_user_id(self, user_id: str, since=None, batch_size: int = 500):
+        expenses = sorted(self.get_by_user_id(user_id), key=lambda e: (e.date, e.id))
+        return iter([e for e in expenses if since is None or e.date >= since])
+
+    def get_page(self, user_id: str, query) -> list[Expense]:
+        expenses = sorted(self.get_by_user_id(user_id), key=lambda e: (e.date, e.id), reverse=True)
+        return expenses[:query.limit]
+
+    def get_recurring_by_user_id(self, user_id: str, since) -> list[Expense]:
+        return [e for e in self.get_by_user_id(user_id) if e.is_recurring and e.date >= since]
+
+    def get_daily_totals(self, user_id: str, start_date, end_date, by_category=False):
+        return []
+
     def get_all(self, user_id: str = None) -> list[Expense]:
         if user_id:
             return self.get_by_user_id(user_id)
@@ -57,6 +84,10 @@ class InMemoryIncomeRepository(IncomeRepositoryInterface):
         self.incomes[income.id] = income
         return income
 
+    def bulk_create(self, incomes: list[Income]) -> list[Income]:
+        """Crée plusieurs revenus."""
+        return [self.create(income) for income in incomes]
+
     def add(self, income: Income) -> Income:
         self.incomes[income.id] = income
         return income
@@ -64,9 +95,34 @@ class InMemoryIncomeRepository(IncomeRepositoryInterface):
     def get_by_id(self, income_id: str, user_id: str = None) -> Income:
         return self.incomes.get(income_id)
 
-    def get_all_by_user_id(self, user_id: str, skip: int = 0, limit: int = 100) -> list[Income]:
+    def get_all_by_user_id(self, user_id: str, skip: int = 0, limit: int = None) -> list[Income]:
         incomes = [i for i in self.incomes.values() if i.user_id == user_id]
-        return incomes[skip:skip + limit]
+        return incomes[skip:] if limit is None else incomes[skip:skip + limit]
+
+    def iter_by_user_id(self, user_id: str, since=None, batch_size: int = 500):
+        incomes = sorted(self.get_all_by_user_id(user_id), key=lambda i: (i.date, i.id))
+        return iter([i for i in incomes if since is None or i.date >= since])
+
+    def get_page(self, user_id: str, query) -> list[Income]:
+        incomes = sorted(
+            self.get_all_by_user_id(user_id), key=lambda i: (i.date, i.id), reverse=True
+        )
+        return incomes[:query.limit]
+
+    def get_by_user_id_and_date_range(self, user_id: str, start_date, end_date) -> list[Income]:
+        return [
+            i for i in self.incomes.values()
+            if i.user_id == user_id and start_date <= i.date <= end_date
+        ]
+
+    def get_recurring_by_user_id(self, user_id: str, since) -> list[Income]:
+        return [
+            i for i in self.incomes.values()
+            if i.user_id == user_id and i.is_recurring and i.date >= since
+        ]
+
+    def get_daily_totals(self, user_id: str, start_date, end_date, by_category=False):
+        return []
 
     def get_all(self) -> list[Income]:
         return list(self.incomes.values())
@@ -298,3 +354,285 @@ def test_import_csv_duplicate_income_detection():
     assert result.total_transactions == 2
     assert result.incomes_created == 1  # Seulement le freelance
     assert result.skipped == 1  # Le salaire est un doublon
+
+
+def test_import_csv_duplicates_ignore_case_and_spacing():
+    """Test que les doublons sont détectés malgré la casse et les espaces du libellé."""
+
+    expense_repo = InMemoryExpenseRepository()
+    income_repo = InMemoryIncomeRepository()
+    user_id = str(uuid.uuid4())
+    expense_repo.add(
+        Expense(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            name="Carrefour  Market",
+            amount=45.5,
+            date=datetime(2024, 1, 15, 12, 0),
+            category=ExpenseCategory.FOOD,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+    )
+
+    csv_content = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;CARREFOUR MARKET;Alimentation;Alimentation & Restauration;-45.50;
+"""
+
+    result = ImportCSV(expense_repo, income_repo).execute(user_id, csv_content)
+
+    assert result.expenses_created == 0
+    assert result.skipped == 1
+
+
+def test_import_csv_stores_fingerprints_and_skips_repeated_rows():
+    """Test que les transactions importées portent leur empreinte (doublons du fichier ignorés)."""
+
+    expense_repo = InMemoryExpenseRepository()
+    income_repo = InMemoryIncomeRepository()
+    user_id = str(uuid.uuid4())
+
+    csv_content = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;TICKET METRO;Transport;Transport;-2.10;
+2024-01-15;2024-01-15;TICKET METRO;Transport;Transport;-2.10;
+"""
+
+    result = ImportCSV(expense_repo, income_repo).execute(user_id, csv_content)
+
+    assert result.expenses_created == 1
+    assert result.skipped == 1
+    (expense,) = expense_repo.expenses.values()
+    assert len(expense.fingerprint) == 64
+
+
+def test_import_csv_database_conflict_counts_as_skipped():
+    """Test qu'un doublon refusé par l'index unique de la base est compté comme ignoré."""
+
+    class ConflictingExpenseRepository(InMemoryExpenseRepository):
+        def create(self, expense: Expense) -> Expense:
+            raise DuplicateTransactionError(expense.name)
+
+    user_id = str(uuid.uuid4())
+    csv_content = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;CARREFOUR MARKET;Alimentation;Alimentation & Restauration;-45.50;
+"""
+
+    result = ImportCSV(ConflictingExpenseRepository(), InMemoryIncomeRepository()).execute(
+        user_id, csv_content
+    )
+
+    assert result.success is True
+    assert result.expenses_created == 0
+    assert result.skipped == 1
+
+
+def test_import_csv_writes_in_chunks_and_reports_each_chunk():
+    """Test que les transactions validées sont écrites par lots, avec un résultat par lot."""
+
+    expense_repo = InMemoryExpenseRepository()
+    income_repo = InMemoryIncomeRepository()
+    user_id = str(uuid.uuid4())
+
+    csv_content = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;ACHAT 1;Alimentation;Alimentation;-10.00;
+2024-01-16;2024-01-16;ACHAT 2;Alimentation;Alimentation;-11.00;
+2024-01-17;2024-01-17;ACHAT 3;Alimentation;Alimentation;-12.00;
+2024-01-18;2024-01-18;VIREMENT SALAIRE;Salaire;Revenus;2000.00;
+"""
+
+    result = ImportCSV(expense_repo, income_repo, chunk_size=2).execute(user_id, csv_content)
+
+    assert result.success is True
+    assert result.expenses_created == 3
+    assert result.incomes_created == 1
+    assert expense_repo.bulk_calls == 2
+    assert [(c.kind, c.index, c.size, c.created) for c in result.chunks] == [
+        ("expense", 0, 2, 2),
+        ("expense", 1, 1, 1),
+        ("income", 0, 1, 1),
+    ]
+
+
+def test_import_csv_rejected_chunk_falls_back_to_row_by_row():
+    """Test qu'un lot refusé par l'index unique est réécrit ligne à ligne."""
+
+    class PartiallyConflictingRepository(InMemoryExpenseRepository):
+        def bulk_create(self, expenses: list[Expense]) -> list[Expense]:
+            raise DuplicateTransactionError("lot")
+
+        def create(self, expense: Expense) -> Expense:
+            if expense.name == "ACHAT 1":
+                raise DuplicateTransactionError(expense.name)
+            return super().create(expense)
+
+    expense_repo = PartiallyConflictingRepository()
+    csv_content = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;ACHAT 1;Alimentation;Alimentation;-10.00;
+2024-01-16;2024-01-16;ACHAT 2;Alimentation;Alimentation;-11.00;
+"""
+
+    result = ImportCSV(expense_repo, InMemoryIncomeRepository()).execute(
+        str(uuid.uuid4()), csv_content
+    )
+
+    assert result.success is True
+    assert result.expenses_created == 1
+    assert result.skipped == 1
+    (chunk,) = result.chunks
+    assert (chunk.created, chunk.skipped, chunk.error) == (1, 1, None)
+
+
+def test_import_csv_failed_row_rolls_back_pending_rollups():
+    """Test qu'une ligne en échec lors de l'écriture ligne à ligne annule ses agrégats."""
+
+    class FailingRowRepository(InMemoryExpenseRepository):
+        def bulk_create(self, expenses: list[Expense]) -> list[Expense]:
+            raise DuplicateTransactionError("lot")
+
+        def create(self, expense: Expense) -> Expense:
+            if expense.name == "ACHAT 1":
+                raise RuntimeError("connexion perdue")
+            return super().create(expense)
+
+    rollup_repo = Mock()
+    csv_content = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;ACHAT 1;Alimentation;Alimentation;-10.00;
+2024-01-16;2024-01-16;ACHAT 2;Alimentation;Alimentation;-11.00;
+"""
+
+    result = ImportCSV(FailingRowRepository(), InMemoryIncomeRepository(), rollup_repo).execute(
+        str(uuid.uuid4()), csv_content
+    )
+
+    assert result.expenses_created == 1
+    assert "connexion perdue" in result.chunks[0].error
+    rollup_repo.rollback.assert_called_once()
+
+
+def test_import_csv_failed_chunk_is_reported():
+    """Test qu'un lot en échec est consigné sans interrompre les lots suivants."""
+
+    class FailingExpenseRepository(InMemoryExpenseRepository):
+        def bulk_create(self, expenses: list[Expense]) -> list[Expense]:
+            raise RuntimeError("connexion perdue")
+
+    csv_content = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;ACHAT 1;Alimentation;Alimentation;-10.00;
+2024-01-18;2024-01-18;VIREMENT SALAIRE;Salaire;Revenus;2000.00;
+"""
+
+    result = ImportCSV(FailingExpenseRepository(), InMemoryIncomeRepository()).execute(
+        str(uuid.uuid4()), csv_content
+    )
+
+    assert result.success is False
+    assert result.expenses_created == 0
+    assert result.incomes_created == 1
+    assert result.chunks[0].error == "connexion perdue"
+    assert "lot 1" in result.errors[0]
+
+
+def test_import_csv_stream_skips_duplicates_across_chunks():
+    """Test que l'import en flux ignore les doublons répartis sur plusieurs lots."""
+
+    expense_repo = InMemoryExpenseRepository()
+    lines = iter([
+        "dateOp;dateVal;label;category;categoryParent;montant;\n",
+        "2024-01-15;2024-01-15;TICKET METRO;Transport;Transport;-2.10;\n",
+        "2024-01-16;2024-01-16;BOULANGERIE;Alimentation;Alimentation;-4.20;\n",
+        "2024-01-15;2024-01-15;ticket  metro;Transport;Transport;-2.10;\n",
+    ])
+
+    result = ImportCSV(expense_repo, InMemoryIncomeRepository(), chunk_size=1).execute_stream(
+        str(uuid.uuid4()), lines
+    )
+
+    assert result.total_transactions == 3
+    assert result.expenses_created == 2
+    assert result.skipped == 1
+    assert [c.index for c in result.chunks] == [0, 1]
+
+
+def test_import_csv_reads_each_day_of_history_once():
+    """Test que l'index des doublons n'est chargé que pour les jours pas encore lus."""
+
+    class RecordingExpenseRepository(InMemoryExpenseRepository):
+        def get_by_user_id_and_date_range(self, user_id, start_date, end_date):
+            self.ranges = getattr(self, "ranges", []) + [(start_date, end_date)]
+            return super().get_by_user_id_and_date_range(user_id, start_date, end_date)
+
+    expense_repo = RecordingExpenseRepository()
+    user_id = str(uuid.uuid4())
+    expense_repo.add(
+        Expense(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            name="LOYER",
+            amount=800.0,
+            date=datetime(2024, 1, 5),
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+    )
+    lines = iter([
+        "dateOp;dateVal;label;category;categoryParent;montant;\n",
+        "2024-03-01;2024-03-01;PHARMACIE;Santé;Santé;-12.00;\n",
+        "2024-01-05;2024-01-05;LOYER;Autres;Autres;-800.00;\n",
+        "2024-02-10;2024-02-10;CINEMA;Loisirs;Loisirs;-9.00;\n",
+        "2024-03-01;2024-03-01;pharmacie;Santé;Santé;-12.00;\n",
+    ])
+
+    result = ImportCSV(expense_repo, InMemoryIncomeRepository(), chunk_size=1).execute_stream(
+        user_id, lines
+    )
+
+    assert (result.expenses_created, result.skipped) == (2, 2)
+    # Le 1er mars, puis les jours du 5 janvier au 29 février ; rien pour les lots suivants
+    assert [(start.date(), end.date()) for start, end in expense_repo.ranges] == [
+        (datetime(2024, 3, 1).date(), datetime(2024, 3, 1).date()),
+        (datetime(2024, 1, 5).date(), datetime(2024, 2, 29).date()),
+    ]
+
+
+class InMemoryCategoryRuleRepository:
+    """Repository en mémoire pour les catégories apprises."""
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.loads = 0
+
+    def get_by_user_id(self, user_id):
+        self.loads += 1
+        return [r for r in self.rules if r.user_id == user_id]
+
+
+def test_import_csv_applies_learned_categories():
+    """Test que les catégories apprises des corrections priment sur le mapping bancaire."""
+
+    expense_repo = InMemoryExpenseRepository()
+    income_repo = InMemoryIncomeRepository()
+    rule_repo = InMemoryCategoryRuleRepository(
+        [
+            CategoryRule("user-1", RollupKind.EXPENSE, "amazon", "shopping"),
+            CategoryRule("user-1", RollupKind.INCOME, "acme", "freelance"),
+            CategoryRule("user-1", RollupKind.EXPENSE, "cinema", "categorie-supprimee"),
+        ]
+    )
+    csv_content = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;CB AMAZON EU 15/01;Non catégorisé;Autres;-45.50;
+2024-01-16;2024-01-16;VIR SEPA ACME;Virement;Revenus;800.00;
+2024-01-17;2024-01-17;CINEMA;Loisirs;Loisirs;-15.00;
+"""
+
+    result = ImportCSV(
+        expense_repo, income_repo, get_category_index=GetCategoryIndex(rule_repo)
+    ).execute("user-1", csv_content)
+
+    assert result.success is True
+    categories = {e.name: e.category for e in expense_repo.get_by_user_id("user-1")}
+    assert categories == {
+        "CB AMAZON EU 15/01": ExpenseCategory.SHOPPING,
+        "CINEMA": ExpenseCategory.ENTERTAINMENT,
+    }
+    assert income_repo.get_all_by_user_id("user-1")[0].category == IncomeCategory.FREELANCE
+    assert rule_repo.loads == 1
@@ -0,0 +1,251 @@
+"""Tests pour les imports CSV en arrière-plan."""
+
+from copy import deepcopy
+from io import BytesIO
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.entities.import_job import ImportJob, ImportJobStatus
+from app.domain.entities.import_result import ImportResult
+from app.domain.exceptions import DuplicateImportJobError
+from app.use_cases.imports.create_import_job import CreateImportJob
+from app.use_cases.imports.get_import_job import GetImportJob
+from app.use_cases.imports.import_csv import ImportCSV
+from app.use_cases.imports.run_import_job import RunImportJob
+from tests.unit.use_cases.imports.test_import_csv import (
+    InMemoryExpenseRepository,
+    InMemoryIncomeRepository,
+)
+
+
+class InMemoryImportJobRepository:
+    """Repository d'imports en mémoire, qui conserve chaque état enregistré."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.history = []
+
+    def create(self, job):
+        self.jobs[job.id] = deepcopy(job)
+        return job
+
+    def get_by_id(self, job_id, user_id=None):
+        job = self.jobs.get(job_id)
+        if job is None or (user_id is not None and job.user_id != user_id):
+            return None
+        return deepcopy(job)
+
+    def update(self, job):
+        self.jobs[job.id] = deepcopy(job)
+        self.history.append(deepcopy(job))
+        return job
+
+    def get_unfinished(self):
+        return [job for job in self.jobs.values() if not job.is_finished]
+
+    def get_latest_by_content_hash(self, user_id, content_hash):
+        jobs = [
+            job
+            for job in self.jobs.values()
+            if job.user_id == user_id and job.content_hash == content_hash
+        ]
+        return deepcopy(max(jobs, key=lambda job: job.created_at)) if jobs else None
+
+
+class InMemoryImportLedgerRepository:
+    """Registre des lots importés en mémoire."""
+
+    def __init__(self):
+        self.chunks = {}
+
+    def get_chunks(self, job_id):
+        return sorted(self.chunks.get(job_id, {}).values(), key=lambda chunk: chunk.index)
+
+    def add_chunk(self, job_id, chunk):
+        self.chunks.setdefault(job_id, {})[chunk.index] = chunk
+        return chunk
+
+
+CSV_CONTENT = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;ACHAT 1;Alimentation;Alimentation;-10.00;
+2024-01-16;2024-01-16;ACHAT 2;Alimentation;Alimentation;-11.00;
+2024-01-17;2024-01-17;VIREMENT SALAIRE;Salaire;Revenus;2000.00;
+"""
+
+
+def _job(job_repo):
+    return CreateImportJob(job_repo).execute("user-1", "export.csv", "/tmp/export.csv")
+
+
+def test_create_import_job_is_pending():
+    """Test qu'un import est enregistré en attente."""
+    job_repo = InMemoryImportJobRepository()
+
+    job = _job(job_repo)
+
+    assert job.status == ImportJobStatus.PENDING
+    assert job_repo.get_unfinished()[0].id == job.id
+
+
+def test_create_import_job_rejects_unsupported_file():
+    """Test qu'un fichier d'un format non supporté est refusé."""
+    with pytest.raises(ValueError, match="non supporté"):
+        CreateImportJob(Mock()).execute("user-1", "export.xls", "/tmp/export.xls")
+
+
+def test_run_import_job_persists_progress_after_each_chunk():
+    """Test que l'avancement est enregistré après chaque lot, puis le résultat final."""
+    job_repo = InMemoryImportJobRepository()
+    job = _job(job_repo)
+    import_csv = ImportCSV(InMemoryExpenseRepository(), InMemoryIncomeRepository(), chunk_size=2)
+
+    finished = RunImportJob(job_repo, import_csv).execute(job, BytesIO(CSV_CONTENT.encode()))
+
+    statuses = [(j.status, j.rows_parsed, j.rows_inserted) for j in job_repo.history]
+    assert statuses == [
+        (ImportJobStatus.RUNNING, 0, 0),
+        (ImportJobStatus.RUNNING, 2, 2),
+        (ImportJobStatus.COMPLETED, 3, 3),
+    ]
+    assert finished.result.incomes_created == 1
+    assert finished.finished_at is not None
+    assert job_repo.get_by_id(job.id).is_finished
+
+
+def test_run_import_job_records_failure():
+    """Test qu'un import en échec est enregistré comme tel."""
+    job_repo = InMemoryImportJobRepository()
+    job = _job(job_repo)
+    import_csv = Mock()
+    import_csv.execute_file.side_effect = UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid")
+
+    finished = RunImportJob(job_repo, import_csv).execute(job, BytesIO(b""))
+
+    assert finished.status == ImportJobStatus.FAILED
+    assert "UTF-8" in finished.error
+    assert job_repo.get_by_id(job.id).status == ImportJobStatus.FAILED
+
+
+def test_get_import_job_is_restricted_to_its_owner():
+    """Test qu'un utilisateur ne peut pas consulter l'import d'un autre."""
+    job_repo = InMemoryImportJobRepository()
+    job = _job(job_repo)
+
+    assert GetImportJob(job_repo).execute(job.id, "user-1").id == job.id
+    with pytest.raises(ValueError):
+        GetImportJob(job_repo).execute(job.id, "user-2")
+
+
+def test_import_job_reports_rows_inserted():
+    """Test le total des transactions écrites."""
+    job = ImportJob(id="job", user_id="user-1", filename="a.csv", file_path="/tmp/a.csv")
+    job.expenses_created, job.incomes_created = 4, 2
+
+    assert job.rows_inserted == 6
+
+
+def test_create_import_job_returns_previous_import_of_identical_file():
+    """Test qu'un fichier identique déjà importé sans erreur n'est pas réimporté."""
+    job_repo = InMemoryImportJobRepository()
+    job = CreateImportJob(job_repo).execute("user-1", "export.csv", "/tmp/a.csv", "hash")
+    job.status = ImportJobStatus.COMPLETED
+    job.result = ImportResult(
+        total_transactions=1,
+        expenses_created=1,
+        incomes_created=0,
+        errors=[],
+        skipped=0,
+        success=True,
+    )
+    job_repo.update(job)
+
+    again = CreateImportJob(job_repo).execute("user-1", "copie.csv", "/tmp/b.csv", "hash")
+
+    assert again.id == job.id
+    assert again.file_path == "/tmp/a.csv"
+    assert CreateImportJob(job_repo).execute("user-2", "a.csv", "/tmp/c.csv", "hash").id != job.id
+
+
+def test_create_import_job_retries_failed_import_of_identical_file():
+    """Test qu'un import en échec est reprogrammé sur le fichier envoyé à nouveau."""
+    job_repo = InMemoryImportJobRepository()
+    job = CreateImportJob(job_repo).execute("user-1", "export.csv", "/tmp/a.csv", "hash")
+    job.status = ImportJobStatus.FAILED
+    job.error = "Erreur lors de l'import"
+    job_repo.update(job)
+
+    again = CreateImportJob(job_repo).execute("user-1", "export.csv", "/tmp/b.csv", "hash")
+
+    assert again.id == job.id
+    assert (again.status, again.file_path, again.error) == (
+        ImportJobStatus.PENDING,
+        "/tmp/b.csv",
+        None,
+    )
+
+
+def test_create_import_job_returns_concurrent_upload_of_identical_file():
+    """Test qu'un envoi simultané du même fichier retourne l'import créé par l'autre."""
+
+    class RacingImportJobRepository(InMemoryImportJobRepository):
+        """L'import de l'autre envoi est créé entre la vérification et l'écriture."""
+
+        checks = 0
+
+        def get_latest_by_content_hash(self, user_id, content_hash):
+            self.checks += 1
+            if self.checks == 1:
+                return None
+            return super().get_latest_by_content_hash(user_id, content_hash)
+
+        def create(self, job):
+            if any(
+                not other.is_finished and other.content_hash == job.content_hash
+                for other in self.jobs.values()
+            ):
+                raise DuplicateImportJobError("Un import de ce fichier est déjà en cours")
+            return super().create(job)
+
+    job_repo = RacingImportJobRepository()
+    InMemoryImportJobRepository.create(
+        job_repo,
+        ImportJob(
+            id="other",
+            user_id="user-1",
+            filename="export.csv",
+            file_path="/tmp/a.csv",
+            content_hash="hash",
+        ),
+    )
+
+    job = CreateImportJob(job_repo).execute("user-1", "export.csv", "/tmp/b.csv", "hash")
+
+    assert (job.id, job.file_path) == ("other", "/tmp/a.csv")
+
+
+def test_run_import_job_resumes_after_committed_chunks():
+    """Test qu'une reprise reporte les lots consignés et ne retraite que les suivants."""
+    job_repo = InMemoryImportJobRepository()
+    ledger_repo = InMemoryImportLedgerRepository()
+    expense_repo = InMemoryExpenseRepository()
+    income_repo = InMemoryIncomeRepository()
+    job = _job(job_repo)
+    import_csv = ImportCSV(expense_repo, income_repo, chunk_size=2)
+    RunImportJob(job_repo, import_csv, ledger_repo).execute(job, BytesIO(CSV_CONTENT.encode()))
+    assert [chunk.rows for chunk in ledger_repo.get_chunks(job.id)] == [2, 1]
+
+    # Interruption simulée après le premier lot
+    del ledger_repo.chunks[job.id][1]
+    import_csv.expense_repo = Mock(wraps=expense_repo)
+    resumed = RunImportJob(job_repo, import_csv, ledger_repo).execute(
+        job, BytesIO(CSV_CONTENT.encode())
+    )
+
+    result = resumed.result
+    assert (result.total_transactions, result.resumed) == (3, 2)
+    assert (result.expenses_created, result.incomes_created, result.skipped) == (2, 0, 1)
+    assert len(expense_repo.expenses) == 2
+    # Seul le second lot est dédupliqué contre l'historique
+    assert import_csv.expense_repo.get_by_user_id_and_date_range.call_count == 1
+    assert len(ledger_repo.get_chunks(job.id)) == 2
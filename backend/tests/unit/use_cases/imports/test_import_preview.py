@@ -0,0 +1,111 @@
+"""Tests pour la prévisualisation et la confirmation des imports."""
+
+import uuid
+from io import BytesIO
+
+import pytest
+
+from app.domain.entities.import_preview import PreviewRowStatus
+from app.infrastructure.cache.import_preview_cache import InMemoryImportPreviewCache
+from app.use_cases.imports.confirm_import import ConfirmImport
+from app.use_cases.imports.get_import_preview import GetImportPreview
+from app.use_cases.imports.import_csv import ImportCSV
+from app.use_cases.imports.preview_import import PreviewImport
+from tests.unit.use_cases.imports.test_import_csv import (
+    InMemoryExpenseRepository,
+    InMemoryIncomeRepository,
+)
+
+CSV_CONTENT = """dateOp;dateVal;label;category;categoryParent;montant;
+2024-01-15;2024-01-15;CARREFOUR MARKET;Alimentation;Alimentation;-45.50;
+2024-01-16;2024-01-16;STATION TOTAL;Transport;Transport;-60.00;
+2024-01-16;2024-01-16;STATION TOTAL;Transport;Transport;-60.00;
+2024-01-17;2024-01-17;VIREMENT SALAIRE;Salaire;Revenus;2000.00;
+"""
+
+
+@pytest.fixture
+def repositories():
+    return InMemoryExpenseRepository(), InMemoryIncomeRepository()
+
+
+@pytest.fixture
+def import_csv(repositories):
+    return ImportCSV(*repositories)
+
+
+def test_preview_classifies_rows_without_writing(repositories, import_csv):
+    """L'aperçu catégorise et déduplique sans rien écrire."""
+    expense_repo, income_repo = repositories
+    user_id = str(uuid.uuid4())
+
+    preview = import_csv.preview(user_id, BytesIO(CSV_CONTENT.encode("utf-8")), "releve.csv")
+
+    assert expense_repo.get_by_user_id(user_id) == []
+    assert income_repo.get_all_by_user_id(user_id) == []
+    assert preview.total_transactions == 4
+    assert preview.count(PreviewRowStatus.NEW) == 3
+    assert preview.count(PreviewRowStatus.DUPLICATE) == 1
+    assert len(preview.expenses) == 2
+    assert len(preview.incomes) == 1
+
+    duplicates, total = preview.page(1, 10, PreviewRowStatus.DUPLICATE)
+    assert total == 1
+    assert duplicates[0].description == "STATION TOTAL"
+
+
+def test_commit_preview_writes_prepared_transactions(repositories, import_csv):
+    """La confirmation écrit les transactions préparées par l'aperçu."""
+    expense_repo, income_repo = repositories
+    user_id = str(uuid.uuid4())
+    preview = import_csv.preview(user_id, BytesIO(CSV_CONTENT.encode("utf-8")))
+
+    result = import_csv.commit_preview(preview)
+
+    assert result.success is True
+    assert result.expenses_created == 2
+    assert result.incomes_created == 1
+    assert result.skipped == 1
+    assert len(expense_repo.get_by_user_id(user_id)) == 2
+    assert len(income_repo.get_all_by_user_id(user_id)) == 1
+
+
+def test_confirm_import_consumes_the_token(import_csv):
+    """Un aperçu ne peut être confirmé qu'une fois, et par son propriétaire."""
+    cache = InMemoryImportPreviewCache()
+    user_id = str(uuid.uuid4())
+    preview = PreviewImport(import_csv, cache).execute(
+        user_id, "releve.csv", BytesIO(CSV_CONTENT.encode("utf-8"))
+    )
+
+    with pytest.raises(ValueError, match="expiré"):
+        GetImportPreview(cache).execute(preview.token, "other-user")
+    with pytest.raises(ValueError, match="expiré"):
+        ConfirmImport(import_csv, cache).execute(preview.token, "other-user")
+
+    result = ConfirmImport(import_csv, cache).execute(preview.token, user_id)
+    assert result.expenses_created == 2
+
+    with pytest.raises(ValueError, match="expiré"):
+        ConfirmImport(import_csv, cache).execute(preview.token, user_id)
+
+
+def test_preview_import_rejects_unsupported_extension(import_csv):
+    """Test de rejet des extensions non supportées."""
+    with pytest.raises(ValueError, match="Format de fichier non supporté"):
+        PreviewImport(import_csv, InMemoryImportPreviewCache()).execute(
+            "user-id", "releve.pdf", BytesIO(b"")
+        )
+
+
+def test_preview_cache_expires_entries():
+    """Test d'expiration des aperçus après le TTL."""
+    now = [0.0]
+    cache = InMemoryImportPreviewCache(ttl_seconds=10, clock=lambda: now[0])
+    import_csv = ImportCSV(InMemoryExpenseRepository(), InMemoryIncomeRepository())
+    preview = import_csv.preview("user-id", BytesIO(CSV_CONTENT.encode("utf-8")))
+    cache.set(preview)
+
+    assert cache.get(preview.token) is preview
+    now[0] = 11
+    assert cache.get(preview.token) is None
@@ -54,6 +54,44 @@ class TestUpdateIncome:
         assert response == updated_income
         mock_repository.update.assert_called_once_with(existing_income)
 
+    def test_update_income_moves_monthly_rollup(self):
+        """Test que la mise à jour déplace le montant entre les agrégats mensuels."""
+        # Arrange
+        mock_repository = Mock()
+        mock_rollup_repository = Mock()
+        use_case = UpdateIncome(mock_repository, mock_rollup_repository)
+
+        previous_income = Income(
+            id="income-123",
+            user_id="user-123",
+            name="Prime",
+            amount=500.0,
+            date=datetime(2024, 1, 31),
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            category=IncomeCategory.BONUS,
+        )
+        updated_income = Income(
+            id="income-123",
+            user_id="user-123",
+            name="Prime",
+            amount=700.0,
+            date=datetime(2024, 2, 1),
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            category=IncomeCategory.BONUS,
+        )
+        mock_repository.get_by_id.return_value = previous_income
+        mock_repository.update.return_value = updated_income
+
+        # Act
+        use_case.execute(updated_income, "user-123")
+
+        # Assert
+        removed, added = [c.args[0] for c in mock_rollup_repository.apply.call_args_list]
+        assert (removed.year_month, removed.amount, removed.count) == ("2024-01", -500.0, -1)
+        assert (added.year_month, added.amount, added.count) == ("2024-02", 700.0, 1)
+
     def test_update_income_not_found(self):
         """Test de mise à jour d'un revenu inexistant."""
         # Arrange
@@ -0,0 +1,148 @@
+"""Test pour le cas d'utilisation des statistiques."""
+
+from datetime import datetime
+import pytest
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction_stats import (
+    AmountStats,
+    StatsBucket,
+    StatsGranularity,
+    StatsGroup,
+    StatsQuery,
+)
+from app.use_cases.stats import get_stats
+from app.use_cases.stats.get_stats import MAX_STATS_PERIODS, GetStats
+
+EXPENSE = RollupKind.EXPENSE
+INCOME = RollupKind.INCOME
+
+
+class InMemoryStatsRepository:
+    """Repository en mémoire renvoyant des agrégats prédéfinis par regroupement."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+
+    def aggregate(self, user_id: str, query: StatsQuery, group: StatsGroup) -> list[StatsBucket]:
+        """Agrégats du regroupement demandé."""
+        return [
+            StatsBucket(kind, key, AmountStats(total, count))
+            for kind, key, total, count in self.buckets[group]
+        ]
+
+
+class InMemoryVersionRepository:
+    """Versions de données en mémoire."""
+
+    def __init__(self):
+        self.versions = {}
+
+    def get(self, user_id: str) -> int:
+        """Version courante (0 par défaut)."""
+        return self.versions.get(user_id, 0)
+
+
+@pytest.fixture
+def stats_repo():
+    """Agrégats de janvier et mars 2025 (février vide)."""
+    return InMemoryStatsRepository(
+        {
+            StatsGroup.TOTAL: [(EXPENSE, None, 400.0, 3), (INCOME, None, 2000.0, 1)],
+            StatsGroup.CATEGORY: [
+                (EXPENSE, "food", 100.0, 2),
+                (EXPENSE, "housing", 300.0, 1),
+                (INCOME, "salary", 2000.0, 1),
+            ],
+            StatsGroup.PERIOD: [
+                (EXPENSE, datetime(2025, 1, 1), 100.0, 1),
+                (INCOME, datetime(2025, 1, 1), 2000.0, 1),
+                (EXPENSE, datetime(2025, 3, 1), 300.0, 2),
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def query():
+    """Premier trimestre 2025, par mois."""
+    return StatsQuery(datetime(2025, 1, 1), datetime(2025, 3, 31))
+
+
+def test_get_stats_builds_totals_categories_and_periods(stats_repo, query):
+    """Test des totaux, parts par catégorie et variations entre périodes contiguës."""
+
+    stats = GetStats(stats_repo, InMemoryVersionRepository()).execute("user-1", query)
+
+    assert stats.expenses.total == 400.0
+    assert (stats.incomes.total, stats.net_balance) == (2000.0, 1600.0)
+    assert [(c.category, c.share) for c in stats.categories] == [
+        ("housing", 0.75),
+        ("food", 0.25),
+        ("salary", 1.0),
+    ]
+    assert [p.start for p in stats.periods] == [
+        datetime(2025, 1, 1),
+        datetime(2025, 2, 1),
+        datetime(2025, 3, 1),
+    ]
+    january, february, march = stats.periods
+    assert january.net == 1900.0 and january.expense_change is None
+    assert february.expenses.count == 0
+    assert february.expense_change == -1.0 and february.income_change == -1.0
+    assert march.expense_change is None
+
+
+def test_get_stats_validation(stats_repo):
+    """Test des erreurs : utilisateur, intervalle inversé et trop de périodes."""
+
+    use_case = GetStats(stats_repo, InMemoryVersionRepository())
+
+    with pytest.raises(ValueError, match="utilisateur"):
+        use_case.execute("", StatsQuery(datetime(2025, 1, 1), datetime(2025, 2, 1)))
+    with pytest.raises(ValueError, match="précéder"):
+        use_case.execute("user-1", StatsQuery(datetime(2025, 2, 1), datetime(2025, 1, 1)))
+    with pytest.raises(ValueError, match="périodes"):
+        use_case.execute(
+            "user-1",
+            StatsQuery(datetime(2020, 1, 1), datetime(2025, 1, 1), StatsGranularity.DAY),
+        )
+
+
+def test_get_stats_stops_enumerating_periods_past_the_limit(stats_repo, monkeypatch):
+    """Test qu'un intervalle démesuré est rejeté sans énumérer toutes ses périodes."""
+
+    yielded = []
+    period_starts = get_stats.period_starts
+
+    def counting_period_starts(*args):
+        for start in period_starts(*args):
+            yielded.append(start)
+            yield start
+
+    monkeypatch.setattr(get_stats, "period_starts", counting_period_starts)
+    use_case = GetStats(stats_repo, InMemoryVersionRepository())
+
+    with pytest.raises(ValueError, match="périodes"):
+        use_case.execute(
+            "user-1",
+            StatsQuery(datetime(1, 1, 1), datetime(9999, 12, 31), StatsGranularity.DAY),
+        )
+    assert len(yielded) == MAX_STATS_PERIODS + 1
+
+
+def test_etag_changes_with_version_and_parameters(stats_repo, query):
+    """Test que l'ETag suit la version des données et les paramètres."""
+
+    versions = InMemoryVersionRepository()
+    use_case = GetStats(stats_repo, versions)
+
+    etag = use_case.etag("user-1", query)
+    assert etag == use_case.etag("user-1", query)
+    assert etag.startswith('"0-')
+
+    weekly = StatsQuery(query.start_date, query.end_date, StatsGranularity.WEEK)
+    assert use_case.etag("user-1", weekly) != etag
+    assert use_case.etag("user-2", query) != etag
+
+    versions.versions["user-1"] = 1
+    assert use_case.etag("user-1", query) != etag
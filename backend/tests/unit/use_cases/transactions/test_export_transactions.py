@@ -0,0 +1,39 @@
+"""Test pour le cas d'utilisation d'export des transactions."""
+
+import pytest
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction_query import TransactionQuery
+from app.use_cases.transactions.export_transactions import ExportTransactions
+
+
+class RecordingTransactionRepository:
+    """Repository en mémoire qui enregistre les lectures en flux."""
+
+    def __init__(self):
+        self.calls = []
+
+    def stream(self, user_id, query, kinds, batch_size):
+        """Enregistre les paramètres et ne renvoie aucun lot."""
+        self.calls.append((user_id, query, kinds, batch_size))
+        return iter([])
+
+
+def test_export_ignores_pagination_and_filters_kind():
+    """Test que l'export lit tout le fil, d'un seul type si demandé."""
+
+    repository = RecordingTransactionRepository()
+    query = TransactionQuery(limit=10, after=("x", "id"), search="loyer")
+
+    ExportTransactions(repository).execute("user-1", query, RollupKind.INCOME, batch_size=50)
+
+    user_id, streamed, kinds, batch_size = repository.calls[0]
+    assert (user_id, kinds, batch_size) == ("user-1", (RollupKind.INCOME,), 50)
+    assert streamed.limit is None and streamed.after is None
+    assert streamed.search == "loyer"
+
+
+def test_export_requires_user():
+    """Test de l'erreur sans utilisateur."""
+
+    with pytest.raises(ValueError, match="utilisateur"):
+        ExportTransactions(RecordingTransactionRepository()).execute("", TransactionQuery())
@@ -0,0 +1,79 @@
+"""Test pour le cas d'utilisation du fil unifié des transactions."""
+
+from datetime import datetime
+import pytest
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction_query import TransactionQuery
+from app.use_cases.transactions.list_transactions import ListTransactions
+
+
+class InMemoryTransactionRepository:
+    """Repository en mémoire pour le fil des transactions."""
+
+    def __init__(self, transactions):
+        self.transactions = transactions
+
+    def get_page(self, user_id: str, query: TransactionQuery, kinds) -> list[Transaction]:
+        """Récupère les transactions des types demandés, triées par (date, id) décroissants."""
+
+        transactions = sorted(
+            (t for t in self.transactions if t.user_id == user_id and t.kind in kinds),
+            key=lambda t: (t.date, t.id),
+            reverse=True,
+        )
+        if query.after is not None:
+            transactions = [t for t in transactions if (t.date, t.id) < query.after]
+        return transactions[:query.limit]
+
+
+def make_transaction(id: str, kind: RollupKind, day: int) -> Transaction:
+    """Crée une transaction de test."""
+    return Transaction(
+        id=id,
+        user_id="user-1",
+        kind=kind,
+        name=id,
+        amount=10.0,
+        date=datetime(2025, 1, day),
+    )
+
+
+@pytest.fixture
+def use_case():
+    """Cas d'usage sur un fil mêlant dépenses et revenus."""
+    return ListTransactions(
+        InMemoryTransactionRepository(
+            [
+                make_transaction("expense-1", RollupKind.EXPENSE, 1),
+                make_transaction("income-2", RollupKind.INCOME, 2),
+                make_transaction("expense-3", RollupKind.EXPENSE, 3),
+            ]
+        )
+    )
+
+
+def test_list_transactions_chains_cursors(use_case):
+    """Test du parcours du fil par curseurs successifs."""
+
+    first = use_case.execute("user-1", TransactionQuery(limit=2))
+    assert [t.id for t in first.items] == ["expense-3", "income-2"]
+
+    rest = use_case.execute("user-1", TransactionQuery(limit=2), first.next_cursor)
+    assert [t.id for t in rest.items] == ["expense-1"]
+    assert rest.next_cursor is None
+
+
+def test_list_transactions_single_kind(use_case):
+    """Test de la restriction à un seul type de transaction."""
+
+    page = use_case.execute("user-1", TransactionQuery(), kind=RollupKind.INCOME)
+
+    assert [t.id for t in page.items] == ["income-2"]
+
+
+def test_list_transactions_requires_user(use_case):
+    """Test de l'erreur sans utilisateur."""
+
+    with pytest.raises(ValueError, match="utilisateur"):
+        use_case.execute("", TransactionQuery())
@@ -0,0 +1,76 @@
+"""Test pour le cas d'utilisation de recherche des transactions."""
+
+from datetime import datetime
+import pytest
+from app.domain.entities.monthly_rollup import RollupKind
+from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction_search import TransactionSearch, TransactionSearchHit
+from app.use_cases.transactions.search_transactions import SearchTransactions
+
+
+class InMemoryTransactionRepository:
+    """Repository en mémoire : le score d'une transaction est son montant."""
+
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.searches = []
+
+    def search(self, user_id: str, search: TransactionSearch) -> list[TransactionSearchHit]:
+        """Transactions des types demandés, par (score, id) décroissants."""
+
+        self.searches.append(search)
+        hits = sorted(
+            (
+                TransactionSearchHit(t, t.amount)
+                for t in self.transactions
+                if t.user_id == user_id and t.kind in search.kinds
+            ),
+            key=lambda hit: (hit.score, hit.id),
+            reverse=True,
+        )
+        if search.after is not None:
+            hits = [hit for hit in hits if (hit.score, hit.id) < search.after]
+        return hits[:search.limit]
+
+
+@pytest.fixture
+def repository():
+    """Repository avec deux dépenses et un revenu."""
+    return InMemoryTransactionRepository(
+        [
+            Transaction("expense-1", "user-1", RollupKind.EXPENSE, "a", 3.0, datetime(2025, 1, 1)),
+            Transaction("income-1", "user-1", RollupKind.INCOME, "b", 2.0, datetime(2025, 1, 1)),
+            Transaction("expense-2", "user-1", RollupKind.EXPENSE, "c", 2.0, datetime(2025, 1, 1)),
+        ]
+    )
+
+
+def test_search_transactions_chains_cursors(repository):
+    """Test du parcours des résultats par curseurs (score, id)."""
+
+    use_case = SearchTransactions(repository)
+
+    first = use_case.execute("user-1", " carrefour ", limit=2)
+    assert [hit.id for hit in first.items] == ["expense-1", "income-1"]
+    assert repository.searches[0].text == "carrefour"
+    assert repository.searches[0].limit == 3
+
+    rest = use_case.execute("user-1", "carrefour", limit=2, cursor=first.next_cursor)
+    assert [hit.id for hit in rest.items] == ["expense-2"]
+    assert rest.next_cursor is None
+
+    incomes = use_case.execute("user-1", "carrefour", kind=RollupKind.INCOME)
+    assert [hit.id for hit in incomes.items] == ["income-1"]
+
+
+def test_search_transactions_validation(repository):
+    """Test des erreurs : utilisateur, recherche vide et curseur d'un autre tri."""
+
+    use_case = SearchTransactions(repository)
+
+    with pytest.raises(ValueError, match="utilisateur"):
+        use_case.execute("", "carrefour")
+    with pytest.raises(ValueError, match="au moins un mot"):
+        use_case.execute("user-1", " ,; ")
+    with pytest.raises(ValueError, match="Curseur"):
+        use_case.execute("user-1", "carrefour", cursor="invalide")
@@ -3,10 +3,12 @@
 import { useState, useRef } from 'react'
 import { toast } from 'sonner'
 import { importCSV } from '@/services/import'
-import { ImportResult } from '@/types/import'
+import { ImportJob, ImportResult } from '@/types/import'
 import Button from '@/components/ui/Button'
 import { handleSilentError } from '@/lib/errorHandler'
 
+const SUPPORTED_EXTENSIONS = ['.csv', '.txt', '.ofx', '.qfx', '.qif', '.xml']
+
 interface CSVUploaderProps {
   onSuccess?: () => void
 }
@@ -15,6 +17,7 @@ export default function CSVUploader({ onSuccess }: CSVUploaderProps) {
   const [isDragging, setIsDragging] = useState(false)
   const [isUploading, setIsUploading] = useState(false)
   const [result, setResult] = useState<ImportResult | null>(null)
+  const [progress, setProgress] = useState<ImportJob | null>(null)
   const fileInputRef = useRef<HTMLInputElement>(null)
 
   const handleDragOver = (e: React.DragEvent) => {
@@ -46,18 +49,20 @@ export default function CSVUploader({ onSuccess }: CSVUploaderProps) {
 
   const handleFile = async (file: File) => {
     // Vérifier le type de fichier
-    if (!file.name.endsWith('.csv')) {
+    const name = file.name.toLowerCase()
+    if (!SUPPORTED_EXTENSIONS.some((extension) => name.endsWith(extension))) {
       toast.error('Type de fichier invalide', {
-        description: 'Veuillez sélectionner un fichier CSV (.csv)',
+        description: 'Veuillez sélectionner un relevé CSV, OFX/QFX, QIF ou CAMT.053 (XML)',
       })
       return
     }
 
     setIsUploading(true)
     setResult(null)
+    setProgress(null)
 
     try {
-      const importResult = await importCSV(file)
+      const importResult = await importCSV(file, { onProgress: setProgress })
       setResult(importResult)
 
       if (importResult.success) {
@@ -78,6 +83,7 @@ export default function CSVUploader({ onSuccess }: CSVUploaderProps) {
       })
     } finally {
       setIsUploading(false)
+      setProgress(null)
       // Réinitialiser l'input file
       if (fileInputRef.current) {
         fileInputRef.current.value = ''
@@ -109,7 +115,7 @@ export default function CSVUploader({ onSuccess }: CSVUploaderProps) {
         <input
           ref={fileInputRef}
           type="file"
-          accept=".csv"
+          accept={SUPPORTED_EXTENSIONS.join(',')}
           onChange={handleFileSelect}
           className="hidden"
         />
@@ -158,7 +164,11 @@ export default function CSVUploader({ onSuccess }: CSVUploaderProps) {
                 <circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4"></circle>
                 <path className="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path>
               </svg>
-              <span>Traitement du fichier...</span>
+              <span>
+                {progress && progress.rows_parsed > 0
+                  ? `${progress.rows_parsed} lignes lues, ${progress.rows_inserted} importées, ${progress.skipped} ignorées...`
+                  : 'Traitement du fichier...'}
+              </span>
             </div>
           )}
         </div>
@@ -225,8 +235,8 @@ export default function CSVUploader({ onSuccess }: CSVUploaderProps) {
           Format attendu
         </h4>
         <ul className="text-sm text-gray-300 space-y-1">
-          <li>• Fichier CSV avec séparateur point-virgule (;)</li>
-          <li>• Colonnes: dateOp, dateVal, label, category, amount, etc.</li>
+          <li>• Export CSV de votre banque (séparateur et encodage détectés automatiquement)</li>
+          <li>• Relevés OFX/QFX, QIF et CAMT.053 (XML) également acceptés</li>
           <li>• Montants négatifs pour les dépenses, positifs pour les revenus</li>
           <li>• Les doublons sont automatiquement détectés et ignorés</li>
         </ul>
@@ -16,6 +16,8 @@ export default function TransactionsClientWrapper() {
     transactions,
     loading,
     error,
+    hasMore,
+    loadMore,
     createTransaction,
     updateTransaction,
     deleteTransaction,
@@ -156,6 +158,17 @@ export default function TransactionsClientWrapper() {
             onDelete={handleDeleteTransaction}
             onEdit={handleEditTransaction}
           />
+          {hasMore && (
+            <div className='text-center'>
+              <button
+                onClick={loadMore}
+                disabled={loading}
+                className='px-6 py-3 glass rounded font-medium transition-all elevation-1 hover:elevation-2 disabled:opacity-50'
+              >
+                {loading ? 'Chargement...' : 'Afficher plus'}
+              </button>
+            </div>
+          )}
         </div>
       )}
 
@@ -55,7 +55,12 @@ interface ExpenseDataState {
   error: string | null;
 }
 
-export const useExpenses = () => {
+interface UseExpensesOptions {
+  // false : la liste est chargée ailleurs (ex. fil /transactions), seules les actions servent
+  loadList?: boolean;
+}
+
+export const useExpenses = ({ loadList = true }: UseExpensesOptions = {}) => {
   const [expensesState, setExpensesState] = useState<ExpenseState>({ 
     loading: false, 
     error: null, 
@@ -104,7 +109,7 @@ export const useExpenses = () => {
       setCreateExpenseState({ loading: false, error: null, data });
 
       // Rafraîchir la liste des dépenses après création
-      await fetchExpenses();
+      if (loadList) await fetchExpenses();
 
       return data;
     } catch (error: unknown) {
@@ -113,7 +118,7 @@ export const useExpenses = () => {
       setCreateExpenseState({ loading: false, error: errorMessage, data: null });
       throw error;
     }
-  }, [fetchExpenses]);
+  }, [fetchExpenses, loadList]);
 
   const deleteExpense = useCallback(async (expenseId: string) => {
     setDeleteExpenseState({ loading: true, error: null, data: null });
@@ -122,7 +127,7 @@ export const useExpenses = () => {
       setDeleteExpenseState({ loading: false, error: null, data: true });
       
       // Rafraîchir la liste des dépenses après suppression
-      await fetchExpenses();
+      if (loadList) await fetchExpenses();
       
       return true;
     } catch (error: unknown) {
@@ -131,7 +136,7 @@ export const useExpenses = () => {
       setDeleteExpenseState({ loading: false, error: errorMessage, data: null });
       throw error;
     }
-  }, [fetchExpenses]);
+  }, [fetchExpenses, loadList]);
 
   const updateExpense = useCallback(async (expenseId: string, expense: UpdateExpenseRequest) => {
     setUpdateExpenseState({ loading: true, error: null, data: null });
@@ -140,7 +145,7 @@ export const useExpenses = () => {
       setUpdateExpenseState({ loading: false, error: null, data });
       
       // Rafraîchir la liste des dépenses après modification
-      await fetchExpenses();
+      if (loadList) await fetchExpenses();
       
       return data;
     } catch (error: unknown) {
@@ -149,7 +154,7 @@ export const useExpenses = () => {
       setUpdateExpenseState({ loading: false, error: errorMessage, data: null });
       throw error;
     }
-  }, [fetchExpenses]);
+  }, [fetchExpenses, loadList]);
 
   const fetchExpenseData = useCallback(async () => {
     try {
@@ -178,9 +183,9 @@ export const useExpenses = () => {
 
   // Charger automatiquement les dépenses et les données au montage du composant
   useEffect(() => {
-    fetchExpenses();
+    if (loadList) fetchExpenses();
     fetchExpenseData();
-  }, [fetchExpenses, fetchExpenseData]);
+  }, [fetchExpenses, fetchExpenseData, loadList]);
 
   return {
     // Actions
@@ -1,9 +1,9 @@
 import { useState, useEffect } from 'react';
-import { forecastService, ForecastData, ForecastPeriod } from '@/services/forecast';
+import { forecastService, ForecastBatch, ForecastPeriod } from '@/services/forecast';
 import { handleSilentError } from '@/lib/errorHandler';
 
 export const useForecast = (period: ForecastPeriod) => {
-  const [data, setData] = useState<ForecastData | null>(null);
+  const [batch, setBatch] = useState<ForecastBatch | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -21,8 +21,9 @@ export const useForecast = (period: ForecastPeriod) => {
           return;
         }
 
-        const forecastData = await forecastService.getForecast(period);
-        setData(forecastData);
+        // Toutes les périodes sont chargées en une requête : changer d'onglet ne refait pas d'appel
+        const forecasts = await forecastService.getAllForecasts();
+        setBatch(forecasts);
       } catch (err) {
         handleSilentError(err);
         setError(err instanceof Error ? err.message : 'Erreur inconnue');
@@ -32,7 +33,9 @@ export const useForecast = (period: ForecastPeriod) => {
     };
 
     fetchForecast();
-  }, [period]);
+  }, []);
+
+  const data = batch?.forecasts[period] ?? null;
 
   return { data, loading, error };
 }; 
\ No newline at end of file
@@ -3,11 +3,16 @@ import { incomeService } from '@/services/income';
 import type { Income, CreateIncomeRequest, UpdateIncomeRequest, Category, Frequency } from '@/types/income';
 import { handleSilentError } from '@/lib/errorHandler';
 
-export const useIncomes = () => {
+interface UseIncomesOptions {
+  // Ne pas charger la liste des revenus (catégories, fréquences et actions uniquement)
+  loadList?: boolean;
+}
+
+export const useIncomes = ({ loadList = true }: UseIncomesOptions = {}) => {
   const [incomes, setIncomes] = useState<Income[]>([]);
   const [categories, setCategories] = useState<Category[]>([]);
   const [frequencies, setFrequencies] = useState<Frequency[]>([]);
-  const [loading, setLoading] = useState(true);
+  const [loading, setLoading] = useState(loadList);
   const [error, setError] = useState<string | null>(null);
 
   // Charger les revenus
@@ -138,13 +143,13 @@ export const useIncomes = () => {
   useEffect(() => {
     const loadData = async () => {
       await Promise.all([
-        loadIncomes(),
+        loadList ? loadIncomes() : Promise.resolve(),
         loadCategories(),
         loadFrequencies()
       ]);
     };
     loadData();
-  }, [loadIncomes, loadCategories, loadFrequencies]);
+  }, [loadIncomes, loadCategories, loadFrequencies, loadList]);
 
   return {
     incomes,
@@ -1,56 +1,81 @@
-import { useMemo, useCallback } from 'react';
+import { useState, useEffect, useCallback } from 'react';
 import { useExpenses } from './useExpenses';
 import { useIncomes } from './useIncomes';
-import {
-  Transaction,
-  expenseToTransaction,
-  incomeToTransaction,
-  sortTransactionsByDate
-} from '@/types/transaction';
+import { transactionService } from '@/services/transaction';
+import type { Transaction } from '@/types/transaction';
 import type { CreateExpenseRequest, UpdateExpenseRequest } from '@/types/expense';
 import type { CreateIncomeRequest, UpdateIncomeRequest } from '@/types/income';
 
+// Taille des pages du fil des transactions
+export const TRANSACTIONS_PAGE_SIZE = 100;
+
 export const useTransactions = () => {
+  const [transactions, setTransactions] = useState<Transaction[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<string | null>(null);
+
+  // Les listes sont lues via /transactions : les hooks ne servent qu'aux actions
   const {
-    expenses,
-    expensesLoading,
-    expensesError,
     createExpense,
     updateExpense,
     deleteExpense,
     categories: expenseCategories,
     frequencies: expenseFrequencies,
-  } = useExpenses();
+  } = useExpenses({ loadList: false });
 
   const {
-    incomes,
-    loading: incomesLoading,
-    error: incomesError,
     createIncome,
     updateIncome,
     deleteIncome,
     categories: incomeCategories,
     frequencies: incomeFrequencies,
-  } = useIncomes();
+  } = useIncomes({ loadList: false });
+
+  // Charger une page du fil, fusionné et trié par date par le serveur
+  const fetchPage = useCallback(async (cursor?: string) => {
+    try {
+      setLoading(true);
+      setError(null);
+      const page = await transactionService.getTransactions({
+        limit: TRANSACTIONS_PAGE_SIZE,
+        cursor,
+      });
+      setTransactions((previous) => (cursor ? [...previous, ...page.items] : page.items));
+      setNextCursor(page.nextCursor);
+    } catch (err: unknown) {
+      const e = err as { response?: { data?: { detail?: string } } };
+      setError(e.response?.data?.detail || 'Erreur lors du chargement des transactions');
+    } finally {
+      setLoading(false);
+    }
+  }, []);
+
+  // Recharger la première page (après une création, modification ou suppression)
+  const loadTransactions = useCallback(() => fetchPage(), [fetchPage]);
+
+  // Ajouter la page suivante à la liste
+  const loadMore = useCallback(async () => {
+    if (nextCursor) {
+      await fetchPage(nextCursor);
+    }
+  }, [fetchPage, nextCursor]);
 
-  // Combiner les dépenses et revenus en transactions
-  const transactions: Transaction[] = useMemo(() => {
-    const expenseTransactions = expenses.map(expenseToTransaction);
-    const incomeTransactions = incomes.map(incomeToTransaction);
-    return sortTransactionsByDate([...expenseTransactions, ...incomeTransactions]);
-  }, [expenses, incomes]);
+  useEffect(() => {
+    loadTransactions();
+  }, [loadTransactions]);
 
   // Créer une transaction (dépense ou revenu)
   const createTransaction = useCallback(async (
     type: 'expense' | 'income',
     data: CreateExpenseRequest | CreateIncomeRequest
   ) => {
-    if (type === 'expense') {
-      return await createExpense(data as CreateExpenseRequest);
-    } else {
-      return await createIncome(data as CreateIncomeRequest);
-    }
-  }, [createExpense, createIncome]);
+    const created = type === 'expense'
+      ? await createExpense(data as CreateExpenseRequest)
+      : await createIncome(data as CreateIncomeRequest);
+    await loadTransactions();
+    return created;
+  }, [createExpense, createIncome, loadTransactions]);
 
   // Mettre à jour une transaction
   const updateTransaction = useCallback(async (
@@ -58,34 +83,32 @@ export const useTransactions = () => {
     type: 'expense' | 'income',
     data: UpdateExpenseRequest | UpdateIncomeRequest
   ) => {
-    if (type === 'expense') {
-      return await updateExpense(id, data as UpdateExpenseRequest);
-    } else {
-      return await updateIncome(id, data as UpdateIncomeRequest);
-    }
-  }, [updateExpense, updateIncome]);
+    const updated = type === 'expense'
+      ? await updateExpense(id, data as UpdateExpenseRequest)
+      : await updateIncome(id, data as UpdateIncomeRequest);
+    await loadTransactions();
+    return updated;
+  }, [updateExpense, updateIncome, loadTransactions]);
 
   // Supprimer une transaction
   const deleteTransaction = useCallback(async (
     id: string,
     type: 'expense' | 'income'
   ) => {
-    if (type === 'expense') {
-      return await deleteExpense(id);
-    } else {
-      return await deleteIncome(id);
-    }
-  }, [deleteExpense, deleteIncome]);
-
-  const loading = expensesLoading || incomesLoading;
-  const error = expensesError || incomesError;
+    const deleted = type === 'expense' ? await deleteExpense(id) : await deleteIncome(id);
+    await loadTransactions();
+    return deleted;
+  }, [deleteExpense, deleteIncome, loadTransactions]);
 
   return {
     transactions,
     loading,
     error,
+    hasMore: nextCursor !== null,
 
     // Actions
+    loadTransactions,
+    loadMore,
     createTransaction,
     updateTransaction,
     deleteTransaction,
@@ -95,13 +118,5 @@ export const useTransactions = () => {
     expenseFrequencies,
     incomeCategories,
     incomeFrequencies,
-
-    // États séparés si nécessaire
-    expenses,
-    incomes,
-    expensesLoading,
-    incomesLoading,
-    expensesError,
-    incomesError,
   };
 };
@@ -6,6 +6,14 @@ export interface DataPoint {
   category?: string;
 }
 
+export interface CategoryForecast {
+  category: string;
+  data: DataPoint[];
+  forecast: DataPoint[];
+  total: number;
+  forecast_total: number;
+}
+
 export interface ForecastData {
   user_id: string;
   period: string;
@@ -23,13 +31,28 @@ export interface ForecastData {
   forecast_net_balance: number;
   created_at: string;
   updated_at: string;
+  expense_categories?: CategoryForecast[] | null;
+  income_categories?: CategoryForecast[] | null;
 }
 
 export type ForecastPeriod = '1m' | '3m' | '6m' | '1y';
 
+export type ForecastGroupBy = 'category';
+
+export interface ForecastBatch {
+  user_id: string;
+  forecasts: Partial<Record<ForecastPeriod, ForecastData>>;
+}
+
 export const forecastService = {
-  async getForecast(period: ForecastPeriod): Promise<ForecastData> {
-    const response = await api.get(`/forecasts?period=${period}`);
+  async getForecast(period: ForecastPeriod, groupBy?: ForecastGroupBy): Promise<ForecastData> {
+    const groupParam = groupBy ? `&group_by=${groupBy}` : '';
+    const response = await api.get(`/forecasts?period=${period}${groupParam}`);
+    return response.data;
+  },
+
+  async getAllForecasts(groupBy?: ForecastGroupBy): Promise<ForecastBatch> {
+    const response = await api.get(groupBy ? `/forecasts/all?group_by=${groupBy}` : '/forecasts/all');
     return response.data;
   }
 }; 
\ No newline at end of file
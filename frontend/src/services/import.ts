@@ -3,22 +3,67 @@
  */
 
 import api from '@/lib/api'
-import { ImportResult } from '@/types/import'
+import { ImportJob, ImportResult } from '@/types/import'
+
+const POLL_INTERVAL_MS = 1000
+
+export interface ImportOptions {
+  /** Appelé à chaque relevé de l'avancement de l'import */
+  onProgress?: (job: ImportJob) => void
+  /** Délai entre deux relevés de l'avancement */
+  pollIntervalMs?: number
+}
+
+const isFinished = (job: ImportJob): boolean =>
+  job.status === 'completed' || job.status === 'failed'
+
+const wait = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+/**
+ * Récupère l'état et l'avancement d'un import
+ * @param jobId - Id de l'import
+ * @returns Import en arrière-plan
+ */
+export const getImportJob = async (jobId: string): Promise<ImportJob> => {
+  const response = await api.get<ImportJob>(`/imports/jobs/${jobId}`)
+  return response.data
+}
 
 /**
  * Importe des transactions depuis un fichier CSV
+ *
+ * Le fichier est importé en arrière-plan : l'avancement est relevé jusqu'à la fin de l'import.
  * @param file - Fichier CSV à importer
+ * @param options - Suivi de l'avancement
  * @returns Résultat de l'import
  */
-export const importCSV = async (file: File): Promise<ImportResult> => {
+export const importCSV = async (file: File, options: ImportOptions = {}): Promise<ImportResult> => {
+  const { onProgress, pollIntervalMs = POLL_INTERVAL_MS } = options
   const formData = new FormData()
   formData.append('file', file)
 
-  const response = await api.post<ImportResult>('/imports/csv', formData, {
+  const response = await api.post<ImportJob>('/imports/csv', formData, {
     headers: {
       'Content-Type': 'multipart/form-data',
     },
   })
 
-  return response.data
+  let job = response.data
+  onProgress?.(job)
+  while (!isFinished(job)) {
+    await wait(pollIntervalMs)
+    job = await getImportJob(job.id)
+    onProgress?.(job)
+  }
+
+  return (
+    job.result ?? {
+      total_transactions: job.rows_parsed,
+      expenses_created: job.expenses_created,
+      incomes_created: job.incomes_created,
+      errors: job.error ? [job.error] : [],
+      skipped: job.skipped,
+      success: false,
+    }
+  )
 }
@@ -2,7 +2,7 @@ import api from '@/lib/api';
 import type { Income, CreateIncomeRequest, UpdateIncomeRequest, Category, Frequency } from '@/types/income';
 
 export const incomeService = {
-  // Récupérer tous les revenus
+  // Récupérer la première page des revenus (100 plus récents, voir X-Next-Cursor)
   async getIncomes(): Promise<Income[]> {
     const response = await api.get(`/incomes`);
     return response.data;
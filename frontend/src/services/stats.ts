@@ -0,0 +1,53 @@
+import api from '@/lib/api';
+import type { TransactionType } from '@/types/transaction';
+
+export type StatsGranularity = 'day' | 'week' | 'month' | 'year';
+
+export interface AmountStats {
+  total: number;
+  count: number;
+  average: number;
+  median: number;
+  p90: number;
+}
+
+export interface CategoryStats {
+  kind: TransactionType;
+  category: string;
+  stats: AmountStats;
+  share: number;
+}
+
+export interface PeriodStats {
+  start: string;
+  expenses: AmountStats;
+  incomes: AmountStats;
+  net: number;
+  expense_change: number | null;
+  income_change: number | null;
+}
+
+export interface TransactionStats {
+  start_date: string;
+  end_date: string;
+  granularity: StatsGranularity;
+  expenses: AmountStats;
+  incomes: AmountStats;
+  net_balance: number;
+  categories: CategoryStats[];
+  periods: PeriodStats[];
+}
+
+export interface StatsParams {
+  start_date?: string;
+  end_date?: string;
+  granularity?: StatsGranularity;
+}
+
+export const statsService = {
+  // Statistiques calculées par le serveur ; le navigateur revalide avec l'ETag (304)
+  async getStats(params: StatsParams = {}): Promise<TransactionStats> {
+    const response = await api.get('/stats', { params });
+    return response.data;
+  },
+};
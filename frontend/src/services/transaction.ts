@@ -0,0 +1,68 @@
+import api from '@/lib/api';
+import type { Transaction, TransactionType } from '@/types/transaction';
+
+export interface TransactionFilters {
+  type?: TransactionType;
+  category?: string[];
+  start_date?: string;
+  end_date?: string;
+  q?: string;
+  sort?: 'date' | '-date' | 'amount' | '-amount';
+  limit?: number;
+  cursor?: string;
+}
+
+export interface TransactionPage {
+  items: Transaction[];
+  nextCursor: string | null;
+}
+
+export interface TransactionSearchResult extends Transaction {
+  score: number;
+}
+
+export interface TransactionSearchPage {
+  items: TransactionSearchResult[];
+  nextCursor: string | null;
+}
+
+export type TransactionExportFormat = 'csv' | 'ndjson' | 'arrow' | 'parquet';
+
+export const transactionService = {
+  // Récupérer les dépenses et revenus en un seul fil trié par le serveur
+  async getTransactions(filters: TransactionFilters = {}): Promise<TransactionPage> {
+    const response = await api.get('/transactions', {
+      params: filters,
+      paramsSerializer: { indexes: null },
+    });
+    return {
+      items: response.data,
+      nextCursor: response.headers?.['x-next-cursor'] ?? null,
+    };
+  },
+
+  // Rechercher dans les libellés et descriptions, par pertinence décroissante
+  async searchTransactions(
+    q: string,
+    options: { type?: TransactionType; limit?: number; cursor?: string } = {}
+  ): Promise<TransactionSearchPage> {
+    const response = await api.get('/transactions/search', { params: { q, ...options } });
+    return {
+      items: response.data,
+      nextCursor: response.headers?.['x-next-cursor'] ?? null,
+    };
+  },
+
+  // Télécharger tout le fil filtré, diffusé par le serveur dans un format compact
+  async exportTransactions(
+    format: TransactionExportFormat = 'csv',
+    filters: Omit<TransactionFilters, 'limit' | 'cursor'> = {}
+  ): Promise<Blob> {
+    const response = await api.get('/transactions/export', {
+      params: { format, ...filters },
+      paramsSerializer: { indexes: null },
+      responseType: 'blob',
+    });
+    return response.data;
+  },
+};
@@ -2,6 +2,15 @@
  * Types pour l'import de transactions
  */
 
+export interface ImportChunkResult {
+  kind: 'expense' | 'income'
+  index: number
+  size: number
+  created: number
+  skipped: number
+  error: string | null
+}
+
 export interface ImportResult {
   total_transactions: number
   expenses_created: number
@@ -9,4 +18,23 @@ export interface ImportResult {
   errors: string[]
   skipped: number
   success: boolean
+  chunks?: ImportChunkResult[]
+}
+
+export type ImportJobStatus = 'pending' | 'running' | 'completed' | 'failed'
+
+export interface ImportJob {
+  id: string
+  status: ImportJobStatus
+  filename: string
+  rows_parsed: number
+  rows_inserted: number
+  expenses_created: number
+  incomes_created: number
+  skipped: number
+  error: string | null
+  result: ImportResult | null
+  created_at: string
+  updated_at: string
+  finished_at: string | null
 }
@@ -1,13 +1,18 @@
-import { renderHook, waitFor } from '@testing-library/react';
-import { useTransactions } from '@/hooks/useTransactions';
+import { act, renderHook, waitFor } from '@testing-library/react';
+import { TRANSACTIONS_PAGE_SIZE, useTransactions } from '@/hooks/useTransactions';
 import { useExpenses } from '@/hooks/useExpenses';
 import { useIncomes } from '@/hooks/useIncomes';
+import { transactionService } from '@/services/transaction';
 
 jest.mock('@/hooks/useExpenses');
 jest.mock('@/hooks/useIncomes');
+jest.mock('@/services/transaction');
 
 const mockedUseExpenses = useExpenses as jest.MockedFunction<typeof useExpenses>;
 const mockedUseIncomes = useIncomes as jest.MockedFunction<typeof useIncomes>;
+const mockedGetTransactions = transactionService.getTransactions as jest.MockedFunction<
+  typeof transactionService.getTransactions
+>;
 
 describe('useTransactions', () => {
   const mockCreateExpense = jest.fn();
@@ -19,6 +24,7 @@ describe('useTransactions', () => {
 
   beforeEach(() => {
     jest.clearAllMocks();
+    mockedGetTransactions.mockResolvedValue({ items: [], nextCursor: null });
 
     mockedUseExpenses.mockReturnValue({
       expenses: [],
@@ -53,121 +59,55 @@ describe('useTransactions', () => {
     });
   });
 
-  it('should combine expenses and incomes into transactions', () => {
-    const mockExpenses = [
-      {
-        id: '1',
-        name: 'Groceries',
-        amount: 100,
-        date: '2025-01-15',
-        category: 'FOOD',
-        user_id: 'user1',
-        created_at: '2025-01-15',
-        updated_at: '2025-01-15',
-      },
+  it('should load the first page of the merged feed', async () => {
+    const mockTransactions = [
+      { id: '2', name: 'Salary', amount: 5000, type: 'income', date: '2025-01-02' },
+      { id: '1', name: 'Groceries', amount: 100, type: 'expense', date: '2025-01-01' },
     ];
+    mockedGetTransactions.mockResolvedValue({ items: mockTransactions, nextCursor: 'abc' });
 
-    const mockIncomes = [
-      {
-        id: '2',
-        name: 'Salary',
-        amount: 5000,
-        date: '2025-01-01',
-        category: 'SALARY',
-        user_id: 'user1',
-        created_at: '2025-01-01',
-        updated_at: '2025-01-01',
-      },
-    ];
+    const { result } = renderHook(() => useTransactions());
 
-    mockedUseExpenses.mockReturnValue({
-      expenses: mockExpenses,
-      expensesLoading: false,
-      expensesError: null,
-      createExpense: mockCreateExpense,
-      updateExpense: mockUpdateExpense,
-      deleteExpense: mockDeleteExpense,
-      fetchExpenses: jest.fn(),
-      fetchExpenseData: jest.fn(),
-      categories: [],
-      frequencies: [],
-      categoriesLoading: false,
-      deleteExpenseLoading: false,
-      deleteExpenseError: null,
-      createExpenseLoading: false,
-      createExpenseError: null,
-      updateExpenseLoading: false,
-      updateExpenseError: null,
+    await waitFor(() => expect(result.current.loading).toBe(false));
+    expect(mockedGetTransactions).toHaveBeenCalledWith({
+      limit: TRANSACTIONS_PAGE_SIZE,
+      cursor: undefined,
     });
+    expect(result.current.transactions).toEqual(mockTransactions);
+    expect(result.current.hasMore).toBe(true);
+    expect(mockedUseExpenses).toHaveBeenCalledWith({ loadList: false });
+    expect(mockedUseIncomes).toHaveBeenCalledWith({ loadList: false });
+  });
 
-    mockedUseIncomes.mockReturnValue({
-      incomes: mockIncomes,
-      loading: false,
-      error: null,
-      createIncome: mockCreateIncome,
-      updateIncome: mockUpdateIncome,
-      deleteIncome: mockDeleteIncome,
-      refetch: jest.fn(),
-      categories: [],
-      frequencies: [],
-    });
+  it('should append the next page on loadMore', async () => {
+    const first = { id: '2', name: 'Salary', amount: 5000, type: 'income', date: '2025-01-02' };
+    const second = { id: '1', name: 'Groceries', amount: 100, type: 'expense', date: '2025-01-01' };
+    mockedGetTransactions
+      .mockResolvedValueOnce({ items: [first], nextCursor: 'abc' })
+      .mockResolvedValueOnce({ items: [second], nextCursor: null });
 
     const { result } = renderHook(() => useTransactions());
+    await waitFor(() => expect(result.current.hasMore).toBe(true));
 
-    expect(result.current.transactions).toHaveLength(2);
-    expect(result.current.transactions[0].type).toBeDefined();
-  });
-
-  it('should return loading state from both hooks', () => {
-    mockedUseExpenses.mockReturnValue({
-      expenses: [],
-      expensesLoading: true,
-      expensesError: null,
-      createExpense: mockCreateExpense,
-      updateExpense: mockUpdateExpense,
-      deleteExpense: mockDeleteExpense,
-      fetchExpenses: jest.fn(),
-      fetchExpenseData: jest.fn(),
-      categories: [],
-      frequencies: [],
-      categoriesLoading: false,
-      deleteExpenseLoading: false,
-      deleteExpenseError: null,
-      createExpenseLoading: false,
-      createExpenseError: null,
-      updateExpenseLoading: false,
-      updateExpenseError: null,
+    await act(async () => {
+      await result.current.loadMore();
     });
 
-    const { result } = renderHook(() => useTransactions());
-
-    expect(result.current.loading).toBe(true);
+    expect(mockedGetTransactions).toHaveBeenLastCalledWith({
+      limit: TRANSACTIONS_PAGE_SIZE,
+      cursor: 'abc',
+    });
+    expect(result.current.transactions).toEqual([first, second]);
+    expect(result.current.hasMore).toBe(false);
   });
 
-  it('should return error state from either hook', () => {
-    mockedUseExpenses.mockReturnValue({
-      expenses: [],
-      expensesLoading: false,
-      expensesError: 'Expense error',
-      createExpense: mockCreateExpense,
-      updateExpense: mockUpdateExpense,
-      deleteExpense: mockDeleteExpense,
-      fetchExpenses: jest.fn(),
-      fetchExpenseData: jest.fn(),
-      categories: [],
-      frequencies: [],
-      categoriesLoading: false,
-      deleteExpenseLoading: false,
-      deleteExpenseError: null,
-      createExpenseLoading: false,
-      createExpenseError: null,
-      updateExpenseLoading: false,
-      updateExpenseError: null,
-    });
+  it('should return the error detail from the API', async () => {
+    mockedGetTransactions.mockRejectedValue({ response: { data: { detail: 'Feed error' } } });
 
     const { result } = renderHook(() => useTransactions());
 
-    expect(result.current.error).toBe('Expense error');
+    await waitFor(() => expect(result.current.error).toBe('Feed error'));
+    expect(result.current.loading).toBe(false);
   });
 
   it('should provide combined categories and frequencies', () => {
@@ -75,6 +75,21 @@ describe('forecast service', () => {
       expect(result).toEqual(mockForecastData);
     });
 
+    it('should request the per-category breakdown', async () => {
+      const breakdown = {
+        ...mockForecastData,
+        expense_categories: [
+          { category: 'food', data: [], forecast: [], total: 1000, forecast_total: 0 },
+        ],
+      };
+      mockedApi.get.mockResolvedValue({ data: breakdown });
+
+      const result = await forecastService.getForecast('3m', 'category');
+
+      expect(mockedApi.get).toHaveBeenCalledWith('/forecasts?period=3m&group_by=category');
+      expect(result.expense_categories?.[0].category).toBe('food');
+    });
+
     it('should handle empty forecast data', async () => {
       const emptyForecast = {
         ...mockForecastData,
@@ -95,5 +110,20 @@ describe('forecast service', () => {
       expect(result.total_expenses).toBe(0);
     });
   });
-});
 
+  describe('getAllForecasts', () => {
+    it('should fetch every period in a single request', async () => {
+      const batch = {
+        user_id: 'user-123',
+        forecasts: { '1m': { period: '1m' }, '1y': { period: '1y' } },
+      };
+      mockedApi.get.mockResolvedValue({ data: batch });
+
+      const result = await forecastService.getAllForecasts();
+
+      expect(mockedApi.get).toHaveBeenCalledTimes(1);
+      expect(mockedApi.get).toHaveBeenCalledWith('/forecasts/all');
+      expect(result.forecasts['1y']).toEqual({ period: '1y' });
+    });
+  });
+});
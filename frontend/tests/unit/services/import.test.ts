@@ -1,9 +1,38 @@
-import { importCSV } from '@/services/import';
+import { importCSV, getImportJob } from '@/services/import';
 import api from '@/lib/api';
+import { ImportJob, ImportResult } from '@/types/import';
 
 jest.mock('@/lib/api');
 const mockedApi = api as jest.Mocked<typeof api>;
 
+const makeResult = (overrides: Partial<ImportResult> = {}): ImportResult => ({
+  total_transactions: 1,
+  expenses_created: 1,
+  incomes_created: 0,
+  errors: [],
+  skipped: 0,
+  success: true,
+  chunks: [],
+  ...overrides,
+});
+
+const makeJob = (overrides: Partial<ImportJob> = {}): ImportJob => ({
+  id: 'job-123',
+  status: 'completed',
+  filename: 'test.csv',
+  rows_parsed: 1,
+  rows_inserted: 1,
+  expenses_created: 1,
+  incomes_created: 0,
+  skipped: 0,
+  error: null,
+  result: makeResult(),
+  created_at: '2025-01-01T00:00:00Z',
+  updated_at: '2025-01-01T00:00:01Z',
+  finished_at: '2025-01-01T00:00:01Z',
+  ...overrides,
+});
+
 describe('import service', () => {
   beforeEach(() => {
     jest.clearAllMocks();
@@ -15,14 +44,7 @@ describe('import service', () => {
         type: 'text/csv',
       });
 
-      const mockResult = {
-        success: true,
-        imported_count: 1,
-        failed_count: 0,
-        errors: [],
-      };
-
-      mockedApi.post.mockResolvedValue({ data: mockResult });
+      mockedApi.post.mockResolvedValue({ data: makeJob() });
 
       const result = await importCSV(mockFile);
 
@@ -35,7 +57,35 @@ describe('import service', () => {
           },
         }
       );
-      expect(result).toEqual(mockResult);
+      expect(mockedApi.get).not.toHaveBeenCalled();
+      expect(result).toEqual(makeResult());
+    });
+
+    it('should poll the import job until it is finished', async () => {
+      const mockFile = new File(['content'], 'large.csv', { type: 'text/csv' });
+      const onProgress = jest.fn();
+
+      mockedApi.post.mockResolvedValue({
+        data: makeJob({ status: 'pending', rows_parsed: 0, rows_inserted: 0, result: null }),
+      });
+      mockedApi.get
+        .mockResolvedValueOnce({
+          data: makeJob({ status: 'running', rows_parsed: 500, rows_inserted: 500, result: null }),
+        })
+        .mockResolvedValueOnce({
+          data: makeJob({ rows_parsed: 800, result: makeResult({ total_transactions: 800 }) }),
+        });
+
+      const result = await importCSV(mockFile, { onProgress, pollIntervalMs: 0 });
+
+      expect(mockedApi.get).toHaveBeenCalledTimes(2);
+      expect(mockedApi.get).toHaveBeenCalledWith('/imports/jobs/job-123');
+      expect(onProgress.mock.calls.map(([job]) => job.status)).toEqual([
+        'pending',
+        'running',
+        'completed',
+      ]);
+      expect(result.total_transactions).toBe(800);
     });
 
     it('should handle import with errors', async () => {
@@ -43,67 +93,33 @@ describe('import service', () => {
         type: 'text/csv',
       });
 
-      const mockResult = {
-        success: false,
-        imported_count: 0,
-        failed_count: 1,
-        errors: ['Invalid date format on line 2'],
-      };
-
-      mockedApi.post.mockResolvedValue({ data: mockResult });
+      mockedApi.post.mockResolvedValue({
+        data: makeJob({
+          result: makeResult({ success: false, errors: ['Invalid date format on line 2'] }),
+        }),
+      });
 
       const result = await importCSV(mockFile);
 
       expect(result.success).toBe(false);
-      expect(result.failed_count).toBe(1);
       expect(result.errors).toHaveLength(1);
     });
 
-    it('should handle partial import success', async () => {
-      const mockFile = new File(
-        ['date,amount,category\n2025-01-01,100,FOOD\ninvalid,200,TRANSPORT'],
-        'test.csv',
-        { type: 'text/csv' }
-      );
-
-      const mockResult = {
-        success: true,
-        imported_count: 1,
-        failed_count: 1,
-        errors: ['Invalid date format on line 3'],
-      };
-
-      mockedApi.post.mockResolvedValue({ data: mockResult });
-
-      const result = await importCSV(mockFile);
+    it('should turn a failed job into a failed result', async () => {
+      const mockFile = new File(['content'], 'test.csv', { type: 'text/csv' });
 
-      expect(result.imported_count).toBe(1);
-      expect(result.failed_count).toBe(1);
-      expect(result.errors).toHaveLength(1);
-    });
-
-    it('should handle large CSV files', async () => {
-      const rows = ['date,amount,category'];
-      for (let i = 0; i < 100; i++) {
-        rows.push(`2025-01-${String(i + 1).padStart(2, '0')},${100 + i},FOOD`);
-      }
-      const mockFile = new File([rows.join('\n')], 'large.csv', {
-        type: 'text/csv',
+      mockedApi.post.mockResolvedValue({
+        data: makeJob({
+          status: 'failed',
+          error: "Erreur de décodage du fichier. Assurez-vous qu'il est en UTF-8.",
+          result: null,
+        }),
       });
 
-      const mockResult = {
-        success: true,
-        imported_count: 100,
-        failed_count: 0,
-        errors: [],
-      };
-
-      mockedApi.post.mockResolvedValue({ data: mockResult });
-
       const result = await importCSV(mockFile);
 
-      expect(result.imported_count).toBe(100);
-      expect(result.failed_count).toBe(0);
+      expect(result.success).toBe(false);
+      expect(result.errors[0]).toContain('UTF-8');
     });
 
     it('should properly format FormData with file', async () => {
@@ -111,23 +127,26 @@ describe('import service', () => {
         type: 'text/csv',
       });
 
-      const mockResult = {
-        success: true,
-        imported_count: 0,
-        failed_count: 0,
-        errors: [],
-      };
-
-      mockedApi.post.mockResolvedValue({ data: mockResult });
+      mockedApi.post.mockResolvedValue({ data: makeJob() });
 
       await importCSV(mockFile);
 
       const callArgs = mockedApi.post.mock.calls[0];
       const formData = callArgs[1] as FormData;
-      
+
       expect(formData).toBeInstanceOf(FormData);
       expect(formData.get('file')).toBe(mockFile);
     });
   });
-});
 
+  describe('getImportJob', () => {
+    it('should fetch the import job state', async () => {
+      mockedApi.get.mockResolvedValue({ data: makeJob() });
+
+      const job = await getImportJob('job-123');
+
+      expect(mockedApi.get).toHaveBeenCalledWith('/imports/jobs/job-123');
+      expect(job.status).toBe('completed');
+    });
+  });
+});
@@ -0,0 +1,46 @@
+import { statsService } from '@/services/stats';
+import api from '@/lib/api';
+
+jest.mock('@/lib/api');
+const mockedApi = api as jest.Mocked<typeof api>;
+
+describe('stats service', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('getStats', () => {
+    it('should fetch stats for a range and granularity', async () => {
+      const mockStats = {
+        start_date: '2025-01-01T00:00:00',
+        end_date: '2025-03-31T23:59:59.999999',
+        granularity: 'month',
+        expenses: { total: 400, count: 3, average: 133.33, median: 100, p90: 280 },
+        incomes: { total: 2000, count: 1, average: 2000, median: 2000, p90: 2000 },
+        net_balance: 1600,
+        categories: [],
+        periods: [],
+      };
+      mockedApi.get.mockResolvedValue({ data: mockStats });
+
+      const result = await statsService.getStats({
+        start_date: '2025-01-01',
+        end_date: '2025-03-31',
+        granularity: 'month',
+      });
+
+      expect(mockedApi.get).toHaveBeenCalledWith('/stats', {
+        params: { start_date: '2025-01-01', end_date: '2025-03-31', granularity: 'month' },
+      });
+      expect(result).toEqual(mockStats);
+    });
+
+    it('should use the server defaults without parameters', async () => {
+      mockedApi.get.mockResolvedValue({ data: {} });
+
+      await statsService.getStats();
+
+      expect(mockedApi.get).toHaveBeenCalledWith('/stats', { params: {} });
+    });
+  });
+});
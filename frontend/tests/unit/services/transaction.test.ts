@@ -0,0 +1,70 @@
+import { transactionService } from '@/services/transaction';
+import api from '@/lib/api';
+
+jest.mock('@/lib/api');
+const mockedApi = api as jest.Mocked<typeof api>;
+
+describe('transaction service', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('getTransactions', () => {
+    it('should fetch the merged feed with filters', async () => {
+      const mockTransactions = [
+        { id: '2', name: 'Salary', amount: 5000, type: 'income', date: '2025-01-02' },
+        { id: '1', name: 'Rent', amount: 1000, type: 'expense', date: '2025-01-01' },
+      ];
+      mockedApi.get.mockResolvedValue({
+        data: mockTransactions,
+        headers: { 'x-next-cursor': 'abc' },
+      });
+
+      const result = await transactionService.getTransactions({ limit: 2, category: ['food'] });
+
+      expect(mockedApi.get).toHaveBeenCalledWith('/transactions', {
+        params: { limit: 2, category: ['food'] },
+        paramsSerializer: { indexes: null },
+      });
+      expect(result).toEqual({ items: mockTransactions, nextCursor: 'abc' });
+    });
+
+    it('should return a null cursor on the last page', async () => {
+      mockedApi.get.mockResolvedValue({ data: [], headers: {} });
+
+      const result = await transactionService.getTransactions();
+
+      expect(result).toEqual({ items: [], nextCursor: null });
+    });
+  });
+
+  describe('searchTransactions', () => {
+    it('should search with options and return the next cursor', async () => {
+      const mockResults = [{ id: '1', name: 'CARREFOUR', type: 'expense', score: 0.7 }];
+      mockedApi.get.mockResolvedValue({ data: mockResults, headers: { 'x-next-cursor': 'next' } });
+
+      const result = await transactionService.searchTransactions('carre', { limit: 10 });
+
+      expect(mockedApi.get).toHaveBeenCalledWith('/transactions/search', {
+        params: { q: 'carre', limit: 10 },
+      });
+      expect(result).toEqual({ items: mockResults, nextCursor: 'next' });
+    });
+  });
+
+  describe('exportTransactions', () => {
+    it('should download the filtered feed as a blob', async () => {
+      const blob = new Blob(['id,type\n']);
+      mockedApi.get.mockResolvedValue({ data: blob, headers: {} });
+
+      const result = await transactionService.exportTransactions('parquet', { type: 'income' });
+
+      expect(mockedApi.get).toHaveBeenCalledWith('/transactions/export', {
+        params: { format: 'parquet', type: 'income' },
+        paramsSerializer: { indexes: null },
+        responseType: 'blob',
+      });
+      expect(result).toBe(blob);
+    });
+  });
+});